@@ -3,9 +3,12 @@ Módulo de análise de dados para o ApostaPro.
 Inclui análise de sentimento, preparação de dados para ML e outras análises.
 """
 
-from .sentimento import AnalisadorSentimento, executar_analise_sentimento
+from .job_sentimento import JobSentimento, executar_job_sentimento
+from .sentimento import analisar_sentimento_texto, analisar_sentimento_textos
 
 __all__ = [
-    'AnalisadorSentimento',
-    'executar_analise_sentimento'
+    'JobSentimento',
+    'executar_job_sentimento',
+    'analisar_sentimento_texto',
+    'analisar_sentimento_textos'
 ]
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Job Incremental de Análise de Sentimento
+========================================
+
+Processa notícias e posts pendentes em lotes, sem carregar a tabela inteira
+em memória:
+
+- Leitura por keyset (``id > ? ORDER BY id LIMIT ?``) a partir de uma marca
+  d'água por tabela, então cada execução só lê textos novos
+- Os lotes são pontuados em um pool de processos (TextBlob ou o léxico PT)
+  enquanto o próximo lote é lido
+- Resultados gravados com ``executemany``; a marca d'água e o resumo por
+  clube/dia/fonte (``resumo_sentimento``) avançam na mesma transação do lote
+- Linhas que a marca d'água deixa para trás sem análise (texto vazio ou erro
+  ao pontuar) ficam em ``pendentes_sentimento`` e são revistas a cada execução
+- Com ``clube_id`` só os pendentes do clube são analisados, sem mover a marca
+  d'água
+
+Uso:
+    from Coleta_de_dados.analise.job_sentimento import JobSentimento
+    resumo = JobSentimento("Banco_de_dados/aposta.db").executar()
+
+Autor: Sistema de Análise de Sentimento ApostaPro
+Data: 2025-08-15
+Versão: 1.0
+"""
+
+import importlib
+import itertools
+import logging
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+MODELO_TEXTBLOB = 'TextBlob'
+MODELO_PT = 'AnalisadorSentimentoPT'
+
+MOTIVO_SEM_TEXTO = 'sem_texto'
+MOTIVO_ERRO = 'erro'
+
+
+@dataclass(frozen=True)
+class TabelaSentimento:
+    """Consulta de pendentes e atualização de resultados de uma tabela."""
+    nome: str
+    colunas_texto: Tuple[str, ...]
+    sql_update: str
+    # Monta os parâmetros do UPDATE: (id, sentimento, score, confianca, modelo, agora)
+    parametros: Callable[[int, str, float, float, str, datetime], tuple]
+
+
+@dataclass
+class LotePendente:
+    """Linhas lidas para análise e o que gravar sobre elas junto com os resultados."""
+    # Marca d'água após o lote (None: o lote não a move)
+    ultimo_id: Optional[int]
+    ids: List[int]
+    textos: List[str]
+    sem_texto: List[int]
+    # Pendentes revistos que já não precisam de análise
+    resolvidos: List[int]
+
+
+def _parametros_noticia(item_id, sentimento, score, confianca, modelo, agora):
+    return (sentimento, score, score, confianca, sentimento, agora, modelo, item_id)
+
+
+def _parametros_post(item_id, sentimento, score, confianca, modelo, agora):
+    return (sentimento, score, item_id)
+
+
+TABELAS: Tuple[TabelaSentimento, ...] = (
+    TabelaSentimento(
+        nome='noticias_clubes',
+        colunas_texto=('titulo', 'resumo', 'conteudo_completo'),
+        sql_update="""
+            UPDATE noticias_clubes
+            SET sentimento = ?, score_sentimento = ?,
+                sentimento_geral = ?, confianca_sentimento = ?,
+                polaridade = ?, analisado_em = ?, modelo_analise = ?,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """,
+        parametros=_parametros_noticia,
+    ),
+    TabelaSentimento(
+        nome='posts_redes_sociais',
+        colunas_texto=('conteudo',),
+        sql_update="""
+            UPDATE posts_redes_sociais
+            SET sentimento = ?, score_sentimento = ?,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """,
+        parametros=_parametros_post,
+    ),
+)
+
+# Pontuador de lotes por processo (o léxico PT é compilado uma vez por worker)
+_pontuadores: Dict[str, Callable[[Sequence[str]], List[Tuple[str, float, float]]]] = {}
+
+
+def _importar(modulo: str):
+    # Funciona tanto como pacote quanto com Coleta_de_dados/analise no sys.path
+    return importlib.import_module(f"{__package__}.{modulo}" if __package__ else modulo)
+
+
+resumo_sentimento = _importar('resumo_sentimento')
+
+
+def _pontuador(modelo: str) -> Callable[[Sequence[str]], List[Tuple[str, float, float]]]:
+    if modelo not in _pontuadores:
+        if modelo == MODELO_PT:
+            _pontuadores[modelo] = _importar('sentimento_pt').AnalisadorSentimentoPT().analisar_textos
+        elif modelo == MODELO_TEXTBLOB:
+            analisar = _importar('sentimento').analisar_sentimento_texto
+            _pontuadores[modelo] = lambda textos: [analisar(texto) for texto in textos]
+        else:
+            raise ValueError(f"Modelo de sentimento desconhecido: {modelo}")
+    return _pontuadores[modelo]
+
+
+def pontuar_textos(modelo: str, textos: Sequence[str]) -> List[Optional[Tuple[str, float, float]]]:
+    """
+    Pontua uma lista de textos; roda nos processos do pool.
+
+    Se o lote falhar, os textos são pontuados um a um e os que falharem
+    ficam como None, sem derrubar o restante do lote.
+    """
+    pontuar = _pontuador(modelo)
+    try:
+        return pontuar(textos)
+    except Exception as e:
+        logger.warning(f"Erro ao pontuar lote de {len(textos)} textos, pontuando um a um: {e}")
+
+    resultados: List[Optional[Tuple[str, float, float]]] = []
+    for texto in textos:
+        try:
+            resultados.append(pontuar([texto])[0])
+        except Exception as e:
+            logger.error(f"Erro ao analisar sentimento do texto: {e}")
+            resultados.append(None)
+    return resultados
+
+
+class JobSentimento:
+    """
+    Job incremental de sentimento sobre noticias_clubes e posts_redes_sociais.
+
+    Args:
+        db_path: Caminho do banco SQLite
+        modelo: ``'TextBlob'`` ou ``'AnalisadorSentimentoPT'``
+        tamanho_lote: Linhas lidas, pontuadas e gravadas por vez
+        processos: Processos de pontuação (1 pontua no próprio processo)
+    """
+
+    def __init__(self, db_path: str, modelo: str = MODELO_TEXTBLOB,
+                 tamanho_lote: int = 500, processos: Optional[int] = None):
+        self.db_path = db_path
+        self.modelo = modelo
+        self.tamanho_lote = max(1, tamanho_lote)
+        self.processos = max(1, processos if processos is not None else min(4, os.cpu_count() or 1))
+
+    def _conectar(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS watermark_sentimento (
+                tabela TEXT PRIMARY KEY,
+                ultimo_id INTEGER NOT NULL,
+                atualizado_em TIMESTAMP
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS pendentes_sentimento (
+                tabela TEXT NOT NULL,
+                item_id INTEGER NOT NULL,
+                motivo TEXT NOT NULL,
+                PRIMARY KEY (tabela, item_id)
+            ) WITHOUT ROWID
+        """)
+        conn.commit()
+        if resumo_sentimento.criar_tabela(conn):
+            logger.info("Resumo de sentimento criado a partir dos textos já analisados")
+        return conn
+
+    @staticmethod
+    def obter_watermark(conn: sqlite3.Connection, tabela: str) -> int:
+        linha = conn.execute(
+            "SELECT ultimo_id FROM watermark_sentimento WHERE tabela = ?", (tabela,)
+        ).fetchone()
+        return linha[0] if linha else 0
+
+    def reiniciar_watermarks(self) -> None:
+        """Volta as marcas d'água ao início (reanalisa pendentes antigos)."""
+        with self._conectar() as conn:
+            conn.execute("DELETE FROM watermark_sentimento")
+
+    def _lote(self, linhas: Sequence[tuple], ultimo_id: Optional[int],
+              resolvidos: Optional[List[int]] = None) -> LotePendente:
+        lote = LotePendente(ultimo_id, [], [], [], resolvidos or [])
+        for item_id, *partes in linhas:
+            texto = " ".join(parte or '' for parte in partes).strip()
+            if texto:
+                lote.ids.append(item_id)
+                lote.textos.append(texto)
+            else:
+                lote.sem_texto.append(item_id)
+        return lote
+
+    def _lotes_pendentes(self, conn: sqlite3.Connection, tabela: TabelaSentimento,
+                         clube_id: Optional[int] = None):
+        """
+        Gera lotes de linhas pendentes acima da marca d'água.
+        
+        Linhas sem texto ficam de fora da análise, mas a marca d'água passa por
+        elas (são registradas em ``pendentes_sentimento``). Com ``clube_id``,
+        lê todos os pendentes do clube e não move a marca d'água.
+        """
+        ultimo_id = 0 if clube_id is not None else self.obter_watermark(conn, tabela.nome)
+        filtro_clube = "AND clube_id = ?" if clube_id is not None else ""
+        sql = f"""
+            SELECT id, {', '.join(tabela.colunas_texto)}
+            FROM {tabela.nome}
+            WHERE id > ? AND (sentimento IS NULL OR score_sentimento IS NULL) {filtro_clube}
+            ORDER BY id
+            LIMIT ?
+        """
+        while True:
+            parametros = (ultimo_id, clube_id, self.tamanho_lote) if clube_id is not None else \
+                (ultimo_id, self.tamanho_lote)
+            linhas = conn.execute(sql, parametros).fetchall()
+            if not linhas:
+                return
+            ultimo_id = linhas[-1][0]
+            yield self._lote(linhas, ultimo_id if clube_id is None else None)
+
+    def _lotes_a_revisar(self, conn: sqlite3.Connection, tabela: TabelaSentimento):
+        """Gera lotes com os pendentes abaixo da marca d'água (texto vazio ou erro)."""
+        ids = [linha[0] for linha in conn.execute(
+            "SELECT item_id FROM pendentes_sentimento WHERE tabela = ? ORDER BY item_id", (tabela.nome,)
+        )]
+        for inicio in range(0, len(ids), self.tamanho_lote):
+            revistos = ids[inicio:inicio + self.tamanho_lote]
+            linhas = conn.execute(f"""
+                SELECT id, {', '.join(tabela.colunas_texto)}
+                FROM {tabela.nome}
+                WHERE id IN ({', '.join('?' * len(revistos))})
+                  AND (sentimento IS NULL OR score_sentimento IS NULL)
+                ORDER BY id
+            """, revistos).fetchall()
+            ainda_pendentes = {linha[0] for linha in linhas}
+            # Analisados por outra execução ou removidos da tabela
+            resolvidos = [item_id for item_id in revistos if item_id not in ainda_pendentes]
+            yield self._lote(linhas, None, resolvidos)
+
+    def _gravar_lote(self, conn: sqlite3.Connection, tabela: TabelaSentimento, lote: LotePendente,
+                     resultados: Sequence[Optional[Tuple[str, float, float]]]) -> Tuple[int, int]:
+        """Grava o lote em uma transação; retorna (analisados, falhas)."""
+        agora = datetime.now()
+        analisados = [(item_id, resultado) for item_id, resultado in zip(lote.ids, resultados) if resultado]
+        falhas = [item_id for item_id, resultado in zip(lote.ids, resultados) if not resultado]
+        ids = [item_id for item_id, _ in analisados]
+
+        antes = resumo_sentimento.agregar_linhas(conn, tabela.nome, ids)
+        conn.executemany(tabela.sql_update, [
+            tabela.parametros(item_id, sentimento, score, confianca, self.modelo, agora)
+            for item_id, (sentimento, score, confianca) in analisados
+        ])
+        resumo_sentimento.aplicar_lote(conn, antes, resumo_sentimento.agregar_linhas(conn, tabela.nome, ids))
+
+        conn.executemany(
+            "DELETE FROM pendentes_sentimento WHERE tabela = ? AND item_id = ?",
+            [(tabela.nome, item_id) for item_id in ids + lote.resolvidos]
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO pendentes_sentimento (tabela, item_id, motivo) VALUES (?, ?, ?)",
+            [(tabela.nome, item_id, MOTIVO_SEM_TEXTO) for item_id in lote.sem_texto] +
+            [(tabela.nome, item_id, MOTIVO_ERRO) for item_id in falhas]
+        )
+        if lote.ultimo_id is not None:
+            conn.execute("""
+                INSERT INTO watermark_sentimento (tabela, ultimo_id, atualizado_em) VALUES (?, ?, ?)
+                ON CONFLICT(tabela) DO UPDATE SET ultimo_id = excluded.ultimo_id, atualizado_em = excluded.atualizado_em
+            """, (tabela.nome, lote.ultimo_id, agora))
+        conn.commit()
+        return len(ids), len(falhas)
+
+    def _processar_tabela(self, conn: sqlite3.Connection, tabela: TabelaSentimento,
+                          executor: Optional[Executor], clube_id: Optional[int] = None) -> Tuple[int, int]:
+        """Analisa os pendentes da tabela; retorna (itens analisados, falhas)."""
+        analisados = falhas = 0
+        em_andamento: deque = deque()
+
+        def concluir_mais_antigo():
+            nonlocal analisados, falhas
+            lote, futuro = em_andamento.popleft()
+            try:
+                resultados = futuro.result() if isinstance(futuro, Future) else futuro
+            except Exception as e:
+                logger.error(f"Erro ao pontuar lote de {tabela.nome}: {e}")
+                resultados = [None] * len(lote.ids)
+            ok, erros = self._gravar_lote(conn, tabela, lote, resultados)
+            analisados += ok
+            falhas += erros
+
+        lotes = self._lotes_pendentes(conn, tabela, clube_id)
+        if clube_id is None:
+            # Os pendentes antigos são revistos antes de ler as linhas novas
+            lotes = itertools.chain(self._lotes_a_revisar(conn, tabela), lotes)
+
+        for lote in lotes:
+            if not lote.ids:
+                em_andamento.append((lote, []))
+            elif executor is None:
+                em_andamento.append((lote, pontuar_textos(self.modelo, lote.textos)))
+            else:
+                em_andamento.append((lote, executor.submit(pontuar_textos, self.modelo, lote.textos)))
+            # Mantém no máximo um lote por processo em andamento; grava em ordem
+            while len(em_andamento) > (self.processos if executor else 0):
+                concluir_mais_antigo()
+
+        while em_andamento:
+            concluir_mais_antigo()
+        return analisados, falhas
+
+    def executar(self, clube_id: Optional[int] = None) -> Dict[str, float]:
+        """
+        Analisa os textos novos de todas as tabelas.
+
+        Args:
+            clube_id: Analisa apenas os pendentes deste clube
+
+        Returns:
+            Resumo com itens por tabela, falhas, segundos e itens por segundo
+        """
+        inicio = time.perf_counter()
+        resumo: Dict[str, float] = {'modelo': self.modelo, 'clube_id': clube_id, 'falhas': 0}
+        executor = None
+        if self.processos > 1:
+            # spawn: seguro mesmo quando chamado de um servidor com threads
+            executor = ProcessPoolExecutor(self.processos, mp_context=multiprocessing.get_context('spawn'))
+        try:
+            with self._conectar() as conn:
+                for tabela in TABELAS:
+                    analisados, falhas = self._processar_tabela(conn, tabela, executor, clube_id)
+                    resumo[tabela.nome] = analisados
+                    resumo['falhas'] += falhas
+                    logger.info(f"{tabela.nome}: {analisados} itens analisados, {falhas} falhas")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        segundos = time.perf_counter() - inicio
+        total = sum(resumo[tabela.nome] for tabela in TABELAS)
+        resumo.update(
+            total=total,
+            segundos=round(segundos, 3),
+            itens_por_segundo=round(total / segundos, 1) if segundos > 0 else 0.0,
+        )
+        logger.info(f"Análise de sentimento: {total} itens em {segundos:.2f}s "
+                    f"({resumo['itens_por_segundo']} itens/s)")
+        return resumo
+
+
+# Uma execução por vez (ex.: reprocessamento disparado pela API)
+_lock_execucao = threading.Lock()
+ultimo_resumo: Optional[Dict[str, float]] = None
+
+
+def executar_job_sentimento(db_path: str, modelo: str = MODELO_TEXTBLOB, reiniciar: bool = False,
+                            clube_id: Optional[int] = None, **opcoes) -> Optional[Dict[str, float]]:
+    """
+    Executa o job se nenhum outro estiver rodando; None se já houver um em andamento.
+
+    Args:
+        db_path: Caminho do banco SQLite
+        modelo: Modelo de sentimento
+        reiniciar: Reanalisa pendentes abaixo da marca d'água
+        clube_id: Analisa apenas os pendentes deste clube
+        **opcoes: tamanho_lote, processos
+    """
+    global ultimo_resumo
+    if not _lock_execucao.acquire(blocking=False):
+        logger.warning("Job de sentimento já em execução")
+        return None
+    try:
+        job = JobSentimento(db_path, modelo, **opcoes)
+        if reiniciar:
+            job.reiniciar_watermarks()
+        ultimo_resumo = job.executar(clube_id)
+        return ultimo_resumo
+    finally:
+        _lock_execucao.release()
+
+
+def job_em_execucao() -> bool:
+    return _lock_execucao.locked()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Resumo Materializado de Sentimento
+==================================
+
+Contagens e somas de sentimento por clube, fonte (notícias ou posts), dia e
+classe de sentimento, mantidas pelo job de sentimento a cada lote gravado.
+As consultas da API leem este resumo em vez de agregar todos os textos
+analisados a cada requisição.
+
+- ``resumo_sentimento`` tem uma linha por (clube_id, fonte, dia, sentimento)
+  com total, soma e contagem dos scores e das confianças e a última análise;
+  as médias são soma / contagem. Atende consultas por janela de dias
+- ``resumo_sentimento_clube`` tem as mesmas somas sem o dia (poucas linhas
+  por clube), para consultas de todo o período, e ``resumo_sentimento_dia``
+  sem o clube, para totais de uma janela de dias
+- Na criação, as tabelas são preenchidas a partir dos textos já analisados
+- ``aplicar_lote`` soma a contribuição atual das linhas de um lote e desconta
+  a anterior (linhas reanalisadas), na mesma transação do UPDATE do lote
+
+Uso:
+    antes = agregar_linhas(conn, 'noticias_clubes', ids)
+    conn.executemany(sql_update, parametros)
+    aplicar_lote(conn, antes, agregar_linhas(conn, 'noticias_clubes', ids))
+
+Autor: Sistema de Análise de Sentimento ApostaPro
+Data: 2026-10-16
+Versão: 1.0
+"""
+
+import sqlite3
+from typing import Dict, List, Sequence, Tuple
+
+TABELA_RESUMO = 'resumo_sentimento'
+TABELA_RESUMO_CLUBE = 'resumo_sentimento_clube'
+TABELA_RESUMO_DIA = 'resumo_sentimento_dia'
+
+# Fonte gravada no resumo para cada tabela de textos
+FONTES = {
+    'noticias_clubes': 'noticias',
+    'posts_redes_sociais': 'posts',
+}
+
+# Colunas de confiança e de data da análise (posts não têm nenhuma das duas)
+_COLUNAS_ANALISE = {
+    'noticias_clubes': ('confianca_sentimento', 'analisado_em'),
+    'posts_redes_sociais': ('NULL', 'NULL'),
+}
+
+# Clube gravado para posts só de jogadores
+SEM_CLUBE = 0
+
+# Ids por consulta ao agregar um lote
+IDS_POR_CONSULTA = 500
+
+CHAVE = ('clube_id', 'fonte', 'dia', 'sentimento')
+CHAVE_CLUBE = ('clube_id', 'fonte', 'sentimento')
+CHAVE_DIA = ('fonte', 'dia', 'sentimento')
+VALORES = ('total', 'soma_score', 'com_score', 'soma_confianca', 'com_confianca', 'ultima_analise')
+COLUNAS = CHAVE + VALORES
+
+
+def _sql_criar(tabela: str, chave: Tuple[str, ...]) -> str:
+    colunas_chave = ''.join(
+        f"{coluna} {'INTEGER' if coluna == 'clube_id' else 'TEXT'} NOT NULL,\n        " for coluna in chave
+    )
+    return f"""
+    CREATE TABLE IF NOT EXISTS {tabela} (
+        {colunas_chave}total INTEGER NOT NULL DEFAULT 0,
+        soma_score REAL NOT NULL DEFAULT 0,
+        com_score INTEGER NOT NULL DEFAULT 0,
+        soma_confianca REAL NOT NULL DEFAULT 0,
+        com_confianca INTEGER NOT NULL DEFAULT 0,
+        ultima_analise TIMESTAMP,
+        PRIMARY KEY ({', '.join(chave)})
+    )
+"""
+
+
+def _sql_somar(tabela: str, chave: Tuple[str, ...]) -> str:
+    colunas = chave + VALORES
+    return f"""
+    INSERT INTO {tabela} ({', '.join(colunas)}) VALUES ({', '.join('?' * len(colunas))})
+    ON CONFLICT ({', '.join(chave)}) DO UPDATE SET
+        total = total + excluded.total,
+        soma_score = soma_score + excluded.soma_score,
+        com_score = com_score + excluded.com_score,
+        soma_confianca = soma_confianca + excluded.soma_confianca,
+        com_confianca = com_confianca + excluded.com_confianca,
+        ultima_analise = CASE
+            WHEN ultima_analise IS NULL OR excluded.ultima_analise > ultima_analise THEN excluded.ultima_analise
+            ELSE ultima_analise
+        END
+"""
+
+
+def _sql_remover_vazias(tabela: str, chave: Tuple[str, ...]) -> str:
+    return f"DELETE FROM {tabela} WHERE {' AND '.join(f'{coluna} = ?' for coluna in chave)} AND total <= 0"
+
+
+# (tabela, colunas da chave) de cada nível do resumo
+NIVEIS = ((TABELA_RESUMO, CHAVE), (TABELA_RESUMO_CLUBE, CHAVE_CLUBE), (TABELA_RESUMO_DIA, CHAVE_DIA))
+
+
+def sql_agregacao(tabela: str, filtro: str = "") -> str:
+    """SELECT com as colunas do resumo agregadas direto da tabela de textos."""
+    confianca, analise = _COLUNAS_ANALISE[tabela]
+    return f"""
+        SELECT COALESCE(clube_id, {SEM_CLUBE}) AS clube_id, '{FONTES[tabela]}' AS fonte,
+               COALESCE(DATE(created_at), '') AS dia, sentimento,
+               COUNT(*) AS total,
+               COALESCE(SUM(score_sentimento), 0) AS soma_score, COUNT(score_sentimento) AS com_score,
+               COALESCE(SUM({confianca}), 0) AS soma_confianca, COUNT({confianca}) AS com_confianca,
+               MAX({analise}) AS ultima_analise
+        FROM {tabela}
+        WHERE sentimento IS NOT NULL {filtro}
+        GROUP BY 1, 3, sentimento
+    """
+
+
+def sql_reagrupar(origem: str, chave: Tuple[str, ...]) -> str:
+    """Reagrupa ``origem`` (tabela ou subconsulta com as colunas de ``COLUNAS``) pela ``chave``."""
+    return f"""
+        SELECT {', '.join(chave)}, SUM(total) AS total,
+               SUM(soma_score) AS soma_score, SUM(com_score) AS com_score,
+               SUM(soma_confianca) AS soma_confianca, SUM(com_confianca) AS com_confianca,
+               MAX(ultima_analise) AS ultima_analise
+        FROM {origem}
+        GROUP BY {', '.join(chave)}
+    """
+
+
+# Mesmas linhas do resumo, calculadas dos textos (bancos em que o job ainda não rodou)
+SQL_AGREGACAO_TEXTOS = " UNION ALL ".join(sql_agregacao(tabela) for tabela in FONTES)
+
+
+def tabela_existe(conn: sqlite3.Connection) -> bool:
+    """True se todas as tabelas do resumo existem."""
+    return conn.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ({', '.join('?' * len(NIVEIS))})",
+        [tabela for tabela, _ in NIVEIS]
+    ).fetchone()[0] == len(NIVEIS)
+
+
+def origem_consulta(conn: sqlite3.Connection, tabela: str) -> str:
+    """
+    Nome da tabela do resumo para usar no FROM de uma consulta; em bancos onde
+    o job ainda não criou o resumo, a mesma agregação calculada dos textos.
+    """
+    if tabela_existe(conn):
+        return tabela
+    por_dia = f"({SQL_AGREGACAO_TEXTOS})"
+    return por_dia if tabela == TABELA_RESUMO else f"({sql_reagrupar(por_dia, dict(NIVEIS)[tabela])})"
+
+
+def criar_tabela(conn: sqlite3.Connection) -> bool:
+    """
+    Cria as tabelas do resumo, preenchidas com os textos já analisados, se
+    ainda não existirem.
+
+    Returns:
+        True se as tabelas foram criadas agora
+    """
+    if tabela_existe(conn):
+        return False
+    for tabela, chave in NIVEIS:
+        conn.execute(f"DROP TABLE IF EXISTS {tabela}")
+        conn.execute(_sql_criar(tabela, chave))
+    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{TABELA_RESUMO}_dia ON {TABELA_RESUMO} (dia, fonte, sentimento)")
+    conn.execute(f"INSERT INTO {TABELA_RESUMO} ({', '.join(COLUNAS)}) {SQL_AGREGACAO_TEXTOS}")
+    for tabela, chave in NIVEIS[1:]:
+        conn.execute(f"INSERT INTO {tabela} ({', '.join(chave + VALORES)}) {sql_reagrupar(TABELA_RESUMO, chave)}")
+    conn.commit()
+    return True
+
+
+def reconstruir(conn: sqlite3.Connection) -> None:
+    """Recalcula o resumo inteiro (ex.: depois de apagar textos fora do job)."""
+    for tabela, _ in NIVEIS:
+        conn.execute(f"DROP TABLE IF EXISTS {tabela}")
+    criar_tabela(conn)
+
+
+def agregar_linhas(conn: sqlite3.Connection, tabela: str, ids: Sequence[int]) -> List[tuple]:
+    """Contribuição atual das linhas ``ids`` para o resumo, nas colunas de ``COLUNAS``."""
+    linhas = []
+    for inicio in range(0, len(ids), IDS_POR_CONSULTA):
+        lote = list(ids[inicio:inicio + IDS_POR_CONSULTA])
+        filtro = f"AND id IN ({', '.join('?' * len(lote))})"
+        linhas.extend(conn.execute(sql_agregacao(tabela, filtro), lote))
+    return linhas
+
+
+def aplicar_lote(conn: sqlite3.Connection, antes: Sequence[tuple], depois: Sequence[tuple]) -> None:
+    """
+    Atualiza o resumo com a diferença entre a contribuição de um lote depois e
+    antes da gravação. Não faz commit (fica na transação do lote).
+    """
+    for tabela, chave in NIVEIS:
+        indices = [COLUNAS.index(coluna) for coluna in chave]
+        deltas: Dict[Tuple, list] = {}
+        for sinal, linhas in ((-1, antes), (1, depois)):
+            for linha in linhas:
+                valores = linha[len(CHAVE):]
+                delta = deltas.setdefault(tuple(linha[i] for i in indices), [0, 0.0, 0, 0.0, 0, None])
+                for i, valor in enumerate(valores[:-1]):
+                    delta[i] += sinal * valor
+                # A última análise só avança; linhas removidas não a recuam
+                ultima = valores[-1]
+                if sinal > 0 and ultima is not None and (delta[-1] is None or str(ultima) > str(delta[-1])):
+                    delta[-1] = ultima
+
+        mudancas = [chave_delta + tuple(delta) for chave_delta, delta in deltas.items()
+                    if any(delta[:-1]) or delta[-1]]
+        if not mudancas:
+            continue
+        conn.executemany(_sql_somar(tabela, chave), mudancas)
+        conn.executemany(_sql_remover_vazias(tabela, chave),
+                         [chave_delta for chave_delta, delta in deltas.items() if delta[0] < 0])
@@ -17,6 +17,12 @@ from datetime import datetime
 from textblob import TextBlob
 import logging
 
+try:
+    from Coleta_de_dados.analise.job_sentimento import MODELO_TEXTBLOB, executar_job_sentimento
+except ImportError:
+    # Executado como script de dentro de Coleta_de_dados/analise
+    from job_sentimento import MODELO_TEXTBLOB, executar_job_sentimento
+
 # Configuração de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -77,10 +83,17 @@ def analisar_sentimento_texto(texto):
         logger.error(f"Erro ao analisar sentimento do texto: {e}")
         return 'neutro', 0.0, 0.0
 
-def analisar_sentimento_textos():
+def analisar_sentimento_textos(reiniciar=False, **opcoes):
     """
     Busca por notícias e posts sem análise de sentimento, calcula o sentimento
     usando TextBlob e atualiza os registros no banco de dados.
+    
+    Executa o JobSentimento: só os textos acima da marca d'água da última
+    execução são lidos, em lotes, pontuados em paralelo e gravados em lote.
+    
+    Args:
+        reiniciar: Reanalisa também pendentes abaixo da marca d'água
+        **opcoes: tamanho_lote, processos (ver JobSentimento)
     """
     db_path = get_db_path()
     
@@ -92,110 +105,26 @@ def analisar_sentimento_textos():
     print(f"🔍 Conectando ao banco: {db_path}")
     
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        resumo = executar_job_sentimento(db_path, MODELO_TEXTBLOB, reiniciar=reiniciar, **opcoes)
+        if resumo is None:
+            print("⏳ Já existe uma análise de sentimento em andamento.")
+            return False
         
-        # Buscar notícias sem análise de sentimento
-        cursor.execute("""
-            SELECT id, titulo, resumo, conteudo_completo 
-            FROM noticias_clubes 
-            WHERE sentimento IS NULL OR score_sentimento IS NULL
-        """)
-        noticias_pendentes = cursor.fetchall()
-        
-        # Buscar posts sem análise de sentimento
-        cursor.execute("""
-            SELECT id, conteudo 
-            FROM posts_redes_sociais 
-            WHERE sentimento IS NULL OR score_sentimento IS NULL
-        """)
-        posts_pendentes = cursor.fetchall()
-        
-        total_itens = len(noticias_pendentes) + len(posts_pendentes)
-        
-        if total_itens == 0:
+        if resumo['total'] == 0:
             print("✅ Nenhum item novo para analisar.")
             return True
         
-        print(f"📊 Encontrados {len(noticias_pendentes)} notícias e {len(posts_pendentes)} posts para análise")
-        
-        # Processar notícias
-        noticias_processadas = 0
-        for noticia_id, titulo, resumo, conteudo_completo in noticias_pendentes:
-            try:
-                # Combinar título, resumo e conteúdo para análise
-                texto_completo = f"{titulo or ''} {resumo or ''} {conteudo_completo or ''}".strip()
-                
-                if not texto_completo:
-                    continue
-                
-                # Analisar sentimento
-                sentimento, score, confianca = analisar_sentimento_texto(texto_completo)
-                
-                # Atualizar banco de dados
-                cursor.execute("""
-                    UPDATE noticias_clubes 
-                    SET sentimento = ?, score_sentimento = ?, 
-                        sentimento_geral = ?, confianca_sentimento = ?,
-                        polaridade = ?, analisado_em = ?, modelo_analise = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (sentimento, score, score, confianca, sentimento, datetime.now(), 'TextBlob', noticia_id))
-                
-                noticias_processadas += 1
-                
-                if noticias_processadas % 10 == 0:
-                    print(f"📰 Processadas {noticias_processadas} notícias...")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao processar notícia {noticia_id}: {e}")
-                continue
-        
-        # Processar posts
-        posts_processados = 0
-        for post_id, conteudo in posts_pendentes:
-            try:
-                if not conteudo or not conteudo.strip():
-                    continue
-                
-                # Analisar sentimento
-                sentimento, score, confianca = analisar_sentimento_texto(conteudo)
-                
-                # Atualizar banco de dados
-                cursor.execute("""
-                    UPDATE posts_redes_sociais 
-                    SET sentimento = ?, score_sentimento = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (sentimento, score, post_id))
-                
-                posts_processados += 1
-                
-                if posts_processados % 10 == 0:
-                    print(f"📱 Processados {posts_processados} posts...")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao processar post {post_id}: {e}")
-                continue
-        
-        # Commit das alterações
-        conn.commit()
-        
         print(f"\n✅ Análise de sentimento concluída!")
         print(f"📊 Resumo:")
-        print(f"   - Notícias processadas: {noticias_processadas}")
-        print(f"   - Posts processados: {posts_processados}")
-        print(f"   - Total: {noticias_processadas + posts_processados}")
+        print(f"   - Notícias processadas: {resumo['noticias_clubes']}")
+        print(f"   - Posts processados: {resumo['posts_redes_sociais']}")
+        print(f"   - Total: {resumo['total']} ({resumo['itens_por_segundo']} itens/s)")
         
         return True
         
     except Exception as e:
         logger.error(f"Erro durante análise de sentimento: {e}")
         return False
-    
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 def obter_estatisticas_sentimento():
     """
@@ -14,9 +14,19 @@ Versão: 1.0
 import sqlite3
 import os
 import re
+from collections import OrderedDict
 from datetime import datetime
+from itertools import chain
 import logging
 
+import numpy as np
+
+try:
+    from Coleta_de_dados.analise.job_sentimento import MODELO_PT, executar_job_sentimento
+except ImportError:
+    # Executado como script de dentro de Coleta_de_dados/analise
+    from job_sentimento import MODELO_PT, executar_job_sentimento
+
 # Configuração de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -41,12 +51,24 @@ def get_db_path():
 class AnalisadorSentimentoPT:
     """Analisador de sentimento para português brasileiro."""
     
-    def __init__(self):
-        """Inicializa o analisador com léxicos de sentimento."""
+    _PALAVRA = re.compile(r'\w+')
+    
+    def __init__(self, tamanho_cache=10000):
+        """
+        Inicializa o analisador com léxicos de sentimento.
+        
+        Args:
+            tamanho_cache: Máximo de textos com resultado em cache
+        """
         self.palavras_positivas = self._carregar_palavras_positivas()
         self.palavras_negativas = self._carregar_palavras_negativas()
         self.palavras_intensificadoras = self._carregar_intensificadores()
         self.palavras_negacao = self._carregar_negacoes()
+        self._compilar_lexico()
+        
+        self.tamanho_cache = tamanho_cache
+        self._cache_resultados = OrderedDict()
+        self._ids_tokens = {}
         
         logger.info(f"Analisador de sentimento inicializado com {len(self.palavras_positivas)} palavras positivas e {len(self.palavras_negativas)} negativas")
     
@@ -121,6 +143,24 @@ class AnalisadorSentimentoPT:
             'impossível', 'inviável', 'irrealizável', 'inconcebível'
         }
     
+    def _compilar_lexico(self):
+        """Mapeia as palavras do léxico para ids inteiros e monta os arrays de pontuação por id."""
+        vocabulario = sorted(self.palavras_positivas | self.palavras_negativas |
+                             self.palavras_intensificadoras | self.palavras_negacao)
+        # id 0 = palavra fora do léxico
+        self._ids_lexico = {palavra: i for i, palavra in enumerate(vocabulario, start=1)}
+        self._polaridade = np.zeros(len(vocabulario) + 1, dtype=np.float64)
+        self._intensificador = np.zeros(len(vocabulario) + 1, dtype=bool)
+        self._negacao = np.zeros(len(vocabulario) + 1, dtype=bool)
+        for palavra, i in self._ids_lexico.items():
+            # Positiva tem precedência sobre negativa, como no if/elif da análise palavra a palavra
+            if palavra in self.palavras_positivas:
+                self._polaridade[i] = 1.0
+            elif palavra in self.palavras_negativas:
+                self._polaridade[i] = -1.0
+            self._intensificador[i] = palavra in self.palavras_intensificadoras
+            self._negacao[i] = palavra in self.palavras_negacao
+    
     def analisar_texto(self, texto):
         """
         Analisa o sentimento de um texto.
@@ -131,74 +171,85 @@ class AnalisadorSentimentoPT:
         Returns:
             tuple: (sentimento, score_sentimento, confianca)
         """
-        if not texto or not isinstance(texto, str):
-            return 'neutro', 0.0, 0.0
-        
-        # Normaliza o texto
-        texto_normalizado = self._normalizar_texto(texto)
-        palavras = texto_normalizado.split()
-        
-        # Conta palavras positivas e negativas
-        palavras_positivas_encontradas = []
-        palavras_negativas_encontradas = []
+        return self.analisar_textos([texto])[0]
+    
+    def analisar_textos(self, textos):
+        """
+        Analisa o sentimento de um lote de textos.
         
-        score_positivo = 0
-        score_negativo = 0
+        Textos repetidos (títulos republicados pelos feeds) são pontuados uma
+        vez e guardados em cache; os demais são pontuados juntos com operações
+        vetorizadas sobre os ids do léxico.
         
-        for i, palavra in enumerate(palavras):
-            palavra_lower = palavra.lower()
-            
-            # Verifica se é uma palavra positiva
-            if palavra_lower in self.palavras_positivas:
-                intensidade = self._calcular_intensidade(palavras, i)
-                score_positivo += intensidade
-                palavras_positivas_encontradas.append(palavra)
+        Args:
+            textos: Lista de textos
             
-            # Verifica se é uma palavra negativa
-            elif palavra_lower in self.palavras_negativas:
-                intensidade = self._calcular_intensidade(palavras, i)
-                score_negativo += intensidade
-                palavras_negativas_encontradas.append(palavra)
-        
-        # Calcula score final
-        score_final = score_positivo - score_negativo
-        
-        # Classifica o sentimento
-        sentimento = self._classificar_sentimento(score_final)
-        
-        # Calcula confiança baseada na quantidade de palavras encontradas
-        total_palavras_sentimento = len(palavras_positivas_encontradas) + len(palavras_negativas_encontradas)
-        confianca = min(1.0, total_palavras_sentimento / 10)  # Máximo 100% de confiança
-        
-        return sentimento, score_final, confianca
+        Returns:
+            list: (sentimento, score_sentimento, confianca) para cada texto, na mesma ordem
+        """
+        resultados = [None] * len(textos)
+        pendentes = {}
+        
+        for i, texto in enumerate(textos):
+            if not texto or not isinstance(texto, str):
+                resultados[i] = ('neutro', 0.0, 0.0)
+            elif texto in self._cache_resultados:
+                self._cache_resultados.move_to_end(texto)
+                resultados[i] = self._cache_resultados[texto]
+            else:
+                pendentes.setdefault(texto, []).append(i)
+        
+        if pendentes:
+            unicos = list(pendentes)
+            for texto, resultado in zip(unicos, self._pontuar_lote(unicos)):
+                self._cache_resultados[texto] = resultado
+                for i in pendentes[texto]:
+                    resultados[i] = resultado
+            while len(self._cache_resultados) > self.tamanho_cache:
+                self._cache_resultados.popitem(last=False)
+        
+        return resultados
     
-    def _normalizar_texto(self, texto):
-        """Normaliza o texto para análise."""
-        # Remove caracteres especiais e emojis
-        texto = re.sub(r'[^\w\s]', ' ', texto)
-        # Remove múltiplos espaços
-        texto = re.sub(r'\s+', ' ', texto)
-        # Remove espaços no início e fim
-        texto = texto.strip()
-        return texto
+    def _ids_texto(self, texto):
+        """Tokeniza o texto e converte cada palavra no id do léxico (0 se ausente)."""
+        # \w+ produz os mesmos tokens que trocar [^\w\s] por espaço e dividir nos espaços
+        tokens = self._PALAVRA.findall(texto)
+        ids = list(map(self._ids_tokens.get, tokens))
+        if None in ids:
+            if len(self._ids_tokens) > self.tamanho_cache * 10:
+                self._ids_tokens.clear()
+            for i, token in enumerate(tokens):
+                if ids[i] is None:
+                    ids[i] = self._ids_tokens[token] = self._ids_lexico.get(token.lower(), 0)
+        return ids
     
-    def _calcular_intensidade(self, palavras, indice):
-        """Calcula a intensidade de uma palavra baseada no contexto."""
-        intensidade = 1.0
-        
-        # Verifica intensificadores anteriores
-        if indice > 0:
-            palavra_anterior = palavras[indice - 1].lower()
-            if palavra_anterior in self.palavras_intensificadoras:
-                intensidade *= 2.0
-        
-        # Verifica negações
-        if indice > 0:
-            palavra_anterior = palavras[indice - 1].lower()
-            if palavra_anterior in self.palavras_negacao:
-                intensidade *= -1.0
-        
-        return intensidade
+    def _pontuar_lote(self, textos):
+        """Pontua textos já deduplicados; todas as palavras do lote num único array."""
+        ids_por_texto = [self._ids_texto(texto) for texto in textos]
+        tamanhos = np.fromiter(map(len, ids_por_texto), dtype=np.intp, count=len(textos))
+        ids = np.fromiter(chain.from_iterable(ids_por_texto), dtype=np.intp, count=int(tamanhos.sum()))
+        texto_de = np.repeat(np.arange(len(textos)), tamanhos)
+        
+        # Palavra anterior de cada posição (deslocamento de 1), sem atravessar o início de cada texto
+        anterior = np.zeros_like(ids)
+        anterior[1:] = ids[:-1]
+        inicios = np.cumsum(tamanhos) - tamanhos
+        anterior[inicios[tamanhos > 0]] = 0
+        
+        intensidade = (np.where(self._intensificador[anterior], 2.0, 1.0) *
+                       np.where(self._negacao[anterior], -1.0, 1.0))
+        polaridade = self._polaridade[ids]
+        # Pesos inteiros pequenos: a soma é exata, igual à acumulada palavra a palavra
+        scores = np.bincount(texto_de, weights=polaridade * intensidade, minlength=len(textos))
+        encontradas = np.bincount(texto_de, weights=polaridade != 0, minlength=len(textos)).astype(int)
+        
+        resultados = []
+        for score, total_palavras_sentimento in zip(scores.tolist(), encontradas.tolist()):
+            # Sem palavras de sentimento o score é o inteiro 0, como na soma original
+            score_final = score if total_palavras_sentimento else 0
+            confianca = min(1.0, total_palavras_sentimento / 10)  # Máximo 100% de confiança
+            resultados.append((self._classificar_sentimento(score_final), score_final, confianca))
+        return resultados
     
     def _classificar_sentimento(self, score):
         """Classifica o sentimento baseado no score."""
@@ -213,10 +264,17 @@ class AnalisadorSentimentoPT:
         else:
             return 'neutro'
 
-def analisar_sentimento_textos():
+def analisar_sentimento_textos(reiniciar=False, **opcoes):
     """
     Busca por notícias e posts sem análise de sentimento, calcula o sentimento
     usando o analisador personalizado para português e atualiza os registros no banco de dados.
+    
+    Executa o JobSentimento: só os textos acima da marca d'água da última
+    execução são lidos, em lotes, pontuados em paralelo e gravados em lote.
+    
+    Args:
+        reiniciar: Reanalisa também pendentes abaixo da marca d'água
+        **opcoes: tamanho_lote, processos (ver JobSentimento)
     """
     db_path = get_db_path()
     
@@ -228,113 +286,26 @@ def analisar_sentimento_textos():
     print(f"🔍 Conectando ao banco: {db_path}")
     
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Inicializar analisador
-        analisador = AnalisadorSentimentoPT()
+        resumo = executar_job_sentimento(db_path, MODELO_PT, reiniciar=reiniciar, **opcoes)
+        if resumo is None:
+            print("⏳ Já existe uma análise de sentimento em andamento.")
+            return False
         
-        # Buscar notícias sem análise de sentimento
-        cursor.execute("""
-            SELECT id, titulo, resumo, conteudo_completo 
-            FROM noticias_clubes 
-            WHERE sentimento IS NULL OR score_sentimento IS NULL
-        """)
-        noticias_pendentes = cursor.fetchall()
-        
-        # Buscar posts sem análise de sentimento
-        cursor.execute("""
-            SELECT id, conteudo 
-            FROM posts_redes_sociais 
-            WHERE sentimento IS NULL OR score_sentimento IS NULL
-        """)
-        posts_pendentes = cursor.fetchall()
-        
-        total_itens = len(noticias_pendentes) + len(posts_pendentes)
-        
-        if total_itens == 0:
+        if resumo['total'] == 0:
             print("✅ Nenhum item novo para analisar.")
             return True
         
-        print(f"📊 Encontrados {len(noticias_pendentes)} notícias e {len(posts_pendentes)} posts para análise")
-        
-        # Processar notícias
-        noticias_processadas = 0
-        for noticia_id, titulo, resumo, conteudo_completo in noticias_pendentes:
-            try:
-                # Combinar título, resumo e conteúdo para análise
-                texto_completo = f"{titulo or ''} {resumo or ''} {conteudo_completo or ''}".strip()
-                
-                if not texto_completo:
-                    continue
-                
-                # Analisar sentimento
-                sentimento, score, confianca = analisador.analisar_texto(texto_completo)
-                
-                # Atualizar banco de dados
-                cursor.execute("""
-                    UPDATE noticias_clubes 
-                    SET sentimento = ?, score_sentimento = ?, 
-                        sentimento_geral = ?, confianca_sentimento = ?,
-                        polaridade = ?, analisado_em = ?, modelo_analise = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (sentimento, score, score, confianca, sentimento, datetime.now(), 'AnalisadorSentimentoPT', noticia_id))
-                
-                noticias_processadas += 1
-                
-                if noticias_processadas % 10 == 0:
-                    print(f"📰 Processadas {noticias_processadas} notícias...")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao processar notícia {noticia_id}: {e}")
-                continue
-        
-        # Processar posts
-        posts_processados = 0
-        for post_id, conteudo in posts_pendentes:
-            try:
-                if not conteudo or not conteudo.strip():
-                    continue
-                
-                # Analisar sentimento
-                sentimento, score, confianca = analisador.analisar_texto(conteudo)
-                
-                # Atualizar banco de dados
-                cursor.execute("""
-                    UPDATE posts_redes_sociais 
-                    SET sentimento = ?, score_sentimento = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (sentimento, score, post_id))
-                
-                posts_processados += 1
-                
-                if posts_processados % 10 == 0:
-                    print(f"📱 Processados {posts_processados} posts...")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao processar post {post_id}: {e}")
-                continue
-        
-        # Commit das alterações
-        conn.commit()
-        
         print(f"\n✅ Análise de sentimento concluída!")
         print(f"📊 Resumo:")
-        print(f"   - Notícias processadas: {noticias_processadas}")
-        print(f"   - Posts processados: {posts_processados}")
-        print(f"   - Total: {noticias_processadas + posts_processados}")
+        print(f"   - Notícias processadas: {resumo['noticias_clubes']}")
+        print(f"   - Posts processados: {resumo['posts_redes_sociais']}")
+        print(f"   - Total: {resumo['total']} ({resumo['itens_por_segundo']} itens/s)")
         
         return True
         
     except Exception as e:
         logger.error(f"Erro durante análise de sentimento: {e}")
         return False
-    
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 def obter_estatisticas_sentimento():
     """
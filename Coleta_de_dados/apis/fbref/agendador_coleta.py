@@ -0,0 +1,404 @@
+"""
+AGENDADOR DE COLETA EM PIPELINE - FBREF
+=======================================
+
+Agendador de crawl que separa a coleta de páginas em três etapas ligadas por
+filas limitadas, para que o parsing (CPU) e a gravação no banco se sobreponham
+à espera da rede:
+
+    busca (N workers async) -> parsing (M threads) -> persistência (1 thread)
+
+- O ritmo das requisições é definido por host pela ``Anti429StateMachine``
+  (delay de cada estado, Retry-After e parada em HALTED) em vez de uma pausa
+  fixa entre partidas
+- As filas limitadas aplicam contrapressão: se o banco ou o parsing atrasarem,
+  a busca para de adiantar páginas
+- A persistência roda sempre na mesma thread, então recursos como conexões
+  sqlite3 podem ser criados e usados nela (``iniciar_persistencia``)
+- As páginas passam pelo ``CachePaginas``, como em ``fazer_requisicao``: uma
+  página fresca no cache não consome requisição nem o ritmo do host, uma
+  vencida é revalidada com If-None-Match/If-Modified-Since (304 reaproveita o
+  HTML) e, se a busca falhar de vez, a cópia vencida é usada
+
+Uso:
+    agendador = AgendadorColeta(processar=extrair, persistir=gravar)
+    resumo = await agendador.executar([(partida_id, url), ...])
+    resumo = executar_sincrono(agendador.executar(itens))  # em código síncrono
+
+Autor: Sistema de Coleta de Dados
+Data: 2025-08-15
+Versão: 1.0
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple, TypeVar
+from urllib.parse import urlparse
+
+import aiohttp
+
+from .anti_429_state_machine import Anti429StateMachine
+from .browser_emulation_headers import BrowserEmulationHeaders
+from .cache_paginas import CachePaginas, EntradaCache, get_cache_paginas, pagina_valida
+
+logger = logging.getLogger(__name__)
+
+_FIM = object()
+
+T = TypeVar('T')
+
+
+def executar_sincrono(corrotina: Awaitable[T]) -> T:
+    """
+    Executa a corrotina a partir de código síncrono e retorna o resultado.
+
+    Chamado de dentro de um loop em execução (ex.: endpoint async), usa um loop
+    próprio em outra thread em vez de falhar no ``asyncio.run``.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(corrotina)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, corrotina).result()
+
+
+@dataclass
+class PaginaColetada:
+    """Página que percorre as etapas do pipeline."""
+    item: Any
+    url: str
+    status: Optional[int] = None
+    html: Optional[str] = None
+    dados: Any = None
+    erro: str = ""
+    tentativas: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.erro
+
+
+class RitmoHost:
+    """Ritmo de requisições de um host, governado pela Anti429StateMachine."""
+
+    def __init__(self, maquina: Optional[Anti429StateMachine] = None, max_simultaneas: int = 1):
+        self.maquina = maquina or Anti429StateMachine()
+        self.simultaneas = asyncio.Semaphore(max(1, max_simultaneas))
+        self._proximo_envio = 0.0
+        self._lock = asyncio.Lock()
+
+    async def aguardar_vez(self):
+        """Espera o intervalo do estado atual desde o envio anterior."""
+        async with self._lock:
+            espera = self._proximo_envio - time.monotonic()
+            if espera > 0:
+                await asyncio.sleep(espera)
+            self._proximo_envio = time.monotonic() + self.maquina.get_wait_time()
+
+    def adiar(self, segundos: float):
+        """Empurra o próximo envio (ex.: Retry-After de um 429)."""
+        self._proximo_envio = max(self._proximo_envio, time.monotonic() + segundos)
+
+
+class AgendadorColeta:
+    """
+    Pipeline busca -> parsing -> persistência com filas limitadas.
+
+    Args:
+        processar: ``processar(pagina) -> dados``; roda em threads de parsing.
+            Exceções marcam a página com erro
+        persistir: ``persistir(pagina)``; roda na thread de persistência para
+            toda página, com sucesso ou com erro
+        buscadores: Requisições em andamento no total
+        parsers: Threads de parsing
+        capacidade_fila: Tamanho máximo das filas entre etapas
+        max_simultaneas_host: Requisições simultâneas por host
+        max_tentativas: Tentativas por página após 429/erro de conexão
+        iniciar_persistencia / finalizar_persistencia: Chamadas na thread de
+            persistência antes da primeira e depois da última página
+        buscar: ``async buscar(sessao, url, condicionais) -> (status, headers, html)``,
+            com ``condicionais`` os cabeçalhos de revalidação da cópia em cache
+            (padrão: GET com cabeçalhos de navegador)
+        criar_maquina: Fábrica da máquina de estados de cada host
+        usar_cache: Buscar as páginas pelo cache de páginas
+        cache: Cache usado (padrão: ``get_cache_paginas()``)
+    """
+
+    def __init__(
+        self,
+        processar: Callable[[PaginaColetada], Any],
+        persistir: Callable[[PaginaColetada], None],
+        buscadores: int = 4,
+        parsers: int = 2,
+        capacidade_fila: int = 8,
+        max_simultaneas_host: int = 2,
+        max_tentativas: int = 2,
+        timeout: float = 30.0,
+        iniciar_persistencia: Optional[Callable[[], None]] = None,
+        finalizar_persistencia: Optional[Callable[[Optional[BaseException]], None]] = None,
+        buscar: Optional[Callable] = None,
+        criar_maquina: Callable[[], Anti429StateMachine] = Anti429StateMachine,
+        usar_cache: bool = True,
+        cache: Optional[CachePaginas] = None
+    ):
+        self.processar = processar
+        self.persistir = persistir
+        self.buscadores = max(1, buscadores)
+        self.parsers = max(1, parsers)
+        self.capacidade_fila = max(1, capacidade_fila)
+        self.max_simultaneas_host = max_simultaneas_host
+        self.max_tentativas = max(1, max_tentativas)
+        self.timeout = timeout
+        self.iniciar_persistencia = iniciar_persistencia
+        self.finalizar_persistencia = finalizar_persistencia
+        self.buscar = buscar or self._buscar_http
+        self.criar_maquina = criar_maquina
+        self.cache = (cache or get_cache_paginas()) if usar_cache else None
+
+        self.hosts: Dict[str, RitmoHost] = {}
+        self._cabecalhos = BrowserEmulationHeaders()
+        self.resumo: Dict[str, int] = {}
+
+    def _ritmo(self, url: str) -> RitmoHost:
+        host = urlparse(url).hostname or ""
+        ritmo = self.hosts.get(host)
+        if ritmo is None:
+            ritmo = self.hosts[host] = RitmoHost(self.criar_maquina(), self.max_simultaneas_host)
+        return ritmo
+
+    async def _buscar_http(self, sessao: aiohttp.ClientSession, url: str,
+                           condicionais: Dict[str, str]) -> Tuple[int, Dict[str, str], str]:
+        cabecalhos = self._cabecalhos.get_headers_for_fbref(url)
+        # O aiohttp negocia a compressão que suporta
+        cabecalhos.pop('Accept-Encoding', None)
+        cabecalhos.update(condicionais)
+        async with sessao.get(url, headers=cabecalhos) as resposta:
+            return resposta.status, dict(resposta.headers), await resposta.text()
+
+    async def _consultar_cache(self, pagina: PaginaColetada, maquina: Anti429StateMachine) -> Optional[EntradaCache]:
+        """Cópia da página no cache (fresca ou vencida), registrando hit/miss."""
+        if self.cache is None:
+            return None
+        try:
+            entrada = await asyncio.to_thread(self.cache.obter, pagina.url)
+        except Exception as e:
+            logger.warning(f"Cache de páginas indisponível: {e}")
+            return None
+        if entrada is not None and entrada.fresca:
+            self.cache.registrar_hit()
+            maquina.record_cache_hit(pagina.url)
+        else:
+            self.cache.registrar_miss()
+            maquina.record_cache_miss(pagina.url)
+        return entrada
+
+    async def _atualizar_cache(self, metodo: Callable, url: str, cabecalhos: Dict[str, str]) -> None:
+        try:
+            await asyncio.to_thread(metodo, url, cabecalhos)
+        except Exception as e:
+            logger.warning(f"Erro ao atualizar cache de páginas para {url}: {e}")
+
+    async def _buscar_pagina(self, sessao: aiohttp.ClientSession, pagina: PaginaColetada) -> bool:
+        """Busca a página (cache ou rede) respeitando o ritmo do host; False se deve tentar de novo."""
+        ritmo = self._ritmo(pagina.url)
+        entrada = await self._consultar_cache(pagina, ritmo.maquina)
+        if entrada is not None and entrada.fresca:
+            pagina.status, pagina.html = 200, entrada.html
+            return True
+
+        concluida = await self._buscar_na_rede(sessao, pagina, ritmo, entrada)
+        if concluida and pagina.erro and entrada is not None:
+            # Falha definitiva: uma cópia vencida do cache é melhor que nada
+            logger.warning(f"Busca falhou ({pagina.erro}) - usando cópia vencida do cache: {pagina.url}")
+            self.cache.registrar_obsoleta_servida()
+            pagina.html, pagina.erro = entrada.html, ""
+        return concluida
+
+    async def _buscar_na_rede(self, sessao: aiohttp.ClientSession, pagina: PaginaColetada,
+                              ritmo: RitmoHost, entrada: Optional[EntradaCache]) -> bool:
+        maquina = ritmo.maquina
+        if not maquina.should_continue_scraping():
+            pagina.erro = f"coleta interrompida ({maquina.get_current_state().value})"
+            return True
+
+        condicionais = entrada.cabecalhos_condicionais() if entrada is not None else {}
+        async with ritmo.simultaneas:
+            await ritmo.aguardar_vez()
+            pagina.tentativas += 1
+            try:
+                status, cabecalhos, html = await self.buscar(sessao, pagina.url, condicionais)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                maquina.record_connection_error(pagina.url, type(e).__name__)
+                pagina.erro = f"erro de conexão: {e!r}"
+                return pagina.tentativas >= self.max_tentativas
+
+        pagina.status = status
+        if status == 304 and entrada is not None:
+            maquina.record_success(pagina.url)
+            maquina.record_cache_revalidation(pagina.url)
+            await self._atualizar_cache(self.cache.revalidada, pagina.url, cabecalhos)
+            pagina.html = entrada.html
+            return True
+
+        if status == 200:
+            maquina.record_success(pagina.url)
+            if self.cache is not None and pagina_valida(html):
+                await self._atualizar_cache(
+                    lambda url, cabecalhos: self.cache.armazenar(url, html, cabecalhos), pagina.url, cabecalhos
+                )
+            pagina.html = html
+            return True
+
+        if status == 429:
+            retry_after = cabecalhos.get('Retry-After', '')
+            retry_after = int(retry_after) if retry_after.isdigit() else None
+            maquina.record_429_error(pagina.url, retry_after)
+            if retry_after:
+                ritmo.adiar(retry_after)
+            if maquina.get_current_state().value == "RECONFIGURING":
+                maquina.request_identity_change()
+                self._cabecalhos.reset_session()
+        elif status >= 500:
+            maquina.record_connection_error(pagina.url, f"HTTP_{status}")
+
+        pagina.erro = f"HTTP {status}"
+        temporario = status == 429 or status >= 500
+        return not temporario or pagina.tentativas >= self.max_tentativas
+
+    async def _etapa_busca(self, sessao, entrada: asyncio.Queue, fila_parse: asyncio.Queue):
+        while True:
+            pagina = await entrada.get()
+            try:
+                concluida = await self._buscar_pagina(sessao, pagina)
+                if concluida:
+                    await fila_parse.put(pagina)
+                else:
+                    # Volta para o fim da fila; o host já está em backoff
+                    pagina.erro = ""
+                    entrada.put_nowait(pagina)
+            except Exception as e:
+                logger.error(f"Erro inesperado ao buscar {pagina.url}: {e}")
+                pagina.erro = str(e)
+                await fila_parse.put(pagina)
+            finally:
+                entrada.task_done()
+
+    def _processar(self, pagina: PaginaColetada) -> PaginaColetada:
+        if pagina.ok:
+            try:
+                pagina.dados = self.processar(pagina)
+            except Exception as e:
+                logger.error(f"Erro ao processar {pagina.url}: {e}")
+                pagina.erro = f"erro de parsing: {e}"
+        # O HTML não é mais necessário; libera memória antes da fila de persistência
+        pagina.html = None
+        return pagina
+
+    async def _etapa_parse(self, executor, fila_parse: asyncio.Queue, fila_persistencia: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            pagina = await fila_parse.get()
+            if pagina is _FIM:
+                return
+            await fila_persistencia.put(await loop.run_in_executor(executor, self._processar, pagina))
+
+    def _persistir(self, pagina: PaginaColetada):
+        try:
+            self.persistir(pagina)
+            self.resumo['persistidas'] += 1
+        except Exception as e:
+            logger.error(f"Erro ao persistir {pagina.url}: {e}")
+            self.resumo['erros_persistencia'] += 1
+        chave = 'sucesso' if pagina.ok else 'com_erro'
+        self.resumo[chave] += 1
+
+    async def _etapa_persistencia(self, executor, fila_persistencia: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        erro: Optional[BaseException] = None
+        if self.iniciar_persistencia:
+            await loop.run_in_executor(executor, self.iniciar_persistencia)
+        try:
+            while True:
+                pagina = await fila_persistencia.get()
+                if pagina is _FIM:
+                    return
+                await loop.run_in_executor(executor, self._persistir, pagina)
+        except BaseException as e:
+            erro = e
+            raise
+        finally:
+            if self.finalizar_persistencia:
+                await loop.run_in_executor(executor, self.finalizar_persistencia, erro)
+
+    async def _buscar_e_processar(self, entrada: asyncio.Queue, executor, fila_persistencia: asyncio.Queue):
+        """Etapas de busca e parsing; termina enviando o fim à persistência."""
+        fila_parse: asyncio.Queue = asyncio.Queue(self.capacidade_fila)
+        parsers = [
+            asyncio.create_task(self._etapa_parse(executor, fila_parse, fila_persistencia))
+            for _ in range(self.parsers)
+        ]
+        try:
+            conector = aiohttp.TCPConnector(limit=self.buscadores, ttl_dns_cache=300)
+            async with aiohttp.ClientSession(
+                connector=conector, timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as sessao:
+                buscadores = [
+                    asyncio.create_task(self._etapa_busca(sessao, entrada, fila_parse))
+                    for _ in range(self.buscadores)
+                ]
+                try:
+                    # Termina a busca quando todas as páginas (e novas tentativas) saírem da fila
+                    await entrada.join()
+                finally:
+                    for tarefa in buscadores:
+                        tarefa.cancel()
+                    await asyncio.gather(*buscadores, return_exceptions=True)
+
+            for _ in parsers:
+                await fila_parse.put(_FIM)
+            await asyncio.gather(*parsers)
+        finally:
+            for tarefa in parsers:
+                tarefa.cancel()
+        await fila_persistencia.put(_FIM)
+
+    async def executar(self, itens: Iterable[Tuple[Any, str]]) -> Dict[str, int]:
+        """
+        Coleta todas as páginas e retorna o resumo da execução.
+
+        Args:
+            itens: Pares (item, url); ``item`` é repassado ao processar/persistir
+        """
+        self.resumo = {'total': 0, 'sucesso': 0, 'com_erro': 0, 'persistidas': 0, 'erros_persistencia': 0}
+        entrada: asyncio.Queue = asyncio.Queue()
+        for item, url in itens:
+            entrada.put_nowait(PaginaColetada(item=item, url=url))
+            self.resumo['total'] += 1
+
+        fila_persistencia: asyncio.Queue = asyncio.Queue(self.capacidade_fila)
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(self.parsers, thread_name_prefix="coleta-parse") as executor_parse, \
+                ThreadPoolExecutor(1, thread_name_prefix="coleta-persistencia") as executor_persistencia:
+            etapas = (
+                asyncio.create_task(self._buscar_e_processar(entrada, executor_parse, fila_persistencia)),
+                asyncio.create_task(self._etapa_persistencia(executor_persistencia, fila_persistencia)),
+            )
+            await asyncio.wait(etapas, return_when=asyncio.FIRST_EXCEPTION)
+            # Uma etapa que falha interrompe a outra (evita esperar numa fila que não anda)
+            falha = next((t.exception() for t in etapas if t.done() and not t.cancelled() and t.exception()), None)
+            if falha is not None:
+                for tarefa in etapas:
+                    tarefa.cancel()
+                await asyncio.gather(*etapas, return_exceptions=True)
+                raise falha
+
+        self.resumo['segundos'] = round(time.perf_counter() - inicio, 2)
+        logger.info(
+            f"Coleta em pipeline concluída: {self.resumo['sucesso']}/{self.resumo['total']} páginas "
+            f"em {self.resumo['segundos']}s"
+        )
+        return self.resumo
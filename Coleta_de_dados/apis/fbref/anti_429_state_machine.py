@@ -33,6 +33,9 @@ class StateMetrics:
     current_delay: float = 2.0
     consecutive_failures: int = 0
     identity_changes: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_revalidations: int = 0
 
 class Anti429StateMachine:
     """
@@ -111,6 +114,19 @@ class Anti429StateMachine:
         
         logger.debug(f"Sucesso registrado: {url} (total: {self.metrics.requests_made})")
     
+    def record_cache_hit(self, url: str):
+        """Registra página servida do cache local (sem requisição)."""
+        self.metrics.cache_hits += 1
+        logger.debug(f"Cache hit: {url}")
+    
+    def record_cache_miss(self, url: str):
+        """Registra página ausente ou vencida no cache local."""
+        self.metrics.cache_misses += 1
+    
+    def record_cache_revalidation(self, url: str):
+        """Registra 304: página do cache revalidada sem novo download."""
+        self.metrics.cache_revalidations += 1
+    
     def record_429_error(self, url: str, retry_after: Optional[int] = None):
         """Registra erro 429 (rate limiting)."""
         self.metrics.errors_429 += 1
@@ -240,6 +256,9 @@ class Anti429StateMachine:
             'consecutive_failures': self.metrics.consecutive_failures,
             'identity_changes': self.metrics.identity_changes,
             'current_delay': self.metrics.current_delay,
+            'cache_hits': self.metrics.cache_hits,
+            'cache_misses': self.metrics.cache_misses,
+            'cache_revalidations': self.metrics.cache_revalidations,
             'last_success': self.metrics.last_success.isoformat() if self.metrics.last_success else None,
             'last_error': self.metrics.last_error.isoformat() if self.metrics.last_error else None,
             'should_continue': self.should_continue_scraping()
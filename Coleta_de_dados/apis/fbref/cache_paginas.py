@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Cache persistente de páginas do FBRef com revalidação condicional.
+
+As páginas baixadas ficam em disco, comprimidas e endereçadas pelo conteúdo
+(SHA-256), com um índice SQLite por URL guardando ETag, Last-Modified e a data
+da última validação:
+
+- Dentro do prazo de frescor da classe da URL, a página é servida do disco sem
+  requisição (e sem consumir o orçamento de rate limiting)
+- Vencido o prazo, a requisição leva If-None-Match/If-Modified-Since; um 304
+  renova a entrada sem baixar a página de novo
+- Temporadas encerradas nunca mudam e não expiram; agendas da temporada atual
+  expiram em minutos
+- O tamanho total dos arquivos é limitado; as páginas acessadas há mais tempo
+  são removidas primeiro
+- Páginas de bloqueio (captcha, rate limit) e corpos quase vazios não entram no
+  cache; ver ``pagina_valida``
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Mapping, Optional, Pattern, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+CACHE_DIR = os.path.join(PROJECT_ROOT, 'cache_fbref', 'paginas')
+TAMANHO_MAXIMO = 512 * 1024 * 1024  # 512 MB comprimidos
+TTL_PADRAO = 6 * 3600
+
+# (classe, padrão da URL, prazo de frescor em segundos; None = nunca expira).
+# A primeira que casar vale; temporadas encerradas são tratadas antes.
+POLITICAS_PADRAO: Tuple[Tuple[str, str, Optional[float]], ...] = (
+    ('agenda', r'/schedule/|Scores-and-Fixtures|/fixtures/', 30 * 60),
+    ('partida', r'/en/matches/', 24 * 3600),
+    ('historico', r'/history/', 7 * 24 * 3600),
+    ('competicao', r'/en/comps/', 24 * 3600),
+)
+
+_RE_TEMPORADA = re.compile(r'/(\d{4})(?:-(\d{4}))?/')
+
+# Texto visível mínimo de uma página útil (mesmo critério do content_received do fbref_utils)
+TEXTO_MINIMO = 100
+_RE_SEM_TEXTO = re.compile(r'<(script|style)\b.*?</\1\s*>|<!--.*?-->|<[^>]+>', re.S | re.I)
+_RE_BLOQUEIO = re.compile(
+    r'captcha|just a moment\.\.\.|access denied|too many requests|rate limited', re.I
+)
+
+
+def pagina_valida(html: str) -> bool:
+    """Indica se o HTML de uma resposta 200 pode ser armazenado (não é bloqueio nem quase vazio)."""
+    if not html:
+        return False
+    texto = ' '.join(_RE_SEM_TEXTO.sub(' ', html).split())
+    return len(texto) > TEXTO_MINIMO and not _RE_BLOQUEIO.search(texto[:2000])
+
+
+@dataclass
+class EntradaCache:
+    """Página armazenada no cache."""
+    url: str
+    html: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    validado_em: float
+    classe: str
+    ttl: Optional[float]
+
+    @property
+    def fresca(self) -> bool:
+        return self.ttl is None or time.time() - self.validado_em < self.ttl
+
+    def cabecalhos_condicionais(self) -> Dict[str, str]:
+        """Cabeçalhos para revalidar a página com o servidor."""
+        cabecalhos = {}
+        if self.etag:
+            cabecalhos['If-None-Match'] = self.etag
+        if self.last_modified:
+            cabecalhos['If-Modified-Since'] = self.last_modified
+        return cabecalhos
+
+
+class CachePaginas:
+    """
+    Cache de páginas em disco, endereçado pelo conteúdo e limitado em tamanho.
+
+    Args:
+        diretorio: Diretório do índice e dos arquivos comprimidos
+        tamanho_maximo: Limite, em bytes, dos arquivos comprimidos
+        politicas: Sequência (classe, regex, ttl) avaliada em ordem
+        ttl_padrao: Prazo de frescor das URLs sem política
+    """
+
+    def __init__(
+        self,
+        diretorio: str = CACHE_DIR,
+        tamanho_maximo: int = TAMANHO_MAXIMO,
+        politicas: Sequence[Tuple[str, str, Optional[float]]] = POLITICAS_PADRAO,
+        ttl_padrao: Optional[float] = TTL_PADRAO
+    ):
+        self.diretorio = diretorio
+        self.tamanho_maximo = tamanho_maximo
+        self.politicas: Tuple[Tuple[str, Pattern, Optional[float]], ...] = tuple(
+            (classe, re.compile(padrao), ttl) for classe, padrao, ttl in politicas
+        )
+        self.ttl_padrao = ttl_padrao
+        self.contadores = {'hits': 0, 'misses': 0, 'revalidadas': 0, 'obsoletas_servidas': 0, 'removidas': 0}
+
+        os.makedirs(os.path.join(diretorio, 'objetos'), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(diretorio, 'indice.db'), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS paginas (
+                url TEXT PRIMARY KEY,
+                sha256 TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                validado_em REAL NOT NULL,
+                acessado_em REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS objetos (
+                sha256 TEXT PRIMARY KEY,
+                tamanho INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_paginas_acessado_em ON paginas (acessado_em);
+            CREATE INDEX IF NOT EXISTS idx_paginas_sha256 ON paginas (sha256);
+        """)
+
+    # ------------------------------------------------------------------
+    # Políticas de frescor
+    # ------------------------------------------------------------------
+
+    def politica(self, url: str) -> Tuple[str, Optional[float]]:
+        """Retorna (classe, ttl) da URL; ttl None indica página imutável."""
+        ano_atual = datetime.now().year
+        for inicio, fim in _RE_TEMPORADA.findall(url):
+            # "2022-2023" ou "2022": encerrada se terminou antes do ano atual
+            if int(fim or inicio) < ano_atual:
+                return 'temporada_encerrada', None
+        for classe, padrao, ttl in self.politicas:
+            if padrao.search(url):
+                return classe, ttl
+        return 'padrao', self.ttl_padrao
+
+    # ------------------------------------------------------------------
+    # Armazenamento
+    # ------------------------------------------------------------------
+
+    def _caminho_objeto(self, sha256: str) -> str:
+        return os.path.join(self.diretorio, 'objetos', sha256[:2], f'{sha256}.html.gz')
+
+    def _ler_objeto(self, sha256: str) -> Optional[str]:
+        try:
+            with gzip.open(self._caminho_objeto(sha256), 'rt', encoding='utf-8') as arquivo:
+                return arquivo.read()
+        except (OSError, EOFError) as e:
+            logger.warning(f"Objeto {sha256[:12]} do cache ilegível: {e}")
+            return None
+
+    def obter(self, url: str) -> Optional[EntradaCache]:
+        """
+        Retorna a página armazenada para a URL (fresca ou não), ou None.
+
+        Não altera os contadores; use ``registrar_hit``/``registrar_miss``.
+        """
+        with self._lock:
+            linha = self._conn.execute(
+                "SELECT sha256, etag, last_modified, validado_em FROM paginas WHERE url = ?", (url,)
+            ).fetchone()
+            if linha is None:
+                return None
+            sha256, etag, last_modified, validado_em = linha
+            html = self._ler_objeto(sha256)
+            if html is None:
+                self._conn.execute("DELETE FROM paginas WHERE url = ?", (url,))
+                return None
+            self._conn.execute("UPDATE paginas SET acessado_em = ? WHERE url = ?", (time.time(), url))
+
+        classe, ttl = self.politica(url)
+        return EntradaCache(url, html, etag, last_modified, validado_em, classe, ttl)
+
+    def armazenar(self, url: str, html: str, cabecalhos: Optional[Mapping[str, str]] = None) -> bool:
+        """
+        Armazena a página baixada (resposta 200) com seus validadores.
+
+        Páginas que nunca expiram só são aceitas se ``pagina_valida``: um bloqueio
+        guardado como imutável seria servido para sempre. Retorna se armazenou.
+        """
+        if self.politica(url)[1] is None and not pagina_valida(html):
+            logger.warning(f"Página imutável recusada pelo cache (bloqueio ou conteúdo curto): {url}")
+            return False
+        cabecalhos = cabecalhos or {}
+        conteudo = html.encode('utf-8')
+        sha256 = hashlib.sha256(conteudo).hexdigest()
+        caminho = self._caminho_objeto(sha256)
+        agora = time.time()
+
+        with self._lock:
+            if not os.path.exists(caminho):
+                os.makedirs(os.path.dirname(caminho), exist_ok=True)
+                temporario = f'{caminho}.{threading.get_ident()}.tmp'
+                with open(temporario, 'wb') as arquivo:
+                    arquivo.write(gzip.compress(conteudo, compresslevel=6))
+                os.replace(temporario, caminho)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO objetos (sha256, tamanho) VALUES (?, ?)",
+                    (sha256, os.path.getsize(caminho))
+                )
+
+            anterior = self._conn.execute("SELECT sha256 FROM paginas WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                """INSERT OR REPLACE INTO paginas (url, sha256, etag, last_modified, validado_em, acessado_em)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (url, sha256, cabecalhos.get('ETag'), cabecalhos.get('Last-Modified'), agora, agora)
+            )
+            if anterior and anterior[0] != sha256:
+                self._remover_objeto_sem_referencia(anterior[0])
+            self._limitar_tamanho()
+        return True
+
+    def revalidada(self, url: str, cabecalhos: Optional[Mapping[str, str]] = None) -> None:
+        """Registra um 304: a página armazenada continua válida."""
+        cabecalhos = cabecalhos or {}
+        with self._lock:
+            self._conn.execute(
+                """UPDATE paginas SET validado_em = ?,
+                       etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified)
+                   WHERE url = ?""",
+                (time.time(), cabecalhos.get('ETag'), cabecalhos.get('Last-Modified'), url)
+            )
+        self.contadores['revalidadas'] += 1
+
+    def _remover_objeto_sem_referencia(self, sha256: str) -> None:
+        if self._conn.execute("SELECT 1 FROM paginas WHERE sha256 = ? LIMIT 1", (sha256,)).fetchone():
+            return
+        self._conn.execute("DELETE FROM objetos WHERE sha256 = ?", (sha256,))
+        try:
+            os.remove(self._caminho_objeto(sha256))
+        except FileNotFoundError:
+            pass
+
+    def tamanho_total(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(tamanho), 0) FROM objetos").fetchone()[0]
+
+    def _limitar_tamanho(self) -> None:
+        """Remove as páginas acessadas há mais tempo até caber no limite."""
+        total = self.tamanho_total()
+        while total > self.tamanho_maximo:
+            linha = self._conn.execute(
+                "SELECT url, sha256 FROM paginas ORDER BY acessado_em LIMIT 1"
+            ).fetchone()
+            if linha is None:
+                break
+            url, sha256 = linha
+            self._conn.execute("DELETE FROM paginas WHERE url = ?", (url,))
+            self._remover_objeto_sem_referencia(sha256)
+            self.contadores['removidas'] += 1
+            total = self.tamanho_total()
+
+    # ------------------------------------------------------------------
+    # Estatísticas
+    # ------------------------------------------------------------------
+
+    def registrar_hit(self) -> None:
+        self.contadores['hits'] += 1
+
+    def registrar_miss(self) -> None:
+        self.contadores['misses'] += 1
+
+    def registrar_obsoleta_servida(self) -> None:
+        self.contadores['obsoletas_servidas'] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retorna contadores e ocupação do cache."""
+        with self._lock:
+            paginas = self._conn.execute("SELECT COUNT(*) FROM paginas").fetchone()[0]
+            tamanho = self.tamanho_total()
+        consultas = self.contadores['hits'] + self.contadores['misses']
+        return {
+            **self.contadores,
+            'hit_rate': self.contadores['hits'] / consultas if consultas else 0.0,
+            'paginas': paginas,
+            'bytes': tamanho,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Instância global
+_cache_paginas: Optional[CachePaginas] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache_paginas() -> CachePaginas:
+    """Retorna a instância global do cache de páginas."""
+    global _cache_paginas
+    if _cache_paginas is None:
+        with _cache_lock:
+            if _cache_paginas is None:
+                _cache_paginas = CachePaginas()
+    return _cache_paginas
@@ -0,0 +1,228 @@
+"""
+CARGA EM LOTE - FBREF
+=====================
+
+Camada de gravação em lote dos cadastros coletados do FBRef (clubes,
+jogadores e partidas), no lugar do INSERT + SELECT linha a linha:
+
+- As linhas ficam em memória e são deduplicadas pela chave natural (a
+  primeira ocorrência vale, como no ``INSERT OR IGNORE`` sequencial)
+- SQLite (sqlite3 ou SQLAlchemy): um ``executemany`` com
+  ``INSERT ... ON CONFLICT(chave) DO NOTHING``
+- PostgreSQL (SQLAlchemy + psycopg2): ``COPY`` para uma tabela temporária e
+  um único ``INSERT ... SELECT ... ON CONFLICT``
+- A gravação devolve o mapa ``chave natural -> id`` (linhas novas e já
+  existentes), para resolver chaves estrangeiras sem consultar de novo
+
+Uso:
+    carga = CargaEmLote(TABELA_CLUBES)
+    for clube in clubes:
+        carga.adicionar((pais_id, clube.nome, clube.genero, clube.url_clube, clube.url_records_vs_opponents))
+    ids = carga.gravar(conn)  # {url_clube: id}
+
+Autor: Sistema de Coleta de Dados
+Data: 2025-08-15
+Versão: 1.0
+"""
+
+import io
+import logging
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import bindparam, text
+
+logger = logging.getLogger(__name__)
+
+# Chaves por consulta no SELECT de ids (abaixo do limite de variáveis do SQLite)
+CHAVES_POR_CONSULTA = 500
+
+
+@dataclass(frozen=True)
+class TabelaCarga:
+    """Tabela de destino de uma carga: colunas gravadas e chave natural (UNIQUE)."""
+    nome: str
+    chave: str
+    colunas: Tuple[str, ...]
+    # Colunas atualizadas quando a chave já existe; vazio mantém a linha existente
+    atualizar: Tuple[str, ...] = ()
+
+    @property
+    def posicao_chave(self) -> int:
+        return self.colunas.index(self.chave)
+
+    def clausula_conflito(self) -> str:
+        if not self.atualizar:
+            return f"ON CONFLICT({self.chave}) DO NOTHING"
+        atualizacoes = ', '.join(f"{coluna} = excluded.{coluna}" for coluna in self.atualizar)
+        return f"ON CONFLICT({self.chave}) DO UPDATE SET {atualizacoes}"
+
+
+TABELA_CLUBES = TabelaCarga(
+    nome='clubes',
+    chave='url_clube',
+    colunas=('pais_id', 'nome', 'genero', 'url_clube', 'url_records_vs_opponents'),
+)
+
+TABELA_JOGADORES = TabelaCarga(
+    nome='jogadores',
+    chave='url_jogador',
+    colunas=('pais_id', 'nome', 'url_jogador', 'url_all_competitions', 'url_domestic_leagues',
+             'url_domestic_cups', 'url_international_cups', 'url_national_team'),
+)
+
+TABELA_PARTIDAS = TabelaCarga(
+    nome='partidas',
+    chave='url_match_report',
+    colunas=('link_coleta_id', 'data', 'time_casa', 'placar', 'time_visitante',
+             'url_match_report', 'status_coleta_detalhada'),
+)
+
+
+def _valor_copy(valor: Any) -> str:
+    """Valor no formato texto do COPY (NULL como \\N, separadores escapados)."""
+    if valor is None:
+        return '\\N'
+    return (str(valor).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+class CargaEmLote:
+    """
+    Acumula linhas de uma tabela e as grava com um upsert em lote.
+
+    Args:
+        tabela: Definição da tabela de destino
+
+    Attributes:
+        inseridas: Linhas novas na última gravação
+        duplicadas: Linhas descartadas por repetir a chave natural
+    """
+
+    def __init__(self, tabela: TabelaCarga):
+        self.tabela = tabela
+        self._linhas: Dict[Any, Tuple[Any, ...]] = {}
+        self.inseridas = 0
+        self.duplicadas = 0
+
+    def adicionar(self, linha: Sequence[Any]) -> bool:
+        """
+        Adiciona uma linha (valores na ordem de ``tabela.colunas``).
+
+        Returns:
+            bool: False se a chave natural já estava no lote (linha ignorada)
+        """
+        if len(linha) != len(self.tabela.colunas):
+            raise ValueError(f"{self.tabela.nome}: esperadas {len(self.tabela.colunas)} colunas, "
+                             f"recebidas {len(linha)}")
+        chave = linha[self.tabela.posicao_chave]
+        if chave in self._linhas:
+            self.duplicadas += 1
+            return False
+        self._linhas[chave] = tuple(linha)
+        return True
+
+    def adicionar_varias(self, linhas: Iterable[Sequence[Any]]) -> 'CargaEmLote':
+        for linha in linhas:
+            self.adicionar(linha)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._linhas)
+
+    def gravar(self, conn) -> Dict[Any, int]:
+        """
+        Grava as linhas acumuladas e esvazia o lote (sem commit).
+
+        Args:
+            conn: ``sqlite3.Connection`` ou ``sqlalchemy.engine.Connection``
+
+        Returns:
+            Dict[chave natural, id] de todas as linhas do lote
+        """
+        self.inseridas = 0
+        if not self._linhas:
+            return {}
+
+        if isinstance(conn, sqlite3.Connection):
+            ids = self._gravar_sqlite3(conn)
+        elif conn.dialect.name == 'postgresql':
+            ids = self._gravar_copy(conn)
+        else:
+            ids = self._gravar_sqlalchemy(conn)
+
+        faltando = len(self._linhas) - len(ids)
+        if faltando:
+            logger.error(f"{self.tabela.nome}: {faltando} linhas sem id após a gravação")
+        logger.debug(f"{self.tabela.nome}: {len(self._linhas)} linhas no lote, {self.inseridas} novas")
+        self._linhas.clear()
+        return ids
+
+    def _sql_insert(self, placeholders: str) -> str:
+        return (f"INSERT INTO {self.tabela.nome} ({', '.join(self.tabela.colunas)}) "
+                f"VALUES ({placeholders}) {self.tabela.clausula_conflito()}")
+
+    def _lotes_de_chaves(self) -> Iterable[List[Any]]:
+        chaves = list(self._linhas)
+        for inicio in range(0, len(chaves), CHAVES_POR_CONSULTA):
+            yield chaves[inicio:inicio + CHAVES_POR_CONSULTA]
+
+    def _gravar_sqlite3(self, conn: sqlite3.Connection) -> Dict[Any, int]:
+        tabela = self.tabela
+        cursor = conn.executemany(self._sql_insert(', '.join(['?'] * len(tabela.colunas))),
+                                  list(self._linhas.values()))
+        self.inseridas = max(cursor.rowcount, 0)
+
+        ids: Dict[Any, int] = {}
+        for chaves in self._lotes_de_chaves():
+            ids.update(conn.execute(
+                f"SELECT {tabela.chave}, id FROM {tabela.nome} "
+                f"WHERE {tabela.chave} IN ({', '.join(['?'] * len(chaves))})",
+                chaves
+            ).fetchall())
+        return ids
+
+    def _gravar_sqlalchemy(self, conn) -> Dict[Any, int]:
+        tabela = self.tabela
+        resultado = conn.execute(
+            text(self._sql_insert(', '.join(f":{coluna}" for coluna in tabela.colunas))),
+            [dict(zip(tabela.colunas, linha)) for linha in self._linhas.values()]
+        )
+        self.inseridas = max(resultado.rowcount, 0)
+
+        consulta = text(
+            f"SELECT {tabela.chave}, id FROM {tabela.nome} WHERE {tabela.chave} IN :chaves"
+        ).bindparams(bindparam('chaves', expanding=True))
+        ids: Dict[Any, int] = {}
+        for chaves in self._lotes_de_chaves():
+            ids.update(conn.execute(consulta, {'chaves': chaves}).all())
+        return ids
+
+    def _gravar_copy(self, conn) -> Dict[Any, int]:
+        """PostgreSQL: COPY para uma tabela temporária e upsert a partir dela."""
+        tabela = self.tabela
+        colunas = ', '.join(tabela.colunas)
+        temporaria = f"carga_{tabela.nome}"
+
+        dados = io.StringIO()
+        for linha in self._linhas.values():
+            dados.write('\t'.join(_valor_copy(valor) for valor in linha))
+            dados.write('\n')
+        dados.seek(0)
+
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(f"DROP TABLE IF EXISTS pg_temp.{temporaria}")
+            # Só as colunas da carga, sem as restrições da tabela (o id fica de fora)
+            cursor.execute(f"CREATE TEMP TABLE {temporaria} ON COMMIT DROP AS "
+                           f"SELECT {colunas} FROM {tabela.nome} WITH NO DATA")
+            cursor.copy_expert(f"COPY {temporaria} ({colunas}) FROM STDIN", dados)
+            cursor.execute(f"INSERT INTO {tabela.nome} ({colunas}) SELECT {colunas} FROM {temporaria} "
+                           f"{tabela.clausula_conflito()}")
+            self.inseridas = max(cursor.rowcount, 0)
+            cursor.execute(f"SELECT t.{tabela.chave}, t.id FROM {tabela.nome} t "
+                           f"JOIN {temporaria} c ON c.{tabela.chave} = t.{tabela.chave}")
+            return dict(cursor.fetchall())
+        finally:
+            cursor.close()
@@ -12,6 +12,8 @@ from dataclasses import dataclass
 from contextlib import contextmanager
 from tqdm import tqdm
 
+from ...database.invalidacao_cache import invalidar_tabelas
+from .carga_em_lote import CargaEmLote, TABELA_CLUBES
 from .fbref_utils import fazer_requisicao, BASE_URL
 
 # Configurações
@@ -309,6 +311,28 @@ class ColetorClubes:
                 logger.error(f"Falha ao obter ID do país: {pais.nome}")
                 return None
 
+    def salvar_clubes_no_banco(self, clubes: List[ClubeInfo], pais_id: int) -> Dict[str, int]:
+        """
+        Salva os clubes de um país em lote (clubes já existentes são mantidos).
+        
+        Args:
+            clubes: Informações dos clubes
+            pais_id: ID do país
+            
+        Returns:
+            Dict[str, int]: ID de cada clube, por url_clube
+        """
+        carga = CargaEmLote(TABELA_CLUBES).adicionar_varias(
+            (pais_id, clube.nome, clube.genero, clube.url_clube, clube.url_records_vs_opponents)
+            for clube in clubes
+        )
+        with self.get_db_connection() as conn:
+            ids = carga.gravar(conn)
+            conn.commit()
+        if carga.inseridas:
+            invalidar_tabelas(TABELA_CLUBES.nome)
+        return ids
+
     def salvar_clube_no_banco(self, clube: ClubeInfo, pais_id: int) -> int:
         """
         Salva um clube no banco de dados.
@@ -320,21 +344,10 @@ class ColetorClubes:
         Returns:
             int: ID do clube salvo
         """
-        with self.get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR IGNORE INTO clubes (pais_id, nome, genero, url_clube, url_records_vs_opponents)
-                VALUES (?, ?, ?, ?, ?)
-            """, (pais_id, clube.nome, clube.genero, clube.url_clube, clube.url_records_vs_opponents))
-            
-            cursor.execute("SELECT id FROM clubes WHERE url_clube = ?", (clube.url_clube,))
-            result = cursor.fetchone()
-            
-            if result:
-                return result[0]
-            else:
-                logger.error(f"Falha ao obter ID do clube: {clube.nome}")
-                return None
+        clube_id = self.salvar_clubes_no_banco([clube], pais_id).get(clube.url_clube)
+        if clube_id is None:
+            logger.error(f"Falha ao obter ID do clube: {clube.nome}")
+        return clube_id
 
     def executar_coleta_completa(self) -> Dict[str, int]:
         """
@@ -365,19 +378,21 @@ class ColetorClubes:
                 # Coleta clubes do país
                 clubes = self.coletar_clubes_do_pais(pais)
                 
-                # Salva clubes no banco
+                # Salva clubes no banco (um lote por país)
+                try:
+                    ids_clubes = self.salvar_clubes_no_banco(clubes, pais_id)
+                except Exception as e:
+                    logger.error(f"Erro ao salvar clubes de {pais.nome}: {e}")
+                    self.stats['erros_processamento'] += len(clubes)
+                    ids_clubes = {}
+                
                 for clube in clubes:
-                    try:
-                        clube_id = self.salvar_clube_no_banco(clube, pais_id)
-                        if clube_id:
-                            self.stats['clubes_encontrados'] += 1
-                            if clube.genero == 'M':
-                                self.stats['clubes_masculino'] += 1
-                            else:
-                                self.stats['clubes_feminino'] += 1
-                    except Exception as e:
-                        logger.error(f"Erro ao salvar clube {clube.nome}: {e}")
-                        self.stats['erros_processamento'] += 1
+                    if ids_clubes.get(clube.url_clube):
+                        self.stats['clubes_encontrados'] += 1
+                        if clube.genero == 'M':
+                            self.stats['clubes_masculino'] += 1
+                        else:
+                            self.stats['clubes_feminino'] += 1
                 
                 self.stats['paises_processados'] += 1
                 
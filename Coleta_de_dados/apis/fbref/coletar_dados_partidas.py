@@ -11,6 +11,8 @@ from dataclasses import dataclass
 from contextlib import contextmanager
 from tqdm import tqdm
 
+from ...database.invalidacao_cache import invalidar_tabelas
+from .carga_em_lote import CargaEmLote, TABELA_PARTIDAS
 from .fbref_utils import fazer_requisicao, BASE_URL, driver_context
 
 # Configurações com caminho absoluto
@@ -255,47 +257,42 @@ class ColetorPartidas:
 
     def salvar_partidas_no_banco(self, partidas: List[PartidaInfo], link_coleta_id: int) -> int:
         """
-        Salva as partidas no banco de dados.
+        Salva as partidas no banco de dados em lote (partidas já existentes são mantidas).
         
         Args:
             partidas: Lista de informações das partidas
             link_coleta_id: ID do link de coleta relacionado
             
         Returns:
-            int: Número de partidas salvas
+            int: Número de partidas novas salvas
         """
         if not partidas:
             return 0
             
-        partidas_salvas = 0
+        carga = CargaEmLote(TABELA_PARTIDAS).adicionar_varias(
+            (
+                link_coleta_id,
+                partida.data,
+                partida.time_casa,
+                partida.placar,
+                partida.time_visitante,
+                partida.url_match_report,
+                'pendente'
+            )
+            for partida in partidas
+        )
         
-        with self.get_db_connection() as conn:
-            cursor = conn.cursor()
-            
-            for partida in partidas:
-                try:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO partidas 
-                        (link_coleta_id, data, time_casa, placar, time_visitante, url_match_report, status_coleta_detalhada) 
-                        VALUES (?, ?, ?, ?, ?, ?, 'pendente')
-                    """, (
-                        link_coleta_id,
-                        partida.data,
-                        partida.time_casa,
-                        partida.placar,
-                        partida.time_visitante,
-                        partida.url_match_report
-                    ))
-                    
-                    if cursor.rowcount > 0:
-                        partidas_salvas += 1
-                        
-                except sqlite3.Error as e:
-                    logger.error(f"Erro ao salvar partida no banco: {e}")
-                    continue
-            
-            conn.commit()
+        try:
+            with self.get_db_connection() as conn:
+                carga.gravar(conn)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Erro ao salvar partidas no banco: {e}")
+            return 0
             
+        partidas_salvas = carga.inseridas
+        if partidas_salvas:
+            invalidar_tabelas(TABELA_PARTIDAS.nome)
         logger.info(f"  -> {partidas_salvas} partidas salvas no banco de dados.")
         return partidas_salvas
 
@@ -350,6 +347,7 @@ class ColetorPartidas:
                     (status, link_id)
                 )
                 conn.commit()
+            invalidar_tabelas("links_para_coleta")
         except sqlite3.Error as e:
             logger.error(f"Erro ao atualizar status do link {link_id}: {e}")
 
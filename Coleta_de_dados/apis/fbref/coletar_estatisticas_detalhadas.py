@@ -10,13 +10,16 @@ import sqlite3
 import traceback
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Generator, Iterable, List, Optional, Set, Tuple, Union, cast
 
 from bs4 import BeautifulSoup, ResultSet, Tag
 from sqlalchemy.orm import Session
 from tqdm import tqdm
 
-from .fbref_utils import fazer_requisicao, limpar_recursos
+from ...database.invalidacao_cache import invalidar_tabelas
+from .agendador_coleta import AgendadorColeta, PaginaColetada, executar_sincrono
+from .fbref_utils import limpar_recursos
+from .parser_match_report import analisar_match_report, extrair_match_report_colunar
 from .scraper_estatisticas_avancadas import AdvancedMatchScraper
 
 # Configurações com caminho absoluto
@@ -110,17 +113,165 @@ class EstatisticasJogador:
         """Converte a instância para dicionário."""
         return {field.name: getattr(self, field.name) for field in self.__dataclass_fields__.values()}
 
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """Valores dos campos na ordem de declaração (ver COLUNAS_ESTATISTICAS_JOGADOR)."""
+        return tuple(getattr(self, nome) for nome in COLUNAS_ESTATISTICAS_JOGADOR)
+
+
+COLUNAS_ESTATISTICAS_JOGADOR: Tuple[str, ...] = tuple(EstatisticasJogador.__dataclass_fields__)
+
+
+class EscritorEstatisticas:
+    """Escritor em lote das estatísticas de jogadores.
+    
+    Mantém uma única conexão SQLite (WAL) durante a coleta, grava os jogadores
+    de cada partida com um único ``executemany`` e confirma a transação a cada
+    ``partidas_por_commit`` partidas concluídas. Uma falha antes do commit
+    desfaz apenas as partidas ainda não confirmadas, que continuam pendentes
+    e são reprocessadas na próxima execução (a gravação é idempotente).
+    As gravações de cada partida ficam em um SAVEPOINT (``partida()``): uma
+    falha no meio da partida desfaz só o que ela gravou.
+    """
+
+    def __init__(self, db_path: str, partidas_por_commit: int = 1) -> None:
+        self.db_path: str = db_path
+        self.partidas_por_commit: int = max(1, partidas_por_commit)
+        self.conn: sqlite3.Connection = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # Em WAL, NORMAL só sincroniza nos checkpoints e continua seguro contra corrupção
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self._partidas_pendentes: int = 0
+        # Tabelas gravadas desde o último commit (invalidam o cache da API ao confirmar)
+        self._tabelas_alteradas: Set[str] = set()
+
+        colunas = ', '.join(COLUNAS_ESTATISTICAS_JOGADOR)
+        placeholders = ', '.join(['?'] * len(COLUNAS_ESTATISTICAS_JOGADOR))
+        atualizacoes = ', '.join(
+            f"{coluna} = excluded.{coluna}"
+            for coluna in COLUNAS_ESTATISTICAS_JOGADOR
+            if coluna not in ('partida_id', 'jogador_nome')
+        )
+        self._sql_upsert_jogador: str = f"""
+            INSERT INTO estatisticas_jogador_partida ({colunas}, updated_at)
+            VALUES ({placeholders}, CURRENT_TIMESTAMP)
+            ON CONFLICT(partida_id, jogador_nome) DO UPDATE SET
+                {atualizacoes}, updated_at = CURRENT_TIMESTAMP
+        """
+
+    def salvar_jogadores(self, estatisticas: Iterable[EstatisticasJogador]) -> int:
+        """Grava (insere ou atualiza) as estatísticas dos jogadores.
+        
+        Returns:
+            int: Número de jogadores gravados
+        """
+        linhas = [stats.to_tuple() for stats in estatisticas]
+        if linhas:
+            self.conn.executemany(self._sql_upsert_jogador, linhas)
+            self._tabelas_alteradas.add('estatisticas_jogador_partida')
+        return len(linhas)
+
+    def salvar_estatisticas_avancadas(self, partida_id: int, advanced_stats: Dict[str, Any]) -> None:
+        """Atualiza xG/formações da partida e o xA de todos os jogadores."""
+        self.conn.execute("""
+            UPDATE estatisticas_partidas 
+            SET xg_casa = ?, xg_visitante = ?, formacao_casa = ?, formacao_visitante = ?
+            WHERE partida_id = ?
+        """, (
+            advanced_stats['expected_goals'].get('xg_casa'),
+            advanced_stats['expected_goals'].get('xg_visitante'),
+            advanced_stats['formacoes'].get('casa'),
+            advanced_stats['formacoes'].get('visitante'),
+            partida_id
+        ))
+        self.conn.executemany("""
+            UPDATE estatisticas_jogador_partida 
+            SET xa = ?
+            WHERE partida_id = ? AND jogador_nome = ?
+        """, [
+            (player.get('xa'), partida_id, player.get('nome'))
+            for team in ('home_players', 'away_players')
+            for player in advanced_stats['jogadores'].get(team, [])
+        ])
+        self._tabelas_alteradas.update(('estatisticas_partidas', 'estatisticas_jogador_partida'))
+
+    def atualizar_status_partida(self, partida_id: int, status: str) -> None:
+        """Atualiza o status de coleta da partida (na transação corrente)."""
+        self.conn.execute(
+            "UPDATE partidas SET status_coleta_detalhada = ? WHERE id = ?",
+            (status, partida_id)
+        )
+        self._tabelas_alteradas.add('partidas')
+
+    @contextmanager
+    def partida(self) -> Generator[None, None, None]:
+        """SAVEPOINT das gravações de uma partida, desfeito se o bloco falhar."""
+        if not self.conn.in_transaction:
+            # Sem transação aberta, o SAVEPOINT seria a mais externa e o RELEASE confirmaria o lote
+            self.conn.execute("BEGIN")
+        self.conn.execute("SAVEPOINT partida")
+        try:
+            yield
+        except BaseException:
+            # Um erro grave do SQLite pode já ter desfeito a transação inteira
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK TO SAVEPOINT partida")
+            raise
+        finally:
+            if self.conn.in_transaction:
+                self.conn.execute("RELEASE SAVEPOINT partida")
+
+    def concluir_partida(self) -> None:
+        """Marca o fim de uma partida e confirma o lote quando completo."""
+        self._partidas_pendentes += 1
+        if self._partidas_pendentes >= self.partidas_por_commit:
+            self.commit()
+
+    def commit(self) -> None:
+        """Confirma as gravações pendentes."""
+        self.conn.commit()
+        self._partidas_pendentes = 0
+        if self._tabelas_alteradas:
+            invalidar_tabelas(*self._tabelas_alteradas)
+            self._tabelas_alteradas.clear()
+
+    def rollback(self) -> None:
+        """Descarta as gravações ainda não confirmadas."""
+        self.conn.rollback()
+        self._partidas_pendentes = 0
+        self._tabelas_alteradas.clear()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> 'EscritorEstatisticas':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.close()
+
 class ColetorEstatisticas:
     """Classe principal para coleta de estatísticas detalhadas."""
     
-    def __init__(self, db_path: str = DB_NAME, session: Optional[Session] = None) -> None:
+    def __init__(self, db_path: str = DB_NAME, session: Optional[Session] = None,
+                 partidas_por_commit: int = 1) -> None:
         """Inicializa o coletor de estatísticas.
         
         Args:
             db_path: Caminho para o banco de dados SQLite
             session: Sessão do SQLAlchemy (opcional)
+            partidas_por_commit: Partidas gravadas por transação durante a coleta
         """
         self.db_path: str = db_path
+        self.partidas_por_commit: int = partidas_por_commit
+        # Escritor compartilhado durante a coleta (uma conexão por execução)
+        self._escritor: Optional[EscritorEstatisticas] = None
         self.stats: Dict[str, int] = {
             'partidas_processadas': 0,
             'partidas_com_erro': 0,
@@ -136,6 +287,11 @@ class ColetorEstatisticas:
         
         # Mapeamento de data-stat para campos da classe
         self.stat_mapping: Dict[str, Tuple[str, type]] = self._create_stat_mapping()
+        # (data_stat, tabela, campo, tipo) na ordem do mapeamento, para a extração colunar
+        self._plano_colunas: List[Tuple[str, str, str, type]] = [
+            (data_stat, self._get_table_for_stat(data_stat), field_name, field_type)
+            for data_stat, (field_name, field_type) in self.stat_mapping.items()
+        ]
 
     def _create_stat_mapping(self) -> Dict[str, Tuple[str, type]]:
         """Cria mapeamento entre data-stat HTML e campos da classe.
@@ -261,6 +417,19 @@ class ColetorEstatisticas:
             if conn:
                 conn.close()
 
+    @contextmanager
+    def escritor(self) -> Generator[EscritorEstatisticas, None, None]:
+        """Escritor da coleta em andamento ou, fora dela, um escritor para uma única operação.
+        
+        Yields:
+            EscritorEstatisticas: Escritor em lote (confirmado ao sair, se avulso)
+        """
+        if self._escritor is not None:
+            yield self._escritor
+            return
+        with EscritorEstatisticas(self.db_path) as escritor:
+            yield escritor
+
     def setup_database_stats(self) -> None:
         """Cria/Altera as tabelas de estatísticas para incluir todas as colunas."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
@@ -292,6 +461,7 @@ class ColetorEstatisticas:
                     npxg_jogador REAL DEFAULT 0.0,
                     xg_assist_jogador REAL DEFAULT 0.0,
                     xg_npxg_assist_jogador REAL DEFAULT 0.0,
+                    xa REAL DEFAULT 0.0,
 
                     -- Ações de Criação
                     sca INTEGER DEFAULT 0,
@@ -353,6 +523,11 @@ class ColetorEstatisticas:
                 )
             ''')
             
+            # Tabelas criadas antes da coluna de xA (estatísticas avançadas)
+            colunas = {linha['name'] for linha in cursor.execute('PRAGMA table_info(estatisticas_jogador_partida)')}
+            if 'xa' not in colunas:
+                cursor.execute('ALTER TABLE estatisticas_jogador_partida ADD COLUMN xa REAL DEFAULT 0.0')
+            
             # Criar índices para melhor performance
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_partida_jogador ON estatisticas_jogador_partida(partida_id, jogador_nome)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_time_nome ON estatisticas_jogador_partida(time_nome)')
@@ -388,6 +563,7 @@ class ColetorEstatisticas:
             elemento = linha.find(attrs={"data-stat": stat_name})
             if not elemento or not elemento.text.strip():
                 return valor_padrao
+            valor_str = elemento.text.strip()
             # Tratamento especial para strings
             if tipo == str:
                 return valor_str
@@ -501,139 +677,172 @@ class ColetorEstatisticas:
         Returns:
             Tuple[bool, int]: (sucesso, número_de_jogadores_processados)
         """
-        jogadores_processados = 0
+        try:
+            # Jogadores e estatísticas avançadas saem da mesma passada pelo HTML
+            jogadores, advanced_stats = self.analisar_match_report_html(str(soup), partida_id)
+        except Exception as e:
+            logger.error(f"  -> Erro geral ao processar match report: {e}")
+            return False, 0
         
-        # Processa estatísticas avançadas se o scraper estiver disponível
-        if self.advanced_scraper and match_url:
+        # Grava estatísticas avançadas se o scraper estiver disponível
+        if advanced_stats and match_url:
             try:
-                # Obtém estatísticas avançadas
-                advanced_stats = self.advanced_scraper.get_advanced_match_stats(match_url)
-                
-                # Atualiza o banco de dados com as estatísticas avançadas
-                if advanced_stats:
-                    with self.get_db_connection() as conn:
-                        cursor = conn.cursor()
-                        
-                        # Atualiza estatísticas da partida
-                        cursor.execute("""
-                            UPDATE estatisticas_partidas 
-                            SET xg_casa = ?, xg_visitante = ?, formacao_casa = ?, formacao_visitante = ?
-                            WHERE partida_id = ?
-                        """, (
-                            advanced_stats['expected_goals'].get('xg_casa'),
-                            advanced_stats['expected_goals'].get('xg_visitante'),
-                            advanced_stats['formacoes'].get('casa'),
-                            advanced_stats['formacoes'].get('visitante'),
-                            partida_id
-                        ))
-                        
-                        # Atualiza estatísticas de jogadores (xA, etc.)
-                        for team in ['home_players', 'away_players']:
-                            for player in advanced_stats['jogadores'].get(team, []):
-                                cursor.execute("""
-                                    UPDATE estatisticas_jogador_partida 
-                                    SET xa = ?
-                                    WHERE partida_id = ? AND jogador_nome = ?
-                                """, (
-                                    player.get('xa'),
-                                    partida_id,
-                                    player.get('nome')
-                                ))
-                        
-                        conn.commit()
-                        self.stats['partidas_com_stats_avancados'] += 1
-                        logger.info(f"  -> Estatísticas avançadas salvas para a partida {partida_id}")
+                # xG/formações da partida e xA dos jogadores em um único lote
+                with self.escritor() as escritor:
+                    escritor.salvar_estatisticas_avancadas(partida_id, advanced_stats)
+                    self.stats['partidas_com_stats_avancados'] += 1
+                    logger.info(f"  -> Estatísticas avançadas salvas para a partida {partida_id}")
                         
             except Exception as e:
                 logger.error(f"  -> Erro ao processar estatísticas avançadas: {e}")
         
+        if jogadores is None:
+            return False, 0
+        
+        # Salva todos os jogadores da partida de uma vez
+        jogadores_processados = self.salvar_estatisticas_jogadores(jogadores)
+        logger.info(f"  -> {jogadores_processados} jogadores processados com sucesso.")
+        return jogadores_processados > 0, jogadores_processados
+
+    def extrair_match_report(self, soup: BeautifulSoup, partida_id: int) -> Optional[List[EstatisticasJogador]]:
+        """
+        Extrai as estatísticas de todos os jogadores da página, sem gravar.
+        
+        Args:
+            soup: BeautifulSoup object da página
+            partida_id: ID da partida
+            
+        Returns:
+            Optional[List[EstatisticasJogador]]: Jogadores extraídos ou None se
+            nenhum time foi identificado nas tabelas
+        """
+        return self.extrair_match_report_html(str(soup), partida_id)
+
+    def analisar_match_report_html(
+        self, html: str, partida_id: int
+    ) -> Tuple[Optional[List[EstatisticasJogador]], Optional[Dict[str, Any]]]:
+        """
+        Extrai jogadores e estatísticas avançadas com uma única passada do lxml.
+        
+        As estatísticas avançadas (xG, formações e xA por jogador, no formato
+        de ``salvar_estatisticas_avancadas``) só são montadas quando o scraper
+        avançado está configurado.
+        
+        Args:
+            html: HTML do match report
+            partida_id: ID da partida
+            
+        Returns:
+            Tuple: (jogadores ou None se nenhum time foi identificado,
+            estatísticas avançadas ou None)
+        """
+        colunas, estatisticas = analisar_match_report(html)
+        if colunas is None:
+            logger.warning("  -> Nenhum time identificado nas tabelas.")
+            return None, None
+        
+        advanced_stats = None
+        if self.advanced_scraper and estatisticas is not None:
+            advanced_stats = self._estatisticas_avancadas(colunas, estatisticas)
+        return self.jogadores_de_colunas(colunas, partida_id), advanced_stats
+
+    def _estatisticas_avancadas(self, colunas: Dict[str, Any], estatisticas: Dict[str, Any]) -> Dict[str, Any]:
+        """xG/xA e formações da partida e xA por jogador, a partir do resultado do parser."""
+        times: List[str] = colunas['time_nome']
+        resumo = colunas['sum']
+        nomes = resumo.get('player', [""] * len(times))
+        xa = resumo.get('xg_assist', [""] * len(times))
+        jogadores: Dict[str, List[Dict[str, Any]]] = {'home_players': [], 'away_players': []}
+        for i, time_nome in enumerate(times):
+            # Sem nome ou sem xA não há o que atualizar
+            if not nomes[i] or not xa[i]:
+                continue
+            lado = 'home_players' if time_nome == times[0] else 'away_players'
+            jogadores[lado].append({'nome': nomes[i], 'xa': self._converter_stat(xa[i], float)})
+        
+        return {
+            'expected_goals': {
+                'xg_casa': estatisticas.get('xg_casa'),
+                'xg_visitante': estatisticas.get('xg_visitante'),
+                'xa_casa': estatisticas.get('xa_casa'),
+                'xa_visitante': estatisticas.get('xa_visitante'),
+            },
+            'formacoes': {
+                'casa': estatisticas.get('formacao_casa'),
+                'visitante': estatisticas.get('formacao_visitante'),
+            },
+            'jogadores': jogadores,
+        }
+
+    def extrair_match_report_html(self, html: str, partida_id: int) -> Optional[List[EstatisticasJogador]]:
+        """
+        Extrai as estatísticas de todos os jogadores direto do HTML da página.
+        
+        Usa o parser de uma passada (parser_match_report), que também lê as
+        tabelas escondidas em comentários, e converte as colunas com as mesmas
+        regras de ``extrair_stat_seguro``.
+        
+        Args:
+            html: HTML do match report
+            partida_id: ID da partida
+            
+        Returns:
+            Optional[List[EstatisticasJogador]]: Jogadores extraídos ou None se
+            nenhum time foi identificado nas tabelas
+        """
+        colunas = extrair_match_report_colunar(html)
+        if colunas is None:
+            logger.warning("  -> Nenhum time identificado nas tabelas.")
+            return None
+        return self.jogadores_de_colunas(colunas, partida_id)
+
+    @staticmethod
+    def _converter_stat(valor_str: str, tipo: type) -> Union[int, float, str]:
+        """Conversão de ``extrair_stat_seguro`` aplicada a um texto já extraído."""
+        if not valor_str:
+            return tipo()
         try:
-            # Mapeia o ID da tabela no HTML para o nome do time
-            times_mapeados = {}
-            for caption in soup.select("table[id*='_summary'] caption"):
-                if caption.parent:
-                    id_base = caption.parent['id'].replace('_summary', '')
-                    time_nome = caption.get_text().replace(" Player Stats Table", "").strip()
-                    if time_nome:
-                        times_mapeados[id_base] = time_nome
-
-            if not times_mapeados:
-                logger.warning("  -> Nenhum time identificado nas tabelas.")
-                return False, 0
-
-            # Processa cada time
-            for id_base, time_nome in times_mapeados.items():
-                logger.debug(f"  -> Processando estatísticas do time: {time_nome}")
-                
-                # Encontra todas as tabelas de estatísticas para o time atual
-                tabelas = {
-                    'sum': soup.find('table', id=f'{id_base}_summary'),
-                    'pass': soup.find('table', id=f'{id_base}_passing'),
-                    'pass_types': soup.find('table', id=f'{id_base}_passing_types'),
-                    'def': soup.find('table', id=f'{id_base}_defense'),
-                    'poss': soup.find('table', id=f'{id_base}_possession'),
-                    'misc': soup.find('table', id=f'{id_base}_misc')
-                }
-                
-                # Verifica se todas as tabelas foram encontradas
-                if not all(tabelas.values()):
-                    missing = [k for k, v in tabelas.items() if v is None]
-                    logger.warning(f"  -> Tabelas ausentes para {time_nome}: {missing}")
-                    continue
-
-                # Processa cada jogador
-                tbody_sum = tabelas['sum'].find('tbody')
-                if not tbody_sum:
-                    continue
-                    
-                linhas_sum = tbody_sum.find_all('tr')
-                
-                for i, linha_sum in enumerate(linhas_sum):
-                    try:
-                        # Obtém linhas correspondentes das outras tabelas
-                        linhas_outras = {}
-                        for tipo, tabela in tabelas.items():
-                            if tipo != 'sum':
-                                tbody = tabela.find('tbody')
-                                if tbody:
-                                    todas_linhas = tbody.find_all('tr')
-                                    if i < len(todas_linhas):
-                                        linhas_outras[tipo] = todas_linhas[i]
-                                    else:
-                                        logger.warning(f"  -> Linha {i} não encontrada na tabela {tipo}")
-                                        linhas_outras[tipo] = None
-
-                        # Verifica se todas as linhas foram encontradas
-                        if None in linhas_outras.values():
-                            continue
-
-                        # Extrai estatísticas do jogador
-                        stats_jogador = self.extrair_estatisticas_jogador(
-                            linha_sum, 
-                            linhas_outras['pass'],
-                            linhas_outras['pass_types'],
-                            linhas_outras['def'],
-                            linhas_outras['poss'],
-                            linhas_outras['misc'],
-                            partida_id, 
-                            time_nome
-                        )
-
-                        if stats_jogador:
-                            # Salva no banco de dados
-                            if self.salvar_estatisticas_jogador(stats_jogador):
-                                jogadores_processados += 1
-
-                    except Exception as e:
-                        logger.error(f"  -> Erro ao processar jogador na linha {i}: {e}")
-                        continue
-
-            logger.info(f"  -> {jogadores_processados} jogadores processados com sucesso.")
-            return jogadores_processados > 0, jogadores_processados
+            if tipo == str:
+                return valor_str
+            if tipo == int:
+                return int(float(valor_str))
+            return float(valor_str)
+        except (ValueError, TypeError):
+            return tipo(0) if tipo in (int, float) else ""
 
-        except Exception as e:
-            logger.error(f"  -> Erro geral ao processar match report: {e}")
-            return False, 0
+    def jogadores_de_colunas(self, colunas: Dict[str, Any], partida_id: int) -> List[EstatisticasJogador]:
+        """
+        Monta os jogadores a partir do resultado colunar do parser.
+        
+        Cada estatística é convertida coluna a coluna; jogadores sem minutos ou
+        sem nome são descartados, como em ``extrair_estatisticas_jogador``.
+        """
+        times: List[str] = colunas['time_nome']
+        vazio = [""] * len(times)
+        converter = self._converter_stat
+        resumo = colunas['sum']
+        
+        minutos = [converter(valor, int) for valor in resumo.get('minutes', vazio)]
+        nomes = resumo.get('player', vazio)
+        npxg_plus_xa = [converter(valor, float) for valor in resumo.get('npxg_plus_xg_assist', vazio)]
+        campos = [
+            (field_name, [converter(valor, field_type) for valor in colunas[tabela].get(data_stat, vazio)])
+            for data_stat, tabela, field_name, field_type in self._plano_colunas
+        ]
+        
+        jogadores: List[EstatisticasJogador] = []
+        for i, time_nome in enumerate(times):
+            # Verifica se o jogador jogou
+            if minutos[i] == 0 or not nomes[i]:
+                continue
+            stats = EstatisticasJogador(partida_id=partida_id, jogador_nome=nomes[i], time_nome=time_nome)
+            for field_name, valores in campos:
+                setattr(stats, field_name, valores[i])
+            # Cálculos especiais
+            stats.xg_npxg_assist_jogador = npxg_plus_xa[i] - stats.npxg_jogador
+            jogadores.append(stats)
+        
+        return jogadores
 
     def salvar_estatisticas_jogador(self, stats: EstatisticasJogador) -> bool:
         """
@@ -645,29 +854,29 @@ class ColetorEstatisticas:
         Returns:
             bool: True se salvou com sucesso
         """
+        return self.salvar_estatisticas_jogadores([stats]) > 0
+
+    def salvar_estatisticas_jogadores(self, estatisticas: List[EstatisticasJogador]) -> int:
+        """
+        Salva as estatísticas de vários jogadores com um único executemany.
+        
+        Durante ``executar_coleta`` a gravação entra na transação do lote
+        corrente; fora dela é confirmada imediatamente.
+        
+        Args:
+            estatisticas: Objetos com as estatísticas dos jogadores
+            
+        Returns:
+            int: Número de jogadores salvos
+        """
+        if not estatisticas:
+            return 0
         try:
-            with self.get_db_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Converte para dicionário e prepara query
-                dados = stats.to_dict()
-                colunas = ', '.join(dados.keys())
-                placeholders = ', '.join(['?'] * len(dados))
-                
-                query = f"""
-                    INSERT OR REPLACE INTO estatisticas_jogador_partida 
-                    ({colunas}, updated_at) 
-                    VALUES ({placeholders}, CURRENT_TIMESTAMP)
-                """
-                
-                cursor.execute(query, tuple(dados.values()))
-                conn.commit()
-                
-                return cursor.rowcount > 0
-                
+            with self.escritor() as escritor:
+                return escritor.salvar_jogadores(estatisticas)
         except sqlite3.Error as e:
-            logger.error(f"Erro ao salvar estatísticas do jogador {stats.jogador_nome}: {e}")
-            return False
+            logger.error(f"Erro ao salvar estatísticas de {len(estatisticas)} jogadores: {e}")
+            return 0
 
     def obter_partidas_pendentes(self) -> List[Tuple[int, str]]:
         """Obtém partidas pendentes de processamento detalhado."""
@@ -688,6 +897,9 @@ class ColetorEstatisticas:
     def atualizar_status_partida(self, partida_id: int, status: str) -> None:
         """Atualiza o status de uma partida no banco de dados."""
         try:
+            if self._escritor is not None:
+                self._escritor.atualizar_status_partida(partida_id, status)
+                return
             with self.get_db_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
@@ -695,13 +907,79 @@ class ColetorEstatisticas:
                     (status, partida_id)
                 )
                 conn.commit()
+            invalidar_tabelas('partidas')
         except sqlite3.Error as e:
             logger.error(f"Erro ao atualizar status da partida {partida_id}: {e}")
 
-    async def executar_coleta(self) -> Dict[str, int]:
+    def _processar_pagina(self, pagina: PaginaColetada) -> Tuple[Optional[List[EstatisticasJogador]], Optional[Dict[str, Any]]]:
+        """Etapa de parsing do pipeline: extrai jogadores e estatísticas avançadas (uma passada por página)."""
+        return self.analisar_match_report_html(pagina.html, pagina.item)
+
+    def _persistir_pagina(self, pagina: PaginaColetada) -> None:
+        """Etapa de persistência do pipeline (sempre na mesma thread do escritor)."""
+        partida_id = pagina.item
+        try:
+            if not pagina.ok:
+                logger.warning(f"  -> Falha ao obter a página da partida {partida_id}: {pagina.erro}")
+                self.atualizar_status_partida(partida_id, 'erro')
+                self.stats['partidas_com_erro'] += 1
+                return
+            
+            jogadores, advanced_stats = pagina.dados
+            # Tudo ou nada: uma falha no meio da partida não deixa linhas dela na transação
+            with self._escritor.partida():
+                if advanced_stats:
+                    self._escritor.salvar_estatisticas_avancadas(partida_id, advanced_stats)
+                num_jogadores = self._escritor.salvar_jogadores(jogadores or [])
+                self._escritor.atualizar_status_partida(partida_id, 'concluido' if num_jogadores > 0 else 'sem_stats')
+            
+            if advanced_stats:
+                self.stats['partidas_com_stats_avancados'] += 1
+            if num_jogadores > 0:
+                self.stats['partidas_processadas'] += 1
+                self.stats['jogadores_processados'] += num_jogadores
+                logger.info(f"  -> Partida {partida_id} processada com sucesso ({num_jogadores} jogadores)")
+            else:
+                self.stats['partidas_sem_stats'] += 1
+                logger.warning(f"  -> Nenhuma estatística encontrada para a partida {partida_id}")
+        
+        except Exception as e:
+            logger.error(f"Erro ao gravar partida {partida_id}: {e}")
+            logger.error(traceback.format_exc())
+            self.atualizar_status_partida(partida_id, 'erro')
+            self.stats['partidas_com_erro'] += 1
+        
+        finally:
+            # Confirma o lote quando completo
+            self._escritor.concluir_partida()
+
+    def executar_coleta(self, **opcoes_agendador: Any) -> Dict[str, int]:
+        """
+        Executa o processo completo de coleta de estatísticas detalhadas.
+        
+        Versão síncrona de ``executar_coleta_async``; chamada de dentro de um
+        loop em execução, roda a coleta em um loop próprio em outra thread.
+        
+        Args:
+            **opcoes_agendador: Opções do AgendadorColeta
+        
+        Returns:
+            Dict[str, int]: Estatísticas da execução
+        """
+        return executar_sincrono(self.executar_coleta_async(**opcoes_agendador))
+
+    async def executar_coleta_async(self, **opcoes_agendador: Any) -> Dict[str, int]:
         """
         Executa o processo completo de coleta de estatísticas detalhadas.
         
+        As partidas passam pelo AgendadorColeta: a busca das páginas (no ritmo
+        da Anti429StateMachine por host), o parsing e a gravação em lote rodam
+        em paralelo, ligados por filas limitadas.
+        
+        Args:
+            **opcoes_agendador: Opções do AgendadorColeta (buscadores, parsers,
+                capacidade_fila, max_simultaneas_host, ...)
+        
         Returns:
             Dict[str, int]: Estatísticas da execução
         """
@@ -717,47 +995,35 @@ class ColetorEstatisticas:
             
         logger.info(f"Encontradas {total_partidas} partidas para processar.")
         
-        # Configura a barra de progresso
         with tqdm(total=total_partidas, desc="Processando partidas") as pbar:
-            for partida in partidas:
-                partida_id, url = partida
-                
+            def iniciar_persistencia() -> None:
+                # Uma conexão para toda a execução, criada na thread de persistência
+                self._escritor = EscritorEstatisticas(self.db_path, self.partidas_por_commit)
+
+            def persistir(pagina: PaginaColetada) -> None:
+                self._persistir_pagina(pagina)
+                pbar.update(1)
+
+            def finalizar_persistencia(erro: Optional[BaseException]) -> None:
+                escritor, self._escritor = self._escritor, None
+                if escritor is None:
+                    return
                 try:
-                    # Atualiza status para 'processando'
-                    self.atualizar_status_partida(partida_id, 'processando')
-                    
-                    # Faz a requisição e processa a página
-                    soup = fazer_requisicao(url)
-                    if not soup:
-                        logger.warning(f"  -> Falha ao obter a página da partida {partida_id}")
-                        self.atualizar_status_partida(partida_id, 'erro')
-                        self.stats['partidas_com_erro'] += 1
-                        continue
-                    
-                    # Processa as estatísticas da partida
-                    sucesso, num_jogadores = self.processar_match_report(soup, partida_id, url)
-                    
-                    if sucesso and num_jogadores > 0:
-                        self.atualizar_status_partida(partida_id, 'concluido')
-                        self.stats['partidas_processadas'] += 1
-                        self.stats['jogadores_processados'] += num_jogadores
-                        logger.info(f"  -> Partida {partida_id} processada com sucesso ({num_jogadores} jogadores)")
+                    if erro is None:
+                        escritor.commit()
                     else:
-                        self.atualizar_status_partida(partida_id, 'sem_stats')
-                        self.stats['partidas_sem_stats'] += 1
-                        logger.warning(f"  -> Nenhuma estatística encontrada para a partida {partida_id}")
-                    
-                except Exception as e:
-                    logger.error(f"Erro ao processar partida {partida_id}: {e}")
-                    logger.error(traceback.format_exc())
-                    self.atualizar_status_partida(partida_id, 'erro')
-                    self.stats['partidas_com_erro'] += 1
-                
-                # Atualiza a barra de progresso
-                pbar.update(1)
-                
-                # Pequena pausa para evitar sobrecarga
-                time.sleep(1)
+                        escritor.rollback()
+                finally:
+                    escritor.close()
+
+            agendador = AgendadorColeta(
+                processar=self._processar_pagina,
+                persistir=persistir,
+                iniciar_persistencia=iniciar_persistencia,
+                finalizar_persistencia=finalizar_persistencia,
+                **opcoes_agendador
+            )
+            await agendador.executar((partida_id, url) for partida_id, url in partidas)
         
         logger.info("Coleta de estatísticas concluída.")
         return self.stats
@@ -12,6 +12,8 @@ from dataclasses import dataclass
 from contextlib import contextmanager
 from tqdm import tqdm
 
+from ...database.invalidacao_cache import invalidar_tabelas
+from .carga_em_lote import CargaEmLote, TABELA_JOGADORES
 from .fbref_utils import fazer_requisicao, BASE_URL
 
 # Configurações
@@ -304,41 +306,48 @@ class ColetorJogadores:
                 logger.error(f"Falha ao obter ID do país: {pais.nome}")
                 return None
 
-    def salvar_jogador_no_banco(self, jogador: JogadorInfo, pais_id: int) -> int:
+    def salvar_jogadores_no_banco(self, jogadores: List[JogadorInfo], pais_id: int) -> Dict[str, int]:
         """
-        Salva um jogador no banco de dados.
+        Salva os jogadores de um país em lote (jogadores já existentes são mantidos).
         
         Args:
-            jogador: Informações do jogador
+            jogadores: Informações dos jogadores
             pais_id: ID do país
             
         Returns:
-            int: ID do jogador salvo
+            Dict[str, int]: ID de cada jogador, por url_jogador
         """
-        with self.get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR IGNORE INTO jogadores (
-                    pais_id, nome, url_jogador, url_all_competitions, 
-                    url_domestic_leagues, url_domestic_cups, 
-                    url_international_cups, url_national_team
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        carga = CargaEmLote(TABELA_JOGADORES).adicionar_varias(
+            (
                 pais_id, jogador.nome, jogador.url_jogador,
                 jogador.url_all_competitions, jogador.url_domestic_leagues,
                 jogador.url_domestic_cups, jogador.url_international_cups,
                 jogador.url_national_team
-            ))
-            
-            cursor.execute("SELECT id FROM jogadores WHERE url_jogador = ?", (jogador.url_jogador,))
-            result = cursor.fetchone()
+            )
+            for jogador in jogadores
+        )
+        with self.get_db_connection() as conn:
+            ids = carga.gravar(conn)
+            conn.commit()
+        if carga.inseridas:
+            invalidar_tabelas(TABELA_JOGADORES.nome)
+        return ids
+
+    def salvar_jogador_no_banco(self, jogador: JogadorInfo, pais_id: int) -> int:
+        """
+        Salva um jogador no banco de dados.
+        
+        Args:
+            jogador: Informações do jogador
+            pais_id: ID do país
             
-            if result:
-                return result[0]
-            else:
-                logger.error(f"Falha ao obter ID do jogador: {jogador.nome}")
-                return None
+        Returns:
+            int: ID do jogador salvo
+        """
+        jogador_id = self.salvar_jogadores_no_banco([jogador], pais_id).get(jogador.url_jogador)
+        if jogador_id is None:
+            logger.error(f"Falha ao obter ID do jogador: {jogador.nome}")
+        return jogador_id
 
     def executar_coleta_completa(self) -> Dict[str, int]:
         """
@@ -369,15 +378,17 @@ class ColetorJogadores:
                 # Coleta jogadores do país
                 jogadores = self.coletar_jogadores_do_pais(pais)
                 
-                # Salva jogadores no banco
-                for jogador in jogadores:
-                    try:
-                        jogador_id = self.salvar_jogador_no_banco(jogador, pais_id)
-                        if jogador_id:
-                            self.stats['jogadores_encontrados'] += 1
-                    except Exception as e:
-                        logger.error(f"Erro ao salvar jogador {jogador.nome}: {e}")
-                        self.stats['erros_processamento'] += 1
+                # Salva jogadores no banco (um lote por país)
+                try:
+                    ids_jogadores = self.salvar_jogadores_no_banco(jogadores, pais_id)
+                except Exception as e:
+                    logger.error(f"Erro ao salvar jogadores de {pais.nome}: {e}")
+                    self.stats['erros_processamento'] += len(jogadores)
+                    ids_jogadores = {}
+                
+                self.stats['jogadores_encontrados'] += sum(
+                    1 for jogador in jogadores if ids_jogadores.get(jogador.url_jogador)
+                )
                 
                 self.stats['paises_processados'] += 1
                 
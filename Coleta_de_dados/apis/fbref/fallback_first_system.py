@@ -72,8 +72,14 @@ class FallbackFirstSystem:
         self.fallback_until = datetime.now() + timedelta(minutes=minutes)
         logger.warning(f"Entrando em modo fallback por {minutes} minutos")
     
-    def make_safe_request(self, url: str, timeout_seconds: int = 10) -> Optional[requests.Response]:
-        """Faz requisição com timeout rigoroso usando threading."""
+    def make_safe_request(self, url: str, timeout_seconds: int = 10,
+                          headers: Optional[dict] = None) -> Optional[requests.Response]:
+        """
+        Faz requisição com timeout rigoroso usando threading.
+        
+        ``headers`` extras (ex.: If-None-Match do cache de páginas) são enviados
+        com a requisição; um 304 é tratado como sucesso e retornado.
+        """
         
         if not self.should_attempt_real_request(url):
             return None
@@ -107,7 +113,7 @@ class FallbackFirstSystem:
                 })
                 
                 # Timeout muito agressivo
-                response = session.get(url, timeout=(3, 5))  # 3s conectar, 5s ler
+                response = session.get(url, headers=headers, timeout=(3, 5))  # 3s conectar, 5s ler
                 result['response'] = response
                 
             except Exception as e:
@@ -132,7 +138,7 @@ class FallbackFirstSystem:
             self.consecutive_failures += 1
             return None
         
-        if result['response'] and result['response'].status_code == 200:
+        if result['response'] is not None and result['response'].status_code in (200, 304):
             # Sucesso!
             logger.debug(f"Requisição bem-sucedida para {url}")
             self.successful_attempts += 1
@@ -188,10 +194,10 @@ def should_use_fallback(url: str) -> bool:
     system = get_fallback_first_system()
     return not system.should_attempt_real_request(url)
 
-def make_controlled_request(url: str) -> Optional[requests.Response]:
+def make_controlled_request(url: str, headers: Optional[dict] = None) -> Optional[requests.Response]:
     """Faz requisição controlada com fallback automático."""
     system = get_fallback_first_system()
-    return system.make_safe_request(url)
+    return system.make_safe_request(url, headers=headers)
 
 def get_fallback_stats() -> dict:
     """Retorna estatísticas do sistema fallback-first."""
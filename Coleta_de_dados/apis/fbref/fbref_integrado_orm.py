@@ -28,10 +28,12 @@ from sqlalchemy.orm import Session
 # Imports do sistema FBRef existente
 from .fbref_utils import fechar_driver, fazer_requisicao, extrair_tabelas_da_pagina, BASE_URL
 from .fbref_fallback_system import create_fallback_system
+from .agendador_coleta import AgendadorColeta, PaginaColetada, executar_sincrono
+from .parser_match_report import extrair_estatisticas_partida
 
 # Imports do novo sistema de banco de dados
 from ...database import SessionLocal, db_manager
-from ...database.models import Competicao, LinkParaColeta
+from ...database.models import Competicao, LinkParaColeta, Partida, EstatisticaPartida
 
 # --- CONFIGURAÇÕES ---
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -287,6 +289,38 @@ class FBRefCollectorORM:
             session.rollback()
             return 0
 
+    def extrair_estatisticas_avancadas(self, html: str, partida_id: int) -> Optional[Dict]:
+        """
+        Extrai as estatísticas avançadas da página de uma partida.
+        
+        Args:
+            html: HTML da página da partida
+            partida_id: ID da partida no banco de dados
+            
+        Returns:
+            Dict com os campos de EstatisticaPartida, ou None se a página não
+            tem as estatísticas dos dois times
+        """
+        estatisticas = extrair_estatisticas_partida(html)
+        if not estatisticas:
+            return None
+        estatisticas['partida_id'] = partida_id
+        return estatisticas
+
+    def salvar_estatisticas_avancadas(self, session: Session, partida_id: int, estatisticas: Dict) -> None:
+        """Cria ou atualiza o registro de EstatisticaPartida da partida (sem commit)."""
+        # Verificar se já existe registro para esta partida
+        estatistica = session.query(EstatisticaPartida).filter_by(partida_id=partida_id).first()
+        
+        if not estatistica:
+            # Criar novo registro
+            estatistica = EstatisticaPartida(**estatisticas)
+            session.add(estatistica)
+        else:
+            # Atualizar registro existente
+            for key, value in estatisticas.items():
+                setattr(estatistica, key, value)
+
     def processar_partida_com_stats_avancadas(self, partida_id: int, match_url: str) -> bool:
         """
         Processa uma partida individual e extrai estatísticas avançadas.
@@ -307,65 +341,14 @@ class FBRefCollectorORM:
                 self.logger.error(f"Falha ao obter a página da partida {partida_id}")
                 return False
             
-            # Extrair dados da partida (implementar lógica de extração)
-            # Exemplo: xG, xA, formações táticas, etc.
-            # ...
-            
-            # Simulando dados extraídos (substituir pela lógica real)
-            estatisticas = {
-                'partida_id': partida_id,
-                'xg_casa': 1.8,
-                'xg_visitante': 1.2,
-                'formacao_casa': '4-4-2',
-                'formacao_visitante': '4-3-3',
-                'posse_bola_casa': 55,
-                'posse_bola_visitante': 45,
-                'finalizacoes_casa': 12,
-                'finalizacoes_visitante': 8,
-                'finalizacoes_no_gol_casa': 5,
-                'finalizacoes_no_gol_visitante': 3,
-                'escanteios_casa': 6,
-                'escanteios_visitante': 4,
-                'faltas_casa': 10,
-                'faltas_visitante': 12,
-                'impedimentos_casa': 2,
-                'impedimentos_visitante': 1,
-                'cruzamentos_casa': 15,
-                'cruzamentos_visitante': 10,
-                'cortes_casa': 8,
-                'cortes_visitante': 6,
-                'defesas_casa': 3,
-                'defesas_visitante': 4,
-                'cortes_goleiro_casa': 2,
-                'cortes_goleiro_visitante': 1,
-                'jogo_aereo_ganho_casa': 7,
-                'jogo_aereo_ganho_visitante': 5,
-                'desarmes_casa': 12,
-                'desarmes_visitante': 14,
-                'carrinhos_casa': 10,
-                'carrinhos_visitante': 12,
-                'carrinhos_ganhos_casa': 6,
-                'carrinhos_ganhos_visitante': 7,
-                'ataques_casa': 120,
-                'ataques_visitante': 95,
-                'ataques_perigosos_casa': 45,
-                'ataques_perigosos_visitante': 35
-            }
+            estatisticas = self.extrair_estatisticas_avancadas(str(soup), partida_id)
+            if not estatisticas:
+                self.logger.warning(f"Página da partida {partida_id} sem estatísticas dos times")
+                return False
             
             # Salvar estatísticas no banco de dados
             with SessionLocal() as session:
-                # Verificar se já existe registro para esta partida
-                estatistica = session.query(EstatisticaPartida).filter_by(partida_id=partida_id).first()
-                
-                if not estatistica:
-                    # Criar novo registro
-                    estatistica = EstatisticaPartida(**estatisticas)
-                    session.add(estatistica)
-                else:
-                    # Atualizar registro existente
-                    for key, value in estatisticas.items():
-                        setattr(estatistica, key, value)
-                
+                self.salvar_estatisticas_avancadas(session, partida_id, estatisticas)
                 session.commit()
                 self.logger.info(f"Estatísticas avançadas salvas para a partida {partida_id}")
                 return True
@@ -374,12 +357,16 @@ class FBRefCollectorORM:
             self.logger.error(f"Erro ao processar partida {partida_id}: {e}", exc_info=True)
             return False
 
-    def processar_partidas_pendentes_com_stats_avancadas(self, limite: Optional[int] = None) -> Dict[str, int]:
+    def processar_partidas_pendentes_com_stats_avancadas(self, limite: Optional[int] = None, **opcoes_agendador) -> Dict[str, int]:
         """
         Processa partidas pendentes e extrai estatísticas avançadas.
         
+        As páginas são buscadas, processadas e gravadas em pipeline pelo
+        AgendadorColeta, no ritmo da Anti429StateMachine.
+        
         Args:
             limite: Número máximo de partidas a processar (None para todas)
+            **opcoes_agendador: Opções do AgendadorColeta
             
         Returns:
             Dicionário com estatísticas do processamento
@@ -396,7 +383,7 @@ class FBRefCollectorORM:
         try:
             with SessionLocal() as session:
                 # Busca partidas que têm URL mas ainda não têm estatísticas avançadas
-                query = session.query(Partida).filter(
+                query = session.query(Partida.id, Partida.url_fbref).filter(
                     Partida.url_fbref.isnot(None),
                     Partida.url_fbref != ''
                 ).outerjoin(EstatisticaPartida).filter(
@@ -408,43 +395,62 @@ class FBRefCollectorORM:
                     query = query.limit(limite)
                 
                 partidas = query.all()
-                total_partidas = len(partidas)
-                
-                if not partidas:
-                    self.logger.info("Nenhuma partida pendente encontrada para processamento de estatísticas avançadas")
-                    return stats
-                
-                self.logger.info(f"Encontradas {total_partidas} partidas para processar")
-                
-                for i, partida in enumerate(partidas, 1):
-                    self.logger.info(f"Processando partida {i}/{total_partidas}: {partida.id}")
-                    
-                    if not partida.url_fbref:
-                        stats['partidas_sem_url'] += 1
-                        continue
-                    
-                    stats['partidas_processadas'] += 1
-                    
-                    try:
-                        sucesso = self.processar_partida_com_stats_avancadas(partida.id, partida.url_fbref)
-                        if sucesso:
-                            stats['partidas_com_sucesso'] += 1
-                        else:
-                            stats['partidas_com_erro'] += 1
-                    except Exception as e:
-                        self.logger.error(f"Erro ao processar partida {partida.id}: {e}")
-                        stats['partidas_com_erro'] += 1
-                    
-                    # Pequena pausa entre requisições para evitar sobrecarga
-                    time.sleep(1)
-                
-                self.logger.info("\n=== RESUMO DO PROCESSAMENTO ===")
-                self.logger.info(f"Total de partidas processadas: {stats['partidas_processadas']}")
-                self.logger.info(f"Partidas com sucesso: {stats['partidas_com_sucesso']}")
-                self.logger.info(f"Partidas com erro: {stats['partidas_com_erro']}")
-                self.logger.info(f"Partidas sem URL: {stats['partidas_sem_url']}")
-                
+            
+            total_partidas = len(partidas)
+            if not partidas:
+                self.logger.info("Nenhuma partida pendente encontrada para processamento de estatísticas avançadas")
                 return stats
+            
+            self.logger.info(f"Encontradas {total_partidas} partidas para processar")
+            
+            # Sessão de gravação criada e usada apenas na thread de persistência
+            sessao_escrita: Dict[str, Session] = {}
+            
+            def processar(pagina: PaginaColetada) -> Optional[Dict]:
+                return self.extrair_estatisticas_avancadas(pagina.html, pagina.item)
+            
+            def persistir(pagina: PaginaColetada) -> None:
+                stats['partidas_processadas'] += 1
+                if not pagina.ok:
+                    self.logger.error(f"Falha ao obter a página da partida {pagina.item}: {pagina.erro}")
+                    stats['partidas_com_erro'] += 1
+                    return
+                if not pagina.dados:
+                    self.logger.warning(f"Página da partida {pagina.item} sem estatísticas dos times")
+                    stats['partidas_com_erro'] += 1
+                    return
+                session = sessao_escrita['session']
+                try:
+                    self.salvar_estatisticas_avancadas(session, pagina.item, pagina.dados)
+                    session.commit()
+                    stats['partidas_com_sucesso'] += 1
+                except Exception as e:
+                    session.rollback()
+                    self.logger.error(f"Erro ao processar partida {pagina.item}: {e}")
+                    stats['partidas_com_erro'] += 1
+            
+            def iniciar_persistencia() -> None:
+                sessao_escrita['session'] = SessionLocal()
+            
+            def finalizar_persistencia(erro) -> None:
+                sessao_escrita.pop('session').close()
+            
+            agendador = AgendadorColeta(
+                processar=processar,
+                persistir=persistir,
+                iniciar_persistencia=iniciar_persistencia,
+                finalizar_persistencia=finalizar_persistencia,
+                **opcoes_agendador
+            )
+            executar_sincrono(agendador.executar(partidas))
+            
+            self.logger.info("\n=== RESUMO DO PROCESSAMENTO ===")
+            self.logger.info(f"Total de partidas processadas: {stats['partidas_processadas']}")
+            self.logger.info(f"Partidas com sucesso: {stats['partidas_com_sucesso']}")
+            self.logger.info(f"Partidas com erro: {stats['partidas_com_erro']}")
+            self.logger.info(f"Partidas sem URL: {stats['partidas_sem_url']}")
+            
+            return stats
                 
         except Exception as e:
             self.logger.error(f"Erro ao processar partidas: {e}", exc_info=True)
@@ -40,6 +40,13 @@ except ImportError:
     def record_request_result(url, success, content_received=False): pass
     def log_emergency_status(): pass
 
+# Cache persistente de páginas (ETag/Last-Modified)
+try:
+    from .cache_paginas import EntradaCache, get_cache_paginas, pagina_valida
+    PAGE_CACHE_AVAILABLE = True
+except ImportError:
+    PAGE_CACHE_AVAILABLE = False
+
 # Constantes globais
 BASE_URL = "https://fbref.com"
 FALLBACK_DIR = "fallback_htmls"
@@ -49,6 +56,7 @@ TIMEOUT = 30
 RATE_LIMIT_DELAY = 300  # 5 minutos de espera para rate limiting
 MAX_RATE_LIMIT_RETRIES = 2  # Reduzido para 2 tentativas
 USE_PROXY_ROTATION = True  # Ativar rotação de proxies
+USE_PAGE_CACHE = True  # Servir páginas do cache em disco e revalidar com ETag/Last-Modified
 
 # Thread-local storage para múltiplas instâncias
 _thread_local = threading.local()
@@ -336,6 +344,12 @@ def fazer_requisicao(url: str, use_selenium: bool = False, driver: Optional[webd
     """
     logger.debug(f"Fazendo requisição para: {url}")
     
+    # Páginas frescas no cache não consomem requisição nem o delay de rate limiting
+    entrada_cache = _consultar_cache(url)
+    if entrada_cache is not None and entrada_cache.fresca:
+        logger.debug(f"Página servida do cache ({entrada_cache.classe}): {url}")
+        return processar_soup_com_comentarios(BeautifulSoup(entrada_cache.html, 'lxml'))
+    
     # Controle de rate limiting
     time.sleep(REQUEST_DELAY)
     
@@ -345,7 +359,13 @@ def fazer_requisicao(url: str, use_selenium: bool = False, driver: Optional[webd
             soup = _fazer_requisicao_selenium(url, driver)
         else:
             logger.debug("Usando requests HTTP para requisição...")
-            soup = _fazer_requisicao_http(url)
+            soup = _fazer_requisicao_http(url, entrada_cache)
+        
+        # Falha na requisição: uma cópia vencida do cache é melhor que o fallback
+        if soup is None and entrada_cache is not None:
+            logger.warning(f"Requisição falhou - usando cópia vencida do cache: {url}")
+            get_cache_paginas().registrar_obsoleta_servida()
+            soup = BeautifulSoup(entrada_cache.html, 'lxml')
         
         # Aplica parsing de comentários HTML (tática específica do FBRef)
         if soup is not None:
@@ -357,8 +377,71 @@ def fazer_requisicao(url: str, use_selenium: bool = False, driver: Optional[webd
         logger.error(f"Erro inesperado em fazer_requisicao para {url}: {e}")
         return None
 
-def _fazer_requisicao_http(url: str) -> Optional[BeautifulSoup]:
-    """Faz requisição usando requests HTTP com sistema anti-429 avançado."""
+def _consultar_cache(url: str) -> Optional['EntradaCache']:
+    """Busca a URL no cache de páginas e registra hit/miss nas estatísticas anti-429."""
+    if not (USE_PAGE_CACHE and PAGE_CACHE_AVAILABLE):
+        return None
+    
+    try:
+        cache = get_cache_paginas()
+        entrada = cache.obter(url)
+    except Exception as e:
+        logger.warning(f"Cache de páginas indisponível: {e}")
+        return None
+    
+    state_machine, _, _ = get_anti_429_systems()
+    if entrada is not None and entrada.fresca:
+        cache.registrar_hit()
+        if state_machine:
+            state_machine.record_cache_hit(url)
+    else:
+        cache.registrar_miss()
+        if state_machine:
+            state_machine.record_cache_miss(url)
+    return entrada
+
+def _html_da_resposta(url: str, response: requests.Response, entrada_cache: Optional['EntradaCache']) -> str:
+    """
+    HTML de uma resposta 200/304; um 304 renova a entrada do cache.
+
+    Respostas 200 não são armazenadas aqui: use ``_armazenar_no_cache`` depois
+    de confirmar que a página tem conteúdo útil.
+    """
+    if not (USE_PAGE_CACHE and PAGE_CACHE_AVAILABLE):
+        return response.text
+    
+    if response.status_code == 304 and entrada_cache is not None:
+        try:
+            logger.debug(f"Página revalidada (304): {url}")
+            get_cache_paginas().revalidada(url, response.headers)
+            state_machine, _, _ = get_anti_429_systems()
+            if state_machine:
+                state_machine.record_cache_revalidation(url)
+        except Exception as e:
+            logger.warning(f"Erro ao atualizar cache de páginas para {url}: {e}")
+        return entrada_cache.html
+    return response.text
+
+def _armazenar_no_cache(url: str, response: requests.Response, content_received: bool) -> None:
+    """Armazena uma resposta 200 com conteúdo útil; bloqueios e corpos curtos ficam de fora."""
+    if not (USE_PAGE_CACHE and PAGE_CACHE_AVAILABLE) or response.status_code != 200:
+        return
+    if not content_received or not pagina_valida(response.text):
+        logger.warning(f"Resposta 200 sem conteúdo útil não foi armazenada no cache: {url}")
+        return
+    
+    try:
+        get_cache_paginas().armazenar(url, response.text, response.headers)
+    except Exception as e:
+        logger.warning(f"Erro ao atualizar cache de páginas para {url}: {e}")
+
+def _fazer_requisicao_http(url: str, entrada_cache: Optional['EntradaCache'] = None) -> Optional[BeautifulSoup]:
+    """
+    Faz requisição usando requests HTTP com sistema anti-429 avançado.
+    
+    Com ``entrada_cache`` (página vencida no cache), a requisição é condicional
+    e um 304 reaproveita o HTML armazenado.
+    """
     logger = logging.getLogger(__name__)
     logger.debug(f"Iniciando requisição para: {url}")
     
@@ -421,9 +504,10 @@ def _fazer_requisicao_http(url: str) -> Optional[BeautifulSoup]:
         
         # Tentar requisição controlada (com timeout rígido)
         logger.debug("Tentando requisição controlada (Fallback-First)")
-        response = make_controlled_request(url)
+        cabecalhos_condicionais = entrada_cache.cabecalhos_condicionais() if entrada_cache else None
+        response = make_controlled_request(url, headers=cabecalhos_condicionais)
         
-        if response and response.status_code == 200:
+        if response is not None and response.status_code in (200, 304):
             logger.debug(f"Requisição controlada bem-sucedida: {url}")
             
             # Registrar sucesso nos outros sistemas
@@ -432,10 +516,11 @@ def _fazer_requisicao_http(url: str) -> Optional[BeautifulSoup]:
             if anti_blocking:
                 record_fbref_request(url, True, 0.0, 200)
             
-            soup = BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup(_html_da_resposta(url, response, entrada_cache), 'lxml')
             
             # Verificar se realmente recebeu conteúdo útil
-            content_received = soup and len(soup.get_text().strip()) > 100
+            content_received = bool(soup) and len(soup.get_text().strip()) > 100
+            _armazenar_no_cache(url, response, content_received)
             
             # Registrar resultado no sistema de emergência
             if EMERGENCY_SYSTEM_AVAILABLE:
@@ -469,9 +554,11 @@ def _fazer_requisicao_http(url: str) -> Optional[BeautifulSoup]:
         # FALLBACK: Sistema anti-bloqueio simplificado
         if simple_anti_blocking:
             logger.debug("Usando sistema anti-bloqueio simplificado")
-            response = simple_anti_blocking.make_request(url)
+            response = simple_anti_blocking.make_request(
+                url, headers=entrada_cache.cabecalhos_condicionais() if entrada_cache else None
+            )
             
-            if response and response.status_code == 200:
+            if response is not None and response.status_code in (200, 304):
                 logger.debug(f"Requisição bem-sucedida (simplificado): {url}")
                 
                 if state_machine:
@@ -479,7 +566,9 @@ def _fazer_requisicao_http(url: str) -> Optional[BeautifulSoup]:
                 if anti_blocking:
                     record_fbref_request(url, True, 0.0, 200)
                 
-                return BeautifulSoup(response.text, 'lxml')
+                soup = BeautifulSoup(_html_da_resposta(url, response, entrada_cache), 'lxml')
+                _armazenar_no_cache(url, response, len(soup.get_text().strip()) > 100)
+                return soup
             
             else:
                 logger.debug("Sistema simplificado falhou - usando fallback")
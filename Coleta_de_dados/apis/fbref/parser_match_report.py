@@ -0,0 +1,290 @@
+"""
+PARSER DE MATCH REPORTS - FBREF
+===============================
+
+Parser das tabelas de jogadores dos match reports do FBRef feito direto
+sobre o lxml, em uma única passada pelo documento:
+
+- Todas as tabelas com id são indexadas uma vez (``id -> linhas``), inclusive
+  as que o FBRef esconde em comentários HTML, sem reparsear a página inteira
+- Cada linha do tbody vira um dicionário ``data-stat -> texto``; as buscas por
+  estatística deixam de percorrer a árvore
+- O resultado é colunar: para cada tabela do time, uma lista por data-stat,
+  alinhada pela posição do jogador
+- As estatísticas da partida por time (EstatisticaPartida) saem da mesma
+  árvore: totais das tabelas de jogadores, posse do quadro ``team_stats`` e
+  formações das escalações
+
+Uso:
+    colunas = extrair_match_report_colunar(html)
+    colunas['time_nome'][i], colunas['sum']['player'][i], colunas['pass']['passes'][i]
+    estatisticas = extrair_estatisticas_partida(html)  # campos de EstatisticaPartida
+    colunas, estatisticas = analisar_match_report(html)  # os dois, parseando uma vez
+
+Autor: Sistema de Coleta de Dados
+Data: 2025-08-15
+Versão: 1.0
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+from lxml import html as lxml_html
+
+logger = logging.getLogger(__name__)
+
+# Chave usada pelo ColetorEstatisticas -> sufixo do id da tabela no FBRef
+SUFIXOS_TABELAS: Dict[str, str] = {
+    'sum': '_summary',
+    'pass': '_passing',
+    'pass_types': '_passing_types',
+    'def': '_defense',
+    'poss': '_possession',
+    'misc': '_misc',
+}
+
+# Campo de EstatisticaPartida (sem o sufixo _casa/_visitante) -> (tabela, data-stat)
+# somado sobre os jogadores do time
+TOTAIS_PARTIDA: Dict[str, Tuple[str, str]] = {
+    'chutes': ('sum', 'shots'),
+    'chutes_no_gol': ('sum', 'shots_on_target'),
+    'cartoes_amarelos': ('sum', 'cards_yellow'),
+    'cartoes_vermelhos': ('sum', 'cards_red'),
+    'xg': ('sum', 'xg'),
+    'xa': ('sum', 'xg_assist'),
+    'escanteios': ('pass_types', 'corner_kicks'),
+    'faltas': ('misc', 'fouls'),
+}
+CAMPOS_DECIMAIS = {'xg', 'xa'}
+
+# "Flamengo (4-2-3-1)" no cabeçalho da escalação
+_RE_FORMACAO = re.compile(r'\(([^()]+)\)\s*$')
+_RE_PERCENTUAL = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+
+
+@dataclass
+class TabelaIndexada:
+    """Tabela com id, com as linhas do tbody indexadas por data-stat."""
+    id: str
+    caption: str = ""
+    # None quando a tabela não tem tbody
+    linhas: Optional[List[Dict[str, str]]] = None
+
+
+def _indexar_linha(tr) -> Dict[str, str]:
+    celulas: Dict[str, str] = {}
+    for elemento in tr.iterdescendants():
+        data_stat = elemento.get('data-stat')
+        # Primeira ocorrência vale, como em find(attrs={'data-stat': ...})
+        if data_stat and data_stat not in celulas:
+            celulas[data_stat] = elemento.text_content().strip()
+    return celulas
+
+
+def _indexar_tabelas_de(raiz, tabelas: Dict[str, TabelaIndexada]) -> None:
+    for tabela in raiz.iter('table'):
+        id_tabela = tabela.get('id')
+        if not id_tabela or id_tabela in tabelas:
+            continue
+        caption = tabela.find('caption')
+        tbody = tabela.find('.//tbody')
+        tabelas[id_tabela] = TabelaIndexada(
+            id=id_tabela,
+            caption=caption.text_content() if caption is not None else "",
+            linhas=[_indexar_linha(tr) for tr in tbody.iter('tr')] if tbody is not None else None,
+        )
+
+
+def _parsear(html: str):
+    if not html or not html.strip():
+        return None
+    return lxml_html.fromstring(html)
+
+
+def indexar_tabelas(html: str) -> Dict[str, TabelaIndexada]:
+    """
+    Indexa por id todas as tabelas da página, incluindo as de comentários HTML.
+
+    Tabelas visíveis têm precedência sobre as de comentários com o mesmo id.
+    """
+    return _indexar_raiz(_parsear(html))
+
+
+def _indexar_raiz(raiz) -> Dict[str, TabelaIndexada]:
+    tabelas: Dict[str, TabelaIndexada] = {}
+    if raiz is None:
+        return tabelas
+
+    _indexar_tabelas_de(raiz, tabelas)
+
+    # Só o conteúdo dos comentários é parseado, não o documento inteiro
+    for comentario in raiz.iter(etree.Comment):
+        texto = comentario.text or ""
+        if '<table' not in texto:
+            continue
+        try:
+            fragmento = lxml_html.fragment_fromstring(texto, create_parent='div')
+        except etree.ParserError as e:
+            logger.debug(f"Comentário com HTML inválido ignorado: {e}")
+            continue
+        _indexar_tabelas_de(fragmento, tabelas)
+
+    return tabelas
+
+
+def _identificar_times(tabelas: Dict[str, TabelaIndexada]) -> Dict[str, str]:
+    """``id base das tabelas -> nome do time``, na ordem do documento (casa primeiro)."""
+    times: Dict[str, str] = {}
+    for id_tabela, tabela in tabelas.items():
+        if '_summary' in id_tabela and tabela.caption:
+            time_nome = tabela.caption.replace(" Player Stats Table", "").strip()
+            if time_nome:
+                times[id_tabela.replace('_summary', '')] = time_nome
+    return times
+
+
+def extrair_match_report_colunar(html: str) -> Optional[Dict[str, object]]:
+    """
+    Extrai as tabelas de jogadores de todos os times em formato colunar.
+
+    Os times são identificados pelas tabelas ``*_summary`` com caption
+    "<Time> Player Stats Table". Linhas sem correspondente em alguma das
+    outras tabelas do time são descartadas; times sem alguma das seis tabelas
+    são ignorados.
+
+    Args:
+        html: HTML do match report
+
+    Returns:
+        ``{'time_nome': [...], 'sum': {data_stat: [...]}, 'pass': {...}, ...}``
+        com listas alinhadas por jogador (texto vazio para células ausentes),
+        ou None se nenhum time foi identificado
+    """
+    return _colunas_de(indexar_tabelas(html))
+
+
+def _colunas_de(tabelas: Dict[str, TabelaIndexada]) -> Optional[Dict[str, object]]:
+    times = _identificar_times(tabelas)
+    if not times:
+        return None
+
+    linhas_por_tabela: Dict[str, List[Dict[str, str]]] = {chave: [] for chave in SUFIXOS_TABELAS}
+    times_jogadores: List[str] = []
+
+    for id_base, time_nome in times.items():
+        do_time = {chave: tabelas.get(f'{id_base}{sufixo}') for chave, sufixo in SUFIXOS_TABELAS.items()}
+        ausentes = [chave for chave, tabela in do_time.items() if tabela is None]
+        if ausentes:
+            logger.warning(f"  -> Tabelas ausentes para {time_nome}: {ausentes}")
+            continue
+        if do_time['sum'].linhas is None:
+            continue
+
+        for i, linha_sum in enumerate(do_time['sum'].linhas):
+            linhas = {'sum': linha_sum}
+            for chave, tabela in do_time.items():
+                if chave == 'sum':
+                    continue
+                if tabela.linhas is None or i >= len(tabela.linhas):
+                    break
+                linhas[chave] = tabela.linhas[i]
+            else:
+                for chave, linha in linhas.items():
+                    linhas_por_tabela[chave].append(linha)
+                times_jogadores.append(time_nome)
+
+    colunas: Dict[str, object] = {'time_nome': times_jogadores}
+    for chave, linhas in linhas_por_tabela.items():
+        data_stats = dict.fromkeys(ds for linha in linhas for ds in linha)
+        colunas[chave] = {ds: [linha.get(ds, "") for linha in linhas] for ds in data_stats}
+    return colunas
+
+
+def _numero(texto: str) -> Optional[float]:
+    try:
+        return float(texto.replace(',', ''))
+    except ValueError:
+        return None
+
+
+def _total_do_time(tabela: Optional[TabelaIndexada], data_stat: str) -> Optional[float]:
+    """Soma da coluna sobre os jogadores; None se nenhum jogador tem o valor."""
+    if tabela is None or not tabela.linhas:
+        return None
+    valores = [_numero(linha.get(data_stat, "")) for linha in tabela.linhas]
+    valores = [valor for valor in valores if valor is not None]
+    return sum(valores) if valores else None
+
+
+def _posse_de_bola(raiz) -> List[float]:
+    """Percentuais de posse (casa, visitante) do quadro ``team_stats``."""
+    for quadro in raiz.iterfind('.//div[@id="team_stats"]'):
+        linhas = list(quadro.iter('tr'))
+        for i, tr in enumerate(linhas[:-1]):
+            if tr.text_content().strip().lower() != 'possession':
+                continue
+            percentuais = [_RE_PERCENTUAL.search(td.text_content()) for td in linhas[i + 1].iter('td')]
+            return [float(p.group(1)) for p in percentuais if p]
+    return []
+
+
+def _formacoes(raiz) -> List[str]:
+    """Formações (casa, visitante) dos cabeçalhos das escalações."""
+    formacoes = []
+    for escalacao in raiz.iterfind('.//div[@class="lineup"]'):
+        th = escalacao.find('.//th')
+        formacao = _RE_FORMACAO.search(th.text_content()) if th is not None else None
+        if formacao:
+            formacoes.append(formacao.group(1).strip()[:20])
+    return formacoes
+
+
+def extrair_estatisticas_partida(html: str) -> Optional[Dict[str, object]]:
+    """
+    Extrai as estatísticas da partida por time nos campos de EstatisticaPartida.
+
+    Chutes, cartões, xG, xA, escanteios e faltas são os totais das tabelas de
+    jogadores de cada time; a posse vem do quadro ``team_stats`` e as formações
+    das escalações. Campos que a página não traz ficam de fora.
+
+    Args:
+        html: HTML do match report
+
+    Returns:
+        ``{'xg_casa': 1.4, 'xg_visitante': 0.8, 'formacao_casa': '4-3-3', ...}``,
+        ou None se a página não tem as tabelas dos dois times
+    """
+    raiz = _parsear(html)
+    return _estatisticas_de(raiz, _indexar_raiz(raiz))
+
+
+def _estatisticas_de(raiz, tabelas: Dict[str, TabelaIndexada]) -> Optional[Dict[str, object]]:
+    times = list(_identificar_times(tabelas))
+    if len(times) != 2:
+        return None
+
+    estatisticas: Dict[str, object] = {}
+    for lado, id_base in zip(('casa', 'visitante'), times):
+        for campo, (chave, data_stat) in TOTAIS_PARTIDA.items():
+            total = _total_do_time(tabelas.get(f'{id_base}{SUFIXOS_TABELAS[chave]}'), data_stat)
+            if total is not None:
+                estatisticas[f'{campo}_{lado}'] = round(total, 2) if campo in CAMPOS_DECIMAIS else int(total)
+
+    for campo, valores in (('posse_bola', _posse_de_bola(raiz)), ('formacao', _formacoes(raiz))):
+        if len(valores) == 2:
+            estatisticas[f'{campo}_casa'], estatisticas[f'{campo}_visitante'] = valores
+    return estatisticas
+
+
+def analisar_match_report(html: str) -> Tuple[Optional[Dict[str, object]], Optional[Dict[str, object]]]:
+    """
+    Jogadores em formato colunar e estatísticas da partida, parseando a página uma vez.
+
+    Equivale a ``(extrair_match_report_colunar(html), extrair_estatisticas_partida(html))``.
+    """
+    raiz = _parsear(html)
+    tabelas = _indexar_raiz(raiz)
+    return _colunas_de(tabelas), _estatisticas_de(raiz, tabelas)
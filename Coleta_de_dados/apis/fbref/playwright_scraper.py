@@ -19,7 +19,7 @@ import json
 import re
 from pathlib import Path
 
-from ..playwright_base import PlaywrightBaseScraper
+from ..playwright_base import PlaywrightBaseScraper, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -583,7 +583,7 @@ def run_fbref_scraper(competition_urls: List[str], **kwargs) -> Dict[str, Any]:
         async with FBRefPlaywrightScraper(**kwargs) as scraper:
             return await scraper.collect_all_data(competition_urls)
     
-    return asyncio.run(_run())
+    return run_async(_run())
 
 # Exemplo de uso
 if __name__ == "__main__":
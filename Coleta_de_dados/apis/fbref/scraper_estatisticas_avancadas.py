@@ -235,6 +235,18 @@ class AdvancedMatchScraper:
         if not soup:
             return {}
         
+        return self.extrair_estatisticas_avancadas(soup)
+    
+    def extrair_estatisticas_avancadas(self, soup: BeautifulSoup) -> Dict:
+        """
+        Extrai as estatísticas avançadas de uma página de relatório já obtida.
+        
+        Args:
+            soup: BeautifulSoup da página de relatório da partida
+            
+        Returns:
+            Dicionário com todas as estatísticas avançadas coletadas
+        """
         # Extrai metadados da partida
         metadata = self.extract_match_metadata(soup)
         
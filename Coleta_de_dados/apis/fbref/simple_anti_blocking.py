@@ -105,8 +105,8 @@ class SimpleAntiBlocking:
         
         return session
     
-    def make_request(self, url: str) -> Optional[requests.Response]:
-        """Faz requisição com proteções anti-bloqueio."""
+    def make_request(self, url: str, headers: Optional[dict] = None) -> Optional[requests.Response]:
+        """Faz requisição com proteções anti-bloqueio (304 conta como sucesso)."""
         
         # Aguardar se necessário
         wait_time = self.should_wait()
@@ -130,9 +130,9 @@ class SimpleAntiBlocking:
             
             logger.debug(f"Fazendo requisição para {url} com timeout {timeout}")
             
-            response = session.get(url, timeout=timeout)
+            response = session.get(url, headers=headers, timeout=timeout)
             
-            if response.status_code == 200:
+            if response.status_code in (200, 304):
                 self.successful_requests += 1
                 self.consecutive_failures = 0
                 logger.debug(f"Requisição bem-sucedida: {url}")
@@ -0,0 +1,194 @@
+"""
+Coleta paralela de notícias para vários clubes.
+
+Em vez de percorrer os clubes um a um (busca do clube e depois o conteúdo de
+cada notícia, com pausa entre requisições), a coleta é feita em três fases:
+
+1. As páginas de busca de todos os clubes são baixadas em paralelo
+2. As URLs de notícias são deduplicadas entre clubes (a notícia fica com o
+   primeiro clube da lista, como na coleta sequencial) e as que já estão em
+   noticias_clubes são descartadas com uma consulta por lote
+3. O conteúdo completo é baixado em paralelo só para as notícias novas
+
+Cada fonte (host) tem seu próprio pool de conexões, limitado a
+``max_por_fonte`` conexões, e todas as requisições dividem um orçamento
+global de ``max_simultaneas``. O banco é consultado uma única vez entre as
+fases e as notícias são salvas depois da coleta, pelo ``_salvar_noticias``
+do coletor.
+
+Uso:
+    coleta = ColetaParalelaNoticias(coletor, max_simultaneas=32, max_por_fonte=8)
+    resultado = coleta.executar(clubes, limite_por_clube=5)
+"""
+import asyncio
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+import aiohttp
+
+from Coleta_de_dados.database.models import NoticiaClube
+
+logger = logging.getLogger(__name__)
+
+# URLs por consulta de notícias já existentes
+URLS_POR_CONSULTA = 500
+
+
+class ColetaParalelaNoticias:
+    """
+    Coleta assíncrona das notícias de vários clubes com um ``NewsCollector``.
+
+    O coletor fornece a sessão do banco, os cabeçalhos e o parsing das páginas
+    (``_url_busca``, ``_extrair_noticias_busca``, ``_extrair_conteudo`` e
+    ``_salvar_noticias``), então o resultado é o mesmo da coleta sequencial.
+
+    Args:
+        coletor: Instância de NewsCollector
+        max_simultaneas: Requisições em andamento no total
+        max_por_fonte: Conexões simultâneas por host
+        timeout: Timeout total de cada requisição, em segundos
+    """
+
+    def __init__(self, coletor: Any, max_simultaneas: int = 32, max_por_fonte: int = 8,
+                 timeout: float = 10.0):
+        self.coletor = coletor
+        self.max_simultaneas = max(1, max_simultaneas)
+        self.max_por_fonte = max(1, max_por_fonte)
+        self.timeout = timeout
+        self.stats: Counter = Counter()
+        self._sessoes: Dict[str, aiohttp.ClientSession] = {}
+        self._orcamento: Optional[asyncio.Semaphore] = None
+
+    def _sessao(self, url: str) -> aiohttp.ClientSession:
+        """Sessão (pool de conexões) da fonte da URL, criada no primeiro uso."""
+        fonte = urlparse(url).netloc
+        sessao = self._sessoes.get(fonte)
+        if sessao is None:
+            sessao = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_por_fonte, ttl_dns_cache=300),
+                headers=self.coletor.HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._sessoes[fonte] = sessao
+        return sessao
+
+    async def _baixar(self, url: str) -> Optional[str]:
+        """Baixa uma página; None (com log) em caso de erro."""
+        async with self._orcamento:
+            try:
+                async with self._sessao(url).get(url) as resposta:
+                    resposta.raise_for_status()
+                    html = await resposta.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.stats['erros_requisicao'] += 1
+                logger.error(f"Erro ao baixar {url}: {e!r}")
+                return None
+        self.stats['paginas_baixadas'] += 1
+        return html
+
+    async def _buscar_clube(self, clube: Any, limite: int) -> List[Dict[str, Any]]:
+        """Notícias da busca do clube; [] (com log) em caso de erro, sem interromper os demais."""
+        try:
+            url_busca = self.coletor._url_busca(clube)
+            html = await self._baixar(url_busca)
+            if html is None:
+                return []
+            return self.coletor._extrair_noticias_busca(html, limite)
+        except Exception as e:
+            self.stats['erros_requisicao'] += 1
+            logger.error(f"Erro ao buscar notícias de {getattr(clube, 'nome', clube)}: {e!r}")
+            return []
+
+    async def _baixar_conteudos(self, noticias: Sequence[Dict[str, Any]]) -> None:
+        async def baixar(noticia):
+            try:
+                html = await self._baixar(noticia['url_noticia'])
+                noticia['conteudo_completo'] = self.coletor._extrair_conteudo(html) if html else ""
+            except Exception as e:
+                self.stats['erros_requisicao'] += 1
+                logger.error(f"Erro ao extrair conteúdo de {noticia['url_noticia']}: {e!r}")
+                noticia['conteudo_completo'] = ""
+
+        await asyncio.gather(*(baixar(noticia) for noticia in noticias))
+
+    async def _coletar(self, clubes: Sequence[Any], limite: int) -> List[List[Dict[str, Any]]]:
+        self._orcamento = asyncio.Semaphore(self.max_simultaneas)
+        try:
+            por_clube = await asyncio.gather(*(self._buscar_clube(clube, limite) for clube in clubes))
+
+            # Cada URL fica só com o primeiro clube que a listou
+            vistas = set()
+            for indice, noticias in enumerate(por_clube):
+                unicas = []
+                for noticia in noticias:
+                    if noticia['url_noticia'] in vistas:
+                        self.stats['urls_repetidas'] += 1
+                        continue
+                    vistas.add(noticia['url_noticia'])
+                    unicas.append(noticia)
+                por_clube[indice] = unicas
+
+            existentes = self._urls_existentes(list(vistas))
+            self.stats['ja_existentes'] += len(existentes)
+            novas = [noticia for noticias in por_clube for noticia in noticias
+                     if noticia['url_noticia'] not in existentes and not noticia.get('conteudo_completo')]
+            await self._baixar_conteudos(novas)
+            return [[noticia for noticia in noticias if noticia['url_noticia'] not in existentes]
+                    for noticias in por_clube]
+        finally:
+            for sessao in self._sessoes.values():
+                await sessao.close()
+            self._sessoes.clear()
+
+    def _urls_existentes(self, urls: List[str]) -> set:
+        existentes = set()
+        for inicio in range(0, len(urls), URLS_POR_CONSULTA):
+            lote = urls[inicio:inicio + URLS_POR_CONSULTA]
+            existentes.update(url for (url,) in self.coletor.db.query(NoticiaClube.url_noticia).filter(
+                NoticiaClube.url_noticia.in_(lote)
+            ))
+        return existentes
+
+    def executar(self, clubes: Sequence[Any], limite_por_clube: int = 5) -> Dict[str, Any]:
+        """
+        Coleta e salva as notícias de todos os clubes.
+
+        Returns:
+            Dict: Estatísticas da coleta, no formato de ``coletar_para_todos_clubes``
+        """
+        self.stats.clear()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            noticias_por_clube = asyncio.run(self._coletar(clubes, limite_por_clube))
+        else:
+            # Chamado de dentro de um loop (ex.: endpoint async): usa um loop próprio em outra thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                noticias_por_clube = executor.submit(
+                    asyncio.run, self._coletar(clubes, limite_por_clube)
+                ).result()
+
+        total_noticias = 0
+        for clube, noticias in zip(clubes, noticias_por_clube):
+            total_noticias += self.coletor._salvar_noticias(clube.id, noticias)
+
+        logger.info(
+            f"Coleta paralela concluída para {len(clubes)} clubes: {total_noticias} notícias salvas, "
+            f"{self.stats['paginas_baixadas']} páginas baixadas, {self.stats['urls_repetidas']} URLs repetidas, "
+            f"{self.stats['ja_existentes']} já existentes"
+        )
+        return {
+            'status': 'sucesso',
+            'total_clubes': len(clubes),
+            'total_noticias_coletadas': total_noticias,
+            'limite_por_clube': limite_por_clube,
+            'paginas_baixadas': self.stats['paginas_baixadas'],
+            'urls_repetidas': self.stats['urls_repetidas'],
+            'noticias_ja_existentes': self.stats['ja_existentes'],
+            'erros_requisicao': self.stats['erros_requisicao'],
+            'timestamp': datetime.now().isoformat()
+        }
@@ -15,6 +15,7 @@ from bs4 import BeautifulSoup
 from sqlalchemy.orm import Session
 
 # Importações locais
+from Coleta_de_dados.apis.news.coleta_paralela import ColetaParalelaNoticias
 from Coleta_de_dados.database.models import Clube, NoticiaClube
 from Coleta_de_dados.database.config import SessionLocal
 
@@ -188,6 +189,46 @@ class NewsCollector:
             
         return agora
     
+    def _url_busca(self, clube: Clube) -> str:
+        """URL da busca de notícias recentes do clube no Globo Esporte."""
+        # Formata o termo de busca (nome do clube)
+        termo_busca = quote_plus(clube.nome)
+        return f"{self.BASE_URL}?q={termo_busca}&order=recent&species=notícias"
+    
+    def _extrair_noticias_busca(self, html: str, limite: int) -> List[Dict[str, Any]]:
+        """
+        Extrai as notícias de uma página de busca do Globo Esporte.
+        
+        Args:
+            html: HTML da página de busca
+            limite: Número máximo de notícias a retornar
+            
+        Returns:
+            Lista de dicionários com as notícias válidas
+        """
+        soup = BeautifulSoup(html, 'lxml')
+        
+        # Encontra os elementos das notícias
+        noticias_elements = soup.find_all('li', class_='widget--info')
+        
+        # Processa cada notícia encontrada
+        noticias = []
+        for element in noticias_elements[:limite]:
+            noticia = self._parse_noticia_element(element)
+            if noticia:
+                noticias.append(noticia)
+        return noticias
+    
+    def _extrair_conteudo(self, html: str) -> str:
+        """Junta os parágrafos do conteúdo principal de uma página de notícia."""
+        soup = BeautifulSoup(html, 'lxml')
+        
+        # Encontra o conteúdo principal da notícia
+        conteudo_elements = soup.find_all('p', class_='content-text__container')
+        
+        # Junta todos os parágrafos em um único texto
+        return '\n\n'.join([p.get_text(strip=True) for p in conteudo_elements])
+    
     def _coletar_noticias_globo_esporte(self, clube: Clube, limite: int = 10) -> List[Dict[str, Any]]:
         """
         Coleta notícias reais do Globo Esporte para um clube específico.
@@ -202,9 +243,7 @@ class NewsCollector:
         noticias = []
         
         try:
-            # Formata o termo de busca (nome do clube)
-            termo_busca = quote_plus(clube.nome)
-            url_busca = f"{self.BASE_URL}?q={termo_busca}&order=recent&species=notícias"
+            url_busca = self._url_busca(clube)
             
             self.logger.info(f"Buscando notícias para {clube.nome} em: {url_busca}")
             
@@ -212,17 +251,7 @@ class NewsCollector:
             response = requests.get(url_busca, headers=self.HEADERS, timeout=10)
             response.raise_for_status()
             
-            # Faz o parsing do HTML
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # Encontra os elementos das notícias
-            noticias_elements = soup.find_all('li', class_='widget--info')
-            
-            # Processa cada notícia encontrada
-            for element in noticias_elements[:limite]:
-                noticia = self._parse_noticia_element(element)
-                if noticia:
-                    noticias.append(noticia)
+            noticias = self._extrair_noticias_busca(response.text, limite)
             
             # Se não encontrou notícias suficientes, tenta buscar mais páginas
             if len(noticias) < limite:
@@ -250,15 +279,7 @@ class NewsCollector:
             response = requests.get(url, headers=self.HEADERS, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # Encontra o conteúdo principal da notícia
-            conteudo_elements = soup.find_all('p', class_='content-text__container')
-            
-            # Junta todos os parágrafos em um único texto
-            conteudo = '\n\n'.join([p.get_text(strip=True) for p in conteudo_elements])
-            
-            return conteudo
+            return self._extrair_conteudo(response.text)
             
         except Exception as e:
             self.logger.error(f"Erro ao obter conteúdo da notícia {url}: {str(e)}")
@@ -338,12 +359,17 @@ class NewsCollector:
             self.logger.error(f"Erro ao fazer commit das notícias: {str(e)}", exc_info=True)
             return 0
     
-    def coletar_para_todos_clubes(self, limite_por_clube: int = 5) -> Dict:
+    def coletar_para_todos_clubes(self, limite_por_clube: int = 5, paralelo: bool = True,
+                                  max_simultaneas: int = 32, max_por_fonte: int = 8) -> Dict:
         """
         Coleta notícias para todos os clubes no banco de dados.
         
         Args:
             limite_por_clube: Número máximo de notícias a coletar por clube
+            paralelo: Coleta assíncrona de todos os clubes (ColetaParalelaNoticias);
+                False percorre os clubes um a um
+            max_simultaneas: Requisições simultâneas no total (modo paralelo)
+            max_por_fonte: Conexões simultâneas por fonte (modo paralelo)
             
         Returns:
             Dict: Estatísticas da coleta
@@ -363,6 +389,10 @@ class NewsCollector:
                     'clubes_processados': 0
                 }
             
+            if paralelo:
+                coleta = ColetaParalelaNoticias(self, max_simultaneas, max_por_fonte)
+                return coleta.executar(clubes, limite_por_clube)
+            
             # Coleta notícias para cada clube
             total_noticias = 0
             for clube in clubes:
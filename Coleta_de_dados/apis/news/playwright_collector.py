@@ -26,7 +26,7 @@ from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 from sqlalchemy.orm import Session
 
 # Importações locais
-from ..playwright_base import PlaywrightBaseScraper
+from ..playwright_base import PlaywrightBaseScraper, fechar_pools_navegadores
 from ...database.models import Clube, NoticiaClube
 from ...database.config import SessionLocal
 
@@ -503,6 +503,51 @@ class NewsPlaywrightCollector(PlaywrightBaseScraper):
         
         return False
     
+    async def _collect_from_source(self, source: str, club_name: str) -> List[Dict[str, Any]]:
+        """Coleta uma fonte para um clube em uma página isolada do pool."""
+        collectors = {
+            'ge_globo': self.collect_news_from_ge_globo,
+            'uol_esporte': self.collect_news_from_uol_esporte,
+            'espn_brasil': self.collect_news_from_espn_brasil
+        }
+        try:
+            async with self.worker_page(self.news_sources[source]['search_url']) as page:
+                logger.info(f"🎯 Coletando notícias de {source} para {club_name}")
+                return await collectors[source](club_name, page)
+        except Exception as e:
+            logger.error(f"Erro durante coleta de notícias de {source} para {club_name}: {e}")
+            return []
+    
+    async def collect_news_for_clubs(self, club_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Coleta notícias de todas as fontes para vários clubes em paralelo.
+        
+        Cada par (clube, fonte) roda em um worker de página do pool de
+        navegadores compartilhado; o pool limita as páginas simultâneas no
+        total e por site, no lugar das pausas fixas entre fontes.
+        
+        Args:
+            club_names: Nomes dos clubes
+            
+        Returns:
+            Dicionário clube -> notícias coletadas (na ordem das fontes)
+        """
+        tasks = [
+            (club_name, self._collect_from_source(source, club_name))
+            for club_name in club_names
+            for source in self.news_sources
+        ]
+        results = await asyncio.gather(*(task for _, task in tasks))
+        
+        all_news: Dict[str, List[Dict[str, Any]]] = {club_name: [] for club_name in club_names}
+        for (club_name, _), news in zip(tasks, results):
+            all_news[club_name].extend(news)
+        
+        for club_name, news in all_news.items():
+            logger.info(f"✅ {club_name}: {len(news)} notícias coletadas no total")
+        
+        return all_news
+    
     async def collect_all_news_for_club(self, club_name: str) -> List[Dict[str, Any]]:
         """
         Coleta notícias de todas as fontes para um clube específico.
@@ -513,49 +558,8 @@ class NewsPlaywrightCollector(PlaywrightBaseScraper):
         Returns:
             Lista de todas as notícias coletadas
         """
-        all_news = []
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=self.headless,
-                args=self.browser_args
-            )
-            
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent=self.user_agent
-            )
-            
-            page = await context.new_page()
-            await self.setup_page(page)
-            
-            try:
-                # Coleta do GE Globo
-                logger.info(f"🎯 Coletando notícias do GE Globo para {club_name}")
-                ge_news = await self.collect_news_from_ge_globo(club_name, page)
-                all_news.extend(ge_news)
-                await page.wait_for_timeout(2000)
-                
-                # Coleta do UOL Esporte
-                logger.info(f"🎯 Coletando notícias do UOL Esporte para {club_name}")
-                uol_news = await self.collect_news_from_uol_esporte(club_name, page)
-                all_news.extend(uol_news)
-                await page.wait_for_timeout(2000)
-                
-                # Coleta do ESPN Brasil
-                logger.info(f"🎯 Coletando notícias do ESPN Brasil para {club_name}")
-                espn_news = await self.collect_news_from_espn_brasil(club_name, page)
-                all_news.extend(espn_news)
-                
-                logger.info(f"✅ {club_name}: {len(all_news)} notícias coletadas no total")
-                
-            except Exception as e:
-                logger.error(f"Erro durante coleta de notícias: {e}")
-            
-            finally:
-                await browser.close()
-        
-        return all_news
+        all_news = await self.collect_news_for_clubs([club_name])
+        return all_news[club_name]
     
     async def save_to_database(self, news_data: List[Dict[str, Any]]) -> int:
         """
@@ -635,16 +639,13 @@ async def demo_news_collector():
         # Clubes para coletar notícias
         clubes = ["Flamengo", "Palmeiras", "Corinthians", "São Paulo"]
         
+        # Coleta notícias de todos os clubes em paralelo
+        all_news = await collector.collect_news_for_clubs(clubes)
         total_news = 0
         
-        for clube in clubes:
-            print(f"\n🏆 Coletando notícias para: {clube}")
-            
-            # Coleta notícias do clube
-            news = await collector.collect_all_news_for_club(clube)
+        for clube, news in all_news.items():
             total_news += len(news)
-            
-            print(f"   📰 {len(news)} notícias coletadas")
+            print(f"\n🏆 {clube}: {len(news)} notícias coletadas")
         
         print(f"\n📊 TOTAL: {total_news} notícias coletadas")
         
@@ -657,6 +658,9 @@ async def demo_news_collector():
     except Exception as e:
         print(f"❌ Erro durante demonstração: {e}")
         return False
+    
+    finally:
+        await fechar_pools_navegadores()
 
 if __name__ == "__main__":
     # Executa demonstração
@@ -6,6 +6,10 @@ Classe base para todos os scrapers usando Playwright da Microsoft.
 Oferece funcionalidades avançadas como auto-wait, screenshots, interceptação de requisições,
 e suporte a múltiplos navegadores.
 
+Os navegadores ficam em um pool compartilhado (PoolNavegadores): poucos
+navegadores de longa duração entregam contextos isolados aos scrapers e aos
+workers de página, com limite global de páginas simultâneas e limite por domínio.
+
 Autor: Sistema de Coleta de Dados
 Data: 2025-08-14
 Versão: 1.0
@@ -14,9 +18,12 @@ Versão: 1.0
 import asyncio
 import logging
 import time
-from typing import Optional, Dict, Any, List, Union
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Union, Tuple, AsyncIterator
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import urlparse
 import json
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Response, Request
@@ -24,6 +31,216 @@ from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 logger = logging.getLogger(__name__)
 
+# Argumentos padrão de lançamento dos navegadores
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor"
+]
+
+@dataclass
+class _NavegadorPool:
+    """Navegador do pool e número de contextos abertos nele."""
+    navegador: Browser
+    contextos: int = 0
+
+class PoolNavegadores:
+    """
+    Pool de navegadores Playwright compartilhado entre scrapers e coletores.
+    
+    Em vez de lançar um navegador por scraper (ou por clube), mantém até
+    ``max_navegadores`` navegadores abertos e entrega a cada tarefa um contexto
+    isolado (cookies, cache e storage próprios), que custa milissegundos.
+    
+    - ``novo_contexto``: contexto de longa duração (ex.: PlaywrightBaseScraper.start)
+    - ``pagina``: worker de página; respeita o limite global ``max_paginas`` e o
+      limite do domínio da URL, e fecha o contexto ao sair
+    - ``limite_dominio``: apenas o limite por domínio, para navegações avulsas
+    
+    Os limites por domínio casam também subdomínios: ``{"globo.com": 2}``
+    vale para ``ge.globo.com``. Domínios sem limite próprio usam
+    ``limite_por_dominio``.
+    
+    Uso:
+        pool = obter_pool_navegadores()
+        async with pool.pagina("https://ge.globo.com/busca/?q=flamengo") as page:
+            await page.goto(...)
+    """
+    
+    def __init__(
+        self,
+        browser_type: str = "chromium",
+        headless: bool = True,
+        max_navegadores: int = 2,
+        max_paginas: int = 8,
+        limite_por_dominio: int = 2,
+        limites_dominio: Dict[str, int] = None,
+        browser_args: List[str] = None
+    ):
+        """
+        Inicializa o pool (os navegadores são lançados sob demanda).
+        
+        Args:
+            browser_type: Tipo de navegador (chromium, firefox, webkit)
+            headless: Executar em modo headless
+            max_navegadores: Máximo de navegadores abertos
+            max_paginas: Máximo de workers de página simultâneos
+            limite_por_dominio: Páginas simultâneas por domínio (padrão)
+            limites_dominio: Limites específicos por domínio
+            browser_args: Argumentos de lançamento dos navegadores
+        """
+        self.browser_type = browser_type
+        self.headless = headless
+        self.max_navegadores = max(1, max_navegadores)
+        self.max_paginas = max(1, max_paginas)
+        self.limite_por_dominio = max(1, limite_por_dominio)
+        self.limites_dominio = dict(limites_dominio or {})
+        self.browser_args = list(browser_args or BROWSER_ARGS)
+        
+        self._playwright = None
+        self._navegadores: List[_NavegadorPool] = []
+        self._lock = asyncio.Lock()
+        self._paginas = asyncio.Semaphore(self.max_paginas)
+        self._dominios: Dict[str, asyncio.Semaphore] = {}
+        
+        # Métricas
+        self.navegadores_lancados = 0
+        self.contextos_criados = 0
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+    
+    def _chave_dominio(self, url: str) -> Tuple[str, int]:
+        """Domínio que limita a URL e o seu limite de páginas simultâneas."""
+        host = urlparse(url).hostname or url
+        for dominio, limite in self.limites_dominio.items():
+            if host == dominio or host.endswith(f".{dominio}"):
+                return dominio, limite
+        return host, self.limite_por_dominio
+    
+    @asynccontextmanager
+    async def limite_dominio(self, url: str) -> AsyncIterator[None]:
+        """Reserva uma vaga no domínio da URL enquanto o bloco executa."""
+        chave, limite = self._chave_dominio(url)
+        semaforo = self._dominios.get(chave)
+        if semaforo is None:
+            semaforo = self._dominios[chave] = asyncio.Semaphore(max(1, limite))
+        async with semaforo:
+            yield
+    
+    async def _lancar_navegador(self) -> Browser:
+        """Lança um navegador novo (inicia o Playwright na primeira vez)."""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        
+        if self.browser_type not in ("chromium", "firefox", "webkit"):
+            raise ValueError(f"Tipo de navegador inválido: {self.browser_type}")
+        browser_launcher = getattr(self._playwright, self.browser_type)
+        
+        logger.info(f"🚀 Lançando navegador do pool: {self.browser_type}")
+        return await browser_launcher.launch(headless=self.headless, args=self.browser_args)
+    
+    async def _reservar_navegador(self) -> _NavegadorPool:
+        """Escolhe o navegador menos ocupado, lançando outro se houver espaço."""
+        async with self._lock:
+            # Descarta navegadores que caíram; serão substituídos sob demanda
+            self._navegadores = [n for n in self._navegadores if n.navegador.is_connected()]
+            
+            entrada = min(self._navegadores, key=lambda n: n.contextos, default=None)
+            if entrada is None or (entrada.contextos > 0 and len(self._navegadores) < self.max_navegadores):
+                entrada = _NavegadorPool(await self._lancar_navegador())
+                self._navegadores.append(entrada)
+                self.navegadores_lancados += 1
+            
+            entrada.contextos += 1
+            return entrada
+    
+    @staticmethod
+    def _liberar(entrada: _NavegadorPool):
+        entrada.contextos = max(0, entrada.contextos - 1)
+    
+    async def novo_contexto(self, **opcoes_contexto) -> BrowserContext:
+        """
+        Cria um contexto isolado em um dos navegadores do pool.
+        
+        O chamador é responsável por fechar o contexto (``context.close()``),
+        o que libera a vaga no navegador.
+        """
+        entrada = await self._reservar_navegador()
+        try:
+            contexto = await entrada.navegador.new_context(**opcoes_contexto)
+        except Exception:
+            self._liberar(entrada)
+            raise
+        
+        contexto.on("close", lambda _: self._liberar(entrada))
+        self.contextos_criados += 1
+        return contexto
+    
+    @asynccontextmanager
+    async def pagina(self, url: str, **opcoes_contexto) -> AsyncIterator[Page]:
+        """
+        Worker de página: contexto isolado com uma página, fechado ao sair.
+        
+        Args:
+            url: URL (ou domínio) que a página vai visitar, para o limite por domínio
+            **opcoes_contexto: Opções de ``browser.new_context``
+        """
+        # Domínio antes da vaga global: quem espera um domínio cheio não bloqueia os outros
+        async with self.limite_dominio(url), self._paginas:
+            contexto = await self.novo_contexto(**opcoes_contexto)
+            try:
+                yield await contexto.new_page()
+            finally:
+                await contexto.close()
+    
+    async def stop(self):
+        """Fecha todos os navegadores do pool e para o Playwright."""
+        async with self._lock:
+            for entrada in self._navegadores:
+                try:
+                    await entrada.navegador.close()
+                except Exception as e:
+                    logger.error(f"❌ Erro ao fechar navegador do pool: {e}")
+            self._navegadores.clear()
+            
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
+                logger.info("🛑 Pool de navegadores encerrado")
+
+_pools_navegadores: Dict[Tuple[str, bool], Tuple[asyncio.AbstractEventLoop, PoolNavegadores]] = {}
+
+def obter_pool_navegadores(browser_type: str = "chromium", headless: bool = True, **kwargs) -> PoolNavegadores:
+    """
+    Retorna o pool compartilhado do tipo de navegador no event loop atual.
+    
+    Os demais argumentos de PoolNavegadores (limites) só valem na criação do
+    pool. Como objetos do Playwright pertencem a um event loop, um novo pool é
+    criado se o loop atual for outro (ex.: vários asyncio.run).
+    """
+    loop = asyncio.get_running_loop()
+    chave = (browser_type, headless)
+    registro = _pools_navegadores.get(chave)
+    if registro is not None and registro[0] is loop:
+        return registro[1]
+    
+    pool = PoolNavegadores(browser_type=browser_type, headless=headless, **kwargs)
+    _pools_navegadores[chave] = (loop, pool)
+    return pool
+
+async def fechar_pools_navegadores():
+    """Fecha os pools de navegadores do event loop atual (encerramento da aplicação)."""
+    loop = asyncio.get_running_loop()
+    for chave, (loop_pool, pool) in list(_pools_navegadores.items()):
+        if loop_pool is loop:
+            await pool.stop()
+            del _pools_navegadores[chave]
+
 class PlaywrightBaseScraper:
     """
     Classe base para scrapers usando Playwright.
@@ -47,7 +264,8 @@ class PlaywrightBaseScraper:
         timeout: int = 30000,
         screenshot_dir: str = "screenshots",
         enable_video: bool = False,
-        enable_har: bool = False
+        enable_har: bool = False,
+        pool: Optional[PoolNavegadores] = None
     ):
         """
         Inicializa o scraper base.
@@ -61,6 +279,7 @@ class PlaywrightBaseScraper:
             screenshot_dir: Diretório para screenshots
             enable_video: Gravar vídeo das sessões
             enable_har: Salvar arquivo HAR (HTTP Archive)
+            pool: Pool de navegadores (padrão: pool compartilhado do browser_type)
         """
         self.headless = headless
         self.browser_type = browser_type
@@ -70,6 +289,8 @@ class PlaywrightBaseScraper:
         self.screenshot_dir = Path(screenshot_dir)
         self.enable_video = enable_video
         self.enable_har = enable_har
+        self.pool = pool
+        self.browser_args = list(BROWSER_ARGS)
         
         # Criar diretório de screenshots
         self.screenshot_dir.mkdir(exist_ok=True)
@@ -99,72 +320,69 @@ class PlaywrightBaseScraper:
         """Context manager exit."""
         await self.stop()
     
+    def _get_pool(self) -> PoolNavegadores:
+        """Pool usado pelo scraper (o compartilhado, se nenhum foi informado)."""
+        if self.pool is None:
+            self.pool = obter_pool_navegadores(self.browser_type, self.headless)
+        return self.pool
+    
+    def context_options(self) -> Dict[str, Any]:
+        """Opções dos contextos criados pelo scraper."""
+        context_options = {
+            "viewport": self.viewport,
+            "user_agent": self.user_agent,
+            "ignore_https_errors": True,
+            "java_script_enabled": True
+        }
+        
+        # Adicionar gravação de vídeo se habilitado
+        if self.enable_video:
+            context_options["record_video_dir"] = str(self.screenshot_dir)
+            context_options["record_video_size"] = self.viewport
+        
+        # Adicionar HAR se habilitado
+        if self.enable_har:
+            har_path = self.screenshot_dir / f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.har"
+            context_options["record_har_path"] = str(har_path)
+        
+        return context_options
+    
+    async def setup_page(self, page: Page) -> None:
+        """Configura timeouts e handlers de erro de uma página."""
+        page.set_default_timeout(self.timeout)
+        page.set_default_navigation_timeout(self.timeout)
+        page.on("pageerror", self._handle_page_error)
+        page.on("requestfailed", self._handle_request_failed)
+    
+    @asynccontextmanager
+    async def worker_page(self, url: str) -> AsyncIterator[Page]:
+        """
+        Página isolada do pool para uma tarefa concorrente.
+        
+        Respeita os limites globais e por domínio do pool; o contexto é
+        fechado ao sair.
+        
+        Args:
+            url: URL que a tarefa vai visitar
+        """
+        async with self._get_pool().pagina(url, **self.context_options()) as page:
+            await self.setup_page(page)
+            yield page
+    
     async def start(self):
-        """Inicia o Playwright e navegador."""
+        """Obtém um contexto do pool de navegadores e abre a página do scraper."""
         try:
             logger.info("🚀 Iniciando Playwright...")
             
-            self.playwright = await async_playwright().start()
-            
-            # Selecionar navegador
-            if self.browser_type == "chromium":
-                browser_launcher = self.playwright.chromium
-            elif self.browser_type == "firefox":
-                browser_launcher = self.playwright.firefox
-            elif self.browser_type == "webkit":
-                browser_launcher = self.playwright.webkit
-            else:
-                raise ValueError(f"Tipo de navegador inválido: {self.browser_type}")
-            
-            # Configurações do navegador
-            browser_args = [
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-web-security",
-                "--disable-features=VizDisplayCompositor"
-            ]
-            
-            # Lançar navegador
-            self.browser = await browser_launcher.launch(
-                headless=self.headless,
-                args=browser_args
-            )
-            
-            # Configurações do contexto
-            context_options = {
-                "viewport": self.viewport,
-                "user_agent": self.user_agent,
-                "ignore_https_errors": True,
-                "java_script_enabled": True
-            }
-            
-            # Adicionar gravação de vídeo se habilitado
-            if self.enable_video:
-                video_path = self.screenshot_dir / f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
-                context_options["record_video_dir"] = str(self.screenshot_dir)
-                context_options["record_video_size"] = self.viewport
-            
-            # Adicionar HAR se habilitado
-            if self.enable_har:
-                har_path = self.screenshot_dir / f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.har"
-                context_options["record_har_path"] = str(har_path)
-            
-            # Criar contexto
-            self.context = await self.browser.new_context(**context_options)
+            # Criar contexto isolado em um navegador do pool (sem lançar navegador próprio)
+            self.context = await self._get_pool().novo_contexto(**self.context_options())
             
             # Configurar interceptação de requisições
             await self._setup_request_interception()
             
             # Criar página
             self.page = await self.context.new_page()
-            
-            # Configurar timeouts
-            self.page.set_default_timeout(self.timeout)
-            self.page.set_default_navigation_timeout(self.timeout)
-            
-            # Configurar handlers de erro
-            self.page.on("pageerror", self._handle_page_error)
-            self.page.on("requestfailed", self._handle_request_failed)
+            await self.setup_page(self.page)
             
             logger.info(f"✅ Playwright iniciado com sucesso: {self.browser_type}")
             
@@ -174,23 +392,17 @@ class PlaywrightBaseScraper:
             raise
     
     async def stop(self):
-        """Para o Playwright e fecha navegador."""
+        """Fecha a página e o contexto do scraper (os navegadores ficam no pool)."""
         try:
             if self.page:
                 await self.page.close()
+                self.page = None
                 logger.info("📄 Página fechada")
             
             if self.context:
                 await self.context.close()
+                self.context = None
                 logger.info("🔒 Contexto fechado")
-            
-            if self.browser:
-                await self.browser.close()
-                logger.info("🌐 Navegador fechado")
-            
-            if self.playwright:
-                await self.playwright.stop()
-                logger.info("🛑 Playwright parado")
                 
         except Exception as e:
             logger.error(f"❌ Erro ao parar Playwright: {e}")
@@ -242,7 +454,8 @@ class PlaywrightBaseScraper:
             try:
                 logger.info(f"🌐 Navegando para: {url} (tentativa {attempt + 1})")
                 
-                response = await self.page.goto(url, wait_until=wait_until)
+                async with self._get_pool().limite_dominio(url):
+                    response = await self.page.goto(url, wait_until=wait_until)
                 
                 if response and response.ok:
                     logger.info(f"✅ Navegação bem-sucedida: {response.status}")
@@ -478,5 +691,11 @@ class PlaywrightBaseScraper:
 
 # Função de conveniência para uso síncrono
 def run_async(coro):
-    """Executa corotina de forma síncrona."""
-    return asyncio.run(coro)
+    """Executa corotina de forma síncrona, fechando os navegadores do pool ao final."""
+    async def _executar():
+        try:
+            return await coro
+        finally:
+            await fechar_pools_navegadores()
+    
+    return asyncio.run(_executar())
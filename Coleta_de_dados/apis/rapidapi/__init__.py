@@ -45,7 +45,10 @@ from .sportapi7 import SportAPI7
 from .base_rapidapi import (
     RapidAPIBase,
     RapidAPICache,
-    CacheEntry
+    CacheEntry,
+    obter_sessao_http,
+    fechar_sessoes_http,
+    executar_coleta
 )
 
 # Sistema de fallback
@@ -161,6 +164,9 @@ __all__ = [
     "RapidAPIBase",
     "RapidAPICache",
     "CacheEntry",
+    "obter_sessao_http",
+    "fechar_sessoes_http",
+    "executar_coleta",
     
     # Sistema de fallback
     "APIFallbackManager",
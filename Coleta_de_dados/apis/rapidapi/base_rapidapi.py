@@ -8,6 +8,12 @@ CLASSE BASE PARA APIS RAPIDAPI
 Classe base que implementa as funções padronizadas para todas as APIs do RapidAPI.
 Fornece funcionalidades comuns como autenticação, rate limiting, retry e logging.
 
+As requisições usam uma sessão aiohttp compartilhada por host (keep-alive,
+cache de DNS e limite de conexões), e chamadas concorrentes para a mesma
+``cache_key`` são agrupadas em uma única requisição ao servidor. As sessões
+são fechadas no encerramento da API e ao fim de cada coleta executada com
+``executar_coleta``.
+
 Autor: Sistema de Coleta de Dados
 Data: 2025-08-14
 Versão: 1.0
@@ -16,7 +22,8 @@ Versão: 1.0
 import asyncio
 import json
 import time
-from typing import List, Dict, Any, Optional
+import weakref
+from typing import Awaitable, List, Dict, Any, Optional, Tuple, TypeVar
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 import aiohttp
@@ -36,6 +43,74 @@ class RapidAPIConfig:
     timeout: int = 30
     retry_attempts: int = 3
     retry_delay: float = 1.0
+    max_conexoes: int = 20
+
+T = TypeVar('T')
+
+# Sessões HTTP compartilhadas, por event loop: {loop: {(host, timeout, máx. conexões): sessão}}.
+# Sessões aiohttp pertencem ao loop em que foram criadas e nunca são usadas em outro;
+# a entrada de um loop some quando ele é coletado.
+_sessoes_http: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, int, int], aiohttp.ClientSession]]' = (
+    weakref.WeakKeyDictionary()
+)
+
+def _descartar_loops_encerrados() -> None:
+    """Remove os loops já fechados, avisando se alguma sessão deles ficou aberta."""
+    for loop in [loop for loop in list(_sessoes_http.keys()) if loop.is_closed()]:
+        abertas = [chave[0] for chave, sessao in _sessoes_http.pop(loop).items() if not sessao.closed]
+        if abertas:
+            logger.warning(
+                f"Sessões HTTP de um event loop encerrado não foram fechadas ({', '.join(abertas)}); "
+                "use executar_coleta ou fechar_sessoes_http antes de encerrar o loop"
+            )
+
+def obter_sessao_http(config: RapidAPIConfig) -> aiohttp.ClientSession:
+    """
+    Retorna a sessão aiohttp compartilhada do host da API no event loop atual.
+    
+    A sessão mantém conexões keep-alive e cache de DNS entre requisições e
+    entre clientes do mesmo host. Clientes com timeout ou limite de conexões
+    diferentes têm sessões próprias, e cada event loop tem as suas (ex.:
+    vários asyncio.run ou loops em threads diferentes).
+    """
+    loop = asyncio.get_running_loop()
+    _descartar_loops_encerrados()
+    sessoes = _sessoes_http.setdefault(loop, {})
+    chave = (config.host, config.timeout, config.max_conexoes)
+    sessao = sessoes.get(chave)
+    if sessao is not None and not sessao.closed:
+        return sessao
+    
+    conector = aiohttp.TCPConnector(
+        limit=config.max_conexoes,
+        limit_per_host=config.max_conexoes,
+        ttl_dns_cache=300,
+        keepalive_timeout=30
+    )
+    sessao = aiohttp.ClientSession(
+        connector=conector,
+        timeout=aiohttp.ClientTimeout(total=config.timeout)
+    )
+    sessoes[chave] = sessao
+    return sessao
+
+async def fechar_sessoes_http():
+    """Fecha as sessões HTTP compartilhadas do event loop atual (encerramento da aplicação)."""
+    sessoes = _sessoes_http.pop(asyncio.get_running_loop(), {})
+    for sessao in sessoes.values():
+        await sessao.close()
+
+def executar_coleta(coleta: Awaitable[T]) -> T:
+    """
+    Executa uma coleta em um novo event loop (como ``asyncio.run``) e fecha
+    as sessões HTTP compartilhadas ao final, mesmo em caso de erro.
+    """
+    async def executar() -> T:
+        try:
+            return await coleta
+        finally:
+            await fechar_sessoes_http()
+    return asyncio.run(executar())
 
 class CacheEntry:
     def __init__(self, data: Any, timestamp: float, ttl: int = 3600):
@@ -91,6 +166,8 @@ class RapidAPIBase(ABC):
         self._request_counts = {"daily": 0, "minute": 0}
         self._last_request_time = 0
         self._cache = RapidAPICache()
+        # Requisições em andamento por cache_key (single-flight)
+        self._em_andamento: Dict[str, asyncio.Task] = {}
         
         # Reset contadores diários à meia-noite
         self._schedule_daily_reset()
@@ -155,16 +232,34 @@ class RapidAPIBase(ABC):
             if cached_data is not None:
                 self.logger.info(f"Cache hit para {cache_key}")
                 return cached_data
+            
+            # Chamadas concorrentes para a mesma chave aguardam a mesma requisição
+            tarefa = self._em_andamento.get(cache_key)
+            if tarefa is None:
+                tarefa = asyncio.ensure_future(
+                    self._requisitar(url, params, headers, cache_key, cache_ttl)
+                )
+                self._em_andamento[cache_key] = tarefa
+                tarefa.add_done_callback(lambda _: self._em_andamento.pop(cache_key, None))
+            else:
+                self.logger.debug(f"Aguardando requisição em andamento para {cache_key}")
+            # shield: o cancelamento de um chamador não cancela os demais
+            return await asyncio.shield(tarefa)
+        
+        return await self._requisitar(url, params, headers, cache_key, cache_ttl)
+    
+    async def _requisitar(self, url: str, params: Optional[Dict[str, Any]],
+                          headers: Optional[Dict[str, Any]],
+                          cache_key: Optional[str], cache_ttl: int) -> Optional[Dict[str, Any]]:
+        """Executa a requisição HTTP (sem consultar o cache)"""
         
         # Verifica rate limits
         if not self._check_rate_limits():
             self.logger.warning("Rate limit atingido")
             return None
         
-        # Prepara headers
-        if headers is None:
-            headers = {}
-        
+        # Prepara headers (cópia: o dicionário do chamador não é alterado)
+        headers = dict(headers or {})
         headers.update({
             "X-RapidAPI-Key": self._get_next_api_key(),
             "X-RapidAPI-Host": self.config.host
@@ -173,36 +268,36 @@ class RapidAPIBase(ABC):
         # Faz requisição com retry
         for attempt in range(self.config.retry_attempts):
             try:
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.config.timeout)) as session:
-                    async with session.get(url, params=params, headers=headers) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            
-                            # Atualiza contadores
-                            self._update_request_counts()
-                            
-                            # Armazena no cache se especificado
-                            if cache_key:
-                                self._cache.set(cache_key, data, cache_ttl)
-                                self.logger.info(f"Dados armazenados no cache: {cache_key}")
-                            
-                            return data
+                session = obter_sessao_http(self.config)
+                async with session.get(url, params=params, headers=headers) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        
+                        # Atualiza contadores
+                        self._update_request_counts()
                         
-                        elif response.status == 403:
-                            error_data = await response.json()
-                            self.logger.error(f"Erro na requisição: {response.status} - {error_data}")
-                            if "You are not subscribed to this API" in str(error_data):
-                                self.logger.error("API não inscrita - verificar subscrição")
-                            return None
+                        # Armazena no cache se especificado
+                        if cache_key:
+                            self._cache.set(cache_key, data, cache_ttl)
+                            self.logger.info(f"Dados armazenados no cache: {cache_key}")
                         
-                        elif response.status == 429:
-                            error_data = await response.json()
-                            self.logger.warning(f"Rate limit atingido: {error_data}")
-                            return None
+                        return data
+                    
+                    elif response.status == 403:
+                        error_data = await response.json()
+                        self.logger.error(f"Erro na requisição: {response.status} - {error_data}")
+                        if "You are not subscribed to this API" in str(error_data):
+                            self.logger.error("API não inscrita - verificar subscrição")
+                        return None
+                    
+                    elif response.status == 429:
+                        error_data = await response.json()
+                        self.logger.warning(f"Rate limit atingido: {error_data}")
+                        return None
+                    
+                    else:
+                        self.logger.error(f"Erro na requisição: {response.status} - {await response.text()}")
                         
-                        else:
-                            self.logger.error(f"Erro na requisição: {response.status} - {await response.text()}")
-                            
             except Exception as e:
                 self.logger.error(f"Erro na tentativa {attempt + 1}: {e}")
                 if attempt < self.config.retry_attempts - 1:
@@ -2,11 +2,10 @@
 Bet365 Futebol Virtual API - Coleta de dados de futebol virtual e odds
 """
 
-import asyncio
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from .base_rapidapi import RapidAPIBase, RapidAPIConfig
+from .base_rapidapi import RapidAPIBase, RapidAPIConfig, executar_coleta
 
 
 class Bet365FutebolVirtualAPI(RapidAPIBase):
@@ -442,4 +441,4 @@ async def demo_bet365_futebol_virtual():
 
 
 if __name__ == "__main__":
-    asyncio.run(demo_bet365_futebol_virtual())
+    executar_coleta(demo_bet365_futebol_virtual())
@@ -142,8 +142,13 @@ class AdvancedCacheManager:
     def _start_cleanup_task(self):
         """Inicia tarefa de limpeza automática"""
         if not self.running:
-            self.running = True
-            self.cleanup_task = asyncio.create_task(self._cleanup_loop())
+            try:
+                self.cleanup_task = asyncio.get_running_loop().create_task(self._cleanup_loop())
+                self.running = True
+            except RuntimeError:
+                # Sem event loop (ex.: threads de trabalho): entradas expiradas
+                # são removidas sob demanda em get()
+                logger.debug("Cache criado fora de um event loop; limpeza automática desativada")
     
     async def _cleanup_loop(self):
         """Loop de limpeza automática"""
@@ -337,6 +342,16 @@ class AdvancedCacheManager:
                         result.append((key, value))
         return result
     
+    def invalidate_tag(self, tag: str) -> int:
+        """Remove todas as entradas com uma tag específica"""
+        with self._lock:
+            keys = list(self.tag_index.pop(tag, ()))
+            for key in keys:
+                self._remove_entry(key)
+        if keys:
+            logger.debug(f"Cache invalidado por tag '{tag}': {len(keys)} entradas")
+        return len(keys)
+    
     def get_by_priority(self, priority: int) -> List[Tuple[str, Any]]:
         """Recupera todas as entradas com uma prioridade específica"""
         result = []
@@ -466,6 +481,10 @@ def get_cache_by_tag(tag: str) -> List[Tuple[str, Any]]:
     """Recupera entradas por tag"""
     return get_advanced_cache_manager().get_by_tag(tag)
 
+def invalidate_cache_tag(tag: str) -> int:
+    """Remove entradas por tag"""
+    return get_advanced_cache_manager().invalidate_tag(tag)
+
 def get_cache_by_priority(priority: int) -> List[Tuple[str, Any]]:
     """Recupera entradas por prioridade"""
     return get_advanced_cache_manager().get_by_priority(priority)
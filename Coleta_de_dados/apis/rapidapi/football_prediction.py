@@ -4,9 +4,8 @@ Football Prediction API - RapidAPI
 Coleta previsões e probabilidades de futebol
 """
 
-import asyncio
 from typing import List, Dict, Any, Optional
-from .base_rapidapi import RapidAPIBase, RapidAPIConfig
+from .base_rapidapi import RapidAPIBase, RapidAPIConfig, executar_coleta
 from datetime import datetime
 
 
@@ -232,4 +231,4 @@ async def demo_football_prediction():
 
 
 if __name__ == "__main__":
-    asyncio.run(demo_football_prediction())
+    executar_coleta(demo_football_prediction())
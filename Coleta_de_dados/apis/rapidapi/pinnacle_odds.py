@@ -14,7 +14,7 @@ import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
-from .base_rapidapi import RapidAPIBase, RapidAPIConfig
+from .base_rapidapi import RapidAPIBase, RapidAPIConfig, executar_coleta
 
 logger = logging.getLogger(__name__)
 
@@ -348,5 +348,4 @@ async def demo_pinnacle_odds():
         return False
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(demo_pinnacle_odds())
+    executar_coleta(demo_pinnacle_odds())
@@ -4,9 +4,8 @@ Player Market Data API - RapidAPI
 Coleta dados de mercado de jogadores e transferências
 """
 
-import asyncio
 from typing import List, Dict, Any, Optional
-from .base_rapidapi import RapidAPIBase, RapidAPIConfig
+from .base_rapidapi import RapidAPIBase, RapidAPIConfig, executar_coleta
 
 
 class PlayerMarketDataAPI(RapidAPIBase):
@@ -208,4 +207,4 @@ async def demo_player_market_data():
 
 
 if __name__ == "__main__":
-    asyncio.run(demo_player_market_data())
+    executar_coleta(demo_player_market_data())
@@ -14,7 +14,7 @@ import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
-from .base_rapidapi import RapidAPIBase, RapidAPIConfig
+from .base_rapidapi import RapidAPIBase, RapidAPIConfig, executar_coleta
 
 logger = logging.getLogger(__name__)
 
@@ -356,5 +356,4 @@ async def demo_soccer_football_info():
         return False
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(demo_soccer_football_info())
+    executar_coleta(demo_soccer_football_info())
@@ -4,9 +4,8 @@ SportAPI7 API - RapidAPI
 Coleta dados esportivos avançados via RapidAPI
 """
 
-import asyncio
 from typing import List, Dict, Any, Optional
-from .base_rapidapi import RapidAPIBase, RapidAPIConfig
+from .base_rapidapi import RapidAPIBase, RapidAPIConfig, executar_coleta
 
 
 class SportAPI7(RapidAPIBase):
@@ -290,4 +289,4 @@ async def demo_sportapi7():
 
 
 if __name__ == "__main__":
-    asyncio.run(demo_sportapi7())
+    executar_coleta(demo_sportapi7())
@@ -14,7 +14,7 @@ import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
-from .base_rapidapi import RapidAPIBase, RapidAPIConfig
+from .base_rapidapi import RapidAPIBase, RapidAPIConfig, executar_coleta
 
 logger = logging.getLogger(__name__)
 
@@ -394,5 +394,4 @@ async def demo_sportspage_feeds():
         return False
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(demo_sportspage_feeds())
+    executar_coleta(demo_sportspage_feeds())
@@ -25,7 +25,7 @@ from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 from sqlalchemy.orm import Session
 
 # Importações locais
-from ..playwright_base import PlaywrightBaseScraper
+from ..playwright_base import PlaywrightBaseScraper, fechar_pools_navegadores
 from ...database.models import Clube, PostRedeSocial
 from ...database.config import SessionLocal
 
@@ -431,62 +431,48 @@ class SocialMediaPlaywrightCollector(PlaywrightBaseScraper):
             logger.warning(f"Erro ao extrair post do Facebook: {e}")
             return None
     
+    async def _collect_from_platform(self, platform: str, club_name: str, handle: str) -> List[Dict[str, Any]]:
+        """Coleta uma plataforma de um clube em uma página isolada do pool."""
+        collectors = {
+            'twitter': self.collect_twitter_posts,
+            'instagram': self.collect_instagram_posts,
+            'facebook': self.collect_facebook_posts
+        }
+        try:
+            async with self.worker_page(self.platforms[platform]['base_url']) as page:
+                logger.info(f"🎯 Coletando {platform} do clube: {club_name}")
+                return await collectors[platform](handle, page)
+        except Exception as e:
+            logger.error(f"Erro durante coleta de {platform} do clube {club_name}: {e}")
+            return []
+    
     async def collect_all_social_media_data(self, club_handles: Dict[str, Dict[str, str]]) -> Dict[str, List[Dict[str, Any]]]:
         """
         Coleta dados de todas as redes sociais de todos os clubes.
         
+        Cada par (clube, plataforma) roda em um worker de página do pool de
+        navegadores compartilhado, limitado no total e por plataforma.
+        
         Args:
             club_handles: Dicionário com handles das redes sociais por clube
             
         Returns:
             Dicionário com dados organizados por clube e plataforma
         """
-        all_data = {}
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=self.headless,
-                args=self.browser_args
-            )
-            
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent=self.user_agent
-            )
-            
-            page = await context.new_page()
-            await self.setup_page(page)
-            
-            try:
-                for club_name, handles in club_handles.items():
-                    logger.info(f"🎯 Coletando dados do clube: {club_name}")
-                    all_data[club_name] = {}
-                    
-                    # Coleta do Twitter
-                    if 'twitter' in handles:
-                        twitter_posts = await self.collect_twitter_posts(handles['twitter'], page)
-                        all_data[club_name]['twitter'] = twitter_posts
-                        await page.wait_for_timeout(2000)
-                    
-                    # Coleta do Instagram
-                    if 'instagram' in handles:
-                        instagram_posts = await self.collect_instagram_posts(handles['instagram'], page)
-                        all_data[club_name]['instagram'] = instagram_posts
-                        await page.wait_for_timeout(2000)
-                    
-                    # Coleta do Facebook
-                    if 'facebook' in handles:
-                        facebook_posts = await self.collect_facebook_posts(handles['facebook'], page)
-                        all_data[club_name]['facebook'] = facebook_posts
-                        await page.wait_for_timeout(2000)
-                    
-                    logger.info(f"✅ {club_name}: dados coletados de {len(all_data[club_name])} plataformas")
-                    
-            except Exception as e:
-                logger.error(f"Erro durante coleta de dados: {e}")
-            
-            finally:
-                await browser.close()
+        tasks = [
+            (club_name, platform, self._collect_from_platform(platform, club_name, handles[platform]))
+            for club_name, handles in club_handles.items()
+            for platform in self.platforms
+            if platform in handles
+        ]
+        results = await asyncio.gather(*(task for _, _, task in tasks))
+        
+        all_data = {club_name: {} for club_name in club_handles}
+        for (club_name, platform, _), posts in zip(tasks, results):
+            all_data[club_name][platform] = posts
+        
+        for club_name, platforms in all_data.items():
+            logger.info(f"✅ {club_name}: dados coletados de {len(platforms)} plataformas")
         
         return all_data
     
@@ -604,6 +590,9 @@ async def demo_social_media_collector():
     except Exception as e:
         print(f"❌ Erro durante demonstração: {e}")
         return False
+    
+    finally:
+        await fechar_pools_navegadores()
 
 if __name__ == "__main__":
     # Executa demonstração
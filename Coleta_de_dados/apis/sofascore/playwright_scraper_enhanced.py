@@ -25,7 +25,7 @@ from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 from sqlalchemy.orm import Session
 
 # Importações locais
-from ..playwright_base import PlaywrightBaseScraper
+from ..playwright_base import PlaywrightBaseScraper, fechar_pools_navegadores
 from ...database.models import PartidaSofascore, Clube
 from ...database.config import SessionLocal
 
@@ -341,48 +341,30 @@ class SofaScorePlaywrightScraperEnhanced(PlaywrightBaseScraper):
         
         return None
     
+    async def _collect_sport(self, sport: str) -> List[Dict[str, Any]]:
+        """Coleta um esporte em uma página isolada do pool."""
+        try:
+            async with self.worker_page(f"{self.base_url}/{sport}") as page:
+                logger.info(f"🎯 Coletando dados do esporte: {sport}")
+                matches = await self.collect_sport_matches(sport, page)
+                logger.info(f"✅ {sport}: {len(matches)} partidas coletadas")
+                return matches
+        except Exception as e:
+            logger.error(f"Erro durante coleta do esporte {sport}: {e}")
+            return []
+    
     async def collect_all_sports_data(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         Coleta dados de todos os esportes configurados.
         
+        Os esportes são coletados em workers de página do pool de navegadores;
+        o limite por domínio do pool controla o ritmo no SofaScore.
+        
         Returns:
             Dicionário com dados organizados por esporte
         """
-        all_data = {}
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=self.headless,
-                args=self.browser_args
-            )
-            
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent=self.user_agent
-            )
-            
-            page = await context.new_page()
-            await self.setup_page(page)
-            
-            try:
-                for sport in self.sports:
-                    logger.info(f"🎯 Coletando dados do esporte: {sport}")
-                    
-                    matches = await self.collect_sport_matches(sport, page)
-                    all_data[sport] = matches
-                    
-                    logger.info(f"✅ {sport}: {len(matches)} partidas coletadas")
-                    
-                    # Pausa entre esportes para evitar bloqueio
-                    await page.wait_for_timeout(2000)
-                    
-            except Exception as e:
-                logger.error(f"Erro durante coleta de dados: {e}")
-            
-            finally:
-                await browser.close()
-        
-        return all_data
+        results = await asyncio.gather(*(self._collect_sport(sport) for sport in self.sports))
+        return dict(zip(self.sports, results))
     
     async def save_to_database(self, data: Dict[str, List[Dict[str, Any]]]) -> int:
         """
@@ -469,6 +451,9 @@ async def demo_sofascore_enhanced():
     except Exception as e:
         print(f"❌ Erro durante demonstração: {e}")
         return False
+    
+    finally:
+        await fechar_pools_navegadores()
 
 if __name__ == "__main__":
     # Executa demonstração
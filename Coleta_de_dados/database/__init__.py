@@ -27,13 +27,19 @@ Versão: 1.0
 from .config import (
     get_db_manager,
     get_db,
+    sessao_async,
     init_database,
     SessionLocal
 )
 
+from .invalidacao_cache import invalidar_tabelas, instalar_invalidacao_orm
+
 # Criar instância global do db_manager
 db_manager = get_db_manager()
 
+# Escritas confirmadas pelo ORM invalidam os caches de leitura das tabelas afetadas
+instalar_invalidacao_orm()
+
 # Versão do módulo
 __version__ = "1.0.0"
 
@@ -42,6 +48,8 @@ __all__ = [
     # Configuração
     "get_db_manager",
     "get_db",
+    "sessao_async",
+    "invalidar_tabelas",
     "init_database",
     "SessionLocal",
     "db_manager",
@@ -11,7 +11,7 @@ Versão: 1.0
 """
 
 import os
-from typing import Optional
+from typing import Any, Callable, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator, ConfigDict
 from sqlalchemy import create_engine, MetaData, Engine, text
@@ -19,8 +19,11 @@ from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import QueuePool
 import logging
 from dotenv import load_dotenv
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 import time
+import anyio
+
+from .perfil_sqlite import SessaoSQLite, criar_engines_sqlite
 
 # Carregar variáveis de ambiente
 load_dotenv()
@@ -54,6 +57,20 @@ class DatabaseSettings(BaseSettings):
     max_overflow: int = Field(default=10, description="Máximo de conexões extras")
     pool_timeout: int = Field(default=30, description="Timeout para obter conexão do pool")
     pool_recycle: int = Field(default=3600, description="Reciclagem de conexões (segundos)")
+    db_session_limit: Optional[int] = Field(
+        default=None,
+        description="Sessões simultâneas abertas por código async (padrão: pool_size + max_overflow)"
+    )
+    
+    # Perfil do SQLite de fallback
+    sqlite_otimizado: bool = Field(
+        default=True,
+        description="WAL, synchronous=NORMAL, mmap e pools separadas de leitura/escrita no SQLite de fallback"
+    )
+    sqlite_mmap_size: int = Field(default=268435456, description="Bytes do arquivo mapeados em memória (mmap_size)")
+    sqlite_cache_size: int = Field(default=-65536, description="Páginas em cache por conexão (negativo = KiB)")
+    sqlite_busy_timeout: int = Field(default=30000, description="Espera por locks do arquivo em ms (busy_timeout)")
+    sqlite_pool_leitura: int = Field(default=8, description="Conexões de leitura mantidas na pool do SQLite")
     
     # Configurações de logging e debug
     log_level: str = Field(default="INFO", description="Nível de logging")
@@ -90,7 +107,9 @@ class DatabaseManager:
         self.logger = logging.getLogger(__name__)
         self.using_fallback = False
         self._engine: Optional[Engine] = None
+        self._engine_leitura: Optional[Engine] = None
         self._session_factory: Optional[sessionmaker] = None
+        self._limitador_sessoes: Optional[anyio.CapacityLimiter] = None
         # Usar a Base global em vez de criar uma nova
         self._base = Base
         self._metadata = MetaData()
@@ -98,7 +117,7 @@ class DatabaseManager:
         self.logger.info("DatabaseManager inicializado")
         
         # Criar engine e session factory
-        self._create_engine()
+        self._engine = self._create_engine()
         self._create_session_factory()
         
         # Configurar logging
@@ -112,16 +131,21 @@ class DatabaseManager:
             self._engine = self._create_engine()
         return self._engine
     
+    @property
+    def engine_leitura(self) -> Engine:
+        """
+        Engine para consultas somente leitura.
+        
+        No SQLite otimizado é a pool de conexões ``query_only``; nos demais
+        casos, o próprio ``engine``.
+        """
+        return self._engine_leitura or self.engine
+    
     @property
     def session_factory(self) -> sessionmaker:
         """Retorna a factory de sessões."""
         if self._session_factory is None:
-            self._session_factory = sessionmaker(
-                bind=self.engine,
-                expire_on_commit=False,
-                autoflush=True,
-                autocommit=False
-            )
+            self._create_session_factory()
         return self._session_factory
     
     @property
@@ -180,6 +204,17 @@ class DatabaseManager:
             sqlite_url = f"sqlite:///{sqlite_path}"
             
             logger.info(f"📁 Usando SQLite: {sqlite_url}")
+            self.using_fallback = True
+            
+            if self.settings.sqlite_otimizado:
+                engine, self._engine_leitura = criar_engines_sqlite(
+                    sqlite_url, self.settings, echo=self.settings.debug
+                )
+                logger.info(
+                    f"✅ Engine SQLite criado com sucesso (fallback, WAL, 1 conexão de escrita e "
+                    f"{self.settings.sqlite_pool_leitura} de leitura)"
+                )
+                return engine
             
             engine = create_engine(
                 sqlite_url,
@@ -192,23 +227,91 @@ class DatabaseManager:
                 }
             )
             
-            self.using_fallback = True
             logger.info("✅ Engine SQLite criado com sucesso (fallback)")
             return engine
     
     def _create_session_factory(self):
-        """Cria a factory de sessões."""
+        """Cria a factory de sessões (com leitura roteada no SQLite otimizado)."""
+        opcoes = {}
+        if self._engine_leitura is not None:
+            opcoes = {"class_": SessaoSQLite, "engine_leitura": self._engine_leitura}
         self._session_factory = sessionmaker(
             bind=self.engine,
             expire_on_commit=False,
             autoflush=True,
-            autocommit=False
+            autocommit=False,
+            **opcoes
         )
     
     def get_session(self):
         """Retorna uma nova sessão do banco de dados."""
         return self.session_factory()
     
+    @property
+    def limite_sessoes(self) -> int:
+        """
+        Número máximo de sessões abertas ao mesmo tempo por código async.
+
+        Por padrão acompanha a capacidade do pool (pool_size + max_overflow):
+        requisições além disso aguardam no event loop, sem ocupar threads.
+        """
+        if self.settings.db_session_limit:
+            return self.settings.db_session_limit
+        return self.settings.pool_size + self.settings.max_overflow
+    
+    @property
+    def limitador_sessoes(self) -> anyio.CapacityLimiter:
+        """Limitador de sessões simultâneas (criado sob demanda no event loop)."""
+        if self._limitador_sessoes is None:
+            self._limitador_sessoes = anyio.CapacityLimiter(self.limite_sessoes)
+        return self._limitador_sessoes
+    
+    def configurar_concorrencia(self):
+        """
+        Prepara o acesso concorrente ao banco a partir do event loop.
+        
+        Recria o limitador de sessões para o event loop atual e garante que o
+        threadpool do anyio (onde rodam endpoints ``def`` do FastAPI e a
+        serialização de suas respostas) tenha ao menos uma thread por sessão.
+        Com menos threads do que sessões, requisições segurando conexões
+        podem ficar esperando thread enquanto as threads esperam conexão.
+        Deve ser chamado dentro do event loop, por exemplo no lifespan.
+        """
+        self._limitador_sessoes = anyio.CapacityLimiter(self.limite_sessoes)
+        limitador_threads = anyio.to_thread.current_default_thread_limiter()
+        limitador_threads.total_tokens = max(limitador_threads.total_tokens, self.limite_sessoes)
+        logger.info(
+            f"🧵 Sessões simultâneas limitadas a {self.limite_sessoes} "
+            f"({limitador_threads.total_tokens} threads)"
+        )
+    
+    async def executar_em_sessao(self, funcao: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Executa ``funcao(session, *args, **kwargs)`` em uma thread do pool.
+        
+        Para código ``async`` que precisa do banco sem bloquear o event loop.
+        A sessão é criada, confirmada (commit) ou revertida e fechada na
+        própria thread de trabalho.
+        
+        Args:
+            funcao: Função síncrona que recebe a sessão como primeiro argumento
+            
+        Returns:
+            Any: Valor retornado por ``funcao``
+        """
+        def _executar():
+            with self.session_factory() as session:
+                try:
+                    resultado = funcao(session, *args, **kwargs)
+                    session.commit()
+                    return resultado
+                except Exception:
+                    session.rollback()
+                    raise
+        
+        async with self.limitador_sessoes:
+            return await anyio.to_thread.run_sync(_executar)
+    
     def create_all_tables(self):
         """Cria todas as tabelas definidas nos modelos."""
         logger.info("Criando todas as tabelas...")
@@ -272,6 +375,15 @@ class DatabaseManager:
             except AttributeError:
                 status["invalid"] = "N/A"
             
+            if self._engine_leitura is not None:
+                leitura = self._engine_leitura.pool
+                status["leitura"] = {
+                    "pool_size": leitura.size(),
+                    "checked_in": leitura.checkedin(),
+                    "checked_out": leitura.checkedout(),
+                    "overflow": leitura.overflow()
+                }
+            
             return status
         except Exception as e:
             return {"status": f"Erro ao obter status: {e}"}
@@ -280,6 +392,8 @@ class DatabaseManager:
         """Fecha todas as conexões do pool."""
         if self._engine:
             self._engine.dispose()
+            if self._engine_leitura is not None:
+                self._engine_leitura.dispose()
             logger.info("Todas as conexões fechadas")
     
     def _mask_password(self, url: str) -> str:
@@ -364,6 +478,29 @@ def get_db():
     finally:
         db.close()
 
+@asynccontextmanager
+async def sessao_async():
+    """
+    Abre uma sessão para endpoints síncronos (``def``) chamados pelo FastAPI.
+    
+    Reserva uma vaga no limitador de sessões antes de abrir a sessão, de modo
+    que requisições excedentes aguardem no event loop em vez de ocuparem uma
+    thread bloqueada no pool de conexões. O fechamento da sessão também roda
+    fora do event loop.
+    
+    Uso em uma dependency:
+        async def get_db():
+            async with sessao_async() as db:
+                yield db
+    """
+    manager = get_db_manager()
+    async with manager.limitador_sessoes:
+        db = manager.get_session()
+        try:
+            yield db
+        finally:
+            await anyio.to_thread.run_sync(db.close)
+
 def init_database():
     """Inicializa o banco de dados."""
     logger.info("🚀 Inicializando banco de dados...")
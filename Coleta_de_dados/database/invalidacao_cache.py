@@ -0,0 +1,151 @@
+"""
+INVALIDAÇÃO DE CACHE POR TABELA
+===============================
+
+Registro de versões por tag usado para invalidar caches de leitura (ex.: o
+cache de respostas da API) quando os coletores gravam no banco.
+
+Cada tag corresponde ao nome de uma tabela. Toda escrita confirmada incrementa
+a versão das tabelas afetadas; uma entrada de cache guarda as versões vigentes
+quando foi gerada e deixa de valer assim que qualquer uma delas muda.
+
+As versões ficam em um arquivo SQLite compartilhado, de modo que coletores
+rodando em outros processos invalidam o cache da API no mesmo host. Leituras
+usam uma cópia em memória renovada a cada ``intervalo`` segundos.
+
+Escritas pelo ORM e ``session.execute`` de INSERT/UPDATE/DELETE são
+detectadas automaticamente (eventos da Session). Código que grava com sqlite3
+ou conexões Core diretamente deve chamar ``invalidar_tabelas``.
+
+Autor: Sistema de API RESTful
+Data: 2025-08-15
+Versão: 1.0
+"""
+
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+CAMINHO_PADRAO = os.path.join(tempfile.gettempdir(), "apostapro_cache_tags.db")
+
+
+class RegistroVersoesTags:
+    """Versões por tag, em memória ou em arquivo SQLite compartilhado."""
+
+    def __init__(self, caminho: Optional[str] = None, intervalo: float = 1.0):
+        self.caminho = caminho
+        self.intervalo = intervalo
+        self._versoes: Dict[str, int] = {}
+        self._lido_em = 0.0
+        self._lock = threading.Lock()
+        if caminho:
+            with self._conectar() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS cache_tags (
+                        tag TEXT PRIMARY KEY,
+                        versao INTEGER NOT NULL
+                    )
+                """)
+
+    def _conectar(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.caminho, timeout=5)
+
+    def _recarregar(self):
+        with self._conectar() as conn:
+            self._versoes = dict(conn.execute("SELECT tag, versao FROM cache_tags"))
+        self._lido_em = time.monotonic()
+
+    def versoes(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        """Versões atuais das tags, na ordem informada."""
+        with self._lock:
+            if self.caminho and time.monotonic() - self._lido_em > self.intervalo:
+                try:
+                    self._recarregar()
+                except sqlite3.Error as e:
+                    logger.warning(f"Erro ao ler versões do cache: {e}")
+            return tuple(self._versoes.get(tag, 0) for tag in tags)
+
+    def invalidar(self, tags: Iterable[str]):
+        """Incrementa a versão das tags informadas."""
+        tags = sorted(set(tags))
+        if not tags:
+            return
+        with self._lock:
+            if self.caminho:
+                try:
+                    with self._conectar() as conn:
+                        conn.executemany(
+                            "INSERT INTO cache_tags (tag, versao) VALUES (?, 1) "
+                            "ON CONFLICT(tag) DO UPDATE SET versao = versao + 1",
+                            [(tag,) for tag in tags]
+                        )
+                    self._recarregar()
+                    logger.debug(f"Cache invalidado: {', '.join(tags)}")
+                    return
+                except sqlite3.Error as e:
+                    logger.warning(f"Erro ao registrar invalidação do cache: {e}")
+            for tag in tags:
+                self._versoes[tag] = self._versoes.get(tag, 0) + 1
+
+
+_registro: Optional[RegistroVersoesTags] = None
+
+
+def get_registro_versoes() -> RegistroVersoesTags:
+    """Retorna o registro global (arquivo em CACHE_TAGS_DB ou no diretório temporário)."""
+    global _registro
+    if _registro is None:
+        _registro = RegistroVersoesTags(os.getenv("CACHE_TAGS_DB", CAMINHO_PADRAO))
+    return _registro
+
+
+def invalidar_tabelas(*tabelas: str):
+    """Invalida caches que dependem das tabelas informadas."""
+    get_registro_versoes().invalidar(tabelas)
+
+
+def _registrar_tabelas_alteradas(session: Session, flush_context, instances):
+    alteradas = session.info.setdefault("tabelas_alteradas", set())
+    for objeto in (*session.new, *session.dirty, *session.deleted):
+        tabela = getattr(objeto, "__tablename__", None)
+        if tabela:
+            alteradas.add(tabela)
+
+
+def _registrar_dml(estado):
+    """Captura INSERT/UPDATE/DELETE executados via session.execute (operações em lote)."""
+    if estado.is_insert or estado.is_update or estado.is_delete:
+        tabela = getattr(estado.statement, "table", None)
+        nome = getattr(tabela, "name", None)
+        if nome:
+            estado.session.info.setdefault("tabelas_alteradas", set()).add(nome)
+
+
+def _invalidar_apos_commit(session: Session):
+    alteradas = session.info.pop("tabelas_alteradas", None)
+    if alteradas:
+        invalidar_tabelas(*alteradas)
+
+
+def _descartar_apos_rollback(session: Session):
+    session.info.pop("tabelas_alteradas", None)
+
+
+def instalar_invalidacao_orm():
+    """Invalida automaticamente as tabelas gravadas por qualquer Session do ORM."""
+    if event.contains(Session, "before_flush", _registrar_tabelas_alteradas):
+        return
+    event.listen(Session, "before_flush", _registrar_tabelas_alteradas)
+    event.listen(Session, "do_orm_execute", _registrar_dml)
+    event.listen(Session, "after_commit", _invalidar_apos_commit)
+    event.listen(Session, "after_rollback", _descartar_apos_rollback)
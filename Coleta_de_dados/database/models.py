@@ -1071,6 +1071,8 @@ class RecomendacaoAposta(Base):
         Index('idx_recomendacoes_status', 'status'),
         Index('idx_recomendacoes_modelo', 'modelo_utilizado'),
         Index('idx_recomendacoes_probabilidade', 'probabilidade'),
+        Index('idx_recomendacoes_mercado_data', 'mercado_aposta', 'created_at'),
+        Index('idx_recomendacoes_data', 'created_at'),
         UniqueConstraint('partida_id', 'mercado_aposta', 'previsao', name='uq_recomendacao_partida_mercado'),
     )
     
@@ -0,0 +1,152 @@
+"""
+PERFIL DE DESEMPENHO DO SQLITE DE FALLBACK
+==========================================
+
+Quando o PostgreSQL não está disponível, o DatabaseManager usa o arquivo
+``Banco_de_dados/aposta.db``. Coletores e API disputam esse arquivo, então o
+fallback é configurado para leitura concorrente:
+
+- WAL (leitores não bloqueiam o escritor nem o contrário), synchronous=NORMAL,
+  mmap, cache de páginas maior, temporários em memória e busy_timeout,
+  aplicados em cada conexão pelo evento ``connect`` do engine
+- Um engine de escrita com uma única conexão (as escritas do processo entram
+  em fila na pool, em vez de disputar o lock do arquivo) e um engine de
+  leitura com várias conexões ``query_only``
+- ``SessaoSQLite`` lê pela pool de leitura até a primeira escrita da
+  transação; a partir dela (flush, INSERT/UPDATE/DELETE) tudo vai para a
+  conexão de escrita, que enxerga as próprias alterações
+
+Uso:
+    escrita, leitura = criar_engines_sqlite("sqlite:///aposta.db", settings)
+    Sessao = sessionmaker(bind=escrita, class_=SessaoSQLite, engine_leitura=leitura)
+
+Autor: Sistema de Migração de Banco de Dados
+Data: 2026-10-16
+Versão: 1.0
+"""
+
+import logging
+import sqlite3
+from typing import Any, Tuple
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.elements import TextClause
+
+logger = logging.getLogger(__name__)
+
+# Comandos SQL textuais que só leem (os demais vão para a conexão de escrita)
+_COMANDOS_LEITURA = ("SELECT", "EXPLAIN")
+
+
+def pragmas(settings: Any, somente_leitura: bool = False) -> Tuple[str, ...]:
+    """PRAGMAs aplicados a cada nova conexão do perfil."""
+    comandos = (
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}",
+        f"PRAGMA cache_size={int(settings.sqlite_cache_size)}",
+        "PRAGMA temp_store=MEMORY",
+        f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout)}",
+    )
+    if somente_leitura:
+        return comandos + ("PRAGMA query_only=ON",)
+    # journal_mode é persistente no arquivo; só a conexão de escrita o define
+    return ("PRAGMA journal_mode=WAL",) + comandos
+
+
+def instalar_pragmas(engine: Engine, settings: Any, somente_leitura: bool = False) -> None:
+    """Aplica o perfil em cada conexão aberta pelo engine."""
+    comandos = pragmas(settings, somente_leitura)
+
+    @event.listens_for(engine, "connect")
+    def _configurar(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for comando in comandos:
+                cursor.execute(comando)
+        except sqlite3.DatabaseError as e:
+            # Arquivo inválido ou bloqueado: a conexão segue com o padrão do SQLite
+            logger.warning(f"⚠️ Perfil SQLite não aplicado ({comando}): {e}")
+        finally:
+            cursor.close()
+
+
+def criar_engines_sqlite(url: str, settings: Any, echo: bool = False) -> Tuple[Engine, Engine]:
+    """
+    Cria os engines de escrita (uma conexão) e de leitura (pool) do arquivo.
+
+    Returns:
+        Tuple[Engine, Engine]: (escrita, leitura)
+    """
+    connect_args = {
+        "check_same_thread": False,  # Conexões da pool passam entre threads
+        "timeout": settings.sqlite_busy_timeout / 1000,
+    }
+    escrita = create_engine(
+        url,
+        echo=echo,
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=settings.pool_timeout,
+        connect_args=connect_args,
+    )
+    leitura = create_engine(
+        url,
+        echo=echo,
+        poolclass=QueuePool,
+        pool_size=settings.sqlite_pool_leitura,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        connect_args=connect_args,
+    )
+    instalar_pragmas(escrita, settings)
+    instalar_pragmas(leitura, settings, somente_leitura=True)
+    return escrita, leitura
+
+
+def _somente_leitura(clause: Any) -> bool:
+    if clause is None:
+        return False
+    if getattr(clause, "is_select", False):
+        return True
+    if isinstance(clause, TextClause):
+        comando = clause.text.lstrip().split(None, 1)
+        return bool(comando) and comando[0].upper() in _COMANDOS_LEITURA
+    return False
+
+
+class SessaoSQLite(Session):
+    """
+    Sessão que lê pela pool de leitura até a primeira escrita da transação.
+
+    Leituras anteriores à primeira escrita usam um snapshot próprio da pool de
+    leitura; depois dela (flush ou comando DML), a sessão fica na conexão de
+    escrita até o commit ou rollback.
+
+    Args:
+        engine_leitura: Engine com as conexões ``query_only``
+    """
+
+    def __init__(self, *args, engine_leitura: Engine, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.engine_leitura = engine_leitura
+        self._escrevendo = False
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        if not self._escrevendo and not self._flushing:
+            if _somente_leitura(clause):
+                return self.engine_leitura
+            if clause is None:
+                # Consulta do bind sem comando (ex.: get_bind().dialect): não
+                # prende a sessão na única conexão de escrita
+                return super().get_bind(mapper, **kw)
+        self._escrevendo = True
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@event.listens_for(SessaoSQLite, "after_transaction_end")
+def _fim_transacao(session: SessaoSQLite, transaction) -> None:
+    if transaction.parent is None:
+        session._escrevendo = False
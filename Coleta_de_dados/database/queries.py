@@ -0,0 +1,132 @@
+"""
+CAMADA DE CONSULTAS - SISTEMA FBREF
+===================================
+
+Consultas reutilizáveis sobre os modelos ORM que carregam os relacionamentos
+necessários em uma única ida ao banco (joined/eager loading), evitando o
+padrão N+1 nos endpoints da API.
+
+Para listagens de clubes e jogadores, agregados são calculados em
+subconsultas e relacionamentos carregados em lote (SELECT ... IN), de modo
+que uma página custa sempre o mesmo número de consultas.
+
+Uso básico:
+    from Coleta_de_dados.database.queries import buscar_partida_completa
+
+    with SessionLocal() as session:
+        partida = buscar_partida_completa(session, 42)
+        partida.clube_casa.nome  # já carregado, sem nova consulta
+
+Autor: Sistema de API RESTful
+Data: 2025-08-15
+Versão: 1.0
+"""
+
+from typing import Optional
+
+from sqlalchemy import desc, func, nulls_last, select
+from sqlalchemy.orm import Query, Session, joinedload, selectinload
+
+from .models import Partida, Clube, Jogador
+
+
+def consultar_partidas_com_relacionamentos(session: Session) -> Query:
+    """
+    Retorna uma query de partidas com competição e clubes carregados via JOIN.
+
+    Os três relacionamentos muitos-para-um são resolvidos na mesma consulta
+    SQL, portanto acessar ``partida.competicao`` ou ``partida.clube_casa`` não
+    gera consultas adicionais. Filtros, ordenação e paginação podem ser
+    aplicados normalmente sobre o objeto retornado.
+
+    Args:
+        session: Sessão SQLAlchemy ativa
+
+    Returns:
+        Query: Query de ``Partida`` com eager loading configurado
+    """
+    return session.query(Partida).options(
+        joinedload(Partida.competicao),
+        joinedload(Partida.clube_casa),
+        joinedload(Partida.clube_visitante),
+    )
+
+
+def ordenar_partidas_recentes(query: Query) -> Query:
+    """Ordena partidas da mais recente para a mais antiga (nulos por último)."""
+    return query.order_by(
+        nulls_last(desc(Partida.data_partida)),
+        nulls_last(desc(Partida.horario)),
+        desc(Partida.id),
+    )
+
+
+def buscar_partida_completa(session: Session, partida_id: int) -> Optional[Partida]:
+    """
+    Busca uma partida com estatísticas, clubes e competição em uma única consulta.
+
+    Estatísticas, competição e clubes são unidos por LEFT OUTER JOIN no mesmo
+    SELECT através de ``joinedload``.
+
+    Args:
+        session: Sessão SQLAlchemy ativa
+        partida_id: ID da partida
+
+    Returns:
+        Optional[Partida]: Partida encontrada ou None
+    """
+    return (
+        consultar_partidas_com_relacionamentos(session)
+        .options(joinedload(Partida.estatisticas))
+        .filter(Partida.id == partida_id)
+        .one_or_none()
+    )
+
+
+def subconsulta_total_jogadores():
+    """
+    Subconsulta escalar correlacionada com o total de jogadores de um clube.
+
+    Resolvida pelo índice ``idx_jogadores_clube_atual`` apenas para as linhas
+    da página, sem agregar a tabela de jogadores inteira.
+    """
+    return (
+        select(func.count(Jogador.id))
+        .where(Jogador.clube_atual_id == Clube.id)
+        .correlate(Clube)
+        .scalar_subquery()
+    )
+
+
+def consultar_clubes_com_total_jogadores(query: Query) -> Query:
+    """
+    Acrescenta o total de jogadores a uma query de clubes já filtrada.
+
+    Cada linha retornada é uma tupla ``(Clube, total_jogadores)``; o país do
+    clube é carregado em lote com ``selectinload``.
+
+    Args:
+        query: Query de ``Clube`` com filtros aplicados
+
+    Returns:
+        Query: Query de ``(Clube, int)``
+    """
+    return query.add_columns(
+        subconsulta_total_jogadores().label("total_jogadores")
+    ).options(selectinload(Clube.pais))
+
+
+def consultar_jogadores_com_clube(session: Session) -> Query:
+    """
+    Retorna uma query de jogadores com o clube atual carregado em lote.
+
+    Após buscar a página de jogadores, os clubes referenciados são obtidos em
+    uma única consulta ``SELECT ... WHERE id IN (...)``.
+
+    Args:
+        session: Sessão SQLAlchemy ativa
+
+    Returns:
+        Query: Query de ``Jogador`` com ``selectinload`` do clube atual
+    """
+    return session.query(Jogador).options(selectinload(Jogador.clube_atual))
@@ -6,10 +6,13 @@ Responsável por preparação de dados, treinamento de modelos e geração de re
 from .preparacao_dados import PreparadorDadosML
 from .treinamento import TreinadorModeloML
 from .gerar_recomendacoes import GeradorRecomendacoes
+from .registro_modelos import RegistroModelos, obter_registro
 
 __all__ = [
     'PreparadorDadosML',
     'TreinadorModeloML', 
-    'GeradorRecomendacoes'
+    'GeradorRecomendacoes',
+    'RegistroModelos',
+    'obter_registro'
 ]
 
@@ -6,12 +6,12 @@ Responsável por usar modelos ML treinados para gerar previsões e recomendaçõ
 import pandas as pd
 import numpy as np
 import sqlite3
-import joblib
 import os
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 from .preparacao_dados import PreparadorDadosML
+from .registro_modelos import obter_registro, PREFIXO_APOSTAS
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
@@ -23,6 +23,7 @@ class GeradorRecomendacoes:
         self.db_path = db_path
         self.models_dir = models_dir
         self.modelo_carregado = None
+        self.versao_modelo = None
         self.preparador = PreparadorDadosML(db_path)
         
     def _get_connection(self) -> sqlite3.Connection:
@@ -37,56 +38,25 @@ class GeradorRecomendacoes:
             True se o modelo foi carregado com sucesso
         """
         try:
-            # Listar arquivos de modelo
             if not os.path.exists(self.models_dir):
                 logger.error(f"Diretório de modelos não encontrado: {self.models_dir}")
                 return False
             
-            arquivos_modelo = [f for f in os.listdir(self.models_dir) if f.endswith('.joblib')]
-            
-            if not arquivos_modelo:
-                logger.error("Nenhum arquivo de modelo encontrado")
-                return False
-            
-            # Encontrar o modelo mais recente
-            arquivos_com_timestamp = []
-            for arquivo in arquivos_modelo:
-                try:
-                    # Extrair timestamp do nome do arquivo
-                    if 'modelo_apostas_' in arquivo:
-                        # O formato é: modelo_apostas_gradient_boosting_20250814_061740.joblib
-                        # Precisamos pegar as duas últimas partes para formar o timestamp completo
-                        partes = arquivo.split('_')
-                        if len(partes) >= 5:
-                            # Últimas duas partes: 20250814 e 061740
-                            data_str = partes[-2]  # 20250814
-                            hora_str = partes[-1].replace('.joblib', '')  # 061740
-                            timestamp_str = f"{data_str}_{hora_str}"  # 20250814_061740
-                            timestamp = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-                            arquivos_com_timestamp.append((arquivo, timestamp))
-                except Exception as e:
-                    logger.warning(f"Erro ao processar arquivo {arquivo}: {e}")
-                    continue
-            
-            if not arquivos_com_timestamp:
-                logger.error("Não foi possível extrair timestamp dos arquivos de modelo")
-                return False
-            
-            # Ordenar por timestamp e pegar o mais recente
-            arquivos_com_timestamp.sort(key=lambda x: x[1], reverse=True)
-            modelo_mais_recente = arquivos_com_timestamp[0][0]
-            
-            caminho_modelo = os.path.join(self.models_dir, modelo_mais_recente)
-            logger.info(f"Carregando modelo: {modelo_mais_recente}")
-            
-            # Carregar modelo
-            self.modelo_carregado = joblib.load(caminho_modelo)
+            # Versão residente do registro: o arquivo só é lido na primeira vez
+            # (ou quando um modelo mais novo aparece no diretório)
+            versao = obter_registro(self.models_dir).obter(PREFIXO_APOSTAS)
+            self.versao_modelo = versao
+            self.modelo_carregado = versao.dados
             
+            logger.info(f"Modelo em uso: {versao.arquivo}")
             logger.info(f"✅ Modelo carregado com sucesso: {self.modelo_carregado['tipo_modelo']}")
             logger.info(f"📊 Accuracy: {self.modelo_carregado['accuracy']:.4f}")
             
             return True
             
+        except FileNotFoundError as e:
+            logger.error(f"Nenhum arquivo de modelo encontrado: {e}")
+            return False
         except Exception as e:
             logger.error(f"Erro ao carregar modelo: {e}")
             return False
@@ -127,7 +97,7 @@ class GeradorRecomendacoes:
         logger.info(f"Encontradas {len(partidas)} partidas futuras sem recomendações")
         return partidas
     
-    def _preparar_features_partida(self, partida: pd.Series, partidas_historicas: pd.DataFrame) -> np.ndarray:
+    def _preparar_features_partida(self, partida: Dict[str, Any], partidas_historicas: pd.DataFrame) -> np.ndarray:
         """
         Prepara features para uma partida específica
         
@@ -136,7 +106,7 @@ class GeradorRecomendacoes:
             partidas_historicas: DataFrame com partidas históricas para cálculo de forma
         
         Returns:
-            Array com features normalizadas
+            Array com features na ordem do treinamento (sem normalização)
         """
         # Calcular forma dos times
         forma_casa = self.preparador._calcular_forma_time(
@@ -176,44 +146,46 @@ class GeradorRecomendacoes:
             sentimento_casa['sentimento_medio'] - sentimento_visitante['sentimento_medio']
         ])
         
-        # Normalizar features usando o scaler do modelo
-        features_scaled = self.modelo_carregado['scaler'].transform(features.reshape(1, -1))
-        
-        return features_scaled
+        return features
     
-    def _gerar_previsoes_partida(self, features: np.ndarray) -> Dict[str, Any]:
+    def _gerar_previsoes_lote(self, features: np.ndarray) -> List[Dict[str, Any]]:
         """
-        Gera previsões para uma partida usando o modelo treinado
+        Gera previsões para várias partidas com uma única chamada ao modelo
         
         Args:
-            features: Features normalizadas da partida
+            features: Matriz com uma linha de features (sem normalização) por partida
         
         Returns:
-            Dicionário com previsões e probabilidades
+            Lista com previsões e probabilidades, na ordem das linhas
         """
         modelo = self.modelo_carregado['modelo']
         label_encoder = self.modelo_carregado['label_encoder']
         
-        # Fazer previsão
-        previsao_encoded = modelo.predict(features)[0]
-        previsao = label_encoder.inverse_transform([previsao_encoded])[0]
-        
-        # Obter probabilidades
-        probabilidades = modelo.predict_proba(features)[0]
-        
-        # Criar dicionário de resultados
-        resultados = {}
-        for i, classe in enumerate(label_encoder.classes_):
-            resultados[classe] = {
-                'probabilidade': float(probabilidades[i]),
-                'odd_justa': 1.0 / probabilidades[i] if probabilidades[i] > 0 else 999.0
-            }
-        
-        return {
-            'previsao_principal': previsao,
-            'probabilidade_principal': float(probabilidades[previsao_encoded]),
-            'todas_probabilidades': resultados
-        }
+        # Normalizar e obter probabilidades de todas as partidas de uma vez
+        features_scaled = self.modelo_carregado['scaler'].transform(features)
+        probabilidades = modelo.predict_proba(features_scaled)
+        
+        # A previsão é a classe mais provável (o mesmo que modelo.predict)
+        indices = probabilidades.argmax(axis=1)
+        previsoes = label_encoder.inverse_transform(modelo.classes_[indices])
+        
+        resultados_lote = []
+        for linha, indice, previsao in zip(probabilidades, indices, previsoes):
+            # Criar dicionário de resultados
+            resultados = {}
+            for i, classe in enumerate(label_encoder.classes_):
+                resultados[classe] = {
+                    'probabilidade': float(linha[i]),
+                    'odd_justa': 1.0 / linha[i] if linha[i] > 0 else 999.0
+                }
+            
+            resultados_lote.append({
+                'previsao_principal': previsao,
+                'probabilidade_principal': float(linha[indice]),
+                'todas_probabilidades': resultados
+            })
+        
+        return resultados_lote
     
     def _salvar_recomendacao(self, partida_id: int, mercado: str, previsao: str, 
                             probabilidade: float, odd_justa: float = None) -> bool:
@@ -280,16 +252,30 @@ class GeradorRecomendacoes:
         
         recomendacoes_geradas = []
         
-        for _, partida in partidas_futuras.iterrows():
+        # Preparar features de todas as partidas
+        partidas_validas = []
+        linhas_features = []
+        for partida in partidas_futuras.to_dict('records'):
+            try:
+                linhas_features.append(self._preparar_features_partida(partida, partidas_historicas))
+                partidas_validas.append(partida)
+            except Exception as e:
+                logger.error(f"Erro ao preparar features da partida {partida['id']}: {e}")
+        
+        if not partidas_validas:
+            return []
+        
+        # Uma única normalização e previsão para todas as partidas
+        try:
+            previsoes_lote = self._gerar_previsoes_lote(np.vstack(linhas_features))
+        except Exception as e:
+            logger.error(f"Erro ao gerar previsões: {e}")
+            return []
+        
+        for partida, previsoes in zip(partidas_validas, previsoes_lote):
             try:
                 logger.info(f"Analisando partida: {partida['nome_time_casa']} vs {partida['nome_time_visitante']}")
                 
-                # Preparar features
-                features = self._preparar_features_partida(partida, partidas_historicas)
-                
-                # Gerar previsões
-                previsoes = self._gerar_previsoes_partida(features)
-                
                 # Salvar recomendações para diferentes mercados
                 recomendacoes_partida = []
                 
@@ -370,6 +356,11 @@ class GeradorRecomendacoes:
                 logger.error(f"Erro ao gerar recomendações para partida {partida['id']}: {e}")
                 continue
         
+        if recomendacoes_geradas:
+            # Resumos em cache (ex.: /recomendacoes/resumo) dependem desta tabela
+            from Coleta_de_dados.database.invalidacao_cache import invalidar_tabelas
+            invalidar_tabelas("recomendacoes_apostas")
+        
         logger.info(f"🎯 Processo concluído: {len(recomendacoes_geradas)} partidas processadas")
         return recomendacoes_geradas
     
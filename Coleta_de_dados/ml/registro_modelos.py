@@ -0,0 +1,358 @@
+"""
+Registro de Modelos Residentes
+Mantém em memória a versão mais recente de cada família de modelos de
+ml_models/saved_models e agrupa previsões concorrentes em lotes
+
+- Cada arquivo é carregado uma única vez, com os arrays grandes mapeados em
+  memória (``joblib.load(..., mmap_mode='r')``)
+- Uma versão nova (arquivo ``<prefixo>AAAAMMDD_HHMMSS.joblib`` mais recente)
+  é detectada pela data de modificação do diretório, carregada por completo
+  e só então trocada, atomicamente; quem já pegou a versão anterior termina
+  com ela. Um arquivo ainda sendo gravado falha ao carregar e é tentado de
+  novo na próxima verificação
+- ``prever_proba`` enfileira as linhas de cada chamada; uma thread por
+  família junta tudo o que chegou enquanto o lote anterior era calculado e
+  faz uma única chamada a ``predict_proba``
+
+Uso:
+    registro = obter_registro()
+    versao, probabilidades = registro.prever_proba('modelo_apostas_', features)
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+DIRETORIO_MODELOS = os.path.join(PROJECT_ROOT, 'ml_models', 'saved_models')
+
+# Modelos de recomendação gerados pelo TreinadorModeloML
+PREFIXO_APOSTAS = 'modelo_apostas_'
+
+# Famílias em que o nome do modelo fica entre o prefixo e o timestamp
+# (o TreinadorModeloML grava modelo_apostas_<melhor modelo>_AAAAMMDD_HHMMSS.joblib)
+FAMILIAS_COM_NOME_MODELO = frozenset({PREFIXO_APOSTAS})
+
+
+def padrao_arquivos(prefixo: str) -> re.Pattern:
+    """
+    Nome exato dos arquivos da família: ``<prefixo>AAAAMMDD_HHMMSS.joblib``.
+
+    Só casa o timestamp logo após o prefixo, então ``rf_`` não pega
+    ``rf_tuned_<timestamp>.joblib``.
+    """
+    nome_modelo = r'(?:\w+_)?' if prefixo in FAMILIAS_COM_NOME_MODELO else ''
+    return re.compile(rf'{re.escape(prefixo)}{nome_modelo}(\d{{8}}_\d{{6}})\.joblib')
+
+
+@dataclass(frozen=True)
+class VersaoModelo:
+    """Versão carregada de um modelo; imutável, pode ser usada por várias threads."""
+    prefixo: str
+    arquivo: str
+    dados: Dict[str, Any] = field(repr=False)
+    modelo: Any = field(repr=False)
+    scaler: Any = field(repr=False)
+    classes: Tuple[Any, ...]
+    feature_names: Tuple[str, ...]
+    carregado_em: float
+
+    @property
+    def n_features(self) -> Optional[int]:
+        if self.feature_names:
+            return len(self.feature_names)
+        return getattr(self.modelo, 'n_features_in_', None)
+
+    def prever_proba(self, X: np.ndarray) -> np.ndarray:
+        """Probabilidades por classe (normaliza com o scaler do modelo, se houver)."""
+        if self.scaler is not None:
+            X = self.scaler.transform(X)
+        return self.modelo.predict_proba(X)
+
+
+def abrir_versao(caminho: str, prefixo: str = '', mmap_mode: Optional[str] = 'r') -> VersaoModelo:
+    """
+    Carrega um arquivo de modelo nos formatos do projeto.
+
+    Aceita o dicionário do TreinadorModeloML (``modelo``, ``scaler``,
+    ``label_encoder``, ``feature_names``) e o do MLModelManager (``model``,
+    ``metadata``).
+    """
+    dados = joblib.load(caminho, mmap_mode=mmap_mode)
+    if 'modelo' in dados:
+        modelo, scaler = dados['modelo'], dados.get('scaler')
+        feature_names = dados.get('feature_names') or ()
+        label_encoder = dados.get('label_encoder')
+    elif 'model' in dados:
+        modelo, scaler = dados['model'], None
+        feature_names = dados.get('metadata', {}).get('feature_names') or ()
+        label_encoder = None
+    else:
+        raise ValueError(f"Formato de modelo desconhecido: {os.path.basename(caminho)}")
+
+    classes = label_encoder.classes_ if label_encoder is not None else getattr(modelo, 'classes_', ())
+    return VersaoModelo(
+        prefixo=prefixo,
+        arquivo=os.path.basename(caminho),
+        dados=dados,
+        modelo=modelo,
+        scaler=scaler,
+        classes=tuple(classes.tolist() if isinstance(classes, np.ndarray) else classes),
+        feature_names=tuple(feature_names),
+        carregado_em=time.time(),
+    )
+
+
+class MicroLote:
+    """
+    Junta previsões concorrentes de uma família em uma chamada a ``predict_proba``.
+
+    Não há espera artificial: o lote é tudo o que chegou enquanto o anterior
+    era calculado (até ``max_linhas``), então um cliente sozinho não paga
+    latência extra.
+    """
+
+    def __init__(self, registro: 'RegistroModelos', prefixo: str, max_linhas: int = 1024):
+        self.registro = registro
+        self.prefixo = prefixo
+        self.max_linhas = max(1, max_linhas)
+        self._fila: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._executar, name=f"micro-lote-{prefixo}", daemon=True)
+        self._thread.start()
+        self.stats = {'lotes': 0, 'linhas': 0, 'pedidos': 0, 'maior_lote': 0}
+
+    def enviar(self, X: np.ndarray) -> Future:
+        futuro: Future = Future()
+        self._fila.put((X, futuro))
+        return futuro
+
+    def _proximo_lote(self) -> List[Tuple[np.ndarray, Future]]:
+        pedidos = [self._fila.get()]
+        linhas = len(pedidos[0][0])
+        while linhas < self.max_linhas:
+            try:
+                pedido = self._fila.get_nowait()
+            except queue.Empty:
+                break
+            pedidos.append(pedido)
+            linhas += len(pedido[0])
+        return pedidos
+
+    def _executar(self):
+        while True:
+            pedidos = self._proximo_lote()
+            try:
+                versao = self.registro.obter(self.prefixo)
+                matriz = pedidos[0][0] if len(pedidos) == 1 else np.vstack([X for X, _ in pedidos])
+                probabilidades = versao.prever_proba(matriz)
+            except Exception as e:
+                for _, futuro in pedidos:
+                    futuro.set_exception(e)
+                continue
+
+            self.stats['lotes'] += 1
+            self.stats['pedidos'] += len(pedidos)
+            self.stats['linhas'] += len(matriz)
+            self.stats['maior_lote'] = max(self.stats['maior_lote'], len(pedidos))
+            inicio = 0
+            for X, futuro in pedidos:
+                futuro.set_result((versao, probabilidades[inicio:inicio + len(X)]))
+                inicio += len(X)
+
+
+class RegistroModelos:
+    """
+    Modelos residentes de um diretório, com troca a quente e micro-lotes.
+
+    Args:
+        models_dir: Diretório com os arquivos ``.joblib``
+        intervalo_verificacao: Segundos entre verificações de versões novas
+        mmap_mode: Repassado ao ``joblib.load`` (None carrega tudo na memória)
+        max_linhas_lote: Linhas por chamada a ``predict_proba``
+    """
+
+    def __init__(self, models_dir: str = DIRETORIO_MODELOS, intervalo_verificacao: float = 2.0,
+                 mmap_mode: Optional[str] = 'r', max_linhas_lote: int = 1024):
+        self.models_dir = models_dir
+        self.intervalo_verificacao = intervalo_verificacao
+        self.mmap_mode = mmap_mode
+        self.max_linhas_lote = max_linhas_lote
+
+        self._versoes: Dict[str, VersaoModelo] = {}
+        self._proxima_verificacao: Dict[str, float] = {}
+        self._assinatura_verificada: Dict[str, Optional[int]] = {}
+        self._lock = threading.Lock()
+        self._lotes: Dict[str, MicroLote] = {}
+        self.trocas = 0
+
+    # ------------------------------------------------------------------
+    # Versões
+    # ------------------------------------------------------------------
+
+    def _assinatura_diretorio(self) -> Optional[int]:
+        try:
+            return os.stat(self.models_dir).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def arquivo_mais_recente(self, prefixo: str) -> Optional[str]:
+        """Arquivo da versão mais recente da família (timestamp no nome)."""
+        padrao = padrao_arquivos(prefixo)
+        candidatos = []
+        with os.scandir(self.models_dir) as entradas:
+            for entrada in entradas:
+                versao = padrao.fullmatch(entrada.name)
+                if versao:
+                    candidatos.append((versao.group(1), entrada.name))
+        return max(candidatos)[1] if candidatos else None
+
+    def _atualizar(self, prefixo: str) -> None:
+        """Carrega a versão mais recente se mudou; chamada com o lock."""
+        assinatura = self._assinatura_diretorio()
+        atual = self._versoes.get(prefixo)
+        if atual is not None and assinatura == self._assinatura_verificada.get(prefixo):
+            return
+        if assinatura is None:
+            raise FileNotFoundError(f"Diretório de modelos não encontrado: {self.models_dir}")
+
+        arquivo = self.arquivo_mais_recente(prefixo)
+        if arquivo is None:
+            raise FileNotFoundError(f"Nenhum arquivo de modelo '{prefixo}*' em {self.models_dir}")
+        if atual is None or arquivo != atual.arquivo:
+            try:
+                nova = abrir_versao(os.path.join(self.models_dir, arquivo), prefixo, self.mmap_mode)
+            except Exception as e:
+                if atual is None:
+                    raise
+                # Provavelmente ainda sendo gravado: mantém a versão atual e tenta de novo depois
+                logger.warning(f"Falha ao carregar {arquivo}, mantendo {atual.arquivo}: {e}")
+                return
+            self._versoes[prefixo] = nova
+            if atual is not None:
+                self.trocas += 1
+                logger.info(f"Modelo '{prefixo}' trocado: {atual.arquivo} -> {arquivo}")
+            else:
+                logger.info(f"Modelo '{prefixo}' carregado: {arquivo}")
+        self._assinatura_verificada[prefixo] = assinatura
+
+    def obter(self, prefixo: str = PREFIXO_APOSTAS) -> VersaoModelo:
+        """
+        Versão residente da família, verificando versões novas a cada
+        ``intervalo_verificacao`` segundos.
+
+        Raises:
+            FileNotFoundError: Diretório ou arquivos do modelo inexistentes
+        """
+        versao = self._versoes.get(prefixo)
+        agora = time.monotonic()
+        if versao is not None and agora < self._proxima_verificacao.get(prefixo, 0.0):
+            return versao
+
+        # Só uma thread verifica; as demais seguem com a versão atual
+        if not self._lock.acquire(blocking=versao is None):
+            return versao
+        try:
+            self._proxima_verificacao[prefixo] = agora + self.intervalo_verificacao
+            self._atualizar(prefixo)
+            return self._versoes[prefixo]
+        finally:
+            self._lock.release()
+
+    def recarregar(self, prefixo: str = PREFIXO_APOSTAS) -> VersaoModelo:
+        """Verifica versões novas imediatamente."""
+        self._proxima_verificacao.pop(prefixo, None)
+        self._assinatura_verificada.pop(prefixo, None)
+        return self.obter(prefixo)
+
+    def tem_modelo(self, prefixo: str) -> bool:
+        if prefixo in self._versoes:
+            return True
+        try:
+            return self.arquivo_mais_recente(prefixo) is not None
+        except FileNotFoundError:
+            return False
+
+    # ------------------------------------------------------------------
+    # Previsão em lote
+    # ------------------------------------------------------------------
+
+    def _micro_lote(self, prefixo: str) -> MicroLote:
+        lote = self._lotes.get(prefixo)
+        if lote is None:
+            with self._lock:
+                lote = self._lotes.get(prefixo)
+                if lote is None:
+                    lote = self._lotes[prefixo] = MicroLote(self, prefixo, self.max_linhas_lote)
+        return lote
+
+    def _enviar(self, prefixo: str, features: Sequence) -> Future:
+        X = np.asarray(features, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        esperadas = self.obter(prefixo).n_features
+        if X.ndim != 2 or (esperadas is not None and X.shape[1] != esperadas):
+            # Validado antes de entrar no lote, para não derrubar os pedidos dos outros
+            raise ValueError(f"Esperadas {esperadas} features por linha, recebido shape {X.shape}")
+        return self._micro_lote(prefixo).enviar(X)
+
+    def prever_proba(self, prefixo: str, features: Sequence,
+                     timeout: Optional[float] = None) -> Tuple[VersaoModelo, np.ndarray]:
+        """
+        Probabilidades das linhas de ``features`` (uma linha ou uma matriz).
+
+        Returns:
+            (versão usada, array linhas x classes)
+        """
+        return self._enviar(prefixo, features).result(timeout)
+
+    async def prever_proba_async(self, prefixo: str, features: Sequence) -> Tuple[VersaoModelo, np.ndarray]:
+        """Como ``prever_proba``, sem bloquear o event loop."""
+        return await asyncio.wrap_future(self._enviar(prefixo, features))
+
+    @staticmethod
+    def formatar(versao: VersaoModelo, probabilidades: np.ndarray) -> List[Dict[str, Any]]:
+        """Uma previsão por linha: classe mais provável, confiança e probabilidades."""
+        indices = probabilidades.argmax(axis=1)
+        return [
+            {
+                'prediction': versao.classes[indice] if versao.classes else int(indice),
+                'confidence': float(linha[indice]),
+                'probabilities': dict(zip(map(str, versao.classes), linha.tolist()))
+                if versao.classes else linha.tolist(),
+                'model_key': versao.prefixo.rstrip('_'),
+                'model_version': versao.arquivo,
+            }
+            for indice, linha in zip(indices, probabilidades)
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'modelos': {prefixo: versao.arquivo for prefixo, versao in self._versoes.items()},
+            'trocas': self.trocas,
+            'lotes': {prefixo: dict(lote.stats) for prefixo, lote in self._lotes.items()},
+        }
+
+
+_registros: Dict[str, RegistroModelos] = {}
+_lock_registros = threading.Lock()
+
+
+def obter_registro(models_dir: Optional[str] = None) -> RegistroModelos:
+    """Registro compartilhado do diretório (um por processo)."""
+    caminho = os.path.realpath(models_dir or DIRETORIO_MODELOS)
+    with _lock_registros:
+        if caminho not in _registros:
+            _registros[caminho] = RegistroModelos(caminho)
+        return _registros[caminho]
@@ -22,7 +22,7 @@ import signal
 import sys
 
 # Importar scrapers
-from apis.playwright_base import PlaywrightBaseScraper
+from apis.playwright_base import PlaywrightBaseScraper, fechar_pools_navegadores
 from apis.fbref.playwright_scraper import FBRefPlaywrightScraper
 from apis.sofascore.playwright_scraper import SofaScorePlaywrightScraper
 from apis.scraper_config import ScraperConfig
@@ -137,6 +137,12 @@ class OrquestradorScrapers:
                 except Exception as e:
                     logger.error(f"❌ Erro ao parar {scraper_name}: {e}")
             
+            # Fechar os navegadores compartilhados e o driver do Playwright
+            try:
+                await fechar_pools_navegadores()
+            except Exception as e:
+                logger.error(f"❌ Erro ao fechar navegadores: {e}")
+            
             # Salvar estatísticas finais
             await self._save_final_stats()
             
@@ -0,0 +1,151 @@
+"""
+Testes do job incremental de análise de sentimento.
+"""
+import sqlite3
+
+import pytest
+
+from Coleta_de_dados.analise import job_sentimento
+from Coleta_de_dados.analise.job_sentimento import MODELO_PT, JobSentimento
+from Coleta_de_dados.analise.sentimento_pt import AnalisadorSentimentoPT
+
+NOTICIAS = [
+    ("Vitória incrível do time", "Torcida feliz", None),
+    ("Derrota", "Crise e pressão no clube", "Técnico demitido após fracasso"),
+    (None, None, None),
+    ("Empate sem gols", None, "Jogo sem emoção"),
+]
+POSTS = ["Que jogo excelente, muito bom!", "   ", "Péssima atuação, não gostei", None]
+
+
+def criar_banco(caminho):
+    conn = sqlite3.connect(caminho)
+    conn.executescript("""
+        CREATE TABLE noticias_clubes (
+            id INTEGER PRIMARY KEY, clube_id INTEGER, titulo TEXT, resumo TEXT, conteudo_completo TEXT,
+            sentimento TEXT, score_sentimento REAL, sentimento_geral REAL,
+            confianca_sentimento REAL, polaridade TEXT, analisado_em TIMESTAMP,
+            modelo_analise TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP
+        );
+        CREATE TABLE posts_redes_sociais (
+            id INTEGER PRIMARY KEY, clube_id INTEGER, conteudo TEXT, sentimento TEXT,
+            score_sentimento REAL, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP
+        );
+    """)
+    inserir(conn, NOTICIAS, POSTS)
+    return conn
+
+
+def inserir(conn, noticias, posts):
+    conn.executemany("INSERT INTO noticias_clubes (titulo, resumo, conteudo_completo) VALUES (?, ?, ?)", noticias)
+    conn.executemany("INSERT INTO posts_redes_sociais (conteudo) VALUES (?)", [(p,) for p in posts])
+    conn.commit()
+
+
+@pytest.fixture
+def banco(tmp_path):
+    caminho = str(tmp_path / "aposta.db")
+    conn = criar_banco(caminho)
+    yield caminho, conn
+    conn.close()
+
+
+def test_resultados_iguais_a_analise_linha_a_linha(banco):
+    caminho, conn = banco
+    resumo = JobSentimento(caminho, MODELO_PT, tamanho_lote=2, processos=1).executar()
+
+    assert (resumo['noticias_clubes'], resumo['posts_redes_sociais'], resumo['total']) == (3, 2, 5)
+    analisador = AnalisadorSentimentoPT()
+    for item_id, titulo, resumo_, conteudo, sentimento, score, confianca, modelo in conn.execute(
+            "SELECT id, titulo, resumo, conteudo_completo, sentimento, score_sentimento, "
+            "confianca_sentimento, modelo_analise FROM noticias_clubes ORDER BY id"):
+        texto = f"{titulo or ''} {resumo_ or ''} {conteudo or ''}".strip()
+        if not texto:
+            assert sentimento is None
+            continue
+        assert (sentimento, score, confianca) == analisador.analisar_texto(texto)
+        assert modelo == MODELO_PT
+    posts = conn.execute("SELECT conteudo, sentimento, score_sentimento FROM posts_redes_sociais ORDER BY id").fetchall()
+    assert [(s, sc) for _, s, sc in posts[::2]] == [analisador.analisar_texto(c)[:2] for c, _, _ in posts[::2]]
+    assert posts[1][1] is None and posts[3][1] is None
+
+
+def test_segunda_execucao_le_apenas_linhas_novas(banco):
+    caminho, conn = banco
+    job = JobSentimento(caminho, MODELO_PT, tamanho_lote=2, processos=1)
+    job.executar()
+    assert job.obter_watermark(conn, 'noticias_clubes') == 4
+    assert job.obter_watermark(conn, 'posts_redes_sociais') == 4
+
+    assert job.executar()['total'] == 0
+
+    inserir(conn, [("Goleada histórica", None, None)], ["Vitória!"])
+    # Texto vazio preenchido depois: abaixo da marca d'água, mas ainda pendente
+    conn.execute("UPDATE noticias_clubes SET titulo = 'Título novo' WHERE id = 3")
+    conn.commit()
+    resumo = job.executar()
+    assert (resumo['noticias_clubes'], resumo['posts_redes_sociais']) == (2, 1)
+    assert conn.execute("SELECT sentimento FROM noticias_clubes WHERE id = 3").fetchone()[0] is not None
+    # Só os posts sem texto continuam pendentes
+    assert conn.execute("SELECT tabela, item_id, motivo FROM pendentes_sentimento ORDER BY tabela, item_id").fetchall() == [
+        ('posts_redes_sociais', 2, 'sem_texto'), ('posts_redes_sociais', 4, 'sem_texto')
+    ]
+
+    job.reiniciar_watermarks()
+    assert job.executar()['total'] == 0
+
+
+def test_pool_de_processos_igual_ao_processo_unico(tmp_path):
+    caminhos = [str(tmp_path / f"{n}.db") for n in ("um", "pool")]
+    for caminho in caminhos:
+        conn = criar_banco(caminho)
+        inserir(conn, NOTICIAS * 5, POSTS * 5)
+        conn.close()
+
+    JobSentimento(caminhos[0], MODELO_PT, tamanho_lote=3, processos=1).executar()
+    JobSentimento(caminhos[1], MODELO_PT, tamanho_lote=3, processos=2).executar()
+
+    consulta = "SELECT id, sentimento, score_sentimento FROM noticias_clubes ORDER BY id"
+    um, pool = (sqlite3.connect(c) for c in caminhos)
+    assert um.execute(consulta).fetchall() == pool.execute(consulta).fetchall()
+    um.close()
+    pool.close()
+
+
+def test_erro_em_um_texto_nao_interrompe_o_lote(banco, monkeypatch):
+    caminho, conn = banco
+    analisar = AnalisadorSentimentoPT().analisar_textos
+
+    def pontuar(textos):
+        if any("Derrota" in texto for texto in textos):
+            raise RuntimeError("texto inválido")
+        return analisar(textos)
+
+    monkeypatch.setitem(job_sentimento._pontuadores, MODELO_PT, pontuar)
+    job = JobSentimento(caminho, MODELO_PT, tamanho_lote=2, processos=1)
+    resumo = job.executar()
+
+    assert (resumo['noticias_clubes'], resumo['falhas']) == (2, 1)
+    assert conn.execute("SELECT id FROM noticias_clubes WHERE sentimento IS NOT NULL ORDER BY id").fetchall() == \
+        [(1,), (4,)]
+    assert conn.execute("SELECT item_id, motivo FROM pendentes_sentimento WHERE tabela = 'noticias_clubes' "
+                        "ORDER BY item_id").fetchall() == [(2, 'erro'), (3, 'sem_texto')]
+
+    # A falha é tentada de novo na próxima execução
+    monkeypatch.setitem(job_sentimento._pontuadores, MODELO_PT, analisar)
+    assert job.executar()['noticias_clubes'] == 1
+    assert conn.execute("SELECT sentimento FROM noticias_clubes WHERE id = 2").fetchone()[0] is not None
+
+
+def test_filtro_por_clube_nao_move_a_marca_dagua(banco):
+    caminho, conn = banco
+    conn.execute("UPDATE noticias_clubes SET clube_id = CASE WHEN id % 2 = 0 THEN 7 ELSE 8 END")
+    conn.execute("UPDATE posts_redes_sociais SET clube_id = 8")
+    conn.commit()
+    job = JobSentimento(caminho, MODELO_PT, tamanho_lote=1, processos=1)
+
+    resumo = job.executar(clube_id=7)
+
+    assert (resumo['noticias_clubes'], resumo['posts_redes_sociais']) == (2, 0)
+    assert job.obter_watermark(conn, 'noticias_clubes') == 0
+    assert job.executar()['noticias_clubes'] == 1
@@ -0,0 +1,114 @@
+"""
+Testes do resumo materializado de sentimento mantido pelo job.
+"""
+import sqlite3
+
+import pytest
+
+from Coleta_de_dados.analise import resumo_sentimento
+from Coleta_de_dados.analise.job_sentimento import MODELO_PT, JobSentimento
+
+NOTICIAS = [
+    # (clube_id, titulo, created_at)
+    (1, "Vitória incrível, torcida feliz", "2026-10-01 10:00:00"),
+    (1, "Derrota e crise no clube", "2026-10-01 18:00:00"),
+    (2, "Empate sem emoção", "2026-10-02 09:00:00"),
+    (2, "Goleada histórica, time excelente", None),
+]
+POSTS = [
+    # (clube_id, conteudo, created_at)
+    (1, "Que jogo excelente, muito bom!", "2026-10-01 11:00:00"),
+    (None, "Péssima atuação, não gostei", "2026-10-02 12:00:00"),
+]
+
+
+@pytest.fixture
+def banco(tmp_path):
+    caminho = str(tmp_path / "aposta.db")
+    conn = sqlite3.connect(caminho)
+    conn.executescript("""
+        CREATE TABLE noticias_clubes (
+            id INTEGER PRIMARY KEY, clube_id INTEGER, titulo TEXT, resumo TEXT, conteudo_completo TEXT,
+            sentimento TEXT, score_sentimento REAL, sentimento_geral REAL,
+            confianca_sentimento REAL, polaridade TEXT, analisado_em TIMESTAMP,
+            modelo_analise TEXT, created_at TIMESTAMP, updated_at TIMESTAMP
+        );
+        CREATE TABLE posts_redes_sociais (
+            id INTEGER PRIMARY KEY, clube_id INTEGER, conteudo TEXT, sentimento TEXT,
+            score_sentimento REAL, created_at TIMESTAMP, updated_at TIMESTAMP
+        );
+    """)
+    inserir(conn, NOTICIAS, POSTS)
+    yield caminho, conn
+    conn.close()
+
+
+def inserir(conn, noticias, posts):
+    conn.executemany("INSERT INTO noticias_clubes (clube_id, titulo, created_at) VALUES (?, ?, ?)", noticias)
+    conn.executemany("INSERT INTO posts_redes_sociais (clube_id, conteudo, created_at) VALUES (?, ?, ?)", posts)
+    conn.commit()
+
+
+def resumo(conn, consulta=resumo_sentimento.TABELA_RESUMO, chave=resumo_sentimento.CHAVE):
+    colunas = ', '.join(chave + resumo_sentimento.VALORES).replace('soma_score', 'ROUND(soma_score, 9)') \
+        .replace('soma_confianca', 'ROUND(soma_confianca, 9)')
+    return conn.execute(f"SELECT {colunas} FROM {consulta} ORDER BY {', '.join(chave)}").fetchall()
+
+
+def assert_igual_a_agregacao_completa(conn):
+    por_dia = f"({resumo_sentimento.SQL_AGREGACAO_TEXTOS})"
+    assert resumo(conn) == resumo(conn, por_dia)
+    for tabela, chave in resumo_sentimento.NIVEIS[1:]:
+        reagrupado = f"({resumo_sentimento.sql_reagrupar(por_dia, chave)})"
+        assert resumo(conn, tabela, chave) == resumo(conn, reagrupado, chave)
+
+
+def test_job_mantem_resumo_igual_a_agregacao_completa(banco):
+    caminho, conn = banco
+    job = JobSentimento(caminho, MODELO_PT, tamanho_lote=2, processos=1)
+    job.executar()
+
+    assert_igual_a_agregacao_completa(conn)
+    assert {linha[:3] for linha in resumo(conn)} == {
+        (0, 'posts', '2026-10-02'), (1, 'noticias', '2026-10-01'), (1, 'posts', '2026-10-01'),
+        (2, 'noticias', ''), (2, 'noticias', '2026-10-02'),
+    }
+    assert sum(linha[4] for linha in resumo(conn)) == len(NOTICIAS) + len(POSTS)
+
+    inserir(conn, [(2, "Vitória fantástica", "2026-10-02 20:00:00")],
+            [(2, "Derrota péssima", "2026-10-03 08:00:00")])
+    job.executar()
+    assert_igual_a_agregacao_completa(conn)
+
+
+def test_linha_reanalisada_troca_a_contribuicao_anterior(banco):
+    caminho, conn = banco
+    job = JobSentimento(caminho, MODELO_PT, tamanho_lote=2, processos=1)
+    job.executar()
+
+    # Sentimento sem score volta a ficar pendente e é reanalisado com outro texto
+    conn.execute("UPDATE noticias_clubes SET titulo = 'Derrota vergonhosa, crise total', "
+                 "score_sentimento = NULL WHERE id = 1")
+    conn.commit()
+    job.reiniciar_watermarks()
+    assert job.executar()['noticias_clubes'] == 1
+
+    assert_igual_a_agregacao_completa(conn)
+    assert sum(linha[4] for linha in resumo(conn) if linha[1] == 'noticias') == len(NOTICIAS)
+
+
+def test_resumo_criado_a_partir_dos_textos_ja_analisados(banco):
+    caminho, conn = banco
+    conn.execute("UPDATE noticias_clubes SET sentimento = 'positivo', score_sentimento = 0.5, "
+                 "confianca_sentimento = 0.8, analisado_em = '2026-10-03 00:00:00' WHERE id <= 2")
+    conn.commit()
+
+    assert resumo_sentimento.criar_tabela(conn)
+    assert resumo(conn) == [(1, 'noticias', '2026-10-01', 'positivo', 2, 1.0, 2, 1.6, 2, '2026-10-03 00:00:00')]
+    assert resumo(conn, resumo_sentimento.TABELA_RESUMO_CLUBE, resumo_sentimento.CHAVE_CLUBE) == [
+        (1, 'noticias', 'positivo', 2, 1.0, 2, 1.6, 2, '2026-10-03 00:00:00')
+    ]
+    assert not resumo_sentimento.criar_tabela(conn)
+
+    JobSentimento(caminho, MODELO_PT, processos=1).executar()
+    assert_igual_a_agregacao_completa(conn)
@@ -0,0 +1,65 @@
+"""
+Testes do léxico compilado do AnalisadorSentimentoPT.
+"""
+import random
+import re
+
+from Coleta_de_dados.analise.sentimento_pt import AnalisadorSentimentoPT
+
+
+def referencia_palavra_a_palavra(analisador, texto):
+    """Análise palavra a palavra (implementação anterior)."""
+    if not texto or not isinstance(texto, str):
+        return 'neutro', 0.0, 0.0
+    palavras = re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', ' ', texto)).strip().split()
+    score_positivo = score_negativo = encontradas = 0
+    for i, palavra in enumerate(palavras):
+        palavra_lower = palavra.lower()
+        if palavra_lower not in analisador.palavras_positivas | analisador.palavras_negativas:
+            continue
+        intensidade = 1.0
+        if i > 0 and palavras[i - 1].lower() in analisador.palavras_intensificadoras:
+            intensidade *= 2.0
+        if i > 0 and palavras[i - 1].lower() in analisador.palavras_negacao:
+            intensidade *= -1.0
+        if palavra_lower in analisador.palavras_positivas:
+            score_positivo += intensidade
+        else:
+            score_negativo += intensidade
+        encontradas += 1
+    score = score_positivo - score_negativo
+    return analisador._classificar_sentimento(score), score, min(1.0, encontradas / 10)
+
+
+def test_lote_igual_a_analise_palavra_a_palavra():
+    analisador = AnalisadorSentimentoPT(tamanho_cache=100)
+    vocabulario = sorted(analisador.palavras_positivas | analisador.palavras_negativas |
+                         analisador.palavras_intensificadoras | analisador.palavras_negacao)
+    vocabulario += ["Muito", "NÃO", "Vitória", "time", "jogo_bom", "🔥", "contra-ataque"]
+    aleatorio = random.Random(7)
+    textos = [
+        "".join(aleatorio.choice(vocabulario) + aleatorio.choice([" ", ", ", "!", "\n", "-"])
+                for _ in range(aleatorio.randint(0, 25)))
+        for _ in range(500)
+    ]
+    textos += ["", None, "   ", "não", "muito bom", "não ruim. Muito ruim!"]
+
+    esperado = [referencia_palavra_a_palavra(analisador, texto) for texto in textos]
+    assert analisador.analisar_textos(textos) == esperado
+    # Segunda passada vem do cache de resultados
+    assert [analisador.analisar_texto(texto) for texto in textos] == esperado
+
+
+def test_mascaras_nao_atravessam_textos_e_duplicados_usam_cache():
+    analisador = AnalisadorSentimentoPT(tamanho_cache=2)
+
+    # "muito" no fim do primeiro texto não intensifica o início do segundo
+    assert analisador.analisar_textos(["jogo muito", "bom", "muito bom", "não bom"]) == [
+        ('neutro', 0, 0.0), ('positivo', 1.0, 0.1), ('positivo', 2.0, 0.1), ('negativo', -1.0, 0.1)
+    ]
+    assert len(analisador._cache_resultados) == 2
+
+    titulo = "Vitória incrível e gol no clássico"
+    resultados = analisador.analisar_textos([titulo] * 3)
+    assert resultados == [('muito_positivo', 3.0, 0.3)] * 3
+    assert list(analisador._cache_resultados)[-1] == titulo
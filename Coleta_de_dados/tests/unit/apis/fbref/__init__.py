@@ -0,0 +1,5 @@
+"""
+Pacote de testes para os coletores do FBRef.
+"""
+
+# Este arquivo é necessário para que o Python reconheça o diretório como um pacote
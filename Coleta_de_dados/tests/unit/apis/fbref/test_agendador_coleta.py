@@ -0,0 +1,195 @@
+"""
+Testes do agendador de coleta em pipeline (busca -> parsing -> persistência).
+"""
+import asyncio
+import threading
+
+import pytest
+
+from Coleta_de_dados.apis.fbref.agendador_coleta import AgendadorColeta, executar_sincrono
+from Coleta_de_dados.apis.fbref.anti_429_state_machine import Anti429StateMachine
+from Coleta_de_dados.apis.fbref.cache_paginas import CachePaginas
+
+
+def maquina_rapida():
+    maquina = Anti429StateMachine()
+    maquina.base_delay = 0.001
+    return maquina
+
+
+class BuscaFalsa:
+    """Responde 200 com o caminho da URL; as primeiras respostas de ``com_429`` são 429."""
+
+    def __init__(self, com_429=(), retry_after="0", conteudo=""):
+        self.pendentes_429 = set(com_429)
+        self.retry_after = retry_after
+        self.conteudo = conteudo
+        self.chamadas = []
+
+    async def __call__(self, sessao, url, condicionais):
+        self.chamadas.append(url)
+        self.condicionais = condicionais
+        await asyncio.sleep(0)
+        if url in self.pendentes_429:
+            self.pendentes_429.discard(url)
+            return 429, {"Retry-After": self.retry_after}, ""
+        return 200, {}, f"<html>{url}{self.conteudo}</html>"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CachePaginas(str(tmp_path / "paginas"))
+
+
+def executar(agendador, itens):
+    return asyncio.run(agendador.executar(itens))
+
+
+def test_todas_as_paginas_sao_processadas_e_persistidas():
+    persistidas = []
+    agendador = AgendadorColeta(
+        processar=lambda pagina: pagina.html.upper(),
+        persistir=persistidas.append,
+        buscar=BuscaFalsa(),
+        criar_maquina=maquina_rapida,
+        usar_cache=False,
+    )
+    itens = [(i, f"https://fbref.com/en/matches/{i}") for i in range(20)]
+
+    resumo = executar(agendador, itens)
+
+    assert resumo["total"] == resumo["sucesso"] == resumo["persistidas"] == 20
+    assert sorted(p.item for p in persistidas) == list(range(20))
+    assert all(p.dados == f"<HTML>{p.url.upper()}</HTML>" and p.html is None for p in persistidas)
+
+
+def test_429_e_tentado_novamente_respeitando_retry_after():
+    url = "https://fbref.com/en/matches/1"
+    busca = BuscaFalsa(com_429={url}, retry_after="0")
+    persistidas = []
+    agendador = AgendadorColeta(
+        processar=lambda pagina: len(pagina.html),
+        persistir=persistidas.append,
+        buscar=busca,
+        criar_maquina=maquina_rapida,
+        usar_cache=False,
+    )
+
+    resumo = executar(agendador, [(1, url), (2, "https://fbref.com/en/matches/2")])
+
+    assert busca.chamadas.count(url) == 2
+    assert resumo["sucesso"] == 2 and resumo["com_erro"] == 0
+    pagina = next(p for p in persistidas if p.item == 1)
+    assert pagina.ok and pagina.tentativas == 2
+
+
+def test_erro_definitivo_chega_a_persistencia_e_tudo_roda_na_mesma_thread():
+    threads = set()
+
+    async def buscar(sessao, url, condicionais):
+        return (404, {}, "") if url.endswith("/404") else (200, {}, "<html></html>")
+
+    def persistir(pagina):
+        threads.add(threading.get_ident())
+
+    agendador = AgendadorColeta(
+        processar=lambda pagina: None,
+        persistir=persistir,
+        iniciar_persistencia=lambda: threads.add(threading.get_ident()),
+        finalizar_persistencia=lambda erro: threads.add(threading.get_ident()),
+        buscar=buscar,
+        criar_maquina=maquina_rapida,
+        usar_cache=False,
+    )
+    itens = [(i, f"https://fbref.com/en/matches/{i}") for i in range(10)] + [(99, "https://fbref.com/404")]
+
+    resumo = executar(agendador, itens)
+
+    assert resumo["com_erro"] == 1 and resumo["sucesso"] == 10
+    assert resumo["persistidas"] == 11
+    assert len(threads) == 1 and threading.get_ident() not in threads
+
+
+def test_pagina_fresca_no_cache_nao_e_buscada(cache):
+    url = "https://fbref.com/en/matches/1"
+    cache.armazenar(url, "<html>cache</html>", {"ETag": '"v1"'})
+    conteudo = " conteudo" * 20
+    busca = BuscaFalsa(conteudo=conteudo)
+    persistidas = []
+    agendador = AgendadorColeta(
+        processar=lambda pagina: pagina.html,
+        persistir=persistidas.append,
+        buscar=busca,
+        criar_maquina=maquina_rapida,
+        cache=cache,
+    )
+
+    resumo = executar(agendador, [(1, url), (2, "https://fbref.com/en/matches/2")])
+
+    assert resumo["sucesso"] == 2
+    assert busca.chamadas == ["https://fbref.com/en/matches/2"]
+    assert {p.item: p.dados for p in persistidas}[1] == "<html>cache</html>"
+    # A página buscada passa a estar no cache
+    assert cache.obter("https://fbref.com/en/matches/2").html == f"<html>https://fbref.com/en/matches/2{conteudo}</html>"
+
+
+def test_pagina_curta_nao_entra_no_cache(cache):
+    url = "https://fbref.com/en/matches/1"
+    agendador = AgendadorColeta(
+        processar=lambda pagina: pagina.html,
+        persistir=lambda pagina: None,
+        buscar=BuscaFalsa(),
+        criar_maquina=maquina_rapida,
+        cache=cache,
+    )
+
+    resumo = executar(agendador, [(1, url)])
+
+    assert resumo["sucesso"] == 1
+    assert cache.obter(url) is None
+
+
+def test_pagina_vencida_e_revalidada_com_304(tmp_path):
+    url = "https://fbref.com/en/matches/1"
+    cache = CachePaginas(str(tmp_path / "paginas"), politicas=(), ttl_padrao=0)
+    cache.armazenar(url, "<html>cache</html>", {"ETag": '"v1"'})
+    condicionais = []
+
+    async def buscar(sessao, url, cabecalhos):
+        condicionais.append(cabecalhos)
+        return 304, {}, ""
+
+    persistidas = []
+    agendador = AgendadorColeta(
+        processar=lambda pagina: pagina.html,
+        persistir=persistidas.append,
+        buscar=buscar,
+        criar_maquina=maquina_rapida,
+        cache=cache,
+    )
+
+    resumo = executar(agendador, [(1, url)])
+
+    assert resumo["sucesso"] == 1
+    assert condicionais == [{"If-None-Match": '"v1"'}]
+    assert persistidas[0].dados == "<html>cache</html>"
+    assert cache.contadores["revalidadas"] == 1
+
+
+def test_executar_sincrono_funciona_dentro_de_um_loop():
+    def coletar():
+        agendador = AgendadorColeta(
+            processar=lambda pagina: pagina.html,
+            persistir=lambda pagina: None,
+            buscar=BuscaFalsa(),
+            criar_maquina=maquina_rapida,
+            usar_cache=False,
+        )
+        return executar_sincrono(agendador.executar([(1, "https://fbref.com/en/matches/1")]))
+
+    async def endpoint():
+        # Código síncrono chamado de dentro de um loop em execução
+        return coletar()
+
+    assert coletar()["sucesso"] == 1
+    assert asyncio.run(endpoint())["sucesso"] == 1
@@ -0,0 +1,125 @@
+"""
+Testes do cache persistente de páginas do FBRef.
+"""
+import os
+
+import pytest
+import requests
+
+from Coleta_de_dados.apis.fbref import fallback_first_system, fbref_utils
+from Coleta_de_dados.apis.fbref.cache_paginas import CachePaginas
+
+TEMPORADA_ENCERRADA = "https://fbref.com/en/comps/9/2019-2020/schedule/2019-2020-Premier-League-Scores-and-Fixtures"
+AGENDA_ATUAL = "https://fbref.com/en/comps/9/schedule/Premier-League-Scores-and-Fixtures"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CachePaginas(str(tmp_path / "paginas"))
+    yield cache
+    cache.close()
+
+
+def resposta(status, html="", cabecalhos=None):
+    r = requests.Response()
+    r.status_code = status
+    r._content = html.encode("utf-8")
+    r.encoding = "utf-8"
+    r.headers.update(cabecalhos or {})
+    return r
+
+
+def test_politicas_por_classe_de_url(cache):
+    assert cache.politica(TEMPORADA_ENCERRADA) == ("temporada_encerrada", None)
+    assert cache.politica(AGENDA_ATUAL) == ("agenda", 30 * 60)
+    assert cache.politica("https://fbref.com/en/matches/cc5b4244/Liverpool-Chelsea")[0] == "partida"
+
+
+def test_conteudo_igual_e_armazenado_uma_vez(cache):
+    cache.armazenar("https://fbref.com/a", "<html>mesma</html>", {"ETag": '"v1"'})
+    cache.armazenar("https://fbref.com/b", "<html>mesma</html>")
+
+    entrada = cache.obter("https://fbref.com/a")
+    assert entrada.html == "<html>mesma</html>"
+    assert entrada.cabecalhos_condicionais() == {"If-None-Match": '"v1"'}
+    assert cache.get_stats()["paginas"] == 2
+    objetos = [arquivo for _, _, arquivos in os.walk(os.path.join(cache.diretorio, "objetos")) for arquivo in arquivos]
+    assert len(objetos) == 1
+
+
+def test_limite_de_tamanho_remove_a_menos_acessada(tmp_path):
+    cache = CachePaginas(str(tmp_path / "paginas"), tamanho_maximo=2500)
+    paginas = {f"https://fbref.com/{i}": os.urandom(1000).hex() for i in range(3)}
+    cache.armazenar("https://fbref.com/0", paginas["https://fbref.com/0"])
+    cache.armazenar("https://fbref.com/1", paginas["https://fbref.com/1"])
+    cache.obter("https://fbref.com/0")
+    cache.armazenar("https://fbref.com/2", paginas["https://fbref.com/2"])
+
+    assert cache.obter("https://fbref.com/1") is None
+    assert cache.obter("https://fbref.com/0").html == paginas["https://fbref.com/0"]
+    assert cache.get_stats()["removidas"] == 1
+    assert cache.tamanho_total() <= 2500
+    cache.close()
+
+
+def test_fazer_requisicao_usa_cache_e_revalida(tmp_path, monkeypatch):
+    # Agenda atual sempre vencida (ttl 0) para forçar a revalidação
+    cache = CachePaginas(str(tmp_path / "paginas"), politicas=(("agenda", r"/schedule/", 0),))
+    chamadas = []
+
+    def requisicao_falsa(url, headers=None):
+        chamadas.append((url, headers))
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return resposta(304, cabecalhos={"ETag": '"v1"'})
+        return resposta(200, f"<html><body><table id='t'><tr><td>{url}</td></tr></table>"
+                             f"{'conteudo ' * 20}</body></html>", {"ETag": '"v1"'})
+
+    monkeypatch.setattr(fbref_utils, "get_cache_paginas", lambda: cache)
+    monkeypatch.setattr(fbref_utils, "REQUEST_DELAY", 0)
+    monkeypatch.setattr(fbref_utils, "EMERGENCY_SYSTEM_AVAILABLE", False)
+    monkeypatch.setattr(fbref_utils, "HANG_DETECTION_AVAILABLE", False)
+    monkeypatch.setattr(fallback_first_system, "should_use_fallback", lambda url: False)
+    monkeypatch.setattr(fallback_first_system, "make_controlled_request", requisicao_falsa)
+
+    for _ in range(3):
+        assert fbref_utils.fazer_requisicao(TEMPORADA_ENCERRADA).find("td").text == TEMPORADA_ENCERRADA
+    assert len(chamadas) == 1
+
+    primeira = fbref_utils.fazer_requisicao(AGENDA_ATUAL)
+    segunda = fbref_utils.fazer_requisicao(AGENDA_ATUAL)
+    assert chamadas[-1] == (AGENDA_ATUAL, {"If-None-Match": '"v1"'})
+    assert segunda.find("td").text == primeira.find("td").text == AGENDA_ATUAL
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["revalidadas"]) == (2, 3, 1)
+    cache.close()
+
+
+def test_pagina_imutavel_de_bloqueio_e_recusada(cache):
+    bloqueio = "<html><body><h1>Just a moment...</h1>" + "verificando " * 20 + "</body></html>"
+
+    assert cache.armazenar(TEMPORADA_ENCERRADA, "<html>curta</html>") is False
+    assert cache.armazenar(TEMPORADA_ENCERRADA, bloqueio) is False
+    assert cache.obter(TEMPORADA_ENCERRADA) is None
+
+
+def test_resposta_200_curta_ou_bloqueada_nao_e_armazenada(tmp_path, monkeypatch):
+    cache = CachePaginas(str(tmp_path / "paginas"))
+    respostas = {
+        TEMPORADA_ENCERRADA: "<html><body>quase vazio</body></html>",
+        AGENDA_ATUAL: "<html><body><div>Complete o CAPTCHA " + "para continuar " * 20 + "</div></body></html>",
+    }
+
+    monkeypatch.setattr(fbref_utils, "get_cache_paginas", lambda: cache)
+    monkeypatch.setattr(fbref_utils, "REQUEST_DELAY", 0)
+    monkeypatch.setattr(fbref_utils, "EMERGENCY_SYSTEM_AVAILABLE", False)
+    monkeypatch.setattr(fbref_utils, "HANG_DETECTION_AVAILABLE", False)
+    monkeypatch.setattr(fallback_first_system, "should_use_fallback", lambda url: False)
+    monkeypatch.setattr(fallback_first_system, "make_controlled_request",
+                        lambda url, headers=None: resposta(200, respostas[url]))
+
+    for url in respostas:
+        assert fbref_utils.fazer_requisicao(url) is not None
+        assert cache.obter(url) is None
+    assert cache.get_stats()["paginas"] == 0
+    cache.close()
@@ -0,0 +1,121 @@
+"""
+Testes da carga em lote de clubes, jogadores e partidas do FBRef.
+"""
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine
+
+from Coleta_de_dados.apis.fbref import carga_em_lote
+from Coleta_de_dados.apis.fbref.carga_em_lote import (
+    CargaEmLote, TABELA_CLUBES, TABELA_PARTIDAS, TabelaCarga, _valor_copy
+)
+from Coleta_de_dados.apis.fbref.coletar_clubes import ClubeInfo, ColetorClubes
+from Coleta_de_dados.apis.fbref.coletar_dados_partidas import ColetorPartidas, PartidaInfo
+from Coleta_de_dados.database import invalidacao_cache
+from Coleta_de_dados.database.invalidacao_cache import RegistroVersoesTags
+
+
+@pytest.fixture(autouse=True)
+def registro(monkeypatch):
+    registro = RegistroVersoesTags()
+    monkeypatch.setattr(invalidacao_cache, "_registro", registro)
+    return registro
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    caminho = str(tmp_path / "aposta.db")
+    ColetorClubes(caminho).setup_database_clubes()
+    with sqlite3.connect(caminho) as conn:
+        conn.execute("""
+            CREATE TABLE partidas (
+                id INTEGER PRIMARY KEY, link_coleta_id INTEGER, data TEXT, time_casa TEXT, placar TEXT,
+                time_visitante TEXT, url_match_report TEXT UNIQUE, status_coleta_detalhada TEXT DEFAULT 'pendente'
+            )
+        """)
+    return caminho
+
+
+def clube(numero, nome=None, genero="M"):
+    return (1, nome or f"Clube {numero}", genero, f"/squads/{numero}", f"/squads/{numero}/records")
+
+
+def test_deduplica_e_mantem_linhas_existentes(db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("INSERT INTO clubes (pais_id, nome, genero, url_clube) VALUES (1, 'Antigo', 'M', '/squads/2')")
+        existente = conn.execute("SELECT id FROM clubes").fetchone()[0]
+
+        carga = CargaEmLote(TABELA_CLUBES)
+        assert carga.adicionar(clube(1))
+        assert not carga.adicionar(clube(1, nome="Repetido"))
+        carga.adicionar_varias([clube(2, nome="Novo"), clube(3)])
+        ids = carga.gravar(conn)
+
+        assert (len(carga), carga.inseridas, carga.duplicadas) == (0, 2, 1)
+        assert ids["/squads/2"] == existente
+        assert ids == dict(conn.execute("SELECT url_clube, id FROM clubes"))
+        assert dict(conn.execute("SELECT url_clube, nome FROM clubes")) == {
+            "/squads/1": "Clube 1", "/squads/2": "Antigo", "/squads/3": "Clube 3"
+        }
+
+
+def test_ids_em_varias_consultas_e_upsert(db_path, monkeypatch):
+    monkeypatch.setattr(carga_em_lote, "CHAVES_POR_CONSULTA", 3)
+    tabela = TabelaCarga(TABELA_CLUBES.nome, TABELA_CLUBES.chave, TABELA_CLUBES.colunas, atualizar=("nome",))
+
+    with sqlite3.connect(db_path) as conn:
+        CargaEmLote(tabela).adicionar_varias(clube(i) for i in range(4)).gravar(conn)
+        ids = CargaEmLote(tabela).adicionar_varias(clube(i, nome="Atualizado") for i in range(10)).gravar(conn)
+
+        assert len(ids) == 10
+        assert conn.execute("SELECT COUNT(*) FROM clubes WHERE nome = 'Atualizado'").fetchone()[0] == 10
+
+
+def test_conexao_sqlalchemy(db_path):
+    engine = create_engine(f"sqlite:///{db_path}")
+    carga = CargaEmLote(TABELA_CLUBES).adicionar_varias([clube(1), clube(2)])
+    with engine.begin() as conn:
+        ids = carga.gravar(conn)
+    engine.dispose()
+
+    assert carga.inseridas == 2
+    with sqlite3.connect(db_path) as conn:
+        assert ids == dict(conn.execute("SELECT url_clube, id FROM clubes"))
+
+
+def test_coletores_usam_a_carga(db_path):
+    coletor = ColetorClubes(db_path)
+    clubes = [ClubeInfo(f"Clube {i}", "Brasil", "M", f"/squads/{i}", None) for i in (1, 2, 1)]
+    ids = coletor.salvar_clubes_no_banco(clubes, 1)
+    assert coletor.salvar_clube_no_banco(clubes[0], 1) == ids["/squads/1"]
+
+    partidas = [PartidaInfo("2025-05-01", "A", "1–0", "B", f"/matches/{i}") for i in (1, 2)]
+    coletor_partidas = ColetorPartidas(db_path)
+    assert coletor_partidas.salvar_partidas_no_banco(partidas, 7) == 2
+    assert coletor_partidas.salvar_partidas_no_banco(partidas, 7) == 0
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM clubes").fetchone()[0] == 2
+        assert conn.execute(
+            "SELECT link_coleta_id, status_coleta_detalhada FROM partidas GROUP BY 1, 2"
+        ).fetchall() == [(7, "pendente")]
+
+
+def test_carga_dos_coletores_invalida_o_cache(db_path, registro):
+    tags = ("clubes", "partidas")
+    ColetorClubes(db_path).salvar_clubes_no_banco([ClubeInfo("Clube 1", "Brasil", "M", "/squads/1", None)], 1)
+    ColetorPartidas(db_path).salvar_partidas_no_banco([PartidaInfo("2025-05-01", "A", "1–0", "B", "/matches/1")], 7)
+    assert registro.versoes(tags) == (1, 1)
+
+    # Lote sem linhas novas não muda nada no banco nem no cache
+    ColetorClubes(db_path).salvar_clubes_no_banco([ClubeInfo("Clube 1", "Brasil", "M", "/squads/1", None)], 1)
+    assert registro.versoes(tags) == (1, 1)
+
+
+def test_linha_invalida_e_formato_copy():
+    with pytest.raises(ValueError):
+        CargaEmLote(TABELA_PARTIDAS).adicionar(("so", "duas"))
+    assert _valor_copy(None) == "\\N"
+    assert _valor_copy("a\tb\\c\nd") == "a\\tb\\\\c\\nd"
+    assert _valor_copy(3) == "3"
@@ -0,0 +1,143 @@
+"""
+Testes do escritor em lote de estatísticas de jogadores do FBRef.
+"""
+import sqlite3
+
+import pytest
+
+from Coleta_de_dados.apis.fbref.agendador_coleta import PaginaColetada
+from Coleta_de_dados.apis.fbref.coletar_estatisticas_detalhadas import (
+    ColetorEstatisticas, EscritorEstatisticas, EstatisticasJogador
+)
+from Coleta_de_dados.database import invalidacao_cache
+from Coleta_de_dados.database.invalidacao_cache import RegistroVersoesTags
+
+
+@pytest.fixture(autouse=True)
+def registro(monkeypatch):
+    registro = RegistroVersoesTags()
+    monkeypatch.setattr(invalidacao_cache, "_registro", registro)
+    return registro
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    caminho = str(tmp_path / "aposta.db")
+    ColetorEstatisticas(caminho).setup_database_stats()
+    with sqlite3.connect(caminho) as conn:
+        conn.execute("CREATE TABLE partidas (id INTEGER PRIMARY KEY, status_coleta_detalhada TEXT)")
+        conn.executemany("INSERT INTO partidas (id) VALUES (?)", [(1,), (2,), (3,)])
+    return caminho
+
+
+def contar(db_path, sql, *params):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(sql, params).fetchone()[0]
+
+
+def test_gravacao_repetida_atualiza_sem_duplicar(db_path):
+    with EscritorEstatisticas(db_path) as escritor:
+        escritor.salvar_jogadores([EstatisticasJogador(1, "Hulk", "Atlético-MG", gols=1)])
+        escritor.salvar_jogadores([EstatisticasJogador(1, "Hulk", "Atlético-MG", gols=2)])
+
+    assert contar(db_path, "SELECT COUNT(*) FROM estatisticas_jogador_partida") == 1
+    assert contar(db_path, "SELECT gols FROM estatisticas_jogador_partida") == 2
+
+
+def test_commit_a_cada_n_partidas(db_path):
+    escritor = EscritorEstatisticas(db_path, partidas_por_commit=2)
+    try:
+        for partida_id in (1, 2, 3):
+            escritor.salvar_jogadores([EstatisticasJogador(partida_id, "Hulk", "Atlético-MG")])
+            escritor.atualizar_status_partida(partida_id, "concluido")
+            escritor.concluir_partida()
+
+        # A terceira partida ainda não foi confirmada e se perde no rollback
+        escritor.rollback()
+    finally:
+        escritor.close()
+
+    assert contar(db_path, "SELECT COUNT(*) FROM estatisticas_jogador_partida") == 2
+    assert contar(db_path, "SELECT COUNT(*) FROM partidas WHERE status_coleta_detalhada = 'concluido'") == 2
+
+
+def test_commit_invalida_o_cache_e_rollback_nao(db_path, registro):
+    tags = ("estatisticas_jogador_partida", "partidas")
+    with EscritorEstatisticas(db_path) as escritor:
+        escritor.salvar_jogadores([EstatisticasJogador(1, "Hulk", "Atlético-MG")])
+        escritor.rollback()
+        assert registro.versoes(tags) == (0, 0)
+
+        escritor.salvar_jogadores([EstatisticasJogador(1, "Hulk", "Atlético-MG")])
+        escritor.atualizar_status_partida(1, "concluido")
+        escritor.concluir_partida()
+        assert registro.versoes(tags) == (1, 1)
+
+
+def test_estatisticas_avancadas_atualizam_xa(db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE estatisticas_partidas (
+                partida_id INTEGER, xg_casa REAL, xg_visitante REAL,
+                formacao_casa TEXT, formacao_visitante TEXT
+            )
+        """)
+        conn.execute("INSERT INTO estatisticas_partidas (partida_id) VALUES (1)")
+
+    coletor = ColetorEstatisticas(db_path)
+    coletor.salvar_estatisticas_jogadores([
+        EstatisticasJogador(1, "Hulk", "Atlético-MG"),
+        EstatisticasJogador(1, "Paulinho", "Atlético-MG"),
+    ])
+    with coletor.escritor() as escritor:
+        escritor.salvar_estatisticas_avancadas(1, {
+            'expected_goals': {'xg_casa': 1.4, 'xg_visitante': 0.7},
+            'formacoes': {'casa': '4-3-3', 'visitante': '4-4-2'},
+            'jogadores': {'home_players': [{'nome': 'Hulk', 'xa': 0.3}, {'nome': 'Paulinho', 'xa': 0.1}]},
+        })
+
+    assert contar(db_path, "SELECT xa FROM estatisticas_jogador_partida WHERE jogador_nome = 'Hulk'") == 0.3
+    assert contar(db_path, "SELECT formacao_casa FROM estatisticas_partidas") == '4-3-3'
+
+
+def test_falha_no_meio_da_partida_nao_deixa_linhas_dela(db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE estatisticas_partidas (
+                partida_id INTEGER, xg_casa REAL, xg_visitante REAL,
+                formacao_casa TEXT, formacao_visitante TEXT
+            )
+        """)
+        conn.executemany("INSERT INTO estatisticas_partidas (partida_id) VALUES (?)", [(1,), (2,)])
+        # Falha no segundo jogador do executemany, depois das estatísticas avançadas
+        conn.execute("""
+            CREATE TRIGGER falha_injetada BEFORE INSERT ON estatisticas_jogador_partida
+            WHEN NEW.jogador_nome = 'Falha' BEGIN SELECT RAISE(ABORT, 'falha injetada'); END
+        """)
+    avancadas = {
+        'expected_goals': {'xg_casa': 1.4, 'xg_visitante': 0.7},
+        'formacoes': {'casa': '4-3-3', 'visitante': '4-4-2'},
+        'jogadores': {},
+    }
+
+    coletor = ColetorEstatisticas(db_path, partidas_por_commit=10)
+    coletor._escritor = EscritorEstatisticas(db_path, partidas_por_commit=10)
+    try:
+        coletor._persistir_pagina(PaginaColetada(2, "https://fbref.com/en/matches/2", dados=(
+            [EstatisticasJogador(2, "Hulk", "Atlético-MG")], avancadas
+        )))
+        coletor._persistir_pagina(PaginaColetada(1, "https://fbref.com/en/matches/1", dados=(
+            [EstatisticasJogador(1, "Hulk", "Atlético-MG"), EstatisticasJogador(1, "Falha", "Atlético-MG")],
+            avancadas
+        )))
+        coletor._escritor.commit()
+    finally:
+        coletor._escritor.close()
+
+    assert contar(db_path, "SELECT COUNT(*) FROM estatisticas_jogador_partida WHERE partida_id = 1") == 0
+    assert contar(db_path, "SELECT xg_casa FROM estatisticas_partidas WHERE partida_id = 1") is None
+    assert contar(db_path, "SELECT status_coleta_detalhada FROM partidas WHERE id = 1") == "erro"
+    # A partida anterior, no mesmo lote, continua gravada
+    assert contar(db_path, "SELECT COUNT(*) FROM estatisticas_jogador_partida WHERE partida_id = 2") == 1
+    assert contar(db_path, "SELECT xg_casa FROM estatisticas_partidas WHERE partida_id = 2") == 1.4
+    assert coletor.stats['partidas_com_erro'] == 1 and coletor.stats['partidas_processadas'] == 1
@@ -0,0 +1,168 @@
+"""
+Testes do parser de uma passada dos match reports do FBRef.
+"""
+from bs4 import BeautifulSoup
+
+from Coleta_de_dados.apis.fbref import parser_match_report
+from Coleta_de_dados.apis.fbref.agendador_coleta import PaginaColetada
+from Coleta_de_dados.apis.fbref.coletar_estatisticas_detalhadas import ColetorEstatisticas
+from Coleta_de_dados.apis.fbref.fbref_utils import extrair_conteudo_comentarios_html
+from Coleta_de_dados.apis.fbref.parser_match_report import (
+    SUFIXOS_TABELAS, analisar_match_report, extrair_estatisticas_partida, extrair_match_report_colunar,
+    indexar_tabelas
+)
+
+VALORES = ["3", "1,234", "", "0.75", "abc", "12"]
+
+
+def gerar_pagina(coletor, comentadas=(), sem_tabela=None):
+    """Dois times; ``comentadas`` vão dentro de comentários HTML."""
+    colunas = {chave: [] for chave in SUFIXOS_TABELAS}
+    for data_stat in coletor.stat_mapping:
+        colunas[coletor._get_table_for_stat(data_stat)].append(data_stat)
+    colunas["sum"] += ["npxg_plus_xg_assist"]
+
+    partes = ["<html><body><div>menu</div>"]
+    for lado, time_nome in (("a", "Flamengo"), ("b", "Palmeiras")):
+        for chave, sufixo in SUFIXOS_TABELAS.items():
+            if (lado, chave) == sem_tabela:
+                continue
+            linhas = ['<tr class="thead"><th data-stat="player">Player</th><td data-stat="minutes">Min</td></tr>']
+            # O último jogador só existe no summary (linha sem par nas outras tabelas)
+            for j in range(6 if chave == "sum" else 5):
+                celulas = [f'<th data-stat="player"><a href="/p/{j}">Jogador {lado}{j}</a> </th>']
+                for k, data_stat in enumerate(colunas[chave]):
+                    valor = VALORES[(j + k) % len(VALORES)]
+                    if data_stat == "minutes":
+                        valor = "0" if j == 2 else str(10 * j + 5)
+                    celulas.append(f'<td data-stat="{data_stat}">{valor}</td>')
+                linhas.append("<tr>" + "".join(celulas) + "</tr>")
+            caption = f"<caption>{time_nome} Player Stats Table</caption>" if chave == "sum" else ""
+            tabela = f'<table id="stats_{lado}{sufixo}">{caption}<tbody>{"".join(linhas)}</tbody></table>'
+            partes.append(f"<div><!--\n{tabela}\n--></div>" if chave in comentadas else tabela)
+    partes.append("</body></html>")
+    return "".join(partes)
+
+
+def referencia_bs4(coletor, html, partida_id):
+    """Extração linha a linha com BeautifulSoup (implementação anterior)."""
+    soup = extrair_conteudo_comentarios_html(BeautifulSoup(html, "lxml"))
+    jogadores = []
+    for caption in soup.select("table[id*='_summary'] caption"):
+        id_base = caption.parent["id"].replace("_summary", "")
+        time_nome = caption.get_text().replace(" Player Stats Table", "").strip()
+        tabelas = {chave: soup.find("table", id=f"{id_base}{sufixo}") for chave, sufixo in SUFIXOS_TABELAS.items()}
+        if not all(tabelas.values()):
+            continue
+        linhas = {chave: tabela.find("tbody").find_all("tr") for chave, tabela in tabelas.items()}
+        for i, linha_sum in enumerate(linhas["sum"]):
+            if any(i >= len(outras) for outras in linhas.values()):
+                continue
+            stats = coletor.extrair_estatisticas_jogador(
+                linha_sum, linhas["pass"][i], linhas["pass_types"][i], linhas["def"][i],
+                linhas["poss"][i], linhas["misc"][i], partida_id, time_nome
+            )
+            if stats:
+                jogadores.append(stats)
+    return jogadores
+
+
+def test_resultado_igual_ao_extrator_bs4():
+    coletor = ColetorEstatisticas(":memory:")
+    html = gerar_pagina(coletor)
+
+    esperado = referencia_bs4(coletor, html, 7)
+    obtido = coletor.extrair_match_report_html(html, 7)
+
+    assert len(obtido) == 8  # 2 times x (5 linhas pareadas - 1 sem minutos)
+    assert [vars(j) for j in obtido] == [vars(j) for j in esperado]
+
+
+def test_tabelas_em_comentarios_e_time_incompleto():
+    coletor = ColetorEstatisticas(":memory:")
+    visivel = gerar_pagina(coletor, sem_tabela=("b", "misc"))
+    comentado = gerar_pagina(coletor, comentadas=("pass", "defense", "misc"), sem_tabela=("b", "misc"))
+
+    assert [vars(j) for j in coletor.extrair_match_report_html(comentado, 1)] == \
+        [vars(j) for j in coletor.extrair_match_report_html(visivel, 1)] == \
+        [vars(j) for j in referencia_bs4(coletor, visivel, 1)]
+    assert {j.jogador_nome[-2] for j in coletor.extrair_match_report_html(comentado, 1)} == {"a"}
+
+
+def test_indice_e_colunas():
+    coletor = ColetorEstatisticas(":memory:")
+    html = gerar_pagina(coletor, comentadas=("misc",))
+
+    tabelas = indexar_tabelas(html)
+    assert tabelas["stats_a_summary"].caption == "Flamengo Player Stats Table"
+    assert tabelas["stats_b_misc"].linhas[1]["player"] == "Jogador b0"
+
+    colunas = extrair_match_report_colunar(html)
+    assert colunas["time_nome"] == ["Flamengo"] * 6 + ["Palmeiras"] * 6
+    assert colunas["sum"]["minutes"][:3] == ["Min", "5", "15"]
+    assert all(len(valores) == 12 for valores in colunas["misc"].values())
+    assert extrair_match_report_colunar("<html><body><p>sem tabelas</p></body></html>") is None
+
+
+def pagina_com_estatisticas_dos_times():
+    """Match report mínimo: jogadores de dois times, quadro de posse e escalações."""
+    jogadores = {
+        "a": [{"player": "Arrascaeta", "shots": "3", "shots_on_target": "1", "cards_yellow": "1", "cards_red": "0", "xg": "0.7",
+               "xg_assist": "0.1", "corner_kicks": "4", "fouls": "2"},
+              {"player": "Pedro", "shots": "2", "shots_on_target": "2", "cards_yellow": "0", "cards_red": "0", "xg": "0.45",
+               "xg_assist": "0.3", "corner_kicks": "1", "fouls": "1"}],
+        "b": [{"player": "Veiga", "shots": "1", "shots_on_target": "0", "cards_yellow": "2", "cards_red": "1", "xg": "0.2",
+               "xg_assist": "", "corner_kicks": "0", "fouls": "5"}],
+    }
+    partes = ["<html><body>",
+              '<div id="team_stats"><table><tr><th colspan="2">Flamengo</th><th>Palmeiras</th></tr>'
+              '<tr><th colspan="2">Possession</th></tr>'
+              '<tr><td><div><strong>58%</strong></div></td><td><div><strong>42%</strong></div></td></tr>'
+              '</table></div>']
+    for lado, time_nome, formacao in (("a", "Flamengo", "4-2-3-1"), ("b", "Palmeiras", "3-5-2")):
+        partes.append(f'<div class="lineup" id="{lado}"><table><tr><th colspan="2">{time_nome} ({formacao})'
+                      f'</th></tr></table></div>')
+        for chave, sufixo in SUFIXOS_TABELAS.items():
+            linhas = '<tr class="thead"><th data-stat="player">Player</th><td data-stat="shots">Sh</td></tr>'
+            for stats in jogadores[lado]:
+                linhas += "<tr>" + "".join(f'<td data-stat="{k}">{v}</td>' for k, v in stats.items()) + "</tr>"
+            caption = f"<caption>{time_nome} Player Stats Table</caption>" if chave == "sum" else ""
+            tabela = f'<table id="stats_{lado}{sufixo}">{caption}<tbody>{linhas}</tbody></table>'
+            partes.append(f"<!--\n{tabela}\n-->" if chave == "misc" else tabela)
+    partes.append("</body></html>")
+    return "".join(partes)
+
+
+def test_estatisticas_da_partida_por_time():
+    estatisticas = extrair_estatisticas_partida(pagina_com_estatisticas_dos_times())
+
+    assert estatisticas == {
+        "chutes_casa": 5, "chutes_no_gol_casa": 3, "cartoes_amarelos_casa": 1, "cartoes_vermelhos_casa": 0,
+        "xg_casa": 1.15, "xa_casa": 0.4, "escanteios_casa": 5, "faltas_casa": 3,
+        "chutes_visitante": 1, "chutes_no_gol_visitante": 0, "cartoes_amarelos_visitante": 2,
+        "cartoes_vermelhos_visitante": 1, "xg_visitante": 0.2, "escanteios_visitante": 0, "faltas_visitante": 5,
+        "posse_bola_casa": 58.0, "posse_bola_visitante": 42.0,
+        "formacao_casa": "4-2-3-1", "formacao_visitante": "3-5-2",
+    }
+    assert extrair_estatisticas_partida("<html><body><p>sem tabelas</p></body></html>") is None
+
+
+def test_pipeline_extrai_jogadores_e_avancadas_parseando_uma_vez(monkeypatch):
+    parseamentos = []
+    parsear = parser_match_report._parsear
+    monkeypatch.setattr(parser_match_report, "_parsear", lambda html: parseamentos.append(1) or parsear(html))
+    html = pagina_com_estatisticas_dos_times()
+    coletor = ColetorEstatisticas(":memory:")
+    coletor.advanced_scraper = object()
+
+    jogadores, avancadas = coletor._processar_pagina(PaginaColetada(7, "https://fbref.com/en/matches/7", html=html))
+
+    assert len(parseamentos) == 1
+    assert analisar_match_report(html) == (extrair_match_report_colunar(html), extrair_estatisticas_partida(html))
+    assert jogadores == coletor.extrair_match_report_html(html, 7)
+    assert avancadas == {
+        "expected_goals": {"xg_casa": 1.15, "xg_visitante": 0.2, "xa_casa": 0.4, "xa_visitante": None},
+        "formacoes": {"casa": "4-2-3-1", "visitante": "3-5-2"},
+        "jogadores": {"home_players": [{"nome": "Arrascaeta", "xa": 0.1}, {"nome": "Pedro", "xa": 0.3}],
+                      "away_players": []},
+    }
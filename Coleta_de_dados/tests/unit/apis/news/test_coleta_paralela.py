@@ -0,0 +1,163 @@
+"""
+Testes da coleta paralela de notícias para todos os clubes.
+"""
+import asyncio
+import threading
+from collections import Counter
+from datetime import datetime
+
+import pytest
+from aiohttp import web
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from Coleta_de_dados.apis.news import collector as collector_module
+from Coleta_de_dados.apis.news.collector import NewsCollector
+from Coleta_de_dados.database.config import Base
+from Coleta_de_dados.database.models import Clube, NoticiaClube
+
+CLUBES = ["Flamengo", "Palmeiras", "Santos", "Grêmio"]
+
+
+class ServidorNoticias:
+    """Busca do GE com duas notícias por clube e uma comum a todos; conta acessos e concorrência."""
+
+    def __init__(self, latencia=0.02):
+        self.latencia = latencia
+        self.acessos = Counter()
+        self.em_andamento = self.max_em_andamento = 0
+        self.pronto = threading.Event()
+
+    def noticia(self, chave):
+        return (f'<li class="widget--info"><a class="feed-post-link" href="{self.url}/noticia/{chave}">'
+                f'Notícia {chave}</a><span class="feed-post-datetime">há 2 horas</span></li>')
+
+    async def tratar(self, request):
+        self.acessos[request.path] += 1
+        self.em_andamento += 1
+        self.max_em_andamento = max(self.max_em_andamento, self.em_andamento)
+        try:
+            await asyncio.sleep(self.latencia)
+        finally:
+            self.em_andamento -= 1
+        if request.path == "/busca/":
+            indice = CLUBES.index(request.query["q"])
+            itens = [self.noticia(f"{indice}-{i}") for i in range(2)] + [self.noticia("comum")]
+            return web.Response(text="<html><ul>" + "".join(itens) + "</ul></html>", content_type="text/html")
+        chave = request.path.rsplit("/", 1)[1]
+        return web.Response(text=f'<p class="content-text__container">Texto {chave}</p>', content_type="text/html")
+
+    async def _servir(self):
+        app = web.Application()
+        app.router.add_get("/{caminho:.*}", self.tratar)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        self.pronto.set()
+        await asyncio.Event().wait()
+
+    def iniciar(self):
+        threading.Thread(target=asyncio.run, args=(self._servir(),), daemon=True).start()
+        self.pronto.wait()
+        return self
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    return ServidorNoticias().iniciar()
+
+
+@pytest.fixture
+def coletor(tmp_path, servidor, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'noticias.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([Clube(nome=nome) for nome in CLUBES])
+    session.commit()
+
+    monkeypatch.setattr(collector_module.time, "sleep", lambda segundos: None)
+    servidor.acessos.clear()
+    servidor.max_em_andamento = 0
+    coletor = NewsCollector(db_session=session)
+    coletor.BASE_URL = f"{servidor.url}/busca/"
+    yield coletor
+    session.close()
+    engine.dispose()
+
+
+def noticias_salvas(coletor):
+    return sorted(
+        (clube_id, url.rsplit("/", 1)[1], conteudo)
+        for clube_id, url, conteudo in coletor.db.query(
+            NoticiaClube.clube_id, NoticiaClube.url_noticia, NoticiaClube.conteudo_completo
+        )
+    )
+
+
+def test_resultado_igual_a_coleta_sequencial(coletor, servidor):
+    sequencial = coletor.coletar_para_todos_clubes(limite_por_clube=3, paralelo=False)
+    esperado = noticias_salvas(coletor)
+    coletor.db.query(NoticiaClube).delete()
+    coletor.db.commit()
+
+    paralelo = coletor.coletar_para_todos_clubes(limite_por_clube=3)
+
+    assert noticias_salvas(coletor) == esperado
+    assert paralelo["total_noticias_coletadas"] == sequencial["total_noticias_coletadas"] == 9
+    assert paralelo["urls_repetidas"] == 3
+    # A notícia comum fica com o primeiro clube
+    assert (1, "comum", "Texto comum") in esperado
+
+
+def test_baixa_conteudo_so_de_noticias_novas(coletor, servidor):
+    coletor.db.add(NoticiaClube(clube_id=2, titulo="Antiga", url_noticia=f"{servidor.url}/noticia/comum",
+                                fonte="Globo Esporte", data_publicacao=datetime.now()))
+    coletor.db.commit()
+
+    resultado = coletor.coletar_para_todos_clubes(limite_por_clube=3)
+
+    assert resultado["noticias_ja_existentes"] == 1
+    assert resultado["total_noticias_coletadas"] == 8
+    assert servidor.acessos["/noticia/comum"] == 0
+    assert servidor.acessos["/busca/"] == len(CLUBES)
+    assert all(servidor.acessos[f"/noticia/{i}-{j}"] == 1 for i in range(len(CLUBES)) for j in range(2))
+
+
+def test_orcamento_de_requisicoes_simultaneas(coletor, servidor):
+    coletor.coletar_para_todos_clubes(limite_por_clube=3, max_simultaneas=3, max_por_fonte=8)
+    assert servidor.max_em_andamento == 3
+
+    servidor.max_em_andamento = 0
+    coletor.db.query(NoticiaClube).delete()
+    coletor.db.commit()
+    coletor.coletar_para_todos_clubes(limite_por_clube=3, max_simultaneas=32, max_por_fonte=2)
+    assert servidor.max_em_andamento == 2
+
+
+def test_erro_de_parsing_de_um_clube_nao_interrompe_os_demais(coletor, servidor, monkeypatch):
+    extrair_busca = coletor._extrair_noticias_busca
+    extrair_conteudo = coletor._extrair_conteudo
+
+    def extrair_noticias_busca(html, limite):
+        if "/noticia/1-0" in html:
+            raise ValueError("página de busca inesperada")
+        return extrair_busca(html, limite)
+
+    def extrair_conteudo_com_falha(html):
+        if "Texto 2-0" in html:
+            raise ValueError("conteúdo inesperado")
+        return extrair_conteudo(html)
+
+    monkeypatch.setattr(coletor, "_extrair_noticias_busca", extrair_noticias_busca)
+    monkeypatch.setattr(coletor, "_extrair_conteudo", extrair_conteudo_com_falha)
+
+    resultado = coletor.coletar_para_todos_clubes(limite_por_clube=3)
+
+    assert resultado["erros_requisicao"] == 2
+    salvas = noticias_salvas(coletor)
+    # Palmeiras (busca com erro) fica sem notícias; a de conteúdo com erro é salva sem texto
+    assert not [noticia for noticia in salvas if noticia[0] == 2]
+    assert (3, "2-0", "") in salvas
+    assert resultado["total_noticias_coletadas"] == 7
@@ -0,0 +1,5 @@
+"""
+Pacote de testes para a classe base das APIs RapidAPI.
+"""
+
+# Este arquivo é necessário para que o Python reconheça o diretório como um pacote
@@ -0,0 +1,163 @@
+"""
+Testes da sessão HTTP compartilhada e do agrupamento de requisições da RapidAPIBase.
+"""
+import asyncio
+import threading
+
+from aiohttp import web
+
+from Coleta_de_dados.apis.rapidapi import base_rapidapi
+from Coleta_de_dados.apis.rapidapi.base_rapidapi import (
+    RapidAPIBase, RapidAPIConfig, executar_coleta, fechar_sessoes_http, obter_sessao_http
+)
+
+
+class APIFalsa(RapidAPIBase):
+    async def coletar_jogos(self, **kwargs):
+        return []
+
+    async def coletar_jogadores(self, **kwargs):
+        return []
+
+    async def coletar_ligas(self, **kwargs):
+        return []
+
+    async def coletar_estatisticas(self, **kwargs):
+        return []
+
+    async def coletar_odds(self, **kwargs):
+        return []
+
+    async def coletar_noticias(self, **kwargs):
+        return []
+
+
+class ServidorFalso:
+    """Servidor HTTP local que conta chamadas e conexões TCP."""
+
+    def __init__(self, atraso: float = 0.05):
+        self.atraso = atraso
+        self.chamadas = 0
+        self.conexoes = set()
+
+    async def tratar(self, request):
+        self.chamadas += 1
+        self.conexoes.add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(self.atraso)
+        return web.json_response({"caminho": request.path, "chave": request.headers["X-RapidAPI-Key"]})
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_get("/{caminho:.*}", self.tratar)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        porta = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{porta}"
+        return self
+
+    async def __aexit__(self, *args):
+        await fechar_sessoes_http()
+        await self.runner.cleanup()
+
+
+def criar_config(**opcoes) -> RapidAPIConfig:
+    return RapidAPIConfig(
+        nome="Teste", host="teste.p.rapidapi.com", endpoint_base="",
+        chaves=["chave"], limite_requisicoes_dia=10_000, limite_requisicoes_minuto=10_000,
+        retry_attempts=1, **opcoes
+    )
+
+
+def criar_api() -> APIFalsa:
+    return APIFalsa(criar_config())
+
+
+def test_chamadas_concorrentes_mesma_chave_fazem_uma_requisicao():
+    async def principal():
+        async with ServidorFalso() as servidor:
+            api = criar_api()
+            resultados = await asyncio.gather(*(
+                api._make_request(f"{servidor.url}/jogos", cache_key="jogos") for _ in range(50)
+            ))
+            return servidor.chamadas, resultados, api._em_andamento
+
+    chamadas, resultados, em_andamento = asyncio.run(principal())
+    assert chamadas == 1
+    assert all(resultado == {"caminho": "/jogos", "chave": "chave"} for resultado in resultados)
+    assert em_andamento == {}
+
+
+def test_cancelar_um_chamador_nao_cancela_os_demais():
+    async def principal():
+        async with ServidorFalso(atraso=0.1) as servidor:
+            api = criar_api()
+            url = f"{servidor.url}/odds"
+            primeiro = asyncio.create_task(api._make_request(url, cache_key="odds"))
+            segundo = asyncio.create_task(api._make_request(url, cache_key="odds"))
+            await asyncio.sleep(0.02)
+            primeiro.cancel()
+            return await segundo, servidor.chamadas
+
+    resultado, chamadas = asyncio.run(principal())
+    assert resultado == {"caminho": "/odds", "chave": "chave"}
+    assert chamadas == 1
+
+
+def test_requisicoes_reutilizam_conexao_entre_clientes():
+    async def principal():
+        async with ServidorFalso(atraso=0) as servidor:
+            api_a, api_b = criar_api(), criar_api()
+            cabecalhos = {"Accept": "application/json"}
+            for i in range(10):
+                await api_a._make_request(f"{servidor.url}/a/{i}", headers=cabecalhos)
+                await api_b._make_request(f"{servidor.url}/b/{i}", headers=cabecalhos)
+            return servidor, cabecalhos
+
+    servidor, cabecalhos = asyncio.run(principal())
+    assert servidor.chamadas == 20
+    assert len(servidor.conexoes) == 1
+    # O dicionário do chamador não recebe as credenciais
+    assert cabecalhos == {"Accept": "application/json"}
+
+
+def test_sessao_separada_por_timeout_e_limite_de_conexoes():
+    async def principal():
+        padrao = obter_sessao_http(criar_config())
+        sessoes = [obter_sessao_http(criar_config()), obter_sessao_http(criar_config(timeout=5)),
+                   obter_sessao_http(criar_config(max_conexoes=2))]
+        return padrao, sessoes, sessoes[2].connector.limit
+
+    padrao, (mesma, outro_timeout, outro_limite), limite = executar_coleta(principal())
+    assert mesma is padrao
+    assert outro_timeout.timeout.total == 5 and outro_timeout is not padrao
+    assert limite == 2 and outro_limite is not padrao
+    # executar_coleta fecha as sessões ao final
+    assert all(sessao.closed for sessao in (padrao, outro_timeout, outro_limite))
+    assert len(base_rapidapi._sessoes_http) == 0
+
+
+def test_loops_simultaneos_tem_sessoes_proprias():
+    barreira = threading.Barrier(2)
+    sessoes = {}
+
+    async def principal(nome):
+        sessoes[nome] = obter_sessao_http(criar_config())
+        # Os dois loops ficam vivos ao mesmo tempo antes de pedir a sessão de novo
+        await asyncio.to_thread(barreira.wait)
+        return obter_sessao_http(criar_config())
+
+    def em_thread(nome):
+        sessoes[f"{nome}_de_novo"] = executar_coleta(principal(nome))
+
+    threads = [threading.Thread(target=em_thread, args=(nome,)) for nome in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sessoes["a"] is sessoes["a_de_novo"] and sessoes["b"] is sessoes["b_de_novo"]
+    assert sessoes["a"] is not sessoes["b"]
+    assert all(sessao.closed for sessao in sessoes.values())
+    assert len(base_rapidapi._sessoes_http) == 0
@@ -0,0 +1,95 @@
+"""
+Testes do pool de navegadores compartilhado dos scrapers Playwright.
+"""
+import asyncio
+
+from Coleta_de_dados.apis.playwright_base import PoolNavegadores
+
+
+class ContextoFalso:
+    def __init__(self):
+        self._ao_fechar = []
+
+    def on(self, evento, callback):
+        if evento == "close":
+            self._ao_fechar.append(callback)
+
+    async def new_page(self):
+        return object()
+
+    async def close(self):
+        for callback in self._ao_fechar:
+            callback(self)
+
+
+class NavegadorFalso:
+    def __init__(self):
+        self.conectado = True
+
+    def is_connected(self):
+        return self.conectado
+
+    async def new_context(self, **opcoes):
+        return ContextoFalso()
+
+    async def close(self):
+        self.conectado = False
+
+
+class PoolFalso(PoolNavegadores):
+    """Pool que lança navegadores falsos em vez do Chromium."""
+
+    async def _lancar_navegador(self):
+        return NavegadorFalso()
+
+
+def test_muitas_tarefas_reutilizam_poucos_navegadores():
+    pool = PoolFalso(max_navegadores=2, max_paginas=4, limite_por_dominio=4)
+
+    async def tarefa(i):
+        async with pool.pagina(f"https://site{i % 3}.com/"):
+            await asyncio.sleep(0.001)
+
+    async def principal():
+        await asyncio.gather(*(tarefa(i) for i in range(100)))
+        await pool.stop()
+
+    asyncio.run(principal())
+    assert pool.navegadores_lancados == 2
+    assert pool.contextos_criados == 100
+
+
+def test_limite_por_dominio_inclui_subdominios():
+    pool = PoolFalso(max_paginas=10, limite_por_dominio=5, limites_dominio={"globo.com": 2})
+    ativos = {"globo.com": 0, "uol.com.br": 0}
+    picos = {"globo.com": 0, "uol.com.br": 0}
+
+    async def tarefa(url, dominio):
+        async with pool.pagina(url):
+            ativos[dominio] += 1
+            picos[dominio] = max(picos[dominio], ativos[dominio])
+            await asyncio.sleep(0.01)
+            ativos[dominio] -= 1
+
+    async def principal():
+        await asyncio.gather(
+            *(tarefa(f"https://ge.globo.com/busca/?q={i}", "globo.com") for i in range(8)),
+            *(tarefa(f"https://www.uol.com.br/esporte/?q={i}", "uol.com.br") for i in range(8)),
+        )
+
+    asyncio.run(principal())
+    assert picos == {"globo.com": 2, "uol.com.br": 5}
+
+
+def test_navegador_desconectado_e_substituido():
+    pool = PoolFalso(max_navegadores=1)
+
+    async def principal():
+        contexto = await pool.novo_contexto()
+        await contexto.close()
+        pool._navegadores[0].navegador.conectado = False
+        await pool.novo_contexto()
+
+    asyncio.run(principal())
+    assert pool.navegadores_lancados == 2
+    assert len(pool._navegadores) == 1
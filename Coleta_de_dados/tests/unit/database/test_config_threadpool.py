@@ -0,0 +1,84 @@
+"""
+Testes do acesso síncrono ao banco a partir de código async (threadpool).
+"""
+import threading
+
+import anyio
+import pytest
+from sqlalchemy import text
+
+from Coleta_de_dados.database.config import get_db_manager, sessao_async
+
+
+@pytest.fixture
+def manager():
+    return get_db_manager()
+
+
+def test_limite_sessoes_acompanha_pool(manager, monkeypatch):
+    monkeypatch.setattr(manager.settings, "db_session_limit", None)
+    assert manager.limite_sessoes == manager.settings.pool_size + manager.settings.max_overflow
+
+    monkeypatch.setattr(manager.settings, "db_session_limit", 4)
+    assert manager.limite_sessoes == 4
+
+
+def test_configurar_concorrencia_mantem_threads_suficientes(manager, monkeypatch):
+    monkeypatch.setattr(manager.settings, "db_session_limit", 60)
+
+    async def principal():
+        manager.configurar_concorrencia()
+        threads = anyio.to_thread.current_default_thread_limiter().total_tokens
+        return manager.limitador_sessoes.total_tokens, threads
+
+    sessoes, threads = anyio.run(principal)
+    assert sessoes == 60
+    assert threads >= 60
+
+
+def test_sessao_async_respeita_limite(manager, monkeypatch):
+    monkeypatch.setattr(manager.settings, "db_session_limit", 2)
+    abertas, pico = 0, 0
+
+    async def requisicao():
+        nonlocal abertas, pico
+        async with sessao_async() as db:
+            abertas += 1
+            pico = max(pico, abertas)
+            await anyio.to_thread.run_sync(lambda: db.execute(text("SELECT 1")))
+            await anyio.sleep(0.01)
+            abertas -= 1
+
+    async def principal():
+        manager.configurar_concorrencia()
+        async with anyio.create_task_group() as grupo:
+            for _ in range(6):
+                grupo.start_soon(requisicao)
+
+    anyio.run(principal)
+    assert pico == 2
+
+
+def test_executar_em_sessao_fora_do_event_loop(manager):
+    def consultar(session, valor):
+        return threading.get_ident(), session.execute(text("SELECT :v"), {"v": valor}).scalar()
+
+    async def principal():
+        manager.configurar_concorrencia()
+        return threading.get_ident(), await manager.executar_em_sessao(consultar, 7)
+
+    thread_loop, (thread_sessao, resultado) = anyio.run(principal)
+    assert resultado == 7
+    assert thread_sessao != thread_loop
+
+
+def test_executar_em_sessao_propaga_erro(manager):
+    def falhar(session):
+        raise ValueError("falha")
+
+    async def principal():
+        manager.configurar_concorrencia()
+        await manager.executar_em_sessao(falhar)
+
+    with pytest.raises(ValueError):
+        anyio.run(principal)
@@ -0,0 +1,86 @@
+"""
+Testes do perfil de desempenho do SQLite de fallback (PRAGMAs e sessão com leitura roteada).
+"""
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.orm import sessionmaker
+
+from Coleta_de_dados.database.config import Base, DatabaseSettings
+from Coleta_de_dados.database.models import Competicao
+from Coleta_de_dados.database.perfil_sqlite import SessaoSQLite, criar_engines_sqlite
+
+
+@pytest.fixture
+def engines(tmp_path):
+    escrita, leitura = criar_engines_sqlite(f"sqlite:///{tmp_path / 'aposta.db'}", DatabaseSettings())
+    Base.metadata.create_all(escrita, tables=[Competicao.__table__])
+    executados = []
+    for nome, engine in (("escrita", escrita), ("leitura", leitura)):
+        event.listen(engine, "before_cursor_execute",
+                     lambda *args, nome=nome: executados.append((nome, args[2].split()[0].upper())))
+    yield escrita, leitura, executados
+    escrita.dispose()
+    leitura.dispose()
+
+
+def pragma(engine, nome):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {nome}").scalar()
+
+
+def test_pragmas_das_conexoes(engines):
+    escrita, leitura, _ = engines
+    settings = DatabaseSettings()
+
+    for engine in (escrita, leitura):
+        assert pragma(engine, "journal_mode") == "wal"
+        assert pragma(engine, "synchronous") == 1  # NORMAL
+        assert pragma(engine, "temp_store") == 2  # MEMORY
+        assert pragma(engine, "cache_size") == settings.sqlite_cache_size
+        assert pragma(engine, "busy_timeout") == settings.sqlite_busy_timeout
+    assert (pragma(escrita, "query_only"), pragma(leitura, "query_only")) == (0, 1)
+    assert (escrita.pool.size(), leitura.pool.size()) == (1, settings.sqlite_pool_leitura)
+
+
+def test_sessao_le_pela_pool_de_leitura_ate_a_primeira_escrita(engines):
+    escrita, leitura, executados = engines
+    Sessao = sessionmaker(bind=escrita, class_=SessaoSQLite, engine_leitura=leitura)
+
+    with Sessao() as session:
+        assert session.scalars(select(Competicao)).all() == []
+        assert executados == [("leitura", "SELECT")]
+
+        session.add(Competicao(nome="Série A", url="/comps/24"))
+        # Depois da escrita, a sessão enxerga as próprias alterações pela conexão de escrita
+        assert [c.nome for c in session.scalars(select(Competicao))] == ["Série A"]
+        session.execute(text("UPDATE competicoes SET ativa = 1"))
+        assert {nome for nome, _ in executados[1:]} == {"escrita"}
+        session.commit()
+
+        del executados[:]
+        assert session.execute(text("SELECT COUNT(*) FROM competicoes")).scalar() == 1
+        assert executados == [("leitura", "SELECT")]
+
+
+def test_consultar_o_dialeto_nao_prende_a_conexao_de_escrita(engines):
+    escrita, leitura, executados = engines
+    Sessao = sessionmaker(bind=escrita, class_=SessaoSQLite, engine_leitura=leitura)
+
+    with Sessao() as session:
+        assert session.get_bind().dialect.name == "sqlite"
+        session.execute(text("SELECT MAX(rowid) FROM competicoes")).scalar()
+        assert executados == [("leitura", "SELECT")]
+        assert escrita.pool.checkedout() == 0
+
+        # Outra sessão grava enquanto esta continua aberta
+        with Sessao() as outra:
+            outra.add(Competicao(nome="Série A", url="/comps/24"))
+            outra.commit()
+        assert not session._escrevendo
+
+
+def test_conexao_de_leitura_nao_escreve(engines):
+    _, leitura, _ = engines
+    with leitura.connect() as conn:
+        with pytest.raises(Exception, match="readonly"):
+            conn.execute(text("INSERT INTO competicoes (nome, url) VALUES ('x', '/x')"))
@@ -0,0 +1,112 @@
+"""
+Testes para a camada de consultas com eager loading.
+
+Verifica que detalhe e listagem de partidas, clubes e jogadores executam um
+número constante de consultas SQL, independentemente do tamanho da página.
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from Coleta_de_dados.database.config import Base
+from Coleta_de_dados.database.models import (
+    Partida, EstatisticaPartida, Clube, Competicao, Jogador, PaisClube
+)
+from Coleta_de_dados.database.queries import (
+    buscar_partida_completa,
+    consultar_clubes_com_total_jogadores,
+    consultar_jogadores_com_clube,
+    consultar_partidas_com_relacionamentos,
+    ordenar_partidas_recentes,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        session.add(Competicao(id=1, nome="Brasileirão", url="/comps/24"))
+        session.add(PaisClube(id=1, nome="Brasil"))
+        session.add_all([Clube(id=i, nome=f"Clube {i}", pais_id=1) for i in range(1, 21)])
+        session.add_all([
+            Jogador(nome=f"Jogador {i}", clube_atual_id=(i % 10) + 1) for i in range(50)
+        ])
+        for i in range(1, 31):
+            partida = Partida(
+                id=i,
+                competicao_id=1,
+                clube_casa_id=(i % 20) + 1,
+                clube_visitante_id=((i + 1) % 20) + 1,
+                status="finalizada",
+            )
+            if i % 2 == 0:
+                partida.estatisticas.append(EstatisticaPartida(xg_casa=1.5, xg_visitante=0.7))
+            session.add(partida)
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def contador(engine):
+    consultas = []
+    event.listen(engine, "before_cursor_execute", lambda *args: consultas.append(args[2]))
+    return consultas
+
+
+def test_detalhe_partida_em_uma_consulta(engine, contador):
+    with sessionmaker(bind=engine)() as session:
+        partida = buscar_partida_completa(session, 2)
+        assert partida.competicao.nome == "Brasileirão"
+        assert partida.clube_casa.nome == "Clube 3"
+        assert partida.clube_visitante.nome == "Clube 4"
+        assert partida.estatisticas[0].xg_casa == 1.5
+    assert len(contador) == 1
+
+
+def test_detalhe_partida_inexistente(engine):
+    with sessionmaker(bind=engine)() as session:
+        assert buscar_partida_completa(session, 999) is None
+
+
+@pytest.mark.parametrize("tamanho", [5, 30])
+def test_listagem_com_numero_constante_de_consultas(engine, contador, tamanho):
+    with sessionmaker(bind=engine)() as session:
+        query = consultar_partidas_com_relacionamentos(session)
+        partidas = ordenar_partidas_recentes(query).limit(tamanho).all()
+        nomes = [(p.competicao.nome, p.clube_casa.nome, p.clube_visitante.nome) for p in partidas]
+    assert len(nomes) == tamanho
+    assert len(contador) == 1
+
+
+@pytest.mark.parametrize("tamanho", [5, 20])
+def test_clubes_com_total_jogadores_em_uma_consulta(engine, contador, tamanho):
+    with sessionmaker(bind=engine)() as session:
+        linhas = (
+            consultar_clubes_com_total_jogadores(session.query(Clube))
+            .order_by(Clube.id)
+            .limit(tamanho)
+            .all()
+        )
+        paises = {clube.pais.nome for clube, _ in linhas}
+    totais = {clube.id: total for clube, total in linhas}
+    assert totais[1] == 5
+    assert tamanho < 11 or totais[11] == 0
+    assert paises == {"Brasil"}
+    # Clubes com total agregado + países carregados em lote
+    assert len(contador) == 2
+
+
+@pytest.mark.parametrize("tamanho", [5, 50])
+def test_jogadores_com_clube_carregado_em_lote(engine, contador, tamanho):
+    with sessionmaker(bind=engine)() as session:
+        jogadores = consultar_jogadores_com_clube(session).order_by(Jogador.id).limit(tamanho).all()
+        nomes = [jogador.clube_atual.nome for jogador in jogadores]
+    assert nomes[0] == "Clube 1"
+    assert len(contador) == 2
@@ -0,0 +1,64 @@
+"""
+Testes da previsão em lote do GeradorRecomendacoes.
+"""
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from Coleta_de_dados.ml.gerar_recomendacoes import GeradorRecomendacoes
+
+N_FEATURES = 18
+
+
+class ScalerContado(StandardScaler):
+    chamadas = 0
+
+    def transform(self, X, copy=None):
+        ScalerContado.chamadas += 1
+        return super().transform(X, copy=copy)
+
+
+class ModeloContado(LogisticRegression):
+    chamadas = 0
+
+    def predict_proba(self, X):
+        ModeloContado.chamadas += 1
+        return super().predict_proba(X)
+
+
+@pytest.fixture
+def gerador(tmp_path):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, N_FEATURES))
+    y = np.array(["Casa", "Empate", "Fora"])[rng.integers(0, 3, size=200)]
+    scaler = ScalerContado().fit(X)
+    encoder = LabelEncoder().fit(y)
+    modelo = ModeloContado(max_iter=500).fit(scaler.transform(X), encoder.transform(y))
+
+    gerador = GeradorRecomendacoes(db_path=str(tmp_path / "aposta.db"), models_dir=str(tmp_path))
+    gerador.modelo_carregado = {"modelo": modelo, "scaler": scaler, "label_encoder": encoder}
+    ScalerContado.chamadas = ModeloContado.chamadas = 0
+    return gerador
+
+
+def test_lote_igual_a_previsao_por_partida(gerador):
+    features = np.random.default_rng(1).normal(size=(25, N_FEATURES))
+
+    previsoes = gerador._gerar_previsoes_lote(features)
+
+    assert ScalerContado.chamadas == 1
+    assert ModeloContado.chamadas == 1
+    modelo = gerador.modelo_carregado["modelo"]
+    scaler = gerador.modelo_carregado["scaler"]
+    encoder = gerador.modelo_carregado["label_encoder"]
+    assert len(previsoes) == len(features)
+    for linha, previsao in zip(features, previsoes):
+        escalada = scaler.transform(linha.reshape(1, -1))
+        codigo = modelo.predict(escalada)[0]
+        probabilidades = modelo.predict_proba(escalada)[0]
+        assert previsao["previsao_principal"] == encoder.inverse_transform([codigo])[0]
+        assert previsao["probabilidade_principal"] == pytest.approx(probabilidades[codigo])
+        for i, classe in enumerate(encoder.classes_):
+            assert previsao["todas_probabilidades"][classe]["probabilidade"] == pytest.approx(probabilidades[i])
+            assert previsao["todas_probabilidades"][classe]["odd_justa"] == pytest.approx(1.0 / probabilidades[i])
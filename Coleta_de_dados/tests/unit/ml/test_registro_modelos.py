@@ -0,0 +1,118 @@
+"""
+Testes do registro de modelos residentes.
+"""
+import os
+import threading
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from Coleta_de_dados.ml.registro_modelos import PREFIXO_APOSTAS, RegistroModelos
+
+N_FEATURES = 4
+
+
+def salvar_modelo(diretorio, timestamp, semente=0):
+    """Modelo no formato do TreinadorModeloML."""
+    rng = np.random.default_rng(semente)
+    X = rng.normal(size=(120, N_FEATURES))
+    y = np.array(["Casa", "Empate", "Fora"])[rng.integers(0, 3, size=120)]
+    scaler = StandardScaler().fit(X)
+    encoder = LabelEncoder().fit(y)
+    modelo = LogisticRegression(max_iter=500).fit(scaler.transform(X), encoder.transform(y))
+    caminho = diretorio / f"{PREFIXO_APOSTAS}logistic_{timestamp}.joblib"
+    joblib.dump({"modelo": modelo, "scaler": scaler, "label_encoder": encoder,
+                 "feature_names": [f"f{i}" for i in range(N_FEATURES)], "accuracy": 0.5,
+                 "tipo_modelo": "logistic"}, caminho)
+    return caminho
+
+
+def forcar_nova_verificacao(diretorio):
+    # A detecção usa a data de modificação do diretório; garante que ela muda
+    os.utime(diretorio, ns=(os.stat(diretorio).st_atime_ns, os.stat(diretorio).st_mtime_ns + 10 ** 9))
+
+
+@pytest.fixture
+def registro(tmp_path):
+    salvar_modelo(tmp_path, "20250101_120000")
+    return RegistroModelos(str(tmp_path), intervalo_verificacao=0)
+
+
+def test_carrega_versao_mais_recente_uma_vez(tmp_path, registro):
+    salvar_modelo(tmp_path, "20240101_120000", semente=1)
+
+    versao = registro.obter()
+
+    assert versao.arquivo.endswith("20250101_120000.joblib")
+    assert versao.classes == ("Casa", "Empate", "Fora")
+    assert registro.obter() is versao
+
+
+def test_previsao_igual_ao_modelo(registro):
+    X = np.random.default_rng(5).normal(size=(7, N_FEATURES))
+    dados = registro.obter().dados
+
+    versao, probabilidades = registro.prever_proba(PREFIXO_APOSTAS, X)
+
+    esperado = dados["modelo"].predict_proba(dados["scaler"].transform(X))
+    np.testing.assert_allclose(probabilidades, esperado)
+    previsoes = registro.formatar(versao, probabilidades)
+    assert [p["prediction"] for p in previsoes] == list(dados["label_encoder"].inverse_transform(esperado.argmax(1)))
+
+
+def test_troca_a_quente_e_arquivo_incompleto(tmp_path, registro):
+    antiga = registro.obter()
+
+    (tmp_path / f"{PREFIXO_APOSTAS}logistic_20250301_120000.joblib").write_bytes(b"gravando...")
+    forcar_nova_verificacao(tmp_path)
+    assert registro.obter() is antiga
+
+    salvar_modelo(tmp_path, "20250401_120000", semente=2)
+    forcar_nova_verificacao(tmp_path)
+    nova = registro.obter()
+    assert nova.arquivo.endswith("20250401_120000.joblib")
+    assert registro.trocas == 1
+
+
+def test_features_invalidas_nao_entram_no_lote(registro):
+    with pytest.raises(ValueError):
+        registro.prever_proba(PREFIXO_APOSTAS, [1.0, 2.0])
+    _, probabilidades = registro.prever_proba(PREFIXO_APOSTAS, [0.0] * N_FEATURES)
+    assert probabilidades.shape == (1, 3)
+
+
+def test_requisicoes_concorrentes_sao_agrupadas(registro):
+    linhas = np.random.default_rng(9).normal(size=(64, N_FEATURES))
+    esperado = registro.obter().prever_proba(linhas)
+    resultados = [None] * len(linhas)
+    barreira = threading.Barrier(len(linhas))
+
+    def cliente(indice):
+        barreira.wait()
+        resultados[indice] = registro.prever_proba(PREFIXO_APOSTAS, linhas[indice])[1][0]
+
+    threads = [threading.Thread(target=cliente, args=(i,)) for i in range(len(linhas))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    np.testing.assert_allclose(np.array(resultados), esperado)
+    stats = registro.get_stats()["lotes"][PREFIXO_APOSTAS]
+    assert stats["pedidos"] == len(linhas)
+    assert stats["lotes"] < len(linhas)
+
+
+def test_familia_casa_o_nome_exato_do_arquivo(tmp_path, registro):
+    modelo = LogisticRegression().fit(np.eye(2), [0, 1])
+    for nome in ("rf_20250101_120000", "rf_tuned_20250601_120000", "rf_backup.joblib_20250701_120000"):
+        joblib.dump({"model": modelo, "metadata": {}}, tmp_path / f"{nome}.joblib")
+
+    assert registro.arquivo_mais_recente("rf_") == "rf_20250101_120000.joblib"
+    assert registro.arquivo_mais_recente("rf_tuned_") == "rf_tuned_20250601_120000.joblib"
+    assert not registro.tem_modelo("rf_backup_")
+    # Os modelos de apostas levam o nome do melhor modelo antes do timestamp
+    assert registro.arquivo_mais_recente(PREFIXO_APOSTAS).endswith("logistic_20250101_120000.joblib")
@@ -0,0 +1,104 @@
+"""
+Testes do pipeline assíncrono do CentralizedLogger.
+"""
+import json
+import logging
+import threading
+from dataclasses import asdict
+from datetime import datetime
+
+import pytest
+
+from Coleta_de_dados.utils.logger_centralizado import CentralizedLogger, LogEntry
+
+
+@pytest.fixture
+def criar_logger(tmp_path, monkeypatch):
+    monkeypatch.setenv("ENVIRONMENT", "test")
+    # Isola dos handlers da instância global (logs/ do projeto)
+    monkeypatch.setattr(logging.getLogger("apostapro"), "handlers", [])
+    criados = []
+
+    def criar(**opcoes):
+        logger = CentralizedLogger(log_dir=str(tmp_path / f"logs{len(criados)}"), **opcoes)
+        criados.append(logger)
+        return logger
+
+    yield criar
+    for logger in criados:
+        logger.close()
+
+
+def linhas(logger, arquivo="apostapro_main.log"):
+    for handler in logger._handlers:
+        handler.flush()
+    with open(logger.log_dir / arquivo, encoding="utf-8") as f:
+        return [json.loads(linha) for linha in f]
+
+
+def test_json_igual_ao_log_entry(criar_logger):
+    logger = criar_logger(async_pipeline=False)
+    entrada = (1723700000.25, "INFO", "fbref", "coletar", "Página \"x\" ok", {"url": "https://fbref.com", "n": [1, None]},
+               0.5, "200")
+    esperado = json.dumps(asdict(LogEntry(
+        timestamp=datetime.fromtimestamp(entrada[0]).isoformat(), level="INFO", module="fbref", function="coletar",
+        message=entrada[4], data=entrada[5], execution_time=0.5, api_status="200"
+    )), ensure_ascii=False)
+
+    assert logger._serializar(entrada) == esperado
+
+
+def test_pipeline_assincrono_escreve_em_ordem_e_atualiza_estatisticas(criar_logger):
+    logger = criar_logger()
+    dados = {"tentativa": 0}
+    for i in range(50):
+        dados["tentativa"] = i
+        logger.log("INFO", "fbref", "coletar", f"req {i}", dados, execution_time=0.1 * (i + 1))
+    for _ in range(6):
+        logger.log("ERROR", "fbref", "coletar", "falhou")
+    logger.flush()
+
+    registros = [r for r in linhas(logger) if r["module"] == "fbref"]
+    assert [r["message"] for r in registros[:50]] == [f"req {i}" for i in range(50)]
+    # Os dados foram copiados no momento do log()
+    assert [r["data"]["tentativa"] for r in registros[:50]] == list(range(50))
+    assert len(linhas(logger, "apostapro_errors.log")) == 6
+
+    stats = logger.get_stats()
+    assert stats["total_logs"] == 56 and stats["fila_pendente"] == 0
+    assert [a["tipo"] for a in logger.get_alerts("fbref")] == ["MULTIPLOS_ERROS"] * 2
+    resumo = logger.get_performance_summary()
+    assert resumo["total"] == 50 and resumo["p50"] == pytest.approx(2.6) and resumo["max"] == pytest.approx(5.0)
+
+
+def test_amostragem_de_debug_e_close_drena_a_fila(criar_logger):
+    logger = criar_logger(debug_sample_rate=0.1)
+    for i in range(100):
+        logger.log("DEBUG", "scraper", "parse", f"debug {i}")
+    logger.log("CRITICAL", "scraper", "parse", "parou")
+    logger.close()
+
+    debug = [r for r in linhas(logger, "apostapro_debug.log") if r["level"] == "DEBUG"]
+    assert len(debug) == 10
+    assert logger.get_stats()["debug_descartados"] == 90
+    assert logger.get_alerts()[0]["tipo"] == "ERRO_CRITICO"
+    assert not logger._writer_thread.is_alive()
+
+
+def test_log_depois_do_close_nao_enfileira(criar_logger):
+    logger = criar_logger(queue_size=5)
+    logger.log("INFO", "fbref", "coletar", "antes")
+    logger.close()
+
+    # Com a fila cheia e sem thread escritora, log() ficaria bloqueado
+    concluiu = threading.Event()
+
+    def registrar():
+        for i in range(20):
+            logger.log("ERROR", "fbref", "coletar", f"depois {i}")
+        concluiu.set()
+
+    threading.Thread(target=registrar, daemon=True).start()
+    assert concluiu.wait(timeout=5)
+    assert logger._fila.qsize() == 0
+    assert logger.get_stats()["total_logs"] == 21
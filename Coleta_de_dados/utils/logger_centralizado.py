@@ -14,6 +14,9 @@ Funcionalidades:
 - Monitoramento de performance
 - Alertas para falhas
 - Dashboard de status
+- Pipeline assíncrono: log() só enfileira; serialização, escrita, estatísticas
+  e alertas rodam numa thread escritora
+- Amostragem de logs DEBUG (LOG_DEBUG_SAMPLE_RATE)
 
 Autor: Sistema de Coleta de Dados
 Data: 2025-08-14
@@ -22,16 +25,36 @@ Versão: 1.0
 
 import logging
 import logging.handlers
+import atexit
 import json
+import queue
 import time
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 import threading
 from collections import defaultdict, deque
 
+NIVEIS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.CRITICAL,
+}
+
+# Serializa str, float e None exatamente como o json.dumps do LogEntry
+_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+# Entrada enfileirada: (time.time(), nível, módulo, função, mensagem, dados, tempo de execução, status da API)
+EntradaFila = Tuple[float, str, str, str, str, Dict[str, Any], Optional[float], Optional[str]]
+
+_PARAR = object()
+
 @dataclass
 class LogEntry:
     """Estrutura padronizada para entradas de log."""
@@ -56,7 +79,8 @@ class CentralizedLogger:
     - Dashboard de status
     """
     
-    def __init__(self, log_dir: str = "logs", max_log_size: int = 10 * 1024 * 1024, backup_count: int = 5):
+    def __init__(self, log_dir: str = "logs", max_log_size: int = 10 * 1024 * 1024, backup_count: int = 5,
+                 async_pipeline: bool = True, queue_size: int = 10000, debug_sample_rate: float = None):
         """
         Inicializa o sistema de logging centralizado.
         
@@ -64,6 +88,9 @@ class CentralizedLogger:
             log_dir: Diretório para armazenar logs
             max_log_size: Tamanho máximo do arquivo de log (bytes)
             backup_count: Número de arquivos de backup
+            async_pipeline: Processa os logs numa thread escritora (False = na thread que chamou log())
+            queue_size: Capacidade da fila; cheia, log() espera a thread escritora
+            debug_sample_rate: Fração dos logs DEBUG mantidos (padrão: LOG_DEBUG_SAMPLE_RATE ou 1.0)
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -78,16 +105,36 @@ class CentralizedLogger:
             "logs_por_modulo": defaultdict(int),
             "erros_por_modulo": defaultdict(int),
             "performance_media": deque(maxlen=1000),
+            "debug_descartados": 0,
             "ultima_atualizacao": datetime.now().isoformat()
         }
         
-        # Alertas e notificações
-        self.alertas = []
-        self.alertas_por_modulo = defaultdict(list)
+        # Alertas e notificações (limitados, inclusive entre as limpezas de 24h)
+        self.max_alertas = 1000
+        self.alertas = deque(maxlen=self.max_alertas)
+        self.alertas_por_modulo = defaultdict(lambda: deque(maxlen=self.max_alertas))
+        
+        # Amostragem de DEBUG: mantém 1 a cada `_passo_debug` logs
+        if debug_sample_rate is None:
+            debug_sample_rate = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1.0"))
+        self._passo_debug = max(1, round(1 / debug_sample_rate)) if debug_sample_rate > 0 else 0
+        self._contador_debug = 0
+        
+        # Prefixos JSON já serializados por (nível, módulo, função)
+        self._prefixos: Dict[Tuple[str, str, str], str] = {}
         
         # Configurar logging
         self._setup_logging()
         
+        # Pipeline assíncrono
+        self.async_pipeline = async_pipeline
+        self._fila: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._writer_thread = None
+        if async_pipeline:
+            self._writer_thread = threading.Thread(target=self._writer_loop, name="CentralizedLoggerWriter", daemon=True)
+            self._writer_thread.start()
+            atexit.register(self.close)
+        
         # Thread para monitoramento
         self.monitoring_thread = None
         self.monitoring_active = False
@@ -134,6 +181,7 @@ class CentralizedLogger:
         debug_handler.setFormatter(json_formatter)
         
         # Adicionar handlers
+        self._handlers = [main_handler, error_handler, debug_handler]
         self.logger.addHandler(main_handler)
         self.logger.addHandler(error_handler)
         self.logger.addHandler(debug_handler)
@@ -146,6 +194,7 @@ class CentralizedLogger:
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             )
             console_handler.setFormatter(console_formatter)
+            self._handlers.append(console_handler)
             self.logger.addHandler(console_handler)
     
     def log(self, level: str, module: str, function: str, message: str, 
@@ -163,24 +212,55 @@ class CentralizedLogger:
             execution_time: Tempo de execução em segundos
             api_status: Status da API (se aplicável)
         """
-        if data is None:
-            data = {}
+        level = level.upper()
         
-        # Criar entrada de log
-        log_entry = LogEntry(
-            timestamp=datetime.now().isoformat(),
-            level=level.upper(),
-            module=module,
-            function=function,
-            message=message,
-            data=data,
-            execution_time=execution_time,
-            api_status=api_status
+        # Amostragem de DEBUG antes de qualquer outro custo
+        if level == "DEBUG" and self._passo_debug != 1:
+            self._contador_debug += 1
+            if not self._passo_debug or self._contador_debug % self._passo_debug:
+                self.stats["debug_descartados"] += 1
+                return
+        
+        # Cópia rasa: o chamador pode alterar o dicionário depois que log() retorna
+        entrada = (time.time(), level, module, function, message, dict(data) if data else {},
+                   execution_time, api_status)
+        
+        if self.async_pipeline:
+            self._fila.put(entrada)
+        else:
+            self._processar(entrada)
+    
+    def _serializar(self, entrada: EntradaFila) -> str:
+        """JSON da entrada, igual a json.dumps(asdict(LogEntry(...))), com as partes fixas em cache."""
+        criado, level, module, function, message, data, execution_time, api_status = entrada
+        prefixo = self._prefixos.get((level, module, function))
+        if prefixo is None:
+            if len(self._prefixos) > 10000:
+                self._prefixos.clear()
+            prefixo = self._prefixos[(level, module, function)] = (
+                f'"level": {_encode(level)}, "module": {_encode(module)}, "function": {_encode(function)}'
+            )
+        dados = json.dumps(data, ensure_ascii=False, default=str) if data else "{}"
+        return (
+            f'{{"timestamp": "{datetime.fromtimestamp(criado).isoformat()}", {prefixo}, '
+            f'"message": {_encode(message)}, "data": {dados}, "execution_time": {_encode(execution_time)}, '
+            f'"error_details": null, "api_status": {_encode(api_status)}}}'
         )
+    
+    def _processar(self, entrada: EntradaFila):
+        """Escreve a entrada nos handlers e atualiza estatísticas e alertas."""
+        self.logger.log(NIVEIS.get(entrada[1], logging.INFO), self._serializar(entrada))
         
-        # Registrar no logger apropriado
-        log_method = getattr(self.logger, level.lower(), self.logger.info)
-        log_method(json.dumps(asdict(log_entry), ensure_ascii=False))
+        log_entry = LogEntry(
+            timestamp=datetime.fromtimestamp(entrada[0]).isoformat(),
+            level=entrada[1],
+            module=entrada[2],
+            function=entrada[3],
+            message=entrada[4],
+            data=entrada[5],
+            execution_time=entrada[6],
+            api_status=entrada[7]
+        )
         
         # Atualizar estatísticas
         self._update_stats(log_entry)
@@ -188,6 +268,64 @@ class CentralizedLogger:
         # Verificar alertas
         self._check_alerts(log_entry)
     
+    def _writer_loop(self):
+        """Thread escritora: consome a fila em lotes até receber o sinal de parada."""
+        while True:
+            lote = [self._fila.get()]
+            try:
+                while len(lote) < 512:
+                    lote.append(self._fila.get_nowait())
+            except queue.Empty:
+                pass
+            
+            parar = False
+            for entrada in lote:
+                if entrada is _PARAR:
+                    parar = True
+                    continue
+                try:
+                    self._processar(entrada)
+                except Exception as e:
+                    print(f"Erro ao processar log: {e}")
+            for _ in lote:
+                self._fila.task_done()
+            if parar:
+                return
+    
+    def flush(self):
+        """Aguarda a thread escritora processar todos os logs já enfileirados."""
+        if self.async_pipeline:
+            self._fila.join()
+    
+    def close(self):
+        """
+        Escreve os logs pendentes, encerra a thread escritora e remove os handlers desta instância.
+        
+        Depois de fechado, log() processa cada entrada na thread que chamou, em
+        vez de enfileirar para uma thread que não consome mais a fila.
+        """
+        self.async_pipeline = False
+        if self._writer_thread and self._writer_thread.is_alive():
+            self._fila.put(_PARAR)
+            self._writer_thread.join()
+        # Entradas de log() concorrentes que chegaram depois do sinal de parada
+        while True:
+            try:
+                entrada = self._fila.get_nowait()
+            except queue.Empty:
+                break
+            if entrada is not _PARAR:
+                try:
+                    self._processar(entrada)
+                except Exception as e:
+                    print(f"Erro ao processar log: {e}")
+            self._fila.task_done()
+        atexit.unregister(self.close)
+        for handler in self._handlers:
+            self.logger.removeHandler(handler)
+            handler.close()
+        self._handlers = []
+    
     def _update_stats(self, log_entry: LogEntry):
         """Atualiza as estatísticas de logging."""
         try:
@@ -299,38 +437,48 @@ class CentralizedLogger:
         cutoff_time = datetime.now() - timedelta(hours=24)
         
         # Limpar alertas gerais
-        self.alertas = [
+        self.alertas = deque((
             alerta for alerta in self.alertas
             if datetime.fromisoformat(alerta["timestamp"]) > cutoff_time
-        ]
+        ), maxlen=self.max_alertas)
         
         # Limpar alertas por módulo
-        for modulo in self.alertas_por_modulo:
-            self.alertas_por_modulo[modulo] = [
+        for modulo in list(self.alertas_por_modulo):
+            self.alertas_por_modulo[modulo] = deque((
                 alerta for alerta in self.alertas_por_modulo[modulo]
                 if datetime.fromisoformat(alerta["timestamp"]) > cutoff_time
-            ]
+            ), maxlen=self.max_alertas)
     
     def get_stats(self) -> Dict[str, Any]:
-        """Retorna estatísticas de logging."""
-        return dict(self.stats)
+        """Retorna estatísticas de logging (logs ainda na fila entram após o processamento)."""
+        stats = dict(self.stats)
+        stats["fila_pendente"] = self._fila.qsize()
+        return stats
     
     def get_alerts(self, modulo: str = None) -> List[Dict[str, Any]]:
         """Retorna alertas ativos."""
         if modulo:
-            return self.alertas_por_modulo.get(modulo, [])
-        return self.alertas
+            return list(self.alertas_por_modulo.get(modulo, []))
+        return list(self.alertas)
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Retorna resumo de performance."""
         if len(self.stats["performance_media"]) == 0:
-            return {"media": 0, "min": 0, "max": 0, "total": 0}
+            return {"media": 0, "min": 0, "max": 0, "p50": 0, "p95": 0, "p99": 0, "total": 0}
+        
+        # Janela das últimas execuções (buffer circular)
+        performances = sorted(self.stats["performance_media"])
+        
+        def percentil(p: float) -> float:
+            return performances[min(len(performances) - 1, int(p * len(performances)))]
         
-        performances = list(self.stats["performance_media"])
         return {
             "media": sum(performances) / len(performances),
-            "min": min(performances),
-            "max": max(performances),
+            "min": performances[0],
+            "max": performances[-1],
+            "p50": percentil(0.50),
+            "p95": percentil(0.95),
+            "p99": percentil(0.99),
             "total": len(performances)
         }
     
@@ -0,0 +1,135 @@
+"""Índices e resumo incremental de recomendacoes_apostas
+
+Revision ID: b41c7e9d2a10
+Revises: a65f244073e1
+Create Date: 2026-10-16 20:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b41c7e9d2a10'
+down_revision = 'a65f244073e1'
+branch_labels = None
+depends_on = None
+
+TABELA = 'recomendacoes_apostas'
+RESUMO = 'recomendacoes_resumo_mercado'
+GATILHOS = ('trg_resumo_recomendacoes_insert', 'trg_resumo_recomendacoes_delete',
+            'trg_resumo_recomendacoes_update')
+
+# Coluna de data -> (índice mercado + data, índice por data). A tabela usada pela
+# API (SQLite) tem data_geracao; a do modelo ORM, created_at, com os nomes
+# declarados em RecomendacaoAposta
+INDICES_DATA = {
+    'created_at': ('idx_recomendacoes_mercado_data', 'idx_recomendacoes_data'),
+    'data_geracao': ('idx_recomendacoes_mercado_geracao', 'idx_recomendacoes_geracao'),
+}
+
+
+def _colunas(inspetor):
+    return {coluna['name'] for coluna in inspetor.get_columns(TABELA)}
+
+
+def _coluna_data(inspetor):
+    return 'data_geracao' if 'data_geracao' in _colunas(inspetor) else 'created_at'
+
+
+def _remover_do_resumo(linha, data):
+    """Tira a linha OLD do resumo do seu mercado (corpo de gatilho SQLite)."""
+    return f"""
+        UPDATE {RESUMO} SET
+            total = total - 1,
+            com_probabilidade = com_probabilidade - ({linha}.probabilidade IS NOT NULL),
+            soma_probabilidade = soma_probabilidade - COALESCE({linha}.probabilidade, 0),
+            ultima_geracao = (
+                SELECT MAX({data}) FROM {TABELA} WHERE mercado_aposta IS {linha}.mercado_aposta
+            )
+        WHERE mercado_aposta = COALESCE({linha}.mercado_aposta, '');
+        DELETE FROM {RESUMO} WHERE mercado_aposta = COALESCE({linha}.mercado_aposta, '') AND total <= 0;
+    """
+
+
+def _somar_ao_resumo(linha, data):
+    """Soma a linha NEW ao resumo do seu mercado (corpo de gatilho SQLite)."""
+    return f"""
+        INSERT INTO {RESUMO} (mercado_aposta, total, com_probabilidade, soma_probabilidade, ultima_geracao)
+        VALUES (COALESCE({linha}.mercado_aposta, ''), 1, {linha}.probabilidade IS NOT NULL,
+                COALESCE({linha}.probabilidade, 0), {linha}.{data})
+        ON CONFLICT (mercado_aposta) DO UPDATE SET
+            total = total + 1,
+            com_probabilidade = com_probabilidade + excluded.com_probabilidade,
+            soma_probabilidade = soma_probabilidade + excluded.soma_probabilidade,
+            ultima_geracao = CASE
+                WHEN ultima_geracao IS NULL OR excluded.ultima_geracao > ultima_geracao
+                THEN excluded.ultima_geracao ELSE ultima_geracao
+            END;
+    """
+
+
+def upgrade() -> None:
+    inspetor = sa.inspect(op.get_bind())
+    if not inspetor.has_table(TABELA):
+        return
+    data = _coluna_data(inspetor)
+
+    # Listagem filtrada por mercado e faixa de data, listagem geral por data e busca por partida
+    colunas = _colunas(inspetor)
+    for coluna, (indice_mercado, indice_data) in INDICES_DATA.items():
+        if coluna in colunas:
+            op.create_index(indice_mercado, TABELA, ['mercado_aposta', coluna], if_not_exists=True)
+            op.create_index(indice_data, TABELA, [coluna], if_not_exists=True)
+    op.create_index('idx_recomendacoes_partida', TABELA, ['partida_id'], if_not_exists=True)
+
+    # O resumo por mercado é lido pela API no banco SQLite
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.create_table(
+        RESUMO,
+        sa.Column('mercado_aposta', sa.Text(), primary_key=True),
+        sa.Column('total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('com_probabilidade', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('soma_probabilidade', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('ultima_geracao', sa.Text()),
+    )
+    op.execute(f"""
+        INSERT INTO {RESUMO} (mercado_aposta, total, com_probabilidade, soma_probabilidade, ultima_geracao)
+        SELECT COALESCE(mercado_aposta, ''), COUNT(*), COUNT(probabilidade),
+               COALESCE(SUM(probabilidade), 0), MAX({data})
+        FROM {TABELA}
+        GROUP BY COALESCE(mercado_aposta, '')
+    """)
+
+    # Toda escrita na tabela (gerador, API, scripts) atualiza o resumo na mesma transação
+    op.execute(f"""
+        CREATE TRIGGER trg_resumo_recomendacoes_insert AFTER INSERT ON {TABELA}
+        BEGIN {_somar_ao_resumo('NEW', data)} END
+    """)
+    op.execute(f"""
+        CREATE TRIGGER trg_resumo_recomendacoes_delete AFTER DELETE ON {TABELA}
+        BEGIN {_remover_do_resumo('OLD', data)} END
+    """)
+    op.execute(f"""
+        CREATE TRIGGER trg_resumo_recomendacoes_update
+        AFTER UPDATE OF mercado_aposta, probabilidade, {data} ON {TABELA}
+        BEGIN {_remover_do_resumo('OLD', data)} {_somar_ao_resumo('NEW', data)} END
+    """)
+
+
+def downgrade() -> None:
+    inspetor = sa.inspect(op.get_bind())
+    if not inspetor.has_table(TABELA):
+        return
+
+    if op.get_bind().dialect.name == 'sqlite':
+        for gatilho in GATILHOS:
+            op.execute(f"DROP TRIGGER IF EXISTS {gatilho}")
+        op.drop_table(RESUMO, if_exists=True)
+
+    # idx_recomendacoes_partida já era declarado pelo modelo ORM e fica
+    for indices in INDICES_DATA.values():
+        for indice in indices:
+            op.drop_index(indice, table_name=TABELA, if_exists=True)
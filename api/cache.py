@@ -0,0 +1,189 @@
+"""
+CACHE DE RESPOSTAS - API FASTAPI
+================================
+
+Cache de respostas para endpoints de leitura pesados (agregados e resumos).
+
+- TTL por rota e chave por caminho + query string
+- ETag em todas as respostas; ``If-None-Match`` correspondente devolve 304
+- Invalidação por tag: cada rota declara as tabelas de que depende e a entrada
+  deixa de valer quando os coletores gravam nelas (ver
+  ``Coleta_de_dados.database.invalidacao_cache``)
+
+As entradas ficam no ``AdvancedCacheManager`` (LRU com índice de tags). A
+autenticação continua sendo feita pelas dependências da rota; o cache evita
+apenas o trabalho no banco.
+
+Uso em um roteador:
+    @router.get("/stats/summary")
+    @cache_resposta(ttl=300, tags=("clubes", "jogadores"))
+    def get_clubs_stats(db: Session = Depends(get_db)):
+        ...
+
+Autor: Sistema de API RESTful
+Data: 2025-08-15
+Versão: 1.0
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from Coleta_de_dados.apis.rapidapi.cache_manager_avancado import AdvancedCacheManager
+from Coleta_de_dados.database.invalidacao_cache import RegistroVersoesTags, get_registro_versoes
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EntradaResposta:
+    """Resposta serializada e as versões das tags vigentes ao gerá-la."""
+    corpo: bytes
+    etag: str
+    versoes: Tuple[int, ...]
+    expira_em: float
+
+
+class CacheRespostas:
+    """Cache de respostas JSON com ETag, TTL e invalidação por tag."""
+
+    def __init__(
+        self,
+        manager: Optional[AdvancedCacheManager] = None,
+        registro: Optional[RegistroVersoesTags] = None
+    ):
+        self.manager = manager or AdvancedCacheManager(max_size=1000, enable_compression=False)
+        self._registro = registro
+
+    @property
+    def registro(self) -> RegistroVersoesTags:
+        if self._registro is None:
+            self._registro = get_registro_versoes()
+        return self._registro
+
+    @staticmethod
+    def _chave(request: Request) -> str:
+        consulta = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+        return f"{request.url.path}?{consulta}"
+
+    def _obter(self, chave: str, versoes: Tuple[int, ...]) -> Optional[EntradaResposta]:
+        entrada = self.manager.get(chave)
+        if entrada is None or entrada.versoes != versoes:
+            return None
+        return entrada
+
+    def _armazenar(
+        self, chave: str, resultado: Any, ttl: int, tags: Tuple[str, ...], versoes: Tuple[int, ...]
+    ) -> EntradaResposta:
+        corpo = JSONResponse(content=jsonable_encoder(resultado)).body
+        entrada = EntradaResposta(
+            corpo=corpo,
+            etag=f'"{hashlib.blake2b(corpo, digest_size=16).hexdigest()}"',
+            versoes=versoes,
+            expira_em=time.time() + ttl,
+        )
+        self.manager.set(chave, entrada, ttl=ttl, tags=list(tags))
+        return entrada
+
+    @staticmethod
+    def _responder(request: Request, entrada: EntradaResposta, origem: str) -> Response:
+        restante = max(0, math.ceil(entrada.expira_em - time.time()))
+        cabecalhos = {
+            "ETag": entrada.etag,
+            "Cache-Control": f"private, max-age={restante}",
+            "X-Cache": origem,
+        }
+        etags_cliente = request.headers.get("if-none-match", "")
+        if entrada.etag in (etag.strip() for etag in etags_cliente.split(",")) or etags_cliente == "*":
+            return Response(status_code=304, headers=cabecalhos)
+        return Response(content=entrada.corpo, media_type="application/json", headers=cabecalhos)
+
+    def responder(
+        self, request: Request, ttl: int, tags: Tuple[str, ...], gerar: Callable[[], Any]
+    ) -> Any:
+        """Serve a resposta do cache ou gera, armazena e serve uma nova."""
+        chave = self._chave(request)
+        # Versões lidas antes de gerar: escritas concorrentes invalidam a entrada
+        versoes = self.registro.versoes(tags)
+        entrada = self._obter(chave, versoes)
+        if entrada is not None:
+            return self._responder(request, entrada, "HIT")
+
+        resultado = gerar()
+        if isinstance(resultado, Response):
+            return resultado
+        entrada = self._armazenar(chave, resultado, ttl, tags, versoes)
+        return self._responder(request, entrada, "MISS")
+
+    async def responder_async(
+        self, request: Request, ttl: int, tags: Tuple[str, ...], gerar: Callable[[], Any]
+    ) -> Any:
+        chave = self._chave(request)
+        versoes = self.registro.versoes(tags)
+        entrada = self._obter(chave, versoes)
+        if entrada is not None:
+            return self._responder(request, entrada, "HIT")
+
+        resultado = await gerar()
+        if isinstance(resultado, Response):
+            return resultado
+        entrada = self._armazenar(chave, resultado, ttl, tags, versoes)
+        return self._responder(request, entrada, "MISS")
+
+    def invalidar(self, *tags: str):
+        """Remove as entradas locais das tags e avisa os demais processos."""
+        for tag in tags:
+            self.manager.invalidate_tag(tag)
+        self.registro.invalidar(tags)
+
+
+cache_respostas = CacheRespostas()
+
+
+def cache_resposta(ttl: int, tags: Iterable[str]):
+    """
+    Decorador de endpoint que aplica o cache de respostas.
+
+    Acrescenta um parâmetro ``Request`` à assinatura vista pelo FastAPI; as
+    dependências da rota (autenticação, sessão) continuam sendo resolvidas
+    normalmente antes da consulta ao cache.
+
+    Args:
+        ttl: Tempo de vida da resposta em segundos
+        tags: Tabelas das quais a resposta depende
+    """
+    tags = tuple(tags)
+
+    def decorador(endpoint: Callable) -> Callable:
+        assinatura = inspect.signature(endpoint)
+        parametro = inspect.Parameter(
+            "_requisicao_cache", inspect.Parameter.KEYWORD_ONLY, annotation=Request
+        )
+        nova_assinatura = assinatura.replace(parameters=[*assinatura.parameters.values(), parametro])
+
+        if inspect.iscoroutinefunction(endpoint):
+            @functools.wraps(endpoint)
+            async def wrapper(*args, _requisicao_cache: Request, **kwargs):
+                return await cache_respostas.responder_async(
+                    _requisicao_cache, ttl, tags, lambda: endpoint(*args, **kwargs)
+                )
+        else:
+            @functools.wraps(endpoint)
+            def wrapper(*args, _requisicao_cache: Request, **kwargs):
+                return cache_respostas.responder(
+                    _requisicao_cache, ttl, tags, lambda: endpoint(*args, **kwargs)
+                )
+
+        wrapper.__signature__ = nova_assinatura
+        return wrapper
+
+    return decorador
@@ -38,6 +38,8 @@ class APISettings(BaseSettings):
     # Rate Limiting
     api_rate_limit: int = Field(default=100, env="API_RATE_LIMIT")
     api_rate_limit_period: int = Field(default=60, env="API_RATE_LIMIT_PERIOD")
+    api_rate_limit_backend: str = Field(default="memoria", env="API_RATE_LIMIT_BACKEND")  # memoria | sqlite
+    api_rate_limit_sqlite_path: str = Field(default="rate_limit.db", env="API_RATE_LIMIT_SQLITE_PATH")
     
     # Configurações gerais
     environment: str = Field(default="development", env="ENVIRONMENT")
@@ -3,17 +3,27 @@ MÓDULO DE BANCO DE DADOS - API FASTAPI
 ======================================
 
 Módulo para gerenciar conexões com o banco de dados PostgreSQL.
-Fornece uma função de dependência para obter sessões do banco de dados.
+Fornece uma função de dependência para obter sessões do banco de dados e
+uma pool de conexões para os roteadores que consultam o SQLite direto.
 
 Autor: Sistema de API RESTful
 Data: 2025-08-06
 Versão: 1.0
 """
 
-from typing import Generator
+import sqlite3
+import threading
+from typing import Dict, Generator
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
 from Coleta_de_dados.database import SessionLocal
 
+# Conexões SQLite reutilizadas entre requisições (uma pool por arquivo de banco)
+TAMANHO_POOL_SQLITE = 5
+MAX_OVERFLOW_SQLITE = 10
+_pools_sqlite: Dict[str, QueuePool] = {}
+_lock_pools_sqlite = threading.Lock()
+
 def get_db() -> Generator[Session, None, None]:
     """
     Fornece uma sessão do banco de dados para cada requisição.
@@ -31,3 +41,20 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+def conexao_sqlite(caminho: str):
+    """
+    Retorna uma conexão da pool do arquivo SQLite ``caminho``.
+    
+    A conexão tem a interface do sqlite3; ``close()`` a devolve à pool.
+    """
+    pool = _pools_sqlite.get(caminho)
+    if pool is None:
+        with _lock_pools_sqlite:
+            pool = _pools_sqlite.get(caminho)
+            if pool is None:
+                pool = _pools_sqlite[caminho] = QueuePool(
+                    lambda: sqlite3.connect(caminho, timeout=30, check_same_thread=False),
+                    pool_size=TAMANHO_POOL_SQLITE, max_overflow=MAX_OVERFLOW_SQLITE, timeout=30
+                )
+    return pool.connect()
@@ -25,6 +25,8 @@ import uvicorn
 # Imports locais
 from .config import get_api_settings, DOCS_CONFIG, MIDDLEWARE_CONFIG
 from .security import rate_limiter, init_api_keys
+from Coleta_de_dados.database.config import get_db_manager
+from Coleta_de_dados.apis.rapidapi.base_rapidapi import fechar_sessoes_http
 from .routers import competitions, clubs, players, health, matches, social, news, analise, recomendacoes, ml_router
 
 # Configuração de logging
@@ -45,12 +47,13 @@ async def lifespan(app: FastAPI):
     
     Startup:
     - Inicializa API keys
+    - Limita as sessões simultâneas à capacidade do pool do banco
     - Configura logging
     - Verifica conectividade do banco
     
     Shutdown:
     - Limpa recursos
-    - Fecha conexões
+    - Fecha conexões (incluindo as sessões HTTP compartilhadas da RapidAPI)
     """
     # Startup
     logger.info("🚀 Iniciando API FastAPI do ApostaPro...")
@@ -60,6 +63,9 @@ async def lifespan(app: FastAPI):
         init_api_keys()
         logger.info("✅ Sistema de API Keys inicializado")
         
+        # Endpoints síncronos rodam no threadpool; sessões limitadas ao pool do banco
+        get_db_manager().configurar_concorrencia()
+        
         # Verificar conectividade do banco (comentado temporariamente)
         # from Coleta_de_dados.database import db_manager
         # if db_manager.test_connection():
@@ -78,6 +84,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🔄 Finalizando API FastAPI...")
+    await fechar_sessoes_http()
     logger.info("✅ API FastAPI finalizada")
 
 # ============================================================================
@@ -131,14 +138,14 @@ def create_app() -> FastAPI:
         client_ip = request.client.host
         api_key = request.headers.get("X-API-Key")
         
-        # Verificar rate limit
-        if rate_limiter.is_rate_limited(client_ip, api_key):
-            rate_info = rate_limiter.get_rate_limit_info(client_ip, api_key)
+        # Verificar rate limit (registro e informações em uma única operação)
+        limitado, rate_info = await rate_limiter.verificar_async(client_ip, api_key)
+        if limitado:
             return JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "error": "Rate limit exceeded",
-                    "message": f"Limite de {rate_info['limit']} requests por {rate_info['reset_in']}s excedido",
+                    "message": f"Limite de {rate_info['limit']} requests por {rate_info['period']}s excedido",
                     "rate_limit": rate_info,
                     "timestamp": datetime.now().isoformat()
                 },
@@ -156,7 +163,6 @@ def create_app() -> FastAPI:
         process_time = time.time() - start_time
         
         # Adicionar headers de rate limit e performance
-        rate_info = rate_limiter.get_rate_limit_info(client_ip, api_key)
         response.headers["X-RateLimit-Limit"] = str(rate_info['limit'])
         response.headers["X-RateLimit-Remaining"] = str(rate_info['remaining'])
         response.headers["X-RateLimit-Reset"] = str(rate_info['reset_in'])
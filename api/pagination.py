@@ -0,0 +1,301 @@
+"""
+PAGINAÇÃO - API FASTAPI
+=======================
+
+Paginação compartilhada pelos roteadores de listagem.
+
+Dois modos são suportados:
+- offset (padrão): ``page``/``size`` com contagem exata, comportamento original
+- cursor (opt-in): keyset sobre (chave de ordenação, id) com cursor opaco;
+  o custo de cada página independe da profundidade e a contagem é opcional
+  ou estimada
+
+Uso em um roteador:
+    chave = ChaveOrdenacao(NoticiaClube.id, NoticiaClube.data_publicacao, descendente=True)
+    pagina = paginar(query, paginacao, page, size, chave, tabela="noticias_clubes")
+    noticias = pagina.resultados(pagina.query.all())
+    return {"items": [...], **pagina.metadados()}
+
+Autor: Sistema de API RESTful
+Data: 2025-08-15
+Versão: 1.0
+"""
+
+import base64
+import binascii
+import json
+import operator
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional
+
+from fastapi import HTTPException, Query as QueryParam, status
+from sqlalchemy import asc, desc, nulls_last, text, tuple_
+from sqlalchemy.orm import Query
+
+MODO_OFFSET = "offset"
+MODO_CURSOR = "cursor"
+
+CONTAGEM_EXATA = "exata"
+CONTAGEM_ESTIMADA = "estimada"
+CONTAGEM_NENHUMA = "nenhuma"
+
+
+@dataclass(frozen=True)
+class ChaveOrdenacao:
+    """
+    Ordenação estável de uma listagem: coluna principal + id como desempate.
+
+    Se ``coluna`` for None, a listagem é ordenada apenas pelo id. Valores nulos
+    na coluna principal ficam sempre no final.
+
+    No modo cursor, cada página é uma busca por faixa no índice da coluna:
+    a comparação usa row values ``(coluna, id) < (valor, id)`` e, quando a
+    coluna aceita nulos, a listagem é percorrida em duas fases (valores
+    preenchidos e depois a cauda de nulos) para que nenhum predicado
+    ``IS NULL`` dentro de um OR force a varredura da tabela.
+    """
+    coluna_id: Any
+    coluna: Any = None
+    descendente: bool = False
+
+    @property
+    def anulavel(self) -> bool:
+        """Indica se a coluna principal aceita nulos (exige a fase da cauda)."""
+        if self.coluna is None:
+            return False
+        return getattr(self.coluna.expression, "nullable", True)
+
+    def ordenar(self, query: Query) -> Query:
+        direcao = desc if self.descendente else asc
+        if self.coluna is None:
+            return query.order_by(direcao(self.coluna_id))
+        return query.order_by(nulls_last(direcao(self.coluna)), direcao(self.coluna_id))
+
+    def filtrar_pagina(self, query: Query, cursor: Optional[tuple] = None) -> Query:
+        """
+        Aplica filtro e ordenação keyset para a página seguinte ao cursor.
+
+        Args:
+            query: Query com os filtros da listagem já aplicados
+            cursor: Tupla (valor, ultimo_id) decodificada, ou None na primeira página.
+                Com valor None a página pertence à cauda de nulos; ultimo_id
+                None indica o início dessa cauda.
+        """
+        direcao = desc if self.descendente else asc
+        apos = operator.lt if self.descendente else operator.gt
+        valor, ultimo_id = cursor if cursor else (None, None)
+
+        if self.coluna is None or (cursor and valor is None):
+            if self.coluna is not None:
+                query = query.filter(self.coluna.is_(None))
+            if ultimo_id is not None:
+                query = query.filter(apos(self.coluna_id, ultimo_id))
+            return query.order_by(direcao(self.coluna_id))
+
+        if self.anulavel:
+            query = query.filter(self.coluna.isnot(None))
+        if cursor:
+            query = query.filter(apos(
+                tuple_(self.coluna, self.coluna_id), tuple_(valor, ultimo_id)
+            ))
+        return query.order_by(direcao(self.coluna), direcao(self.coluna_id))
+
+    def valores(self, entidade: Any) -> tuple:
+        """Extrai (valor da chave, id) de uma entidade ORM."""
+        valor = getattr(entidade, self.coluna.key) if self.coluna is not None else None
+        return valor, getattr(entidade, self.coluna_id.key)
+
+
+class ParametrosPaginacao:
+    """Dependência com os parâmetros de paginação comuns a todas as listagens."""
+
+    def __init__(
+        self,
+        paginacao: str = QueryParam(
+            MODO_OFFSET,
+            pattern=f"^({MODO_OFFSET}|{MODO_CURSOR})$",
+            description="Modo de paginação: 'offset' (page/size) ou 'cursor' (keyset)"
+        ),
+        cursor: Optional[str] = QueryParam(
+            None, description="Cursor opaco retornado em next_cursor (ativa o modo cursor)"
+        ),
+        contagem: Optional[str] = QueryParam(
+            None,
+            pattern=f"^({CONTAGEM_EXATA}|{CONTAGEM_ESTIMADA}|{CONTAGEM_NENHUMA})$",
+            description="Total: 'exata', 'estimada' ou 'nenhuma' (padrão: exata no modo offset, nenhuma no modo cursor)"
+        ),
+    ):
+        self.modo = MODO_CURSOR if cursor else paginacao
+        self.cursor = cursor
+        if contagem is None:
+            contagem = CONTAGEM_EXATA if self.modo == MODO_OFFSET else CONTAGEM_NENHUMA
+        self.contagem = contagem
+
+
+def codificar_cursor(valor: Any, ultimo_id: Optional[int]) -> str:
+    """Serializa (valor, id) em um cursor opaco base64 URL-safe."""
+    tipo = None
+    if isinstance(valor, datetime):
+        tipo, valor = "datetime", valor.isoformat()
+    elif isinstance(valor, date):
+        tipo, valor = "date", valor.isoformat()
+    bruto = json.dumps({"v": valor, "t": tipo, "id": ultimo_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(bruto.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decodificar_cursor(cursor: str) -> tuple:
+    """
+    Decodifica um cursor gerado por ``codificar_cursor``.
+
+    Raises:
+        HTTPException: 400 se o cursor for inválido
+    """
+    try:
+        preenchimento = "=" * (-len(cursor) % 4)
+        dados = json.loads(base64.urlsafe_b64decode(cursor + preenchimento))
+        valor, tipo, ultimo_id = dados["v"], dados.get("t"), dados["id"]
+        if ultimo_id is not None:
+            ultimo_id = int(ultimo_id)
+        elif valor is not None:
+            raise ValueError("cursor sem id")
+        if tipo == "datetime":
+            valor = datetime.fromisoformat(valor)
+        elif tipo == "date":
+            valor = date.fromisoformat(valor)
+        return valor, ultimo_id
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor de paginação inválido"
+        )
+
+
+def estimar_total(query: Query, tabela: str) -> Optional[int]:
+    """
+    Estima o total de linhas de uma tabela sem varredura completa.
+
+    PostgreSQL usa as estatísticas do planner (pg_class.reltuples); SQLite usa
+    o maior rowid, que é um limite superior barato. A estimativa ignora filtros.
+    """
+    session = query.session
+    dialeto = session.get_bind().dialect.name
+    if dialeto == "postgresql":
+        resultado = session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :tabela"),
+            {"tabela": tabela}
+        ).scalar()
+    else:
+        resultado = session.execute(text(f'SELECT MAX(rowid) FROM "{tabela}"')).scalar()
+    return max(int(resultado), 0) if resultado is not None else 0
+
+
+@dataclass
+class Pagina:
+    """Página em construção: query paginada e metadados da resposta."""
+    query: Query
+    modo: str
+    page: int
+    size: int
+    chave: ChaveOrdenacao
+    cursor: Optional[tuple] = None
+    query_base: Optional[Query] = None
+    total: Optional[int] = None
+    total_estimado: bool = False
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+    def resultados(self, linhas: List[Any], entidade: Callable[[Any], Any] = lambda linha: linha) -> List[Any]:
+        """
+        Recebe as linhas da query paginada e devolve apenas as da página.
+
+        No modo cursor a query busca ``size + 1`` linhas para saber se há
+        próxima página; a linha extra é descartada e o cursor é gerado a partir
+        da última linha retornada. ``entidade`` extrai o objeto ORM quando a
+        query retorna tuplas.
+        """
+        if self.modo == MODO_CURSOR:
+            self.has_more = len(linhas) > self.size
+            linhas = linhas[:self.size]
+            if self.has_more and linhas:
+                self.next_cursor = codificar_cursor(*self.chave.valores(entidade(linhas[-1])))
+            elif self._fim_dos_preenchidos() and self._existe_cauda_nula():
+                # Valores preenchidos esgotados: a próxima página começa na cauda de nulos
+                self.has_more = True
+                self.next_cursor = codificar_cursor(None, None)
+        elif self.pages is not None:
+            self.has_more = self.page < self.pages
+        else:
+            self.has_more = len(linhas) == self.size
+        return linhas
+
+    def _fim_dos_preenchidos(self) -> bool:
+        return self.chave.anulavel and (self.cursor is None or self.cursor[0] is not None)
+
+    def _existe_cauda_nula(self) -> bool:
+        filtrada = self.query_base.filter(self.chave.coluna.is_(None))
+        return bool(self.query_base.session.query(filtrada.exists()).scalar())
+
+    @property
+    def pages(self) -> Optional[int]:
+        if self.total is None:
+            return None
+        return (self.total + self.size - 1) // self.size
+
+    def metadados(self) -> dict:
+        """Campos de paginação para a resposta da listagem."""
+        return {
+            "total": self.total,
+            "page": self.page,
+            "size": self.size,
+            "pages": self.pages,
+            "next_cursor": self.next_cursor,
+            "has_more": self.has_more,
+            "total_estimado": self.total_estimado,
+        }
+
+
+def paginar(
+    query: Query,
+    paginacao: ParametrosPaginacao,
+    page: int,
+    size: int,
+    chave: ChaveOrdenacao,
+    tabela: Optional[str] = None,
+    ordenar_offset: Optional[Callable[[Query], Query]] = None
+) -> Pagina:
+    """
+    Aplica ordenação, contagem e paginação (offset ou keyset) a uma query filtrada.
+
+    Args:
+        query: Query com os filtros da listagem já aplicados
+        paginacao: Parâmetros de paginação da requisição
+        page: Página solicitada (apenas modo offset)
+        size: Itens por página
+        chave: Ordenação estável usada pelo keyset
+        tabela: Nome da tabela, necessário para contagem estimada
+        ordenar_offset: Ordenação alternativa para o modo offset (padrão: a chave)
+
+    Returns:
+        Pagina: Query paginada pronta para execução e metadados
+    """
+    pagina = Pagina(
+        query=query, modo=paginacao.modo, page=page, size=size, chave=chave,
+        query_base=query.order_by(None)
+    )
+
+    if paginacao.contagem == CONTAGEM_EXATA:
+        pagina.total = query.order_by(None).count()
+    elif paginacao.contagem == CONTAGEM_ESTIMADA and tabela:
+        pagina.total = estimar_total(query, tabela)
+        pagina.total_estimado = True
+
+    query = query.order_by(None)
+    if paginacao.modo == MODO_CURSOR:
+        if paginacao.cursor:
+            pagina.cursor = decodificar_cursor(paginacao.cursor)
+        pagina.query = chave.filtrar_pagina(query, pagina.cursor).limit(size + 1)
+    else:
+        query = ordenar_offset(query) if ordenar_offset else chave.ordenar(query)
+        pagina.query = query.offset((page - 1) * size).limit(size)
+    return pagina
@@ -11,16 +11,16 @@ Data: 2025-01-15
 Versão: 1.0
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
 from typing import List, Optional
 from datetime import datetime, timedelta
-import sqlite3
 import os
 
 from api import schemas
-from api.database import get_db
+from api.database import conexao_sqlite, get_db
+from Coleta_de_dados.analise import job_sentimento, resumo_sentimento
 
 router = APIRouter(prefix="/analise", tags=["Análise"])
 
@@ -38,6 +38,119 @@ def get_db_path():
     
     return None
 
+def _media(soma: Optional[float], contagem: Optional[int]) -> float:
+    return soma / contagem if contagem else 0.0
+
+def _classificar(score_medio: float) -> str:
+    if score_medio > 0.1:
+        return 'positivo'
+    if score_medio < -0.1:
+        return 'negativo'
+    return 'neutro'
+
+# Declarada antes de /sentimento/{clube_id} para não ser capturada por ela
+@router.get("/sentimento/estatisticas", response_model=schemas.SentimentoEstatisticasSchema)
+def get_estatisticas_sentimento(
+    db: Session = Depends(get_db),
+    dias_atras: int = Query(30, description="Número de dias para análise", ge=1, le=365)
+):
+    """
+    Obtém estatísticas gerais de sentimento.
+    
+    Lidas do resumo por clube/dia/fonte; a janela começa no dia de
+    ``hoje - dias_atras``.
+    
+    Args:
+        dias_atras: Número de dias para análise
+        
+    Returns:
+        Estatísticas gerais de sentimento
+    """
+    try:
+        db_path = get_db_path()
+        if not db_path:
+            raise HTTPException(status_code=500, detail="Banco de dados não encontrado")
+        
+        conn = conexao_sqlite(db_path)
+        try:
+            cursor = conn.cursor()
+            
+            # Dia inicial da janela de análise
+            dia_limite = (datetime.now() - timedelta(days=dias_atras)).date().isoformat()
+            
+            # Totais e somas por fonte e sentimento
+            cursor.execute(f"""
+                SELECT fonte, sentimento, SUM(total), SUM(soma_score), SUM(com_score)
+                FROM {resumo_sentimento.origem_consulta(conn, resumo_sentimento.TABELA_RESUMO_DIA)}
+                WHERE dia >= ?
+                GROUP BY fonte, sentimento
+            """, (dia_limite,))
+            
+            totais = {'noticias': 0, 'posts': 0}
+            somas = {'noticias': [0.0, 0], 'posts': [0.0, 0]}
+            distribuicao_sentimento = {'positivo': 0, 'negativo': 0, 'neutro': 0}
+            for fonte, sentimento, total, soma_score, com_score in cursor.fetchall():
+                totais[fonte] += total
+                somas[fonte][0] += soma_score
+                somas[fonte][1] += com_score
+                if sentimento in distribuicao_sentimento:
+                    distribuicao_sentimento[sentimento] += total
+            
+            total_noticias, total_posts = totais['noticias'], totais['posts']
+            score_medio_noticias = _media(*somas['noticias'])
+            score_medio_posts = _media(*somas['posts'])
+            
+            # Calcular score médio geral
+            total_items = total_noticias + total_posts
+            if total_items > 0:
+                score_medio_geral = (
+                    (score_medio_noticias * total_noticias + score_medio_posts * total_posts) / total_items
+                )
+            else:
+                score_medio_geral = 0.0
+            
+            # Top clubes com sentimento positivo e negativo nas notícias
+            top_clubes = {}
+            for sentimento, ordem in (('positivo', 'DESC'), ('negativo', 'ASC')):
+                cursor.execute(f"""
+                    SELECT 
+                        c.nome as clube,
+                        SUM(r.total) as total_noticias,
+                        SUM(r.soma_score) / NULLIF(SUM(r.com_score), 0) as score_medio
+                    FROM {resumo_sentimento.origem_consulta(conn, resumo_sentimento.TABELA_RESUMO)} r
+                    JOIN clubes c ON r.clube_id = c.id
+                    WHERE r.fonte = 'noticias' AND r.sentimento = ? AND r.dia >= ?
+                    GROUP BY c.id, c.nome
+                    ORDER BY score_medio {ordem}
+                    LIMIT 5
+                """, (sentimento, dia_limite))
+                
+                top_clubes[sentimento] = [
+                    {
+                        'nome': clube[0],
+                        'total_noticias': clube[1],
+                        'score_medio': clube[2] or 0.0
+                    }
+                    for clube in cursor.fetchall()
+                ]
+        finally:
+            conn.close()
+        
+        return {
+            "total_noticias": total_noticias,
+            "total_posts": total_posts,
+            "distribuicao_sentimento": distribuicao_sentimento,
+            "score_medio_geral": score_medio_geral,
+            "top_clubes_positivos": top_clubes['positivo'],
+            "top_clubes_negativos": top_clubes['negativo'],
+            "ultima_atualizacao": datetime.now()
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+
 @router.get("/sentimento/{clube_id}", response_model=schemas.SentimentoClubeSchema)
 def get_sentimento_clube(
     clube_id: int, 
@@ -55,56 +168,48 @@ def get_sentimento_clube(
         Análise de sentimento do clube
     """
     try:
-        # Conectar ao banco SQLite
         db_path = get_db_path()
         if not db_path:
             raise HTTPException(status_code=500, detail="Banco de dados não encontrado")
         
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Verificar se o clube existe
-        cursor.execute("SELECT nome FROM clubes WHERE id = ?", (clube_id,))
-        clube = cursor.fetchone()
-        
-        if not clube:
-            raise HTTPException(status_code=404, detail="Clube não encontrado")
-        
-        nome_clube = clube[0]
-        
-        # Análise de sentimento das notícias
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total,
-                AVG(score_sentimento) as score_medio,
-                AVG(confianca_sentimento) as confianca_media,
-                MAX(analisado_em) as ultima_analise
-            FROM noticias_clubes 
-            WHERE clube_id = ? AND sentimento IS NOT NULL
-        """, (clube_id,))
+        conn = conexao_sqlite(db_path)
+        try:
+            cursor = conn.cursor()
+            
+            # Verificar se o clube existe
+            cursor.execute("SELECT nome FROM clubes WHERE id = ?", (clube_id,))
+            clube = cursor.fetchone()
+            
+            if not clube:
+                raise HTTPException(status_code=404, detail="Clube não encontrado")
+            
+            nome_clube = clube[0]
+            
+            # Sentimento das notícias e dos posts do clube
+            cursor.execute(f"""
+                SELECT fonte, SUM(total), SUM(soma_score), SUM(com_score),
+                       SUM(soma_confianca), SUM(com_confianca), MAX(ultima_analise)
+                FROM {resumo_sentimento.origem_consulta(conn, resumo_sentimento.TABELA_RESUMO_CLUBE)}
+                WHERE clube_id = ?
+                GROUP BY fonte
+            """, (clube_id,))
+            por_fonte = {linha[0]: linha[1:] for linha in cursor.fetchall()}
+        finally:
+            conn.close()
         
-        stats_noticias = cursor.fetchone()
-        total_noticias = stats_noticias[0] or 0
-        score_medio_noticias = stats_noticias[1] or 0.0
-        confianca_media = stats_noticias[3] or 0.0
-        ultima_analise = stats_noticias[4]
+        vazio = (0, 0.0, 0, 0.0, 0, None)
+        total_noticias, soma_score, com_score, soma_confianca, com_confianca, ultima_analise = \
+            por_fonte.get('noticias', vazio)
+        score_medio_noticias = _media(soma_score, com_score)
+        confianca_media = _media(soma_confianca, com_confianca)
         
-        # Análise de sentimento dos posts (se solicitado)
+        # Sentimento dos posts (se solicitado)
         sentimento_medio_posts = None
         posts_analisados = None
         
         if incluir_posts:
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total,
-                    AVG(score_sentimento) as score_medio
-                FROM posts_redes_sociais 
-                WHERE clube_id = ? AND sentimento IS NOT NULL
-            """, (clube_id,))
-            
-            stats_posts = cursor.fetchone()
-            posts_analisados = stats_posts[0] or 0
-            sentimento_medio_posts = stats_posts[1] or 0.0
+            posts_analisados, soma_score, com_score = por_fonte.get('posts', vazio)[:3]
+            sentimento_medio_posts = _media(soma_score, com_score)
         
         # Calcular sentimento geral
         scores = [score_medio_noticias]
@@ -113,15 +218,6 @@ def get_sentimento_clube(
         
         score_medio_geral = sum(scores) / len(scores) if scores else 0.0
         
-        if score_medio_geral > 0.1:
-            sentimento_geral = 'positivo'
-        elif score_medio_geral < -0.1:
-            sentimento_geral = 'negativo'
-        else:
-            sentimento_geral = 'neutro'
-        
-        conn.close()
-        
         return {
             "clube_id": clube_id,
             "nome_clube": nome_clube,
@@ -129,7 +225,7 @@ def get_sentimento_clube(
             "noticias_analisadas": total_noticias,
             "sentimento_medio_posts": sentimento_medio_posts,
             "posts_analisados": posts_analisados,
-            "sentimento_geral": sentimento_geral,
+            "sentimento_geral": _classificar(score_medio_geral),
             "confianca_media": confianca_media,
             "ultima_atualizacao": ultima_analise
         }
@@ -139,141 +235,6 @@ def get_sentimento_clube(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
 
-@router.get("/sentimento/estatisticas", response_model=schemas.SentimentoEstatisticasSchema)
-def get_estatisticas_sentimento(
-    db: Session = Depends(get_db),
-    dias_atras: int = Query(30, description="Número de dias para análise", ge=1, le=365)
-):
-    """
-    Obtém estatísticas gerais de sentimento.
-    
-    Args:
-        dias_atras: Número de dias para análise
-        
-    Returns:
-        Estatísticas gerais de sentimento
-    """
-    try:
-        # Conectar ao banco SQLite
-        db_path = get_db_path()
-        if not db_path:
-            raise HTTPException(status_code=500, detail="Banco de dados não encontrado")
-        
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Data limite para análise
-        data_limite = datetime.now() - timedelta(days=dias_atras)
-        
-        # Estatísticas de notícias
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total,
-                COUNT(CASE WHEN sentimento = 'positivo' THEN 1 END) as positivas,
-                COUNT(CASE WHEN sentimento = 'negativo' THEN 1 END) as negativas,
-                COUNT(CASE WHEN sentimento = 'neutro' THEN 1 END) as neutras,
-                AVG(score_sentimento) as score_medio
-            FROM noticias_clubes 
-            WHERE sentimento IS NOT NULL AND created_at >= ?
-        """, (data_limite,))
-        
-        stats_noticias = cursor.fetchone()
-        total_noticias = stats_noticias[0] or 0
-        score_medio_noticias = stats_noticias[4] or 0.0
-        
-        # Estatísticas de posts
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total,
-                COUNT(CASE WHEN sentimento = 'positivo' THEN 1 END) as positivos,
-                COUNT(CASE WHEN sentimento = 'negativo' THEN 1 END) as negativos,
-                COUNT(CASE WHEN sentimento = 'neutro' THEN 1 END) as neutros,
-                AVG(score_sentimento) as score_medio
-            FROM posts_redes_sociais 
-            WHERE sentimento IS NOT NULL AND created_at >= ?
-        """, (data_limite,))
-        
-        stats_posts = cursor.fetchone()
-        total_posts = stats_posts[0] or 0
-        score_medio_posts = stats_posts[4] or 0.0
-        
-        # Calcular score médio geral
-        total_items = total_noticias + total_posts
-        if total_items > 0:
-            score_medio_geral = (
-                (score_medio_noticias * total_noticias + score_medio_posts * total_posts) / total_items
-            )
-        else:
-            score_medio_geral = 0.0
-        
-        # Distribuição de sentimento
-        distribuicao_sentimento = {
-            'positivo': (stats_noticias[1] or 0) + (stats_posts[1] or 0),
-            'negativo': (stats_noticias[2] or 0) + (stats_posts[2] or 0),
-            'neutro': (stats_noticias[3] or 0) + (stats_posts[3] or 0)
-        }
-        
-        # Top clubes com sentimento positivo
-        cursor.execute("""
-            SELECT 
-                c.nome as clube,
-                COUNT(n.id) as total_noticias,
-                AVG(n.score_sentimento) as score_medio
-            FROM noticias_clubes n
-            JOIN clubes c ON n.clube_id = c.id
-            WHERE n.sentimento = 'positivo' AND n.created_at >= ?
-            GROUP BY c.id, c.nome
-            ORDER BY score_medio DESC
-            LIMIT 5
-        """, (data_limite,))
-        
-        top_positivos = [
-            {
-                'nome': clube[0],
-                'total_noticias': clube[1],
-                'score_medio': clube[2] or 0.0
-            }
-            for clube in cursor.fetchall()
-        ]
-        
-        # Top clubes com sentimento negativo
-        cursor.execute("""
-            SELECT 
-                c.nome as clube,
-                COUNT(n.id) as total_noticias,
-                AVG(n.score_sentimento) as score_medio
-            FROM noticias_clubes n
-            JOIN clubes c ON n.clube_id = c.id
-            WHERE n.sentimento = 'negativo' AND n.created_at >= ?
-            GROUP BY c.id, c.nome
-            ORDER BY score_medio ASC
-            LIMIT 5
-        """, (data_limite,))
-        
-        top_negativos = [
-            {
-                'nome': clube[0],
-                'total_noticias': clube[1],
-                'score_medio': clube[2] or 0.0
-            }
-            for clube in cursor.fetchall()
-        ]
-        
-        conn.close()
-        
-        return {
-            "total_noticias": total_noticias,
-            "total_posts": total_posts,
-            "distribuicao_sentimento": distribuicao_sentimento,
-            "score_medio_geral": score_medio_geral,
-            "top_clubes_positivos": top_positivos,
-            "top_clubes_negativos": top_negativos,
-            "ultima_atualizacao": datetime.now()
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
-
 @router.get("/sentimento/clubes/ranking", response_model=List[schemas.SentimentoClubeSchema])
 def get_ranking_sentimento_clubes(
     db: Session = Depends(get_db),
@@ -291,56 +252,51 @@ def get_ranking_sentimento_clubes(
         Ranking de clubes por sentimento
     """
     try:
-        # Conectar ao banco SQLite
         db_path = get_db_path()
         if not db_path:
             raise HTTPException(status_code=500, detail="Banco de dados não encontrado")
         
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Construir query baseada no filtro
+        # Construir filtro
+        params = []
+        filtro_sentimento = ""
         if tipo_sentimento:
             if tipo_sentimento not in ['positivo', 'negativo', 'neutro']:
                 raise HTTPException(status_code=400, detail="Tipo de sentimento inválido")
             
-            where_clause = "WHERE n.sentimento = ?"
-            params = [tipo_sentimento]
-        else:
-            where_clause = "WHERE n.sentimento IS NOT NULL"
-            params = []
+            filtro_sentimento = "AND r.sentimento = ?"
+            params.append(tipo_sentimento)
         
-        # Query para ranking
-        query = f"""
-            SELECT 
-                c.id as clube_id,
-                c.nome as nome_clube,
-                COUNT(n.id) as total_noticias,
-                AVG(n.score_sentimento) as score_medio,
-                AVG(n.confianca_sentimento) as confianca_media,
-                MAX(n.analisado_em) as ultima_analise
-            FROM noticias_clubes n
-            JOIN clubes c ON n.clube_id = c.id
-            {where_clause}
-            GROUP BY c.id, c.nome
-            ORDER BY score_medio DESC
-            LIMIT ?
-        """
-        
-        params.append(limite)
-        cursor.execute(query, params)
+        conn = conexao_sqlite(db_path)
+        try:
+            cursor = conn.cursor()
+            
+            # Ranking das notícias por clube, a partir do resumo
+            query = f"""
+                SELECT 
+                    c.id as clube_id,
+                    c.nome as nome_clube,
+                    SUM(r.total) as total_noticias,
+                    SUM(r.soma_score) / NULLIF(SUM(r.com_score), 0) as score_medio,
+                    SUM(r.soma_confianca) / NULLIF(SUM(r.com_confianca), 0) as confianca_media,
+                    MAX(r.ultima_analise) as ultima_analise
+                FROM {resumo_sentimento.origem_consulta(conn, resumo_sentimento.TABELA_RESUMO_CLUBE)} r
+                JOIN clubes c ON r.clube_id = c.id
+                WHERE r.fonte = 'noticias' {filtro_sentimento}
+                GROUP BY c.id, c.nome
+                ORDER BY score_medio DESC
+                LIMIT ?
+            """
+            
+            params.append(limite)
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        finally:
+            conn.close()
         
         ranking = []
-        for row in cursor.fetchall():
+        for row in rows:
             score_medio = row[3] or 0.0
             
-            if score_medio > 0.1:
-                sentimento_geral = 'positivo'
-            elif score_medio < -0.1:
-                sentimento_geral = 'negativo'
-            else:
-                sentimento_geral = 'neutro'
-            
             ranking.append({
                 "clube_id": row[0],
                 "nome_clube": row[1],
@@ -348,13 +304,11 @@ def get_ranking_sentimento_clubes(
                 "noticias_analisadas": row[2],
                 "sentimento_medio_posts": None,
                 "posts_analisados": None,
-                "sentimento_geral": sentimento_geral,
+                "sentimento_geral": _classificar(score_medio),
                 "confianca_media": row[4],
                 "ultima_atualizacao": row[5]
             })
         
-        conn.close()
-        
         return ranking
         
     except HTTPException:
@@ -362,38 +316,68 @@ def get_ranking_sentimento_clubes(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
 
-@router.post("/sentimento/reprocessar")
+@router.post("/sentimento/reprocessar", status_code=202)
 def reprocessar_sentimento(
-    db: Session = Depends(get_db),
-    clube_id: Optional[int] = Query(None, description="ID do clube específico (opcional)")
+    background_tasks: BackgroundTasks,
+    clube_id: Optional[int] = Query(None, description="ID do clube específico (opcional)"),
+    reiniciar: bool = Query(False, description="Reanalisar também textos antigos abaixo da marca d'água")
 ):
     """
-    Reprocessa a análise de sentimento para todos os textos ou um clube específico.
+    Agenda o job incremental de análise de sentimento em segundo plano.
+    
+    O job só lê os textos novos desde a última execução (com ``clube_id``,
+    todos os pendentes do clube); o andamento fica disponível em
+    /analise/sentimento/reprocessar/status.
     
     Args:
         clube_id: ID do clube específico (opcional)
+        reiniciar: Reanalisar pendentes abaixo da marca d'água
         
     Returns:
-        Resumo do reprocessamento
+        Confirmação do agendamento (409 se o job já está em execução)
     """
-    try:
-        # Importar função de análise
-        import sys
-        sys.path.append('Coleta_de_dados/analise')
-        
-        from sentimento import analisar_sentimento_textos
-        
-        # Executar análise
-        success = analisar_sentimento_textos()
-        
-        if success:
-            return {
-                "message": "Análise de sentimento reprocessada com sucesso",
-                "success": True,
-                "clube_id": clube_id
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Falha no reprocessamento")
-            
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erro ao reprocessar sentimento: {str(e)}")
+    db_path = get_db_path()
+    if not db_path:
+        raise HTTPException(status_code=500, detail="Banco de dados não encontrado")
+    
+    if job_sentimento.job_em_execucao():
+        raise HTTPException(
+            status_code=409,
+            detail="Análise de sentimento já em andamento; acompanhe em /analise/sentimento/reprocessar/status"
+        )
+    
+    background_tasks.add_task(
+        job_sentimento.executar_job_sentimento, db_path, reiniciar=reiniciar, clube_id=clube_id
+    )
+    return {
+        "message": "Análise de sentimento agendada",
+        "success": True,
+        "clube_id": clube_id
+    }
+
+@router.get("/sentimento/reprocessar/status")
+def status_reprocessamento_sentimento():
+    """
+    Situação do job de sentimento e resumo da última execução.
+    
+    Returns:
+        Em execução, resumo (itens por tabela, itens/s) e marcas d'água
+    """
+    db_path = get_db_path()
+    watermarks = {}
+    if db_path:
+        conn = conexao_sqlite(db_path)
+        try:
+            tabela = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='watermark_sentimento'"
+            ).fetchone()
+            if tabela:
+                watermarks = dict(conn.execute("SELECT tabela, ultimo_id FROM watermark_sentimento"))
+        finally:
+            conn.close()
+    
+    return {
+        "em_execucao": job_sentimento.job_em_execucao(),
+        "ultimo_resumo": job_sentimento.ultimo_resumo,
+        "watermarks": watermarks
+    }
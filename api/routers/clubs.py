@@ -13,31 +13,43 @@ Versão: 1.0
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
-from typing import Optional, List
+from typing import AsyncGenerator, Optional, List
 import logging
 
 from api.schemas import (
     ClubeResponse, ClubeList, ClubeCreate, 
     ClubeUpdate, ClubeFilter, ErrorResponse
 )
+from api.pagination import ChaveOrdenacao, ParametrosPaginacao, paginar
+from api.cache import cache_resposta
 from api.security import get_current_api_key
-from Coleta_de_dados.database import SessionLocal
-from Coleta_de_dados.database.models import Clube, Jogador
+from Coleta_de_dados.database import sessao_async
+from Coleta_de_dados.database.models import Clube, Jogador, PaisClube
+from Coleta_de_dados.database.queries import consultar_clubes_com_total_jogadores
 
-def get_db() -> Session:
+async def get_db() -> AsyncGenerator[Session, None]:
     """
     Fornece uma sessão do banco de dados para cada requisição.
+    A sessão é usada pelos endpoints síncronos no threadpool do FastAPI.
     """
-    db = SessionLocal()
-    try:
+    async with sessao_async() as db:
         yield db
-    finally:
-        db.close()
 
 # Configuração
 router = APIRouter(prefix="/clubs", tags=["clubs"])
 logger = logging.getLogger(__name__)
 
+def _montar_clube_response(club: Clube, total_jogadores: int) -> ClubeResponse:
+    """Monta o schema de resposta a partir do clube já carregado."""
+    return ClubeResponse(
+        id=club.id,
+        nome=club.nome,
+        pais=club.pais.nome if club.pais else None,
+        created_at=club.created_at,
+        updated_at=club.updated_at,
+        total_jogadores=total_jogadores
+    )
+
 # ============================================================================
 # ENDPOINTS DE CLUBES
 # ============================================================================
@@ -53,11 +65,12 @@ logger = logging.getLogger(__name__)
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def list_clubs(
+def list_clubs(
     page: int = Query(1, ge=1, description="Número da página (inicia em 1)"),
     size: int = Query(50, ge=1, le=100, description="Itens por página (máximo 100)"),
     nome: Optional[str] = Query(None, description="Filtrar por nome (busca parcial)"),
     pais: Optional[str] = Query(None, description="Filtrar por país"),
+    paginacao: ParametrosPaginacao = Depends(),
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
 ):
@@ -68,6 +81,9 @@ async def list_clubs(
     - **size**: Número de itens por página (padrão: 50, máximo: 100)
     - **nome**: Filtro por nome do clube (busca parcial)
     - **pais**: Filtro por país do clube
+    - **paginacao**: 'offset' (padrão) ou 'cursor'; no modo cursor use **cursor**
+      com o valor de next_cursor para obter a próxima página
+    - **contagem**: 'exata', 'estimada' ou 'nenhuma'
     """
     try:
         # Construir query base
@@ -78,37 +94,26 @@ async def list_clubs(
             query = query.filter(Clube.nome.ilike(f"%{nome}%"))
         
         if pais:
-            query = query.filter(Clube.pais.ilike(f"%{pais}%"))
-        
-        # Contar total de registros
-        total = query.count()
-        
-        # Aplicar paginação
-        offset = (page - 1) * size
-        clubs = query.offset(offset).limit(size).all()
+            query = query.filter(Clube.pais.has(PaisClube.nome.ilike(f"%{pais}%")))
         
-        # Calcular número de páginas
-        pages = (total + size - 1) // size
+        # Contar e paginar; total de jogadores vem de subconsulta na mesma consulta
+        pagina = paginar(query, paginacao, page, size, ChaveOrdenacao(Clube.id), tabela="clubes")
+        rows = pagina.resultados(
+            consultar_clubes_com_total_jogadores(pagina.query).all(),
+            entidade=lambda row: row[0]
+        )
         
-        # Enriquecer dados com contagem de jogadores
-        enriched_clubs = []
-        for club in clubs:
-            club_data = ClubeResponse.model_validate(club)
-            # Contar jogadores do clube
-            total_jogadores = db.query(Jogador).filter(Jogador.clube_id == club.id).count()
-            club_data.total_jogadores = total_jogadores
-            enriched_clubs.append(club_data)
+        enriched_clubs = [
+            _montar_clube_response(club, total_jogadores)
+            for club, total_jogadores in rows
+        ]
         
-        logger.info(f"Listagem de clubes: {len(clubs)} itens (página {page}/{pages})")
+        logger.info(f"Listagem de clubes: {len(rows)} itens (página {page}/{pagina.pages})")
         
-        return ClubeList(
-            items=enriched_clubs,
-            total=total,
-            page=page,
-            size=size,
-            pages=pages
-        )
+        return ClubeList(items=enriched_clubs, **pagina.metadados())
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erro ao listar clubes: {e}")
         raise HTTPException(
@@ -128,7 +133,7 @@ async def list_clubs(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def get_club(
+def get_club(
     club_id: int,
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
@@ -178,7 +183,7 @@ async def get_club(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def create_club(
+def create_club(
     club_data: ClubeCreate,
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
@@ -229,7 +234,7 @@ async def create_club(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def get_club_players(
+def get_club_players(
     club_id: int,
     page: int = Query(1, ge=1, description="Número da página"),
     size: int = Query(50, ge=1, le=100, description="Itens por página"),
@@ -306,7 +311,8 @@ async def get_club_players(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def get_clubs_stats(
+@cache_resposta(ttl=300, tags=("clubes", "jogadores", "paises_clubes"))
+def get_clubs_stats(
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
 ):
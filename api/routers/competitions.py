@@ -13,7 +13,7 @@ Versão: 1.0
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
-from typing import Optional, List
+from typing import AsyncGenerator, Optional, List
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
@@ -26,19 +26,19 @@ from api.schemas import (
     CompeticaoResponse, CompeticaoList, CompeticaoCreate, 
     CompeticaoUpdate, CompeticaoFilter, ErrorResponse
 )
+from api.pagination import ChaveOrdenacao, ParametrosPaginacao, paginar
+from api.cache import cache_resposta
 from api.security import get_current_api_key
-from Coleta_de_dados.database import SessionLocal
+from Coleta_de_dados.database import sessao_async
 from Coleta_de_dados.database.models import Competicao
 
-def get_db() -> Session:
+async def get_db() -> AsyncGenerator[Session, None]:
     """
     Fornece uma sessão do banco de dados para cada requisição.
+    A sessão é usada pelos endpoints síncronos no threadpool do FastAPI.
     """
-    db = SessionLocal()
-    try:
+    async with sessao_async() as db:
         yield db
-    finally:
-        db.close()
 
 # Configuração
 router = APIRouter(prefix="/competitions", tags=["competitions"])
@@ -59,12 +59,13 @@ logger = logging.getLogger(__name__)
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def list_competitions(
+def list_competitions(
     page: int = Query(1, ge=1, description="Número da página (inicia em 1)"),
     size: int = Query(50, ge=1, le=100, description="Itens por página (máximo 100)"),
     nome: Optional[str] = Query(None, description="Filtrar por nome (busca parcial)"),
     contexto: Optional[str] = Query(None, description="Filtrar por contexto"),
     ativa: Optional[bool] = Query(None, description="Filtrar por status ativo"),
+    paginacao: ParametrosPaginacao = Depends(),
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
 ):
@@ -76,6 +77,9 @@ async def list_competitions(
     - **nome**: Filtro por nome da competição (busca parcial)
     - **contexto**: Filtro por contexto (Masculino, Feminino, etc.)
     - **ativa**: Filtro por status ativo (true/false)
+    - **paginacao**: 'offset' (padrão) ou 'cursor'; no modo cursor use **cursor**
+      com o valor de next_cursor para obter a próxima página
+    - **contagem**: 'exata', 'estimada' ou 'nenhuma'
     """
     try:
         # Construir query base
@@ -91,26 +95,19 @@ async def list_competitions(
         if ativa is not None:
             query = query.filter(Competicao.ativa == ativa)
         
-        # Contar total de registros
-        total = query.count()
-        
-        # Aplicar paginação
-        offset = (page - 1) * size
-        competitions = query.offset(offset).limit(size).all()
+        # Contar e aplicar paginação
+        pagina = paginar(query, paginacao, page, size, ChaveOrdenacao(Competicao.id), tabela="competicoes")
+        competitions = pagina.resultados(pagina.query.all())
         
-        # Calcular número de páginas
-        pages = (total + size - 1) // size
-        
-        logger.info(f"Listagem de competições: {len(competitions)} itens (página {page}/{pages})")
+        logger.info(f"Listagem de competições: {len(competitions)} itens (página {page}/{pagina.pages})")
         
         return CompeticaoList(
             items=[CompeticaoResponse.model_validate(comp) for comp in competitions],
-            total=total,
-            page=page,
-            size=size,
-            pages=pages
+            **pagina.metadados()
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erro ao listar competições: {e}")
         raise HTTPException(
@@ -130,7 +127,7 @@ async def list_competitions(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def get_competition(
+def get_competition(
     competition_id: int,
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
@@ -176,7 +173,7 @@ async def get_competition(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def create_competition(
+def create_competition(
     competition_data: CompeticaoCreate,
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
@@ -230,7 +227,7 @@ async def create_competition(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def update_competition(
+def update_competition(
     competition_id: int,
     competition_data: CompeticaoUpdate,
     api_key: str = Depends(get_current_api_key),
@@ -284,7 +281,7 @@ async def update_competition(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def delete_competition(
+def delete_competition(
     competition_id: int,
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
@@ -332,7 +329,8 @@ async def delete_competition(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def get_competitions_stats(
+@cache_resposta(ttl=300, tags=("competicoes",))
+def get_competitions_stats(
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
 ):
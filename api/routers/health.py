@@ -13,7 +13,7 @@ Versão: 1.0
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from typing import Optional
+from typing import AsyncGenerator, Optional
 import logging
 from datetime import datetime
 import time
@@ -32,18 +32,16 @@ import os
 
 from api.security import get_optional_api_key
 from api.schemas import HealthResponse, ErrorResponse
-from Coleta_de_dados.database import db_manager, SessionLocal
+from Coleta_de_dados.database import db_manager, sessao_async
 from api.config import get_api_settings
 
-def get_db() -> Session:
+async def get_db() -> AsyncGenerator[Session, None]:
     """
     Fornece uma sessão do banco de dados para cada requisição.
+    A sessão é usada pelos endpoints síncronos no threadpool do FastAPI.
     """
-    db = SessionLocal()
-    try:
+    async with sessao_async() as db:
         yield db
-    finally:
-        db.close()
 
 # Configuração
 router = APIRouter(prefix="/health", tags=["health"])
@@ -66,7 +64,7 @@ START_TIME = datetime.now()
         503: {"model": ErrorResponse, "description": "Serviço indisponível"}
     }
 )
-async def health_check(
+def health_check(
     api_key: Optional[str] = Depends(get_optional_api_key),
     db: Session = Depends(get_db)
 ):
@@ -112,7 +110,7 @@ async def health_check(
         503: {"model": ErrorResponse, "description": "Serviço indisponível"}
     }
 )
-async def detailed_health_check(
+def detailed_health_check(
     api_key: Optional[str] = Depends(get_optional_api_key),
     db: Session = Depends(get_db)
 ):
@@ -196,7 +194,7 @@ async def detailed_health_check(
         503: {"model": ErrorResponse, "description": "Banco indisponível"}
     }
 )
-async def database_health_check(
+def database_health_check(
     api_key: Optional[str] = Depends(get_optional_api_key),
     db: Session = Depends(get_db)
 ):
@@ -13,13 +13,19 @@ Versão: 1.0
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi import status as http_status
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import AsyncGenerator, Optional
 import logging
 
 from api import schemas
+from api.pagination import ChaveOrdenacao, ParametrosPaginacao, paginar
 from api.security import get_current_api_key
-from Coleta_de_dados.database import SessionLocal
-from Coleta_de_dados.database.models import Partida, EstatisticaPartida, Clube, Competicao
+from Coleta_de_dados.database import sessao_async
+from Coleta_de_dados.database.models import Partida
+from Coleta_de_dados.database.queries import (
+    buscar_partida_completa,
+    consultar_partidas_com_relacionamentos,
+    ordenar_partidas_recentes,
+)
 
 # Configuração
 router = APIRouter(
@@ -28,13 +34,10 @@ router = APIRouter(
 )
 logger = logging.getLogger(__name__)
 
-def get_db() -> Session:
+async def get_db() -> AsyncGenerator[Session, None]:
     """Fornece uma sessão do banco de dados para cada requisição."""
-    db = SessionLocal()
-    try:
+    async with sessao_async() as db:
         yield db
-    finally:
-        db.close()
 
 @router.get(
     "/{match_id}",
@@ -47,7 +50,7 @@ def get_db() -> Session:
         500: {"description": "Erro interno do servidor"}
     }
 )
-async def get_match_details(
+def get_match_details(
     match_id: int,
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
@@ -58,23 +61,18 @@ async def get_match_details(
     - **match_id**: ID único da partida
     """
     try:
-        # Busca a partida pelo ID
-        match = db.query(Partida).filter(Partida.id == match_id).first()
+        # Busca a partida com estatísticas, clubes e competição em uma única consulta
+        match = buscar_partida_completa(db, match_id)
         if not match:
             raise HTTPException(
                 status_code=http_status.HTTP_404_NOT_FOUND,
                 detail=f"Partida com ID {match_id} não encontrada"
             )
         
-        # Busca as estatísticas avançadas da partida
-        stats = db.query(EstatisticaPartida).filter(
-            EstatisticaPartida.partida_id == match_id
-        ).first()
-        
-        # Busca informações adicionais dos clubes e competição
-        clube_casa = db.query(Clube).filter(Clube.id == match.clube_casa_id).first()
-        clube_visitante = db.query(Clube).filter(Clube.id == match.clube_visitante_id).first()
-        competicao = db.query(Competicao).filter(Competicao.id == match.competicao_id).first()
+        stats = match.estatisticas[0] if match.estatisticas else None
+        clube_casa = match.clube_casa
+        clube_visitante = match.clube_visitante
+        competicao = match.competicao
         
         # Prepara o dicionário de resposta
         response_data = {
@@ -140,12 +138,13 @@ async def get_match_details(
         500: {"description": "Erro interno do servidor"}
     }
 )
-async def list_matches(
+def list_matches(
     page: int = 1,
     size: int = 50,
     competition_id: Optional[int] = None,
     season: Optional[str] = None,
     status: Optional[str] = None,
+    paginacao: ParametrosPaginacao = Depends(),
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
 ):
@@ -157,6 +156,9 @@ async def list_matches(
     - **competition_id**: Filtrar por ID da competição
     - **season**: Filtrar por temporada (ex: "2024-2025")
     - **status**: Filtrar por status (ex: "finalizada", "agendada")
+    - **paginacao**: 'offset' (padrão) ou 'cursor'; no modo cursor use **cursor**
+      com o valor de next_cursor para obter a próxima página
+    - **contagem**: 'exata', 'estimada' ou 'nenhuma'
     """
     try:
         logger.info(f"Iniciando listagem de partidas - Página: {page}, Tamanho: {size}")
@@ -170,9 +172,9 @@ async def list_matches(
             
         logger.info(f"Parâmetros validados - Página: {page}, Tamanho: {size}")
             
-        # Construção da query
+        # Construção da query (competição e clubes carregados via JOIN)
         logger.info("Criando query base para partidas")
-        query = db.query(Partida)
+        query = consultar_partidas_com_relacionamentos(db)
         
         # Aplicação dos filtros
         if competition_id is not None:
@@ -192,25 +194,26 @@ async def list_matches(
         # Ordenação e paginação
         logger.info("Aplicando ordenação e paginação")
         try:
-            # Ordena por data da partida (mais recentes primeiro) e depois por horário
-            # Usando nulls_last() para lidar com valores nulos
-            from sqlalchemy import desc, nulls_last
-            
-            # Primeiro ordena por data (mais recente primeiro)
-            query = query.order_by(
-                nulls_last(desc(Partida.data_partida)),
-                nulls_last(desc(Partida.horario))
+            # Ordena por data da partida (mais recentes primeiro); no modo offset
+            # o horário também entra na ordenação, no modo cursor o id desempata
+            pagina = paginar(
+                query,
+                paginacao,
+                page,
+                size,
+                ChaveOrdenacao(Partida.id, Partida.data_partida, descendente=True),
+                tabela="partidas",
+                ordenar_offset=ordenar_partidas_recentes
             )
-            
-            total = query.count()
+            total = pagina.total
             logger.info(f"Total de partidas encontradas: {total}")
             
             # Aplica paginação
-            matches = query.offset((page - 1) * size).limit(size).all()
+            matches = pagina.resultados(pagina.query.all())
             logger.info(f"Partidas recuperadas: {len(matches)}")
             
             # Cálculo do total de páginas
-            pages = (total + size - 1) // size if total > 0 else 1
+            pages = max(pagina.pages, 1) if pagina.pages is not None else None
             logger.info(f"Total de páginas: {pages}")
             
         except Exception as e:
@@ -233,8 +236,11 @@ async def list_matches(
                         "data_partida": match.data_partida.isoformat() if match.data_partida else None,
                         "hora_partida": match.horario if match.horario else None,
                         "competicao_id": match.competicao_id,
+                        "competicao_nome": match.competicao.nome if match.competicao else None,
                         "clube_casa_id": match.clube_casa_id,
+                        "clube_casa_nome": match.clube_casa.nome if match.clube_casa else None,
                         "clube_visitante_id": match.clube_visitante_id,
+                        "clube_visitante_nome": match.clube_visitante.nome if match.clube_visitante else None,
                         "gols_casa": match.gols_casa if match.gols_casa is not None else 0,
                         "gols_visitante": match.gols_visitante if match.gols_visitante is not None else 0,
                         "resultado": match.resultado if match.resultado else None,
@@ -257,10 +263,7 @@ async def list_matches(
             # Cria a resposta usando o schema
             response_data = schemas.MatchList(
                 items=items,
-                total=total,
-                page=page,
-                size=size,
-                pages=pages
+                **{**pagina.metadados(), "pages": pages}
             )
             
             logger.info(f"Listadas {len(items)} partidas (página {page}/{pages})")
@@ -4,6 +4,7 @@ Router para funcionalidades de Machine Learning na API do ApostaPro
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from typing import Dict, List, Optional, Any
 import logging
@@ -14,14 +15,16 @@ import json
 from ml_models.sentiment_analyzer import analyze_sentiment, analyze_sentiments_batch, get_sentiment_summary
 from ml_models.data_preparation import prepare_data, save_preprocessing_models, load_preprocessing_models
 from ml_models.ml_models import (
-    train_model, train_ensemble, make_prediction, 
-    save_model, load_model, get_model_info
+    train_model, train_ensemble, make_predictions_batch,
+    save_model, load_model, get_model_info, ml_model_manager
 )
 from ml_models.recommendation_system import (
     analyze_match, generate_predictions, 
     get_betting_recommendations, get_recommendation_summary
 )
 from ml_models.cache_manager import get_cache_stats, clear_ml_cache, cleanup_expired_cache
+from Coleta_de_dados.ml.registro_modelos import obter_registro
+from api.schemas import PrevisaoLoteRequest
 
 # Configurar logging
 logger = logging.getLogger(__name__)
@@ -163,23 +166,76 @@ async def train_ensemble_model(
         logger.error(f"Erro no treinamento de ensemble: {e}")
         raise HTTPException(status_code=500, detail=f"Erro no treinamento: {str(e)}")
 
+def _parse_features(features: str) -> List[float]:
+    """Converte a lista de features separadas por vírgula (400 se algum valor não for número)"""
+    try:
+        return [float(valor) for valor in features.split(",") if valor.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Features devem ser números separados por vírgula")
+
+def _json_safe(valor: Any) -> Any:
+    """Converte arrays e escalares numpy da previsão para tipos serializáveis"""
+    if isinstance(valor, dict):
+        return {chave: _json_safe(item) for chave, item in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_json_safe(item) for item in valor]
+    if hasattr(valor, "tolist"):
+        return valor.tolist()
+    return valor
+
+async def _prever(model_key: str, linhas: List[List[float]]) -> List[Dict[str, Any]]:
+    """
+    Previsão em lote: um modelo treinado em memória pelo MLModelManager tem
+    prioridade; os salvos (<model_key>_AAAAMMDD_HHMMSS.joblib) ficam residentes
+    no registro e as requisições concorrentes são agrupadas
+    """
+    registro = obter_registro()
+    prefixo = f"{model_key}_"
+    if model_key not in ml_model_manager.models and registro.tem_modelo(prefixo):
+        versao, probabilidades = await registro.prever_proba_async(prefixo, linhas)
+        return registro.formatar(versao, probabilidades)
+    previsoes = await run_in_threadpool(make_predictions_batch, model_key, linhas)
+    return [_json_safe(previsao) for previsao in previsoes]
+
 @router.post("/models/predict")
 async def make_ml_prediction(
     model_key: str = Query(..., description="Chave do modelo treinado"),
     features: str = Query(..., description="Features para previsão (separadas por vírgula)")
 ):
     """Faz previsão usando um modelo treinado"""
+    linha = _parse_features(features)
     try:
-        prediction = make_prediction(model_key, features)
+        prediction = (await _prever(model_key, [linha]))[0]
         return {
             "success": True,
             "data": prediction,
             "timestamp": datetime.now().isoformat()
         }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Erro na previsão: {str(e)}")
     except Exception as e:
         logger.error(f"Erro na previsão: {e}")
         raise HTTPException(status_code=500, detail=f"Erro na previsão: {str(e)}")
 
+@router.post("/models/predict-batch")
+async def make_ml_predictions_batch(request: PrevisaoLoteRequest):
+    """Faz previsões para várias linhas de features em uma única chamada ao modelo"""
+    if not request.features:
+        raise HTTPException(status_code=400, detail="Nenhuma linha de features informada")
+    try:
+        predictions = await _prever(request.model_key, request.features)
+        return {
+            "success": True,
+            "data": predictions,
+            "total": len(predictions),
+            "timestamp": datetime.now().isoformat()
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Erro na previsão: {str(e)}")
+    except Exception as e:
+        logger.error(f"Erro na previsão em lote: {e}")
+        raise HTTPException(status_code=500, detail=f"Erro na previsão: {str(e)}")
+
 @router.get("/models/info")
 async def get_ml_models_info(model_key: Optional[str] = Query(None, description="Chave específica do modelo")):
     """Retorna informações sobre modelos de ML"""
@@ -13,7 +13,7 @@ Versão: 1.0
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
-from typing import Optional, List
+from typing import AsyncGenerator, Optional, List
 import logging
 from datetime import datetime, timedelta
 
@@ -21,19 +21,18 @@ from api.schemas import (
     NoticiaClubeResponse, NoticiaClubeList, NoticiaClubeCreate, 
     NoticiaClubeUpdate, ErrorResponse
 )
+from api.pagination import ChaveOrdenacao, ParametrosPaginacao, paginar
 from api.security import get_current_api_key
-from Coleta_de_dados.database import SessionLocal
+from Coleta_de_dados.database import sessao_async
 from Coleta_de_dados.database.models import NoticiaClube, Clube
 
-def get_db() -> Session:
+async def get_db() -> AsyncGenerator[Session, None]:
     """
     Fornece uma sessão do banco de dados para cada requisição.
+    A sessão é usada pelos endpoints síncronos no threadpool do FastAPI.
     """
-    db = SessionLocal()
-    try:
+    async with sessao_async() as db:
         yield db
-    finally:
-        db.close()
 
 # Configuração
 router = APIRouter(prefix="/news", tags=["news"])
@@ -55,7 +54,7 @@ logger = logging.getLogger(__name__)
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def list_news(
+def list_news(
     clube_id: Optional[int] = Query(None, description="Filtrar por ID do clube"),
     fonte: Optional[str] = Query(None, description="Filtrar por fonte da notícia"),
     data_inicio: Optional[datetime] = Query(None, description="Data de início para filtrar notícias (inclusive)"),
@@ -63,6 +62,7 @@ async def list_news(
     busca: Optional[str] = Query(None, description="Busca textual no título e resumo da notícia"),
     page: int = Query(1, ge=1, description="Número da página"),
     size: int = Query(20, ge=1, le=100, description="Itens por página"),
+    paginacao: ParametrosPaginacao = Depends(),
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
 ):
@@ -75,6 +75,9 @@ async def list_news(
     - **busca**: Busca textual no título e resumo
     - **page**: Número da página (padrão: 1)
     - **size**: Itens por página (padrão: 20, máximo: 100)
+    - **paginacao**: 'offset' (padrão) ou 'cursor'; no modo cursor use **cursor**
+      com o valor de next_cursor para obter a próxima página
+    - **contagem**: 'exata', 'estimada' ou 'nenhuma'
     """
     try:
         # Inicia a query
@@ -105,16 +108,16 @@ async def list_news(
                 )
             )
         
-        # Ordena por data de publicação (mais recentes primeiro)
-        query = query.order_by(NoticiaClube.data_publicacao.desc())
-        
-        # Calcula a paginação
-        total = query.count()
-        offset = (page - 1) * size
-        pages = (total + size - 1) // size  # Arredonda para cima a divisão
-        
-        # Aplica a paginação
-        noticias = query.offset(offset).limit(size).all()
+        # Ordena por data de publicação (mais recentes primeiro) e pagina
+        pagina = paginar(
+            query,
+            paginacao,
+            page,
+            size,
+            ChaveOrdenacao(NoticiaClube.id, NoticiaClube.data_publicacao, descendente=True),
+            tabela="noticias_clubes"
+        )
+        noticias = pagina.resultados(pagina.query.all())
         
         # Prepara a resposta
         items = []
@@ -127,12 +130,11 @@ async def list_news(
         
         return {
             "items": items,
-            "total": total,
-            "page": page,
-            "size": size,
-            "pages": pages
+            **pagina.metadados()
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erro ao listar notícias: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -152,7 +154,7 @@ async def list_news(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def get_news(
+def get_news(
     noticia_id: int,
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
@@ -199,7 +201,7 @@ async def get_news(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def get_club_news(
+def get_club_news(
     clube_id: int,
     page: int = Query(1, ge=1, description="Número da página"),
     size: int = Query(10, ge=1, le=50, description="Itens por página"),
@@ -267,7 +269,7 @@ async def get_club_news(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def get_recent_news(
+def get_recent_news(
     page: int = Query(1, ge=1, description="Número da página"),
     size: int = Query(10, ge=1, le=50, description="Itens por página"),
     api_key: str = Depends(get_current_api_key),
@@ -336,7 +338,7 @@ async def get_recent_news(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def create_news(
+def create_news(
     noticia_data: NoticiaClubeCreate,
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
@@ -414,7 +416,7 @@ async def create_news(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def update_news(
+def update_news(
     noticia_id: int,
     noticia_data: NoticiaClubeUpdate,
     api_key: str = Depends(get_current_api_key),
@@ -506,7 +508,7 @@ async def update_news(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def delete_news(
+def delete_news(
     noticia_id: int,
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
@@ -558,7 +560,7 @@ async def delete_news(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def coletar_noticias_clube(
+def coletar_noticias_clube(
     clube_id: int,
     limite: int = Query(10, ge=1, le=50, description="Número máximo de notícias a coletar"),
     api_key: str = Depends(get_current_api_key),
@@ -612,7 +614,7 @@ async def coletar_noticias_clube(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def coletar_noticias_todos(
+def coletar_noticias_todos(
     limite_por_clube: int = Query(5, ge=1, le=20, description="Número máximo de notícias por clube"),
     api_key: str = Depends(get_current_api_key)
 ):
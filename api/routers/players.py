@@ -13,31 +13,40 @@ Versão: 1.0
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
-from typing import Optional, List
+from typing import AsyncGenerator, Optional, List
 import logging
 
 from api.schemas import (
     JogadorResponse, JogadorList, JogadorCreate, 
     JogadorUpdate, JogadorFilter, ErrorResponse
 )
+from api.pagination import ChaveOrdenacao, ParametrosPaginacao, paginar
+from api.cache import cache_resposta
 from api.security import get_current_api_key
-from Coleta_de_dados.database import SessionLocal
+from Coleta_de_dados.database import sessao_async
 from Coleta_de_dados.database.models import Jogador, Clube
+from Coleta_de_dados.database.queries import consultar_jogadores_com_clube
 
-def get_db() -> Session:
+async def get_db() -> AsyncGenerator[Session, None]:
     """
     Fornece uma sessão do banco de dados para cada requisição.
+    A sessão é usada pelos endpoints síncronos no threadpool do FastAPI.
     """
-    db = SessionLocal()
-    try:
+    async with sessao_async() as db:
         yield db
-    finally:
-        db.close()
 
 # Configuração
 router = APIRouter(prefix="/players", tags=["players"])
 logger = logging.getLogger(__name__)
 
+def _montar_jogador_response(player: Jogador) -> JogadorResponse:
+    """Monta o schema de resposta usando o clube já carregado em lote."""
+    player_data = JogadorResponse.model_validate(player)
+    player_data.clube_id = player.clube_atual_id
+    if player.clube_atual:
+        player_data.clube_nome = player.clube_atual.nome
+    return player_data
+
 # ============================================================================
 # ENDPOINTS DE JOGADORES
 # ============================================================================
@@ -53,7 +62,7 @@ logger = logging.getLogger(__name__)
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def list_players(
+def list_players(
     page: int = Query(1, ge=1, description="Número da página (inicia em 1)"),
     size: int = Query(50, ge=1, le=100, description="Itens por página (máximo 100)"),
     nome: Optional[str] = Query(None, description="Filtrar por nome (busca parcial)"),
@@ -62,6 +71,7 @@ async def list_players(
     nacionalidade: Optional[str] = Query(None, description="Filtrar por nacionalidade"),
     idade_min: Optional[int] = Query(None, ge=15, description="Idade mínima"),
     idade_max: Optional[int] = Query(None, le=50, description="Idade máxima"),
+    paginacao: ParametrosPaginacao = Depends(),
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
 ):
@@ -76,10 +86,13 @@ async def list_players(
     - **nacionalidade**: Filtro por nacionalidade
     - **idade_min**: Idade mínima (15+)
     - **idade_max**: Idade máxima (50-)
+    - **paginacao**: 'offset' (padrão) ou 'cursor'; no modo cursor use **cursor**
+      com o valor de next_cursor para obter a próxima página
+    - **contagem**: 'exata', 'estimada' ou 'nenhuma'
     """
     try:
-        # Construir query base com join para clube
-        query = db.query(Jogador).outerjoin(Clube)
+        # Construir query base; clubes são carregados em lote após a paginação
+        query = consultar_jogadores_com_clube(db)
         
         # Aplicar filtros
         if nome:
@@ -89,7 +102,7 @@ async def list_players(
             query = query.filter(Jogador.posicao.ilike(f"%{posicao}%"))
             
         if clube_id:
-            query = query.filter(Jogador.clube_id == clube_id)
+            query = query.filter(Jogador.clube_atual_id == clube_id)
             
         if nacionalidade:
             query = query.filter(Jogador.nacionalidade.ilike(f"%{nacionalidade}%"))
@@ -100,36 +113,19 @@ async def list_players(
         if idade_max:
             query = query.filter(Jogador.idade <= idade_max)
         
-        # Contar total de registros
-        total = query.count()
-        
-        # Aplicar paginação
-        offset = (page - 1) * size
-        players = query.offset(offset).limit(size).all()
+        # Contar e aplicar paginação
+        pagina = paginar(query, paginacao, page, size, ChaveOrdenacao(Jogador.id), tabela="jogadores")
+        players = pagina.resultados(pagina.query.all())
         
-        # Calcular número de páginas
-        pages = (total + size - 1) // size
+        # Enriquecer dados com nome do clube (já carregado em lote)
+        enriched_players = [_montar_jogador_response(player) for player in players]
         
-        # Enriquecer dados com nome do clube
-        enriched_players = []
-        for player in players:
-            player_data = JogadorResponse.model_validate(player)
-            if player.clube_id:
-                clube = db.query(Clube).filter(Clube.id == player.clube_id).first()
-                if clube:
-                    player_data.clube_nome = clube.nome
-            enriched_players.append(player_data)
+        logger.info(f"Listagem de jogadores: {len(players)} itens (página {page}/{pagina.pages})")
         
-        logger.info(f"Listagem de jogadores: {len(players)} itens (página {page}/{pages})")
-        
-        return JogadorList(
-            items=enriched_players,
-            total=total,
-            page=page,
-            size=size,
-            pages=pages
-        )
+        return JogadorList(items=enriched_players, **pagina.metadados())
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erro ao listar jogadores: {e}")
         raise HTTPException(
@@ -149,7 +145,7 @@ async def list_players(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def get_player(
+def get_player(
     player_id: int,
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
@@ -202,7 +198,7 @@ async def get_player(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def create_player(
+def create_player(
     player_data: JogadorCreate,
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
@@ -263,10 +259,11 @@ async def create_player(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def search_players_by_position(
+def search_players_by_position(
     posicao: str = Query(..., description="Posição do jogador"),
     page: int = Query(1, ge=1, description="Número da página"),
     size: int = Query(50, ge=1, le=100, description="Itens por página"),
+    paginacao: ParametrosPaginacao = Depends(),
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
 ):
@@ -276,25 +273,17 @@ async def search_players_by_position(
     - **posicao**: Posição a ser buscada (obrigatório)
     - **page**: Página a ser retornada (padrão: 1)
     - **size**: Número de itens por página (padrão: 50)
+    - **paginacao**: 'offset' (padrão) ou 'cursor'; no modo cursor use **cursor**
+      com o valor de next_cursor para obter a próxima página
+    - **contagem**: 'exata', 'estimada' ou 'nenhuma'
     """
     try:
-        query = db.query(Jogador).filter(Jogador.posicao.ilike(f"%{posicao}%"))
-        total = query.count()
-        
-        offset = (page - 1) * size
-        players = query.offset(offset).limit(size).all()
-        
-        pages = (total + size - 1) // size
+        query = consultar_jogadores_com_clube(db).filter(Jogador.posicao.ilike(f"%{posicao}%"))
+        pagina = paginar(query, paginacao, page, size, ChaveOrdenacao(Jogador.id), tabela="jogadores")
+        players = pagina.resultados(pagina.query.all())
         
-        # Enriquecer com dados do clube
-        enriched_players = []
-        for player in players:
-            player_data = JogadorResponse.model_validate(player)
-            if player.clube_id:
-                clube = db.query(Clube).filter(Clube.id == player.clube_id).first()
-                if clube:
-                    player_data.clube_nome = clube.nome
-            enriched_players.append(player_data)
+        # Enriquecer com dados do clube (já carregado em lote)
+        enriched_players = [_montar_jogador_response(player) for player in players]
         
         logger.info(f"Busca por posição '{posicao}': {len(players)} jogadores encontrados")
         
@@ -302,13 +291,12 @@ async def search_players_by_position(
             "position": posicao,
             "players": {
                 "items": enriched_players,
-                "total": total,
-                "page": page,
-                "size": size,
-                "pages": pages
+                **pagina.metadados()
             }
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erro ao buscar jogadores por posição '{posicao}': {e}")
         raise HTTPException(
@@ -330,7 +318,8 @@ async def search_players_by_position(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def get_players_stats(
+@cache_resposta(ttl=300, tags=("jogadores",))
+def get_players_stats(
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
 ):
@@ -391,7 +380,8 @@ async def get_players_stats(
         500: {"model": ErrorResponse, "description": "Erro interno do servidor"}
     }
 )
-async def get_position_stats(
+@cache_resposta(ttl=300, tags=("jogadores",))
+def get_position_stats(
     api_key: str = Depends(get_current_api_key),
     db: Session = Depends(get_db)
 ):
@@ -4,10 +4,10 @@ Router para endpoints de recomendações de apostas geradas pelo sistema ML
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import sqlite3
 import os
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import sys
 
 # Adicionar o diretório raiz ao path para importar módulos ML
@@ -19,20 +19,59 @@ from api.schemas import (
     GerarRecomendacoesRequest
 )
 from Coleta_de_dados.ml.gerar_recomendacoes import GeradorRecomendacoes
+from Coleta_de_dados.database.invalidacao_cache import invalidar_tabelas
+from api.cache import cache_resposta
+from api.database import conexao_sqlite
 
 router = APIRouter(prefix="/recomendacoes", tags=["Recomendações de Apostas"])
 
 # Configuração do banco de dados
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "Banco_de_dados", "aposta.db")
 
+# Resumo por mercado mantido por gatilhos (migração b41c7e9d2a10)
+TABELA_RESUMO = "recomendacoes_resumo_mercado"
+
 def get_db_connection():
-    """Retorna conexão com o banco SQLite"""
+    """Retorna uma conexão da pool do banco SQLite (``close()`` a devolve à pool)"""
     if not os.path.exists(DB_PATH):
         raise HTTPException(status_code=500, detail="Banco de dados não encontrado")
-    return sqlite3.connect(DB_PATH)
+    return conexao_sqlite(DB_PATH)
+
+def _intervalo_datas(data_inicio: Optional[str], data_fim: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Converte o filtro de datas (YYYY-MM-DD, inclusivo) na faixa semiaberta
+    [início, dia seguinte ao fim), comparável direto com data_geracao pelo índice
+    """
+    try:
+        inicio = date.fromisoformat(data_inicio).isoformat() if data_inicio else None
+        fim = (date.fromisoformat(data_fim) + timedelta(days=1)).isoformat() if data_fim else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Datas devem estar no formato YYYY-MM-DD")
+    return inicio, fim
+
+def _resumo_por_mercado(cursor) -> List[Tuple[str, int, int, float, Optional[str]]]:
+    """
+    (mercado, total, com probabilidade, soma das probabilidades, última geração)
+    de cada mercado, lidos da tabela de resumo; sem a migração, agregados da tabela
+    """
+    try:
+        cursor.execute(f"""
+            SELECT mercado_aposta, total, com_probabilidade, soma_probabilidade, ultima_geracao
+            FROM {TABELA_RESUMO}
+            ORDER BY mercado_aposta
+        """)
+    except sqlite3.OperationalError:
+        cursor.execute("""
+            SELECT COALESCE(mercado_aposta, ''), COUNT(*), COUNT(probabilidade),
+                   COALESCE(SUM(probabilidade), 0), MAX(data_geracao)
+            FROM recomendacoes_apostas
+            GROUP BY COALESCE(mercado_aposta, '')
+            ORDER BY 1
+        """)
+    return cursor.fetchall()
 
 @router.get("/", response_model=List[RecomendacaoApostaSchema])
-async def listar_recomendacoes(
+def listar_recomendacoes(
     limite: int = 50,
     offset: int = 0,
     mercado: str = None,
@@ -49,6 +88,7 @@ async def listar_recomendacoes(
         data_inicio: Data de início para filtrar (formato: YYYY-MM-DD)
         data_fim: Data de fim para filtrar (formato: YYYY-MM-DD)
     """
+    inicio, fim = _intervalo_datas(data_inicio, data_fim)
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
@@ -78,16 +118,16 @@ async def listar_recomendacoes(
             query += " AND r.mercado_aposta = ?"
             params.append(mercado)
         
-        if data_inicio:
-            query += " AND DATE(r.data_geracao) >= ?"
-            params.append(data_inicio)
+        if inicio:
+            query += " AND r.data_geracao >= ?"
+            params.append(inicio)
         
-        if data_fim:
-            query += " AND DATE(r.data_geracao) <= ?"
-            params.append(data_fim)
+        if fim:
+            query += " AND r.data_geracao < ?"
+            params.append(fim)
         
-        # Ordenar e limitar
-        query += " ORDER BY r.data_geracao DESC LIMIT ? OFFSET ?"
+        # Ordenar e limitar (id desempata gerações no mesmo instante)
+        query += " ORDER BY r.data_geracao DESC, r.id DESC LIMIT ? OFFSET ?"
         params.extend([limite, offset])
         
         cursor.execute(query, params)
@@ -117,7 +157,8 @@ async def listar_recomendacoes(
         raise HTTPException(status_code=500, detail=f"Erro ao buscar recomendações: {str(e)}")
 
 @router.get("/resumo", response_model=RecomendacaoResumoSchema)
-async def obter_resumo_recomendacoes():
+@cache_resposta(ttl=300, tags=("recomendacoes_apostas",))
+def obter_resumo_recomendacoes():
     """
     Retorna um resumo estatístico das recomendações geradas
     """
@@ -125,28 +166,15 @@ async def obter_resumo_recomendacoes():
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Total de recomendações
-        cursor.execute("SELECT COUNT(*) FROM recomendacoes_apostas")
-        total = cursor.fetchone()[0]
-        
-        # Distribuição por mercado
-        cursor.execute("""
-            SELECT mercado_aposta, COUNT(*) 
-            FROM recomendacoes_apostas 
-            GROUP BY mercado_aposta
-        """)
-        mercados = dict(cursor.fetchall())
-        
-        # Probabilidade média
-        cursor.execute("SELECT AVG(probabilidade) FROM recomendacoes_apostas")
-        prob_media = cursor.fetchone()[0] or 0.0
-        
-        # Última atualização
-        cursor.execute("SELECT MAX(data_geracao) FROM recomendacoes_apostas")
-        ultima_atualizacao = cursor.fetchone()[0]
-        
+        mercados_resumo = _resumo_por_mercado(cursor)
         conn.close()
         
+        total = sum(linha[1] for linha in mercados_resumo)
+        mercados = {linha[0]: linha[1] for linha in mercados_resumo}
+        com_probabilidade = sum(linha[2] for linha in mercados_resumo)
+        prob_media = sum(linha[3] for linha in mercados_resumo) / com_probabilidade if com_probabilidade else 0.0
+        ultima_atualizacao = max((linha[4] for linha in mercados_resumo if linha[4]), default=None)
+        
         return RecomendacaoResumoSchema(
             total_recomendacoes=total,
             recomendacoes_por_mercado=mercados,
@@ -160,65 +188,65 @@ async def obter_resumo_recomendacoes():
         raise HTTPException(status_code=500, detail=f"Erro ao buscar resumo: {str(e)}")
 
 @router.get("/partida/{partida_id}", response_model=List[RecomendacaoApostaSchema])
-async def obter_recomendacoes_partida(partida_id: int):
+def obter_recomendacoes_partida(partida_id: int):
     """
     Retorna todas as recomendações para uma partida específica
     """
     try:
         conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        query = """
-        SELECT 
-            r.id,
-            r.partida_id,
-            r.mercado_aposta,
-            r.previsao,
-            r.probabilidade,
-            r.odd_justa,
-            r.data_geracao,
-            p.time_casa,
-            p.time_visitante,
-            p.data
-        FROM recomendacoes_apostas r
-        JOIN partidas p ON r.partida_id = p.id
-        WHERE r.partida_id = ?
-        ORDER BY r.probabilidade DESC
-        """
-        
-        cursor.execute(query, (partida_id,))
-        rows = cursor.fetchall()
-        
-        if not rows:
-            raise HTTPException(status_code=404, detail=f"Nenhuma recomendação encontrada para a partida {partida_id}")
-        
-        recomendacoes = []
-        for row in rows:
-            recomendacoes.append(RecomendacaoApostaSchema(
-                id=row[0],
-                partida_id=row[1],
-                mercado_aposta=row[2],
-                previsao=row[3],
-                probabilidade=row[4],
-                odd_justa=row[5],
-                data_geracao=datetime.fromisoformat(row[6]),
-                time_casa=row[7],
-                time_visitante=row[8],
-                data_partida=row[9]
-            ))
-        
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            query = """
+            SELECT 
+                r.id,
+                r.partida_id,
+                r.mercado_aposta,
+                r.previsao,
+                r.probabilidade,
+                r.odd_justa,
+                r.data_geracao,
+                p.time_casa,
+                p.time_visitante,
+                p.data
+            FROM recomendacoes_apostas r
+            JOIN partidas p ON r.partida_id = p.id
+            WHERE r.partida_id = ?
+            ORDER BY r.probabilidade DESC
+            """
+            
+            cursor.execute(query, (partida_id,))
+            rows = cursor.fetchall()
+            
+            if not rows:
+                raise HTTPException(status_code=404, detail=f"Nenhuma recomendação encontrada para a partida {partida_id}")
+            
+            recomendacoes = []
+            for row in rows:
+                recomendacoes.append(RecomendacaoApostaSchema(
+                    id=row[0],
+                    partida_id=row[1],
+                    mercado_aposta=row[2],
+                    previsao=row[3],
+                    probabilidade=row[4],
+                    odd_justa=row[5],
+                    data_geracao=datetime.fromisoformat(row[6]),
+                    time_casa=row[7],
+                    time_visitante=row[8],
+                    data_partida=row[9]
+                ))
+        finally:
+            conn.close()
+
         return recomendacoes
         
     except HTTPException:
         raise
     except Exception as e:
-        if 'conn' in locals():
-            conn.close()
         raise HTTPException(status_code=500, detail=f"Erro ao buscar recomendações da partida: {str(e)}")
 
 @router.post("/gerar", response_model=Dict[str, Any])
-async def gerar_recomendacoes(request: GerarRecomendacoesRequest):
+def gerar_recomendacoes(request: GerarRecomendacoesRequest):
     """
     Gera novas recomendações de apostas para partidas futuras usando o sistema ML
     
@@ -249,17 +277,17 @@ async def gerar_recomendacoes(request: GerarRecomendacoesRequest):
         return {
             "mensagem": "Recomendações geradas com sucesso",
             "dias_processados": request.dias_futuros,
-            "recomendacoes_geradas": len(resultado),
+            "recomendacoes_geradas": sum(len(r['recomendacoes']) for r in resultado),
             "partidas_processadas": len(set(r['partida_id'] for r in resultado)),
-            "mercados_gerados": list(set(r['mercado_aposta'] for r in resultado)),
+            "mercados_gerados": sorted(set(rec['mercado'] for r in resultado for rec in r['recomendacoes'])),
             "timestamp_geracao": datetime.now().isoformat()
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro ao gerar recomendações: {str(e)}")
 
-@router.get("/mercados", response_model=List[str])
-async def listar_mercados_disponiveis():
+@router.get("/mercados", response_model=List[Optional[str]])
+def listar_mercados_disponiveis():
     """
     Retorna lista de todos os tipos de mercado disponíveis nas recomendações
     """
@@ -267,13 +295,8 @@ async def listar_mercados_disponiveis():
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT DISTINCT mercado_aposta 
-            FROM recomendacoes_apostas 
-            ORDER BY mercado_aposta
-        """)
-        
-        mercados = [row[0] for row in cursor.fetchall()]
+        # O resumo agrupa mercado NULL sob ''; a listagem devolve None, como a tabela
+        mercados = [linha[0] or None for linha in _resumo_por_mercado(cursor)]
         conn.close()
         
         return mercados
@@ -284,29 +307,30 @@ async def listar_mercados_disponiveis():
         raise HTTPException(status_code=500, detail=f"Erro ao buscar mercados: {str(e)}")
 
 @router.delete("/{recomendacao_id}")
-async def deletar_recomendacao(recomendacao_id: int):
+def deletar_recomendacao(recomendacao_id: int):
     """
     Remove uma recomendação específica
     """
     try:
         conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Verificar se a recomendação existe
-        cursor.execute("SELECT id FROM recomendacoes_apostas WHERE id = ?", (recomendacao_id,))
-        if not cursor.fetchone():
-            raise HTTPException(status_code=404, detail=f"Recomendação {recomendacao_id} não encontrada")
-        
-        # Deletar recomendação
-        cursor.execute("DELETE FROM recomendacoes_apostas WHERE id = ?", (recomendacao_id,))
-        conn.commit()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            # Verificar se a recomendação existe
+            cursor.execute("SELECT id FROM recomendacoes_apostas WHERE id = ?", (recomendacao_id,))
+            if not cursor.fetchone():
+                raise HTTPException(status_code=404, detail=f"Recomendação {recomendacao_id} não encontrada")
+            
+            # Deletar recomendação
+            cursor.execute("DELETE FROM recomendacoes_apostas WHERE id = ?", (recomendacao_id,))
+            conn.commit()
+        finally:
+            conn.close()
+        invalidar_tabelas("recomendacoes_apostas")
         
         return {"mensagem": f"Recomendação {recomendacao_id} removida com sucesso"}
         
     except HTTPException:
         raise
     except Exception as e:
-        if 'conn' in locals():
-            conn.close()
         raise HTTPException(status_code=500, detail=f"Erro ao deletar recomendação: {str(e)}")
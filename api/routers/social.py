@@ -49,7 +49,7 @@ def get_social_collector(db: Session = Depends(get_db)) -> SocialMediaCollector:
     return SocialMediaCollector(db)
 
 @router.get("/posts/clube/{clube_id}", response_model=PostRedeSocialList)
-async def listar_posts_por_clube(
+def listar_posts_por_clube(
     clube_id: int,
     rede_social: Optional[str] = Query(None, description="Filtrar por rede social (ex: 'Twitter', 'Instagram')"),
     data_inicio: Optional[datetime] = Query(None, description="Data de início para filtro"),
@@ -125,7 +125,7 @@ async def listar_posts_por_clube(
     )
 
 @router.get("/posts/{post_id}", response_model=PostRedeSocialResponse)
-async def obter_post(
+def obter_post(
     post_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -161,7 +161,7 @@ async def obter_post(
     )
 
 @router.post("/coletar/clube/{clube_id}", response_model=MessageResponse)
-async def coletar_posts_clube(
+def coletar_posts_clube(
     clube_id: int,
     limite: int = Query(5, description="Número máximo de posts a coletar", ge=1, le=20),
     db: Session = Depends(get_db),
@@ -207,7 +207,7 @@ async def coletar_posts_clube(
         )
 
 @router.post("/coletar/todos", response_model=MessageResponse)
-async def coletar_posts_todos_clubes(
+def coletar_posts_todos_clubes(
     limite_por_clube: int = Query(3, description="Número máximo de posts por clube", ge=1, le=10),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -247,7 +247,7 @@ async def coletar_posts_todos_clubes(
         )
 
 @router.get("/estatisticas/engajamento/{clube_id}")
-async def obter_estatisticas_engajamento(
+def obter_estatisticas_engajamento(
     clube_id: int,
     periodo_dias: int = Query(30, description="Período em dias para análise", ge=1, le=365),
     db: Session = Depends(get_db),
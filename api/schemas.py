@@ -71,6 +71,12 @@ class ContextoEnum(str, Enum):
     FEMININO = "Feminino"
     DESCONHECIDO = "Desconhecido"
 
+class CursorPaginationMixin(BaseModel):
+    """Campos adicionais das listagens paginadas por cursor (keyset)."""
+    next_cursor: Optional[str] = Field(None, description="Cursor opaco para a próxima página (modo cursor)")
+    has_more: Optional[bool] = Field(None, description="Se existem mais itens após esta página")
+    total_estimado: Optional[bool] = Field(None, description="Se o total informado é uma estimativa")
+
 # ============================================================================
 # SCHEMAS DE COMPETIÇÕES
 # ============================================================================
@@ -99,13 +105,13 @@ class CompeticaoResponse(CompeticaoBase, TimestampMixin):
     total_links: Optional[int] = Field(None, description="Total de links para coleta")
     total_partidas: Optional[int] = Field(None, description="Total de partidas")
 
-class CompeticaoList(BaseSchema):
+class CompeticaoList(BaseSchema, CursorPaginationMixin):
     """Schema para lista de competições."""
     items: List[CompeticaoResponse]
-    total: int = Field(..., description="Total de competições")
+    total: Optional[int] = Field(None, description="Total de competições")
     page: int = Field(default=1, description="Página atual")
     size: int = Field(default=50, description="Itens por página")
-    pages: int = Field(..., description="Total de páginas")
+    pages: Optional[int] = Field(None, description="Total de páginas")
 
 # ============================================================================
 # SCHEMAS DE CLUBES
@@ -133,13 +139,13 @@ class ClubeResponse(ClubeBase, TimestampMixin):
     total_jogadores: Optional[int] = Field(None, description="Total de jogadores")
     total_partidas: Optional[int] = Field(None, description="Total de partidas")
 
-class ClubeList(BaseSchema):
+class ClubeList(BaseSchema, CursorPaginationMixin):
     """Schema para lista de clubes."""
     items: List[ClubeResponse]
-    total: int = Field(..., description="Total de clubes")
+    total: Optional[int] = Field(None, description="Total de clubes")
     page: int = Field(default=1, description="Página atual")
     size: int = Field(default=50, description="Itens por página")
-    pages: int = Field(..., description="Total de páginas")
+    pages: Optional[int] = Field(None, description="Total de páginas")
 
 # ============================================================================
 # SCHEMAS DE JOGADORES
@@ -172,13 +178,13 @@ class JogadorResponse(JogadorBase, TimestampMixin):
     clube_id: Optional[int] = Field(None, description="ID do clube")
     clube_nome: Optional[str] = Field(None, description="Nome do clube")
 
-class JogadorList(BaseSchema):
+class JogadorList(BaseSchema, CursorPaginationMixin):
     """Schema para lista de jogadores."""
     items: List[JogadorResponse]
-    total: int = Field(..., description="Total de jogadores")
+    total: Optional[int] = Field(None, description="Total de jogadores")
     page: int = Field(default=1, description="Página atual")
     size: int = Field(default=50, description="Itens por página")
-    pages: int = Field(..., description="Total de páginas")
+    pages: Optional[int] = Field(None, description="Total de páginas")
 
 # ============================================================================
 # SCHEMAS DE PARTIDAS
@@ -243,8 +249,11 @@ class MatchItem(BaseModel):
     data_partida: Optional[datetime] = Field(None, description="Data da partida")
     hora_partida: Optional[str] = Field(None, description="Hora da partida")
     competicao_id: Optional[int] = Field(None, description="ID da competição")
+    competicao_nome: Optional[str] = Field(None, description="Nome da competição")
     clube_casa_id: Optional[int] = Field(None, description="ID do clube da casa")
+    clube_casa_nome: Optional[str] = Field(None, description="Nome do clube da casa")
     clube_visitante_id: Optional[int] = Field(None, description="ID do clube visitante")
+    clube_visitante_nome: Optional[str] = Field(None, description="Nome do clube visitante")
     gols_casa: Optional[int] = Field(None, description="Gols do time da casa")
     gols_visitante: Optional[int] = Field(None, description="Gols do time visitante")
     resultado: Optional[str] = Field(None, description="Resultado da partida")
@@ -252,13 +261,13 @@ class MatchItem(BaseModel):
     temporada: Optional[str] = Field(None, description="Temporada da partida")
     status: Optional[str] = Field(None, description="Status da partida")
 
-class MatchList(BaseModel):
+class MatchList(CursorPaginationMixin):
     """Schema para lista de partidas."""
     items: List[MatchItem] = Field(..., description="Lista de partidas")
-    total: int = Field(..., description="Total de partidas")
+    total: Optional[int] = Field(None, description="Total de partidas")
     page: int = Field(default=1, description="Página atual")
     size: int = Field(default=50, description="Itens por página")
-    pages: int = Field(..., description="Total de páginas")
+    pages: Optional[int] = Field(None, description="Total de páginas")
     
     class Config:
         from_attributes = True
@@ -419,13 +428,13 @@ class NoticiaClubeResponse(NoticiaClubeBase, TimestampMixin):
     )
 
 
-class NoticiaClubeList(BaseSchema):
+class NoticiaClubeList(BaseSchema, CursorPaginationMixin):
     """Schema para lista de notícias de clubes."""
     items: List[NoticiaClubeResponse] = Field(..., description="Lista de notícias")
-    total: int = Field(..., description="Total de notícias")
+    total: Optional[int] = Field(None, description="Total de notícias")
     page: int = Field(1, description="Página atual")
     size: int = Field(50, description="Itens por página")
-    pages: int = Field(..., description="Total de páginas")
+    pages: Optional[int] = Field(None, description="Total de páginas")
 
 
 # ============================================================================
@@ -622,3 +631,8 @@ class RecomendacaoResumoSchema(BaseModel):
 class GerarRecomendacoesRequest(BaseModel):
     dias_futuros: int = Field(default=7, description="Número de dias no futuro para gerar recomendações")
     forcar_reprocessamento: bool = Field(default=False, description="Forçar reprocessamento mesmo se já existirem recomendações")
+
+# Schemas de Machine Learning
+class PrevisaoLoteRequest(BaseModel):
+    model_key: str = Field(..., description="Chave do modelo (prefixo dos arquivos salvos, ex: 'modelo_apostas')")
+    features: List[List[float]] = Field(..., description="Linhas de features, na ordem usada no treinamento")
@@ -13,8 +13,15 @@ Versão: 1.0
 from fastapi import HTTPException, Security, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.security.api_key import APIKeyHeader, APIKey
-from typing import Optional
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+import anyio
 import logging
+import math
+import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -178,44 +185,245 @@ def get_optional_api_key(api_key: Optional[str] = Security(api_key_header)) -> O
 # MIDDLEWARE DE RATE LIMITING
 # ============================================================================
 
+@dataclass
+class EstadoJanela:
+    """Contadores de uma chave na janela deslizante (janela atual e anterior)."""
+    janela: int = 0
+    atual: int = 0
+    anterior: int = 0
+
+    def rolar(self, janela: int):
+        """Avança os contadores até a janela informada."""
+        if janela == self.janela:
+            return
+        self.anterior = self.atual if janela == self.janela + 1 else 0
+        self.atual = 0
+        self.janela = janela
+
+    def estimar(self, fracao_decorrida: float) -> float:
+        """Requisições estimadas nos últimos ``periodo`` segundos."""
+        return self.anterior * (1.0 - fracao_decorrida) + self.atual
+
+
+class RateLimitBackend(ABC):
+    """
+    Interface de armazenamento dos contadores do rate limiting.
+
+    ``consumir`` deve ser atômico por chave: ler, rolar a janela, decidir e
+    incrementar sem que outro processo intercale entre as etapas. Backends
+    com I/O bloqueante marcam ``bloqueante`` para serem chamados fora do
+    event loop.
+    """
+
+    bloqueante: bool = False
+
+    @abstractmethod
+    def consumir(self, chave: str, janela: int, fracao: float, limite: int) -> Tuple[bool, float]:
+        """Registra uma requisição se couber no limite. Retorna (permitida, estimativa)."""
+
+    @abstractmethod
+    def consultar(self, chave: str, janela: int, fracao: float) -> float:
+        """Retorna a estimativa atual sem registrar requisição."""
+
+    @abstractmethod
+    def remover_inativos(self, janela: int) -> int:
+        """Remove chaves sem requisições nas duas últimas janelas."""
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Contadores em memória, locais ao processo."""
+
+    def __init__(self):
+        self.estados: Dict[str, EstadoJanela] = {}
+
+    def consumir(self, chave: str, janela: int, fracao: float, limite: int) -> Tuple[bool, float]:
+        estado = self.estados.get(chave)
+        if estado is None:
+            estado = self.estados[chave] = EstadoJanela(janela=janela)
+        estado.rolar(janela)
+        estimativa = estado.estimar(fracao)
+        if estimativa >= limite:
+            return False, estimativa
+        estado.atual += 1
+        return True, estimativa + 1
+
+    def consultar(self, chave: str, janela: int, fracao: float) -> float:
+        estado = self.estados.get(chave)
+        if estado is None:
+            return 0.0
+        estado.rolar(janela)
+        return estado.estimar(fracao)
+
+    def remover_inativos(self, janela: int) -> int:
+        inativas = [chave for chave, estado in self.estados.items() if estado.janela < janela - 1]
+        for chave in inativas:
+            del self.estados[chave]
+        return len(inativas)
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    Contadores em um arquivo SQLite compartilhado entre workers do uvicorn.
+
+    Cada ``consumir`` é uma transação ``BEGIN IMMEDIATE`` sobre uma única
+    linha; o modo WAL permite que consultas não bloqueiem as escritas. A
+    espera pelo lock pode chegar ao timeout da conexão, por isso o middleware
+    chama o backend em uma thread.
+    """
+
+    bloqueante = True
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._local = threading.local()
+        with self._conexao() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_limit (
+                    chave TEXT PRIMARY KEY,
+                    janela INTEGER NOT NULL,
+                    atual INTEGER NOT NULL,
+                    anterior INTEGER NOT NULL
+                ) WITHOUT ROWID
+            """)
+
+    def _conexao(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.caminho, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _ler(self, conn: sqlite3.Connection, chave: str, janela: int) -> Optional[EstadoJanela]:
+        linha = conn.execute(
+            "SELECT janela, atual, anterior FROM rate_limit WHERE chave = ?", (chave,)
+        ).fetchone()
+        if linha is None:
+            return None
+        estado = EstadoJanela(*linha)
+        estado.rolar(janela)
+        return estado
+
+    def consumir(self, chave: str, janela: int, fracao: float, limite: int) -> Tuple[bool, float]:
+        conn = self._conexao()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            estado = self._ler(conn, chave, janela) or EstadoJanela(janela=janela)
+            estimativa = estado.estimar(fracao)
+            permitida = estimativa < limite
+            if permitida:
+                estado.atual += 1
+                estimativa += 1
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit (chave, janela, atual, anterior) VALUES (?, ?, ?, ?)",
+                (chave, estado.janela, estado.atual, estado.anterior)
+            )
+            conn.execute("COMMIT")
+            return permitida, estimativa
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def consultar(self, chave: str, janela: int, fracao: float) -> float:
+        estado = self._ler(self._conexao(), chave, janela)
+        return estado.estimar(fracao) if estado else 0.0
+
+    def remover_inativos(self, janela: int) -> int:
+        cursor = self._conexao().execute("DELETE FROM rate_limit WHERE janela < ?", (janela - 1,))
+        return cursor.rowcount
+
+
 class RateLimitMiddleware:
-    """Middleware para controle de rate limiting."""
+    """
+    Middleware para controle de rate limiting.
+
+    Usa contador de janela deslizante: a taxa nos últimos ``periodo``
+    segundos é estimada a partir das contagens da janela fixa atual e da
+    anterior, ponderada pela fração da janela atual já decorrida. O custo por
+    requisição é constante, independentemente do volume do cliente. Chaves
+    ociosas são removidas a cada período.
+    """
     
-    def __init__(self):
-        self.requests = {}  # Em produção, usar Redis
+    def __init__(
+        self,
+        backend: Optional[RateLimitBackend] = None,
+        relogio: Callable[[], float] = time.time
+    ):
         self.settings = get_api_settings()
+        self.backend = backend or criar_backend_rate_limit(self.settings)
+        self.relogio = relogio
+        self._proxima_limpeza = 0
     
-    def is_rate_limited(self, client_ip: str, api_key: Optional[str] = None) -> bool:
+    def _chave(self, client_ip: str, api_key: Optional[str]) -> str:
+        return f"{client_ip}:{api_key}" if api_key else client_ip
+    
+    def _posicao(self) -> Tuple[int, float, float]:
+        """Retorna (janela atual, fração decorrida, segundos até a próxima janela)."""
+        periodo = self.settings.api_rate_limit_period
+        janela, decorrido = divmod(self.relogio(), periodo)
+        return int(janela), decorrido / periodo, periodo - decorrido
+    
+    def _limpar_inativos(self, janela: int):
+        if janela < self._proxima_limpeza:
+            return
+        self._proxima_limpeza = janela + 1
+        removidas = self.backend.remover_inativos(janela)
+        if removidas:
+            logger.debug(f"Rate limit: {removidas} clientes inativos removidos")
+    
+    def _info(self, estimativa: float, reset_in: float) -> dict:
+        atual = int(estimativa)
+        return {
+            "limit": self.settings.api_rate_limit,
+            "remaining": max(0, self.settings.api_rate_limit - atual),
+            "reset_in": max(1, math.ceil(reset_in)),
+            "period": self.settings.api_rate_limit_period,
+            "current": atual
+        }
+    
+    def verificar(self, client_ip: str, api_key: Optional[str] = None) -> Tuple[bool, dict]:
         """
-        Verifica se o cliente excedeu o rate limit.
+        Registra a requisição e retorna (limitado, informações) em uma única operação.
         
         Args:
             client_ip: IP do cliente
             api_key: API key (se fornecida)
             
         Returns:
-            bool: True se excedeu o limite
+            Tuple[bool, dict]: True se excedeu o limite e as informações do rate limit
         """
-        now = datetime.now()
-        key = f"{client_ip}:{api_key}" if api_key else client_ip
-        
-        # Limpar requisições antigas
-        if key in self.requests:
-            self.requests[key] = [
-                req_time for req_time in self.requests[key]
-                if (now - req_time).seconds < self.settings.api_rate_limit_period
-            ]
-        else:
-            self.requests[key] = []
+        janela, fracao, reset_in = self._posicao()
+        self._limpar_inativos(janela)
+        key = self._chave(client_ip, api_key)
         
-        # Verificar limite
-        if len(self.requests[key]) >= self.settings.api_rate_limit:
+        permitida, estimativa = self.backend.consumir(key, janela, fracao, self.settings.api_rate_limit)
+        if not permitida:
             logger.warning(f"Rate limit excedido para {key}")
-            return True
+        return not permitida, self._info(estimativa, reset_in)
+    
+    async def verificar_async(self, client_ip: str, api_key: Optional[str] = None) -> Tuple[bool, dict]:
+        """
+        Versão de ``verificar`` para o middleware: backends bloqueantes rodam
+        em uma thread para não travar o event loop.
+        """
+        if self.backend.bloqueante:
+            return await anyio.to_thread.run_sync(self.verificar, client_ip, api_key)
+        return self.verificar(client_ip, api_key)
+    
+    def is_rate_limited(self, client_ip: str, api_key: Optional[str] = None) -> bool:
+        """
+        Verifica se o cliente excedeu o rate limit.
         
-        # Adicionar requisição atual
-        self.requests[key].append(now)
-        return False
+        Args:
+            client_ip: IP do cliente
+            api_key: API key (se fornecida)
+            
+        Returns:
+            bool: True se excedeu o limite
+        """
+        limitado, _ = self.verificar(client_ip, api_key)
+        return limitado
     
     def get_rate_limit_info(self, client_ip: str, api_key: Optional[str] = None) -> dict:
         """
@@ -228,15 +436,21 @@ class RateLimitMiddleware:
         Returns:
             dict: Informações do rate limit
         """
-        key = f"{client_ip}:{api_key}" if api_key else client_ip
-        current_requests = len(self.requests.get(key, []))
-        
-        return {
-            "limit": self.settings.api_rate_limit,
-            "remaining": max(0, self.settings.api_rate_limit - current_requests),
-            "reset_in": self.settings.api_rate_limit_period,
-            "current": current_requests
-        }
+        janela, fracao, reset_in = self._posicao()
+        estimativa = self.backend.consultar(self._chave(client_ip, api_key), janela, fracao)
+        return self._info(estimativa, reset_in)
+
+
+def criar_backend_rate_limit(settings) -> RateLimitBackend:
+    """
+    Cria o backend de rate limiting configurado.
+    
+    ``memoria`` mantém os contadores no processo; ``sqlite`` compartilha os
+    contadores entre workers através de ``api_rate_limit_sqlite_path``.
+    """
+    if settings.api_rate_limit_backend == "sqlite":
+        return SQLiteRateLimitBackend(settings.api_rate_limit_sqlite_path)
+    return MemoryRateLimitBackend()
 
 # Instância global do rate limiter
 rate_limiter = RateLimitMiddleware()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark do cache persistente de páginas do FBRef
+
+Executa duas passadas de fazer_requisicao sobre as mesmas URLs de temporadas
+(encerradas e atual), contra um servidor HTTP local com latência fixa que
+responde ETag e 304 para If-None-Match:
+- Sem cache (comportamento original): toda passada baixa todas as páginas
+- Com cache: na segunda passada as temporadas encerradas vêm do disco (sem
+  requisição nem delay) e as páginas da temporada atual, vencidas, são
+  revalidadas com 304
+
+Uso:
+    python benchmark_cache_paginas.py [--temporadas 30] [--atuais 5] [--latencia 150] [--delay 0.2]
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+import hashlib
+import logging
+import tempfile
+import threading
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from aiohttp import web
+
+from Coleta_de_dados.apis.fbref import fallback_first_system, fbref_utils
+from Coleta_de_dados.apis.fbref.cache_paginas import CachePaginas, POLITICAS_PADRAO
+
+
+class ServidorTemporadas:
+    """Servidor local com ETag que conta requisições, 304 e bytes enviados."""
+
+    def __init__(self, latencia: float, tamanho_kb: int):
+        self.latencia = latencia
+        self.corpo = "<html><body>" + "<table><tr><td>1</td></tr></table>" * (tamanho_kb * 30) + "</body></html>"
+        self.pronto = threading.Event()
+        self.zerar()
+
+    def zerar(self):
+        self.requisicoes = self.nao_modificadas = self.bytes_enviados = 0
+
+    async def tratar(self, request):
+        self.requisicoes += 1
+        await asyncio.sleep(self.latencia)
+        html = f"<!-- {request.path} -->{self.corpo}"
+        etag = '"' + hashlib.md5(html.encode()).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            self.nao_modificadas += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        self.bytes_enviados += len(html)
+        return web.Response(text=html, content_type="text/html", headers={"ETag": etag})
+
+    async def _servir(self):
+        app = web.Application()
+        app.router.add_get("/{caminho:.*}", self.tratar)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        self.pronto.set()
+        await asyncio.Event().wait()
+
+    def iniciar(self) -> str:
+        threading.Thread(target=asyncio.run, args=(self._servir(),), daemon=True).start()
+        self.pronto.wait()
+        return self.url
+
+
+def urls_temporadas(base: str, encerradas: int, atuais: int) -> list:
+    ano = time.localtime().tm_year
+    urls = [f"{base}/en/comps/{c}/{ano - 2}-{ano - 1}/schedule/{ano - 2}-{ano - 1}-Scores-and-Fixtures"
+            for c in range(encerradas)]
+    urls += [f"{base}/en/comps/{c}/schedule/Scores-and-Fixtures" for c in range(atuais)]
+    return urls
+
+
+def passada(servidor, urls) -> tuple:
+    servidor.zerar()
+    inicio = time.perf_counter()
+    for url in urls:
+        assert fbref_utils.fazer_requisicao(url) is not None
+    return time.perf_counter() - inicio, servidor.requisicoes, servidor.nao_modificadas, servidor.bytes_enviados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--temporadas", type=int, default=30, help="páginas de temporadas encerradas")
+    parser.add_argument("--atuais", type=int, default=5, help="páginas da temporada atual")
+    parser.add_argument("--latencia", type=float, default=150.0, help="latência do servidor em ms")
+    parser.add_argument("--delay", type=float, default=0.2,
+                        help="REQUEST_DELAY entre requisições em s (produção: 3.0)")
+    parser.add_argument("--tamanho-kb", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    servidor = ServidorTemporadas(args.latencia / 1000, args.tamanho_kb)
+    urls = urls_temporadas(servidor.iniciar(), args.temporadas, args.atuais)
+
+    fbref_utils.REQUEST_DELAY = args.delay
+    fbref_utils.EMERGENCY_SYSTEM_AVAILABLE = False
+    fbref_utils.HANG_DETECTION_AVAILABLE = False
+    fallback_first_system.should_use_fallback = lambda url: False
+
+    # Agendas da temporada atual já vencidas na segunda passada (força a revalidação)
+    politicas = tuple((classe, padrao, 0 if classe == "agenda" else ttl) for classe, padrao, ttl in POLITICAS_PADRAO)
+    cache = CachePaginas(os.path.join(tempfile.mkdtemp(), "paginas"), politicas=politicas)
+    fbref_utils.get_cache_paginas = lambda: cache
+
+    resultados = []
+    for nome, usar_cache in (("sem cache", False), ("com cache", True)):
+        fbref_utils.USE_PAGE_CACHE = usar_cache
+        for numero in (1, 2):
+            resultados.append((f"{nome} - passada {numero}", *passada(servidor, urls)))
+
+    print(f"\n📊 BENCHMARK CACHE DE PÁGINAS ({args.temporadas} temporadas encerradas + {args.atuais} atuais, "
+          f"latência {args.latencia:.0f} ms, delay {args.delay} s)")
+    print("=" * 78)
+    print(f"{'cenário':<26}{'tempo (s)':>11}{'requisições':>13}{'304':>8}{'MB baixados':>13}")
+    for nome, tempo, requisicoes, nao_modificadas, enviados in resultados:
+        print(f"{nome:<26}{tempo:>11.2f}{requisicoes:>13}{nao_modificadas:>8}{enviados / 1024 ** 2:>13.1f}")
+    print("=" * 78)
+    stats = cache.get_stats()
+    print(f"Cache: {stats['hits']} hits, {stats['misses']} misses, {stats['revalidadas']} revalidadas, "
+          f"{stats['paginas']} páginas em {stats['bytes'] / 1024:.0f} KB comprimidos")
+
+
+if __name__ == "__main__":
+    main()
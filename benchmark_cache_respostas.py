@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark do cache de respostas da API
+
+Mede /competitions/stats/summary sobre um banco SQLite com muitas competições:
+- Sem cache: todas as requisições executam as agregações no banco
+- Com cache: apenas a primeira requisição (e a primeira após uma escrita)
+  consulta o banco; as demais são servidas do cache ou com 304 (If-None-Match)
+
+Uso:
+    python benchmark_cache_respostas.py [--competicoes 200000] [--requisicoes 200]
+"""
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+import logging
+import statistics
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+import api.cache
+from api.cache import CacheRespostas
+from api.routers import competitions
+from api.security import get_current_api_key
+from Coleta_de_dados.database import invalidacao_cache
+from Coleta_de_dados.database.config import Base
+from Coleta_de_dados.database.invalidacao_cache import RegistroVersoesTags
+from Coleta_de_dados.database.models import Competicao
+
+URL = "/competitions/stats/summary"
+
+
+class SemCache(CacheRespostas):
+    """Executa o endpoint em toda requisição (comportamento original)."""
+
+    def responder(self, request, ttl, tags, gerar):
+        return gerar()
+
+
+def criar_app(caminho: str, competicoes: int):
+    engine = create_engine(f"sqlite:///{caminho}")
+    Base.metadata.create_all(engine)
+    Sessao = sessionmaker(bind=engine)
+    with Sessao() as session:
+        session.execute(insert(Competicao), [
+            {"nome": f"Competição {i}", "url": f"/comps/{i}", "ativa": i % 3 != 0,
+             "contexto": ("Masculino", "Feminino", "Juvenil")[i % 3]}
+            for i in range(competicoes)
+        ])
+        session.commit()
+
+    consultas = []
+    event.listen(engine, "before_cursor_execute", lambda *args: consultas.append(1))
+
+    def get_db():
+        with Sessao() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(competitions.router)
+    app.dependency_overrides[competitions.get_db] = get_db
+    app.dependency_overrides[get_current_api_key] = lambda: "benchmark"
+    return TestClient(app), Sessao, consultas
+
+
+def medir(client, consultas, requisicoes: int, cabecalhos=None):
+    consultas.clear()
+    tempos = []
+    for _ in range(requisicoes):
+        inicio = time.perf_counter()
+        resposta = client.get(URL, headers=cabecalhos or {})
+        tempos.append((time.perf_counter() - inicio) * 1000)
+        assert resposta.status_code in (200, 304)
+    return statistics.mean(tempos), statistics.quantiles(tempos, n=100)[94], len(consultas) / requisicoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--competicoes", type=int, default=200_000)
+    parser.add_argument("--requisicoes", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    diretorio = tempfile.mkdtemp()
+    registro = RegistroVersoesTags(os.path.join(diretorio, "cache_tags.db"))
+    invalidacao_cache._registro = registro
+    client, Sessao, consultas = criar_app(os.path.join(diretorio, "bench.db"), args.competicoes)
+
+    print(f"\n📊 BENCHMARK CACHE DE RESPOSTAS ({args.competicoes} competições, {args.requisicoes} requisições)")
+    print("=" * 70)
+    print(f"{'cenário':<28}{'média (ms)':>12}{'p95 (ms)':>12}{'consultas/req':>16}")
+
+    api.cache.cache_respostas = SemCache(registro=registro)
+    media, p95, por_req = medir(client, consultas, args.requisicoes)
+    print(f"{'sem cache':<28}{media:>12.2f}{p95:>12.2f}{por_req:>16.2f}")
+
+    api.cache.cache_respostas = CacheRespostas(registro=registro)
+    media, p95, por_req = medir(client, consultas, args.requisicoes)
+    print(f"{'com cache':<28}{media:>12.2f}{p95:>12.2f}{por_req:>16.2f}")
+
+    etag = client.get(URL).headers["ETag"]
+    media, p95, por_req = medir(client, consultas, args.requisicoes, {"If-None-Match": etag})
+    print(f"{'com cache + If-None-Match':<28}{media:>12.2f}{p95:>12.2f}{por_req:>16.2f}")
+
+    # Escrita de um coletor invalida a entrada; a próxima leitura recalcula
+    with Sessao() as session:
+        session.add(Competicao(nome="Nova", url="/comps/nova"))
+        session.commit()
+    resposta = client.get(URL)
+    print("=" * 70)
+    print(f"Após escrita: X-Cache={resposta.headers['X-Cache']}, "
+          f"total_competitions={resposta.json()['total_competitions']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark da carga em lote de clubes, jogadores e partidas do FBRef
+
+Grava os mesmos cadastros sintéticos (com URLs repetidas e parte das linhas
+já existentes no banco) em um SQLite temporário:
+- Linha a linha (comportamento original): INSERT OR IGNORE + SELECT do id por
+  linha, com uma conexão por clube/jogador
+- Em lote (carga_em_lote): deduplicação em memória, um executemany com
+  INSERT ... ON CONFLICT e os ids lidos em poucas consultas
+
+Uso:
+    python benchmark_carga_em_lote.py [--paises 10] [--clubes 200] [--jogadores 1000] [--partidas 380]
+"""
+
+import sys
+import os
+import time
+import sqlite3
+import argparse
+import logging
+import tempfile
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from Coleta_de_dados.apis.fbref.coletar_clubes import ClubeInfo, ColetorClubes
+from Coleta_de_dados.apis.fbref.coletar_dados_partidas import ColetorPartidas, PartidaInfo
+from Coleta_de_dados.apis.fbref.coletar_jogadores import ColetorJogadores, JogadorInfo
+
+
+class ColetoresOriginais:
+    """Gravação original: uma instrução (e, para cadastros, uma conexão) por linha."""
+
+    def __init__(self, db_path):
+        self.clubes, self.jogadores, self.partidas = (
+            ColetorClubes(db_path), ColetorJogadores(db_path), ColetorPartidas(db_path)
+        )
+
+    def salvar_clube(self, clube, pais_id):
+        with self.clubes.get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR IGNORE INTO clubes (pais_id, nome, genero, url_clube, url_records_vs_opponents)
+                VALUES (?, ?, ?, ?, ?)
+            """, (pais_id, clube.nome, clube.genero, clube.url_clube, clube.url_records_vs_opponents))
+            cursor.execute("SELECT id FROM clubes WHERE url_clube = ?", (clube.url_clube,))
+            conn.commit()
+            return cursor.fetchone()[0]
+
+    def salvar_jogador(self, jogador, pais_id):
+        with self.jogadores.get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR IGNORE INTO jogadores (
+                    pais_id, nome, url_jogador, url_all_competitions,
+                    url_domestic_leagues, url_domestic_cups,
+                    url_international_cups, url_national_team
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (pais_id, jogador.nome, jogador.url_jogador, jogador.url_all_competitions,
+                  jogador.url_domestic_leagues, jogador.url_domestic_cups,
+                  jogador.url_international_cups, jogador.url_national_team))
+            cursor.execute("SELECT id FROM jogadores WHERE url_jogador = ?", (jogador.url_jogador,))
+            conn.commit()
+            return cursor.fetchone()[0]
+
+    def salvar_partidas(self, partidas, link_coleta_id):
+        salvas = 0
+        with self.partidas.get_db_connection() as conn:
+            cursor = conn.cursor()
+            for partida in partidas:
+                cursor.execute("""
+                    INSERT OR IGNORE INTO partidas
+                    (link_coleta_id, data, time_casa, placar, time_visitante, url_match_report, status_coleta_detalhada)
+                    VALUES (?, ?, ?, ?, ?, ?, 'pendente')
+                """, (link_coleta_id, partida.data, partida.time_casa, partida.placar,
+                      partida.time_visitante, partida.url_match_report))
+                salvas += cursor.rowcount > 0
+            conn.commit()
+        return salvas
+
+
+def preparar_banco(diretorio, nome):
+    caminho = os.path.join(diretorio, f"{nome}.db")
+    ColetorClubes(caminho).setup_database_clubes()
+    ColetorJogadores(caminho).setup_database_jogadores()
+    with sqlite3.connect(caminho) as conn:
+        conn.execute("""
+            CREATE TABLE partidas (
+                id INTEGER PRIMARY KEY, link_coleta_id INTEGER, data TEXT, time_casa TEXT, placar TEXT,
+                time_visitante TEXT, url_match_report TEXT UNIQUE, status_coleta_detalhada TEXT DEFAULT 'pendente'
+            )
+        """)
+        # Um quarto dos cadastros já existe (execução anterior da coleta)
+        conn.executemany("INSERT INTO clubes (pais_id, nome, genero, url_clube) VALUES (1, ?, 'M', ?)",
+                         [(f"Clube {i}", f"/squads/{i}") for i in range(0, 10 ** 6, 4)][:5000])
+    return caminho
+
+
+def gerar_dados(paises, clubes, jogadores, partidas):
+    """Por país: clubes e jogadores (5% de URLs repetidas) e uma temporada de partidas."""
+    dados = []
+    for p in range(paises):
+        base = p * max(clubes, jogadores)
+        lista_clubes = [ClubeInfo(f"Clube {base + i}", "País", "MF"[i % 2], f"/squads/{base + i}",
+                                  f"/squads/{base + i}/records") for i in range(clubes)]
+        lista_jogadores = [JogadorInfo(f"Jogador {base + i}", "País", f"/players/{base + i}",
+                                       url_all_competitions=f"/players/{base + i}/all") for i in range(jogadores)]
+        lista_partidas = [PartidaInfo("2025-05-01", f"Casa {i}", "1–0", f"Fora {i}", f"/matches/{p}-{i}")
+                          for i in range(partidas)]
+        dados.append((p + 1, lista_clubes + lista_clubes[:clubes // 20],
+                      lista_jogadores + lista_jogadores[:jogadores // 20], lista_partidas))
+    return dados
+
+
+def carga_original(db_path, dados):
+    originais = ColetoresOriginais(db_path)
+    ids = {}
+    for pais_id, clubes, jogadores, partidas in dados:
+        for clube in clubes:
+            ids[clube.url_clube] = originais.salvar_clube(clube, pais_id)
+        for jogador in jogadores:
+            ids[jogador.url_jogador] = originais.salvar_jogador(jogador, pais_id)
+        originais.salvar_partidas(partidas, pais_id)
+    return ids
+
+
+def carga_em_lote(db_path, dados):
+    coletor_clubes, coletor_jogadores = ColetorClubes(db_path), ColetorJogadores(db_path)
+    coletor_partidas = ColetorPartidas(db_path)
+    ids = {}
+    for pais_id, clubes, jogadores, partidas in dados:
+        ids.update(coletor_clubes.salvar_clubes_no_banco(clubes, pais_id))
+        ids.update(coletor_jogadores.salvar_jogadores_no_banco(jogadores, pais_id))
+        coletor_partidas.salvar_partidas_no_banco(partidas, pais_id)
+    return ids
+
+
+def conteudo(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return [conn.execute(f"SELECT * FROM {tabela} ORDER BY id").fetchall()
+                for tabela in ("clubes", "jogadores", "partidas")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--paises", type=int, default=10)
+    parser.add_argument("--clubes", type=int, default=200, help="clubes por país")
+    parser.add_argument("--jogadores", type=int, default=1000, help="jogadores por país")
+    parser.add_argument("--partidas", type=int, default=380, help="partidas por país")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    dados = gerar_dados(args.paises, args.clubes, args.jogadores, args.partidas)
+    linhas = sum(len(c) + len(j) + len(p) for _, c, j, p in dados)
+    diretorio = tempfile.mkdtemp()
+
+    resultados = []
+    for nome, funcao in (("linha a linha", carga_original), ("em lote", carga_em_lote)):
+        caminho = preparar_banco(diretorio, nome.replace(" ", "_"))
+        inicio = time.perf_counter()
+        ids = funcao(caminho, dados)
+        resultados.append((nome, time.perf_counter() - inicio, len(ids), conteudo(caminho)))
+
+    print(f"\n📊 BENCHMARK CARGA EM LOTE ({args.paises} países, {linhas} linhas com repetições)")
+    print("=" * 60)
+    print(f"{'gravação':<18}{'tempo (s)':>12}{'linhas/s':>14}{'ids':>10}")
+    for nome, tempo, total_ids, _ in resultados:
+        print(f"{nome:<18}{tempo:>12.2f}{linhas / tempo:>14.0f}{total_ids:>10}")
+    print("=" * 60)
+    print(f"Bancos idênticos: {'sim' if resultados[0][3] == resultados[1][3] else 'NÃO'}")
+
+
+if __name__ == "__main__":
+    main()
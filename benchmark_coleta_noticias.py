@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark da coleta de notícias para todos os clubes
+
+Executa coletar_para_todos_clubes contra um servidor HTTP local com latência
+fixa que imita a busca do Globo Esporte (parte das notícias aparece na busca
+de vários clubes e parte já está em noticias_clubes):
+- Sequencial (comportamento original): um clube por vez, conteúdo de cada
+  notícia com requests e pausa de --delay s entre notícias
+- Paralela (ColetaParalelaNoticias): buscas e conteúdos em paralelo, com pool
+  de conexões por fonte, URLs deduplicadas e sem baixar notícias existentes
+
+Uso:
+    python benchmark_coleta_noticias.py [--clubes 40] [--noticias 5] [--latencia 100] [--delay 0.2]
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+import logging
+import tempfile
+import threading
+from collections import Counter
+from datetime import datetime
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from aiohttp import web
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from Coleta_de_dados.apis.news import collector as collector_module
+from Coleta_de_dados.apis.news.collector import NewsCollector
+from Coleta_de_dados.database.config import Base
+from Coleta_de_dados.database.models import Clube, NoticiaClube
+
+
+class ServidorGE:
+    """Busca e páginas de notícias com latência fixa; conta requisições."""
+
+    def __init__(self, latencia: float, noticias: int):
+        self.latencia = latencia
+        self.noticias = noticias
+        self.requisicoes = Counter()
+        self.pronto = threading.Event()
+
+    def chaves(self, clube: int) -> list:
+        # A última notícia de cada clube é compartilhada com o clube seguinte (clássicos, rodadas...)
+        return [f"{clube}-{i}" for i in range(self.noticias - 1)] + [f"jogo-{clube // 2}"]
+
+    async def tratar(self, request):
+        await asyncio.sleep(self.latencia)
+        if request.path == "/busca/":
+            self.requisicoes["busca"] += 1
+            clube = int(request.query["q"].rsplit(" ", 1)[1])
+            itens = "".join(
+                f'<li class="widget--info"><a class="feed-post-link" href="{self.url}/noticia/{chave}">'
+                f'Notícia {chave}</a><div class="feed-post-body-resumo">Resumo {chave}</div>'
+                f'<span class="feed-post-datetime">há 3 horas</span></li>'
+                for chave in self.chaves(clube)
+            )
+            return web.Response(text=f"<html><ul>{itens}</ul></html>", content_type="text/html")
+        self.requisicoes["noticia"] += 1
+        paragrafos = "".join(f'<p class="content-text__container">Parágrafo {i} de {request.path}</p>'
+                             for i in range(20))
+        return web.Response(text=f"<html><article>{paragrafos}</article></html>", content_type="text/html")
+
+    async def _servir(self):
+        app = web.Application()
+        app.router.add_get("/{caminho:.*}", self.tratar)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        self.pronto.set()
+        await asyncio.Event().wait()
+
+    def iniciar(self) -> str:
+        threading.Thread(target=asyncio.run, args=(self._servir(),), daemon=True).start()
+        self.pronto.wait()
+        return self.url
+
+
+def criar_banco(diretorio: str, nome: str, clubes: int, url_servidor: str):
+    engine = create_engine(f"sqlite:///{os.path.join(diretorio, nome)}.db")
+    Base.metadata.create_all(engine)
+    Sessao = sessionmaker(bind=engine)
+    with Sessao() as session:
+        session.execute(insert(Clube), [{"nome": f"Clube {i}"} for i in range(clubes)])
+        # Notícias de uma coleta anterior (primeira notícia de cada clube par)
+        session.execute(insert(NoticiaClube), [
+            {"clube_id": i + 1, "titulo": f"Notícia {i}-0", "url_noticia": f"{url_servidor}/noticia/{i}-0",
+             "fonte": "Globo Esporte", "data_publicacao": datetime.now()}
+            for i in range(0, clubes, 2)
+        ])
+        session.commit()
+    return Sessao()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clubes", type=int, default=40)
+    parser.add_argument("--noticias", type=int, default=5, help="notícias por clube na busca")
+    parser.add_argument("--latencia", type=float, default=100.0, help="latência do servidor em ms")
+    parser.add_argument("--delay", type=float, default=0.2,
+                        help="pausa entre notícias na coleta sequencial em s (produção: 1.0)")
+    parser.add_argument("--simultaneas", type=int, default=32)
+    parser.add_argument("--por-fonte", type=int, default=8)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    servidor = ServidorGE(args.latencia / 1000, args.noticias)
+    url = servidor.iniciar()
+    diretorio = tempfile.mkdtemp()
+
+    pausa_original = collector_module.time.sleep
+    collector_module.time.sleep = lambda segundos: pausa_original(args.delay)
+
+    resultados = []
+    for nome, opcoes in (("sequencial", {"paralelo": False}),
+                         ("paralela", {"max_simultaneas": args.simultaneas, "max_por_fonte": args.por_fonte})):
+        session = criar_banco(diretorio, nome, args.clubes, url)
+        coletor = NewsCollector(db_session=session)
+        coletor.BASE_URL = f"{url}/busca/"
+        servidor.requisicoes.clear()
+        inicio = time.perf_counter()
+        resultado = coletor.coletar_para_todos_clubes(limite_por_clube=args.noticias, **opcoes)
+        tempo = time.perf_counter() - inicio
+        salvas = sorted(session.query(NoticiaClube.clube_id, NoticiaClube.url_noticia,
+                                      NoticiaClube.conteudo_completo))
+        resultados.append((nome, tempo, servidor.requisicoes["busca"], servidor.requisicoes["noticia"],
+                           resultado["total_noticias_coletadas"], salvas))
+        session.close()
+
+    print(f"\n📊 BENCHMARK COLETA DE NOTÍCIAS ({args.clubes} clubes x {args.noticias} notícias, "
+          f"latência {args.latencia:.0f} ms, delay {args.delay} s)")
+    print("=" * 70)
+    print(f"{'coleta':<14}{'tempo (s)':>11}{'buscas':>10}{'notícias baixadas':>20}{'salvas':>10}")
+    for nome, tempo, buscas, baixadas, salvas, _ in resultados:
+        print(f"{nome:<14}{tempo:>11.2f}{buscas:>10}{baixadas:>20}{salvas:>10}")
+    print("=" * 70)
+    print(f"Notícias salvas idênticas: {'sim' if resultados[0][5] == resultados[1][5] else 'NÃO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Benchmark da coleta de match reports do FBRef em pipeline
+
+Compara, contra um servidor HTTP local que serve match reports com latência
+fixa, a coleta de estatísticas detalhadas de N partidas:
+- Sequencial (comportamento original): espera do ritmo, busca, parsing e
+  gravação de uma partida por vez
+- Pipeline (AgendadorColeta): busca async no ritmo da Anti429StateMachine,
+  parsing em threads e gravação em lote numa thread dedicada
+
+As duas versões usam o mesmo intervalo entre requisições (base_delay da
+máquina de estados). Os arquivos "Match Report" de htmls/ são servidos quando
+estão disponíveis; se forem ponteiros do git-lfs, são geradas páginas
+sintéticas com as mesmas tabelas (summary, passing, passing_types, defense,
+possession, misc).
+
+Uso:
+    python benchmark_coleta_pipeline.py [--partidas 60] [--latencia 80] [--intervalo 40]
+"""
+
+import sys
+import os
+import time
+import glob
+import asyncio
+import argparse
+import logging
+import sqlite3
+import tempfile
+import threading
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+import requests
+from aiohttp import web
+from bs4 import BeautifulSoup
+
+from Coleta_de_dados.apis.fbref.anti_429_state_machine import Anti429StateMachine
+from Coleta_de_dados.apis.fbref.coletar_estatisticas_detalhadas import (
+    ColetorEstatisticas, EscritorEstatisticas
+)
+from Coleta_de_dados.apis.fbref.fbref_utils import processar_soup_com_comentarios
+
+DIRETORIO_HTMLS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "htmls")
+TABELAS = ("summary", "passing", "passing_types", "defense", "possession", "misc")
+CHAVE_TABELA = {"sum": "summary", "pass": "passing", "pass_types": "passing_types",
+                "def": "defense", "poss": "possession", "misc": "misc"}
+
+
+def carregar_match_reports() -> list:
+    """Match reports salvos em htmls/, ignorando ponteiros do git-lfs."""
+    paginas = []
+    for caminho in sorted(glob.glob(os.path.join(DIRETORIO_HTMLS, "*Match Report*.html"))):
+        with open(caminho, encoding="utf-8", errors="ignore") as arquivo:
+            conteudo = arquivo.read()
+        if not conteudo.startswith("version https://git-lfs"):
+            paginas.append(conteudo)
+    return paginas
+
+
+def gerar_match_report(partida_id: int, jogadores_por_time: int = 16, preenchimento_kb: int = 100) -> str:
+    """Página sintética no formato das tabelas de jogadores do FBRef."""
+    coletor = ColetorEstatisticas(":memory:")
+    colunas = {tabela: [] for tabela in TABELAS}
+    for data_stat in coletor.stat_mapping:
+        colunas[CHAVE_TABELA[coletor._get_table_for_stat(data_stat)]].append(data_stat)
+    colunas["summary"] += ["minutes", "npxg_plus_xg_assist"]
+
+    partes = ["<html><head><title>Match Report | FBref.com</title></head><body>"]
+    # Conteúdo fora das tabelas (menus, scripts, outras seções) como nas páginas reais
+    partes.append("<div class='filler'>" + "<p>lorem ipsum dolor sit amet</p>" * (preenchimento_kb * 30) + "</div>")
+    for lado, time_nome in (("casa", f"Time A{partida_id}"), ("fora", f"Time B{partida_id}")):
+        id_base = f"stats_{partida_id}{lado}"
+        for tabela in TABELAS:
+            caption = f"<caption>{time_nome} Player Stats Table</caption>" if tabela == "summary" else ""
+            linhas = []
+            for j in range(jogadores_por_time):
+                celulas = [f'<th data-stat="player">Jogador {lado} {j}</th>']
+                for k, data_stat in enumerate(colunas[tabela]):
+                    valor = 90 if data_stat == "minutes" else (j * 7 + k) % 13
+                    if data_stat in ("player_position", "position"):
+                        valor = "MF"
+                    celulas.append(f'<td data-stat="{data_stat}">{valor}</td>')
+                linhas.append("<tr>" + "".join(celulas) + "</tr>")
+            partes.append(f'<table id="{id_base}_{tabela}">{caption}<tbody>{"".join(linhas)}</tbody></table>')
+    partes.append("</body></html>")
+    return "".join(partes)
+
+
+class ServidorMatchReports:
+    """Servidor local (em thread própria) que serve match reports com latência fixa."""
+
+    def __init__(self, paginas: list, latencia: float):
+        self.paginas = paginas
+        self.latencia = latencia
+        self.pronto = threading.Event()
+
+    async def tratar(self, request):
+        await asyncio.sleep(self.latencia)
+        partida_id = int(request.match_info["partida_id"])
+        return web.Response(text=self.paginas[partida_id % len(self.paginas)], content_type="text/html")
+
+    async def _servir(self):
+        app = web.Application()
+        app.router.add_get("/en/matches/{partida_id}", self.tratar)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        self.pronto.set()
+        await asyncio.Event().wait()
+
+    def iniciar(self) -> str:
+        threading.Thread(target=asyncio.run, args=(self._servir(),), daemon=True).start()
+        self.pronto.wait()
+        return self.url
+
+
+def criar_banco(diretorio: str, nome: str, url: str, partidas: int) -> str:
+    caminho = os.path.join(diretorio, nome)
+    ColetorEstatisticas(caminho).setup_database_stats()
+    with sqlite3.connect(caminho) as conn:
+        conn.execute("CREATE TABLE partidas (id INTEGER PRIMARY KEY, url_match_report TEXT, "
+                     "status_coleta_detalhada TEXT)")
+        conn.executemany("INSERT INTO partidas VALUES (?, ?, 'pendente')",
+                         [(i, f"{url}/en/matches/{i}") for i in range(1, partidas + 1)])
+    return caminho
+
+
+def coleta_sequencial(caminho: str, criar_maquina) -> int:
+    """Uma partida por vez: espera, busca, parsing e gravação (loop original)."""
+    coletor = ColetorEstatisticas(caminho)
+    maquina = criar_maquina()
+    with EscritorEstatisticas(caminho) as escritor:
+        coletor._escritor = escritor
+        for partida_id, url in coletor.obter_partidas_pendentes():
+            time.sleep(maquina.get_wait_time())
+            resposta = requests.get(url, timeout=30)
+            maquina.record_success(url)
+            soup = processar_soup_com_comentarios(BeautifulSoup(resposta.text, "lxml"))
+            jogadores = coletor.extrair_match_report(soup, partida_id) or []
+            coletor.salvar_estatisticas_jogadores(jogadores)
+            coletor.atualizar_status_partida(partida_id, "concluido")
+            escritor.concluir_partida()
+    return contar_jogadores(caminho)
+
+
+def coleta_pipeline(caminho: str, criar_maquina, parsers: int) -> int:
+    coletor = ColetorEstatisticas(caminho)
+    # Sem cache de páginas: as duas coletas buscam todas as páginas no servidor
+    coletor.executar_coleta(criar_maquina=criar_maquina, parsers=parsers, usar_cache=False)
+    return contar_jogadores(caminho)
+
+
+def contar_jogadores(caminho: str) -> int:
+    with sqlite3.connect(caminho) as conn:
+        return conn.execute("SELECT COUNT(*) FROM estatisticas_jogador_partida").fetchone()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--partidas", type=int, default=60)
+    parser.add_argument("--latencia", type=float, default=80.0, help="latência do servidor em ms")
+    parser.add_argument("--intervalo", type=float, default=40.0,
+                        help="base_delay da Anti429StateMachine em ms (produção: 2000)")
+    parser.add_argument("--parsers", type=int, default=2)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    def criar_maquina():
+        maquina = Anti429StateMachine()
+        maquina.base_delay = args.intervalo / 1000
+        return maquina
+
+    paginas = carregar_match_reports()
+    origem = "htmls/" if paginas else "sintéticas"
+    if not paginas:
+        paginas = [gerar_match_report(i) for i in range(5)]
+    url = ServidorMatchReports(paginas, args.latencia / 1000).iniciar()
+    diretorio = tempfile.mkdtemp()
+
+    resultados = []
+    for nome, executar in (
+        ("sequencial", lambda caminho: coleta_sequencial(caminho, criar_maquina)),
+        (f"pipeline ({args.parsers} parsers)", lambda caminho: coleta_pipeline(caminho, criar_maquina, args.parsers)),
+    ):
+        caminho = criar_banco(diretorio, f"{nome.split()[0]}.db", url, args.partidas)
+        inicio = time.perf_counter()
+        jogadores = executar(caminho)
+        resultados.append((nome, time.perf_counter() - inicio, jogadores))
+
+    print(f"\n📊 BENCHMARK COLETA EM PIPELINE ({args.partidas} partidas, páginas {origem} "
+          f"de {len(paginas[0]) // 1024} KB, latência {args.latencia:.0f} ms, intervalo {args.intervalo:.0f} ms)")
+    print("=" * 70)
+    print(f"{'cenário':<28}{'tempo (s)':>12}{'partidas/s':>14}{'jogadores':>14}")
+    for nome, tempo, jogadores in resultados:
+        print(f"{nome:<28}{tempo:>12.2f}{args.partidas / tempo:>14.1f}{jogadores:>14}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
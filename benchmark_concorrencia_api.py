@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark de concorrência dos endpoints de banco da API
+
+Compara o throughput do detalhe de partida com clientes concorrentes:
+- bloqueante: handler ``async def`` chamando a sessão síncrona no event loop
+  (comportamento original, serializa todas as requisições do worker)
+- threadpool: handler ``def`` executado pelo FastAPI no threadpool, com as
+  sessões simultâneas limitadas à capacidade do pool de conexões
+
+A latência de rede de um PostgreSQL remoto é simulada com um atraso fixo por
+comando SQL (--latencia-ms), já que o SQLite local responde em microssegundos.
+
+Uso:
+    python benchmark_concorrencia_api.py [--requisicoes 400] [--latencia-ms 5]
+"""
+
+import sys
+import os
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+import logging
+from datetime import date, timedelta
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from api.routers import matches
+from api.security import get_current_api_key
+from Coleta_de_dados.database.config import Base, get_db_manager
+from Coleta_de_dados.database.models import Clube, Competicao, Partida
+
+
+def popular_banco(engine, total: int):
+    """Insere competição, clubes e partidas sintéticas."""
+    with engine.begin() as conn:
+        conn.execute(insert(Competicao), [{"id": 1, "nome": "Série A", "url": "/comps/24"}])
+        conn.execute(insert(Clube), [{"id": i, "nome": f"Clube {i}"} for i in range(1, 21)])
+        conn.execute(insert(Partida), [
+            {
+                "id": i,
+                "competicao_id": 1,
+                "clube_casa_id": random.randint(1, 10),
+                "clube_visitante_id": random.randint(11, 20),
+                "data_partida": date(2024, 1, 1) + timedelta(days=i % 300),
+                "status": "finalizada",
+            }
+            for i in range(1, total + 1)
+        ])
+
+
+def criar_app(Session, bloqueante: bool) -> FastAPI:
+    """Monta a aplicação com o router de partidas e dependências de teste."""
+    app = FastAPI()
+
+    if bloqueante:
+        # A sessão é aberta e fechada no próprio handler: com a dependência
+        # gerador, o fechamento fica agendado no event loop bloqueado e, sob
+        # carga, o pool esgota (timeout de 30 s) antes de qualquer devolução.
+        @app.get("/matches/{match_id}")
+        async def detalhe_bloqueante(match_id: int):
+            with Session() as db:
+                return matches.get_match_details(match_id, api_key="benchmark", db=db)
+    else:
+        app.include_router(matches.router)
+        app.dependency_overrides[get_current_api_key] = lambda: "benchmark"
+    return app
+
+
+async def medir(app: FastAPI, clientes: int, requisicoes: int, total_partidas: int) -> float:
+    """Dispara as requisições com N clientes concorrentes e retorna req/s."""
+    get_db_manager().configurar_concorrencia()
+    fila = asyncio.Queue()
+    for _ in range(requisicoes):
+        fila.put_nowait(random.randint(1, total_partidas))
+
+    transporte = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transporte, base_url="http://bench") as cliente:
+        async def trabalhador():
+            while not fila.empty():
+                partida_id = fila.get_nowait()
+                resposta = await cliente.get(f"/matches/{partida_id}")
+                resposta.raise_for_status()
+
+        inicio = time.perf_counter()
+        await asyncio.gather(*(trabalhador() for _ in range(clientes)))
+        return requisicoes / (time.perf_counter() - inicio)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--partidas", type=int, default=2000)
+    parser.add_argument("--requisicoes", type=int, default=400)
+    parser.add_argument("--latencia-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    random.seed(42)
+    logging.disable(logging.INFO)
+    caminho = os.path.join(tempfile.mkdtemp(), "benchmark_concorrencia.db")
+    engine = create_engine(
+        f"sqlite:///{caminho}",
+        connect_args={"check_same_thread": False},
+        pool_size=get_db_manager().settings.pool_size,
+        max_overflow=get_db_manager().settings.max_overflow,
+    )
+    Base.metadata.create_all(engine)
+    popular_banco(engine, args.partidas)
+
+    if args.latencia_ms:
+        @event.listens_for(engine, "before_cursor_execute")
+        def simular_latencia(*_):
+            time.sleep(args.latencia_ms / 1000)
+
+    Session = sessionmaker(bind=engine, expire_on_commit=False)
+    # Aponta o gerenciador global para o banco do benchmark (usado por get_db)
+    manager = get_db_manager()
+    manager._engine, manager._session_factory = engine, Session
+    apps = {"bloqueante": criar_app(Session, True), "threadpool": criar_app(Session, False)}
+
+    print(f"\n📊 BENCHMARK CONCORRÊNCIA ({args.requisicoes} req, latência {args.latencia_ms} ms/consulta)")
+    print("=" * 52)
+    print(f"{'clientes':>10}{'bloqueante (req/s)':>21}{'threadpool (req/s)':>21}")
+    for clientes in (1, 5, 10, 25, 50, 100):
+        resultados = [
+            asyncio.run(medir(apps[nome], clientes, args.requisicoes, args.partidas))
+            for nome in ("bloqueante", "threadpool")
+        ]
+        print(f"{clientes:>10}{resultados[0]:>21.1f}{resultados[1]:>21.1f}")
+    print("=" * 52)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Benchmark das consultas de partidas da API
+
+Compara o padrão antigo dos endpoints de partidas (uma consulta por
+relacionamento) com a camada de consultas com eager loading:
+- Consultas SQL por requisição no detalhe de uma partida
+- Consultas SQL por página na listagem, variando o tamanho da página
+- Tempo médio por requisição em SQLite em memória
+
+Uso:
+    python benchmark_consultas_partidas.py [--partidas 2000] [--repeticoes 50]
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+from datetime import date, timedelta
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker, lazyload
+from sqlalchemy.pool import StaticPool
+
+from Coleta_de_dados.database.config import Base
+from Coleta_de_dados.database.models import (
+    Partida, EstatisticaPartida, Clube, Competicao
+)
+from Coleta_de_dados.database.queries import (
+    buscar_partida_completa,
+    consultar_partidas_com_relacionamentos,
+    ordenar_partidas_recentes,
+)
+
+
+class ContadorConsultas:
+    """Conta os comandos SQL executados por um engine."""
+
+    def __init__(self, engine):
+        self.total = 0
+        event.listen(engine, "before_cursor_execute", self._contar)
+
+    def _contar(self, *args, **kwargs):
+        self.total += 1
+
+
+def popular_banco(session, total_partidas: int):
+    """Cria competições, clubes, partidas e estatísticas sintéticas."""
+    competicoes = [Competicao(nome=f"Liga {i}", url=f"/comps/{i}") for i in range(10)]
+    clubes = [Clube(nome=f"Clube {i}") for i in range(200)]
+    session.add_all(competicoes + clubes)
+    session.flush()
+
+    inicio = date(2020, 1, 1)
+    for i in range(total_partidas):
+        casa, visitante = random.sample(clubes, 2)
+        partida = Partida(
+            competicao_id=random.choice(competicoes).id,
+            clube_casa_id=casa.id,
+            clube_visitante_id=visitante.id,
+            data_partida=inicio + timedelta(days=i % 1500),
+            temporada="2024-2025",
+            gols_casa=random.randint(0, 4),
+            gols_visitante=random.randint(0, 4),
+            status="finalizada",
+        )
+        partida.estatisticas.append(EstatisticaPartida(
+            xg_casa=random.random() * 3, xg_visitante=random.random() * 3
+        ))
+        session.add(partida)
+    session.commit()
+
+
+def detalhe_antigo(session, partida_id: int):
+    """Reproduz o detalhe de partida antigo: uma consulta por entidade."""
+    match = session.query(Partida).filter(Partida.id == partida_id).first()
+    stats = session.query(EstatisticaPartida).filter(
+        EstatisticaPartida.partida_id == partida_id
+    ).first()
+    casa = session.query(Clube).filter(Clube.id == match.clube_casa_id).first()
+    visitante = session.query(Clube).filter(Clube.id == match.clube_visitante_id).first()
+    competicao = session.query(Competicao).filter(Competicao.id == match.competicao_id).first()
+    return match, stats, casa, visitante, competicao
+
+
+def detalhe_novo(session, partida_id: int):
+    """Detalhe de partida com a camada de consultas (uma consulta)."""
+    match = buscar_partida_completa(session, partida_id)
+    stats = match.estatisticas[0] if match.estatisticas else None
+    return match, stats, match.clube_casa, match.clube_visitante, match.competicao
+
+
+def listagem_antiga(session, tamanho: int):
+    """Listagem sem joins: nomes de clubes e competição via lazy loading."""
+    query = session.query(Partida).filter(Partida.status == "finalizada")
+    query.count()
+    partidas = ordenar_partidas_recentes(query).limit(tamanho).all()
+    return [
+        (p.competicao.nome, p.clube_casa.nome, p.clube_visitante.nome)
+        for p in partidas
+    ]
+
+
+def listagem_nova(session, tamanho: int):
+    """Listagem com competição e clubes carregados no mesmo SELECT."""
+    query = consultar_partidas_com_relacionamentos(session).filter(Partida.status == "finalizada")
+    query.options(lazyload("*")).count()
+    partidas = ordenar_partidas_recentes(query).limit(tamanho).all()
+    return [
+        (p.competicao.nome, p.clube_casa.nome, p.clube_visitante.nome)
+        for p in partidas
+    ]
+
+
+def medir(Session, contador, funcao, argumentos, repeticoes: int):
+    """Executa a função em sessões novas e retorna (consultas/req, ms/req)."""
+    contador.total = 0
+    inicio = time.perf_counter()
+    for i in range(repeticoes):
+        session = Session()
+        try:
+            funcao(session, argumentos[i % len(argumentos)])
+        finally:
+            session.close()
+    duracao = time.perf_counter() - inicio
+    return contador.total / repeticoes, duracao / repeticoes * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--partidas", type=int, default=2000)
+    parser.add_argument("--repeticoes", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(42)
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, expire_on_commit=False)
+
+    with Session() as session:
+        popular_banco(session, args.partidas)
+
+    contador = ContadorConsultas(engine)
+    ids = list(range(1, args.partidas + 1))
+
+    print(f"\n📊 BENCHMARK CONSULTAS DE PARTIDAS ({args.partidas} partidas)")
+    print("=" * 64)
+    print(f"{'cenário':<28}{'antigo q/req':>12}{'novo q/req':>12}{'antigo ms':>10}{'novo ms':>10}")
+
+    q_antigo, ms_antigo = medir(Session, contador, detalhe_antigo, ids, args.repeticoes)
+    q_novo, ms_novo = medir(Session, contador, detalhe_novo, ids, args.repeticoes)
+    print(f"{'detalhe':<28}{q_antigo:>12.1f}{q_novo:>12.1f}{ms_antigo:>10.2f}{ms_novo:>10.2f}")
+
+    for tamanho in (10, 50, 100):
+        q_antigo, ms_antigo = medir(Session, contador, listagem_antiga, [tamanho], args.repeticoes)
+        q_novo, ms_novo = medir(Session, contador, listagem_nova, [tamanho], args.repeticoes)
+        cenario = f"listagem (size={tamanho})"
+        print(f"{cenario:<28}{q_antigo:>12.1f}{q_novo:>12.1f}{ms_antigo:>10.2f}{ms_novo:>10.2f}")
+
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
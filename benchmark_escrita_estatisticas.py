@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark da gravação de estatísticas de jogadores do FBRef
+
+Compara, em um arquivo SQLite local, a gravação de ~30 jogadores por partida:
+- Original: uma conexão, um INSERT OR REPLACE e um commit por jogador
+- Escritor em lote: uma conexão por execução (WAL), um executemany por
+  partida e commit a cada N partidas
+
+Uso:
+    python benchmark_escrita_estatisticas.py [--partidas 300] [--jogadores 30]
+"""
+
+import sys
+import os
+import time
+import sqlite3
+import argparse
+import tempfile
+import logging
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from Coleta_de_dados.apis.fbref.coletar_estatisticas_detalhadas import (
+    ColetorEstatisticas, EscritorEstatisticas, EstatisticasJogador
+)
+
+
+def gerar_partidas(partidas: int, jogadores: int):
+    return [
+        [
+            EstatisticasJogador(
+                partida_id=p, jogador_nome=f"Jogador {j}", time_nome=f"Time {j % 2}",
+                minutos_jogados=90, gols=j % 3, passes_completos=20 + j, passes_pct=81.5
+            )
+            for j in range(jogadores)
+        ]
+        for p in range(partidas)
+    ]
+
+
+def gravar_original(db_path: str, lote):
+    """Reproduz o salvar_estatisticas_jogador original, jogador a jogador."""
+    for jogadores in lote:
+        for stats in jogadores:
+            conn = sqlite3.connect(db_path)
+            try:
+                dados = stats.to_dict()
+                colunas = ', '.join(dados.keys())
+                placeholders = ', '.join(['?'] * len(dados))
+                conn.execute(f"""
+                    INSERT OR REPLACE INTO estatisticas_jogador_partida
+                    ({colunas}, updated_at)
+                    VALUES ({placeholders}, CURRENT_TIMESTAMP)
+                """, tuple(dados.values()))
+                conn.commit()
+            finally:
+                conn.close()
+
+
+def gravar_em_lote(db_path: str, lote, partidas_por_commit: int):
+    with EscritorEstatisticas(db_path, partidas_por_commit) as escritor:
+        for jogadores in lote:
+            escritor.salvar_jogadores(jogadores)
+            escritor.concluir_partida()
+
+
+def medir(gravar, lote, *args) -> float:
+    db_path = os.path.join(tempfile.mkdtemp(), "aposta.db")
+    ColetorEstatisticas(db_path).setup_database_stats()
+    inicio = time.perf_counter()
+    gravar(db_path, lote, *args)
+    tempo = time.perf_counter() - inicio
+    with sqlite3.connect(db_path) as conn:
+        linhas = conn.execute("SELECT COUNT(*) FROM estatisticas_jogador_partida").fetchone()[0]
+    assert linhas == sum(len(jogadores) for jogadores in lote)
+    return tempo
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--partidas", type=int, default=300)
+    parser.add_argument("--jogadores", type=int, default=30)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    lote = gerar_partidas(args.partidas, args.jogadores)
+    total = args.partidas * args.jogadores
+
+    print(f"\n📊 BENCHMARK ESCRITA DE ESTATÍSTICAS ({args.partidas} partidas, "
+          f"{args.jogadores} jogadores/partida)")
+    print("=" * 56)
+    print(f"{'cenário':<30}{'tempo (s)':>12}{'linhas/s':>14}")
+
+    cenarios = (
+        ("original (commit por jogador)", gravar_original, ()),
+        ("lote, commit por partida", gravar_em_lote, (1,)),
+        ("lote, commit a cada 10", gravar_em_lote, (10,)),
+    )
+    for nome, gravar, extras in cenarios:
+        tempo = medir(gravar, lote, *extras)
+        print(f"{nome:<30}{tempo:>12.3f}{total / tempo:>14.0f}")
+    print("=" * 56)
+
+
+if __name__ == "__main__":
+    main()
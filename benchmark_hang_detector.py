@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark do detector de travamentos
+
+Mede o custo por operação rastreada (log_operation_start + log_operation_end)
+com dezenas de milhares de operações em andamento, a partir de várias threads
+como os coletores concorrentes, e o custo do monitor:
+- Original: dicionário + varredura de todas as operações a cada heartbeat,
+  com 4-6 linhas de log INFO por operação
+- Roda de tempo: registro O(1) e, a cada tick, só o slot atual
+
+Os logs vão para /dev/null para medir formatação e handler, sem terminal.
+
+Uso:
+    python benchmark_hang_detector.py [--em-andamento 10000 50000] [--operacoes 20000] [--threads 8]
+"""
+
+import sys
+import os
+import time
+import argparse
+import logging
+import threading
+from datetime import datetime
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from utils.hang_detection_logger import HangDetectionLogger, hang_logger
+
+
+class DetectorOriginal(HangDetectionLogger):
+    """Registro e heartbeat originais (ids com o segundo atual + nome)."""
+
+    def __init__(self):
+        super().__init__()
+        self.active_operations = {}
+        self.timeouts = {}
+
+    def log_operation_start(self, operation_name, details="", timeout_seconds=300, cancel=None):
+        op_id = f"{operation_name}_{int(time.time())}"
+        self.active_operations[op_id] = datetime.now()
+        self.timeouts[op_id] = timeout_seconds
+        hang_logger.info(f"🔄 INICIANDO: {operation_name}")
+        if details:
+            hang_logger.info(f"   Detalhes: {details}")
+        hang_logger.info(f"   Timeout: {timeout_seconds}s")
+        hang_logger.info(f"   ID: {op_id}")
+        return op_id
+
+    def log_operation_end(self, op_id, success=True, details=""):
+        if op_id in self.active_operations:
+            duration = (datetime.now() - self.active_operations[op_id]).total_seconds()
+            hang_logger.info(f"{'✅ CONCLUÍDA' if success else '❌ FALHOU'}: {op_id.split('_')[0]}")
+            hang_logger.info(f"   Duração: {duration:.2f}s")
+            if details:
+                hang_logger.info(f"   Detalhes: {details}")
+            del self.active_operations[op_id]
+            self.timeouts.pop(op_id, None)
+        else:
+            hang_logger.warning(f"⚠️ Tentativa de finalizar operação não registrada: {op_id}")
+
+    def advance(self):
+        """Uma passada do _heartbeat_monitor original."""
+        current_time = datetime.now()
+        for op_id, start_time in list(self.active_operations.items()):
+            duration = (current_time - start_time).total_seconds()
+            if duration > self.timeouts.get(op_id, 300):
+                del self.active_operations[op_id]
+        return []
+
+
+def preencher(detector, quantidade):
+    if isinstance(detector, DetectorOriginal):
+        # Com o id original as operações do mesmo segundo colidem; ids únicos simulam o volume real
+        agora = datetime.now()
+        for i in range(quantidade):
+            detector.active_operations[f"HTTP_REQUEST_{i}"] = agora
+            detector.timeouts[f"HTTP_REQUEST_{i}"] = 300
+    else:
+        for i in range(quantidade):
+            detector.log_operation_start("HTTP_REQUEST", f"URL: https://fbref.com/{i}", 300)
+
+
+def custo_por_operacao(detector, operacoes, threads):
+    barreira = threading.Barrier(threads + 1)
+
+    def coletor():
+        barreira.wait()
+        for i in range(operacoes // threads):
+            op_id = detector.log_http_request_start(f"https://fbref.com/en/matches/{i}", 30)
+            detector.log_http_request_end(op_id, 200)
+
+    trabalhadores = [threading.Thread(target=coletor) for _ in range(threads)]
+    for t in trabalhadores:
+        t.start()
+    barreira.wait()
+    inicio = time.perf_counter()
+    for t in trabalhadores:
+        t.join()
+    return (time.perf_counter() - inicio) / operacoes * 1e6
+
+
+def custo_do_monitor(detector, passadas=20):
+    inicio = time.perf_counter()
+    for _ in range(passadas):
+        detector.advance()
+    return (time.perf_counter() - inicio) / passadas * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--em-andamento", type=int, nargs="+", default=[0, 10000, 50000])
+    parser.add_argument("--operacoes", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    hang_logger.handlers = [logging.StreamHandler(open(os.devnull, "w"))]
+    hang_logger.setLevel(logging.INFO)
+
+    resultados = []
+    for em_andamento in args.em_andamento:
+        for nome, classe in (("original", DetectorOriginal), ("roda de tempo", HangDetectionLogger)):
+            detector = classe()
+            preencher(detector, em_andamento)
+            por_operacao = custo_por_operacao(detector, args.operacoes, args.threads)
+            monitor = custo_do_monitor(detector)
+            resultados.append((em_andamento, nome, por_operacao, monitor, len(detector.active_operations)))
+
+    print(f"\n📊 BENCHMARK DETECTOR DE TRAVAMENTOS ({args.operacoes} operações em {args.threads} threads)")
+    print("=" * 80)
+    print(f"{'em andamento':>12}  {'detector':<16}{'µs/operação':>14}{'monitor (ms/tick)':>20}{'ativas':>12}")
+    for em_andamento, nome, por_operacao, monitor, ativas in resultados:
+        print(f"{em_andamento:>12}  {nome:<16}{por_operacao:>14.1f}{monitor:>20.3f}{ativas:>12}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
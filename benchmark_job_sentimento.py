@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark do job incremental de análise de sentimento
+
+Compara, sobre um banco SQLite sintético com notícias e posts pendentes:
+- Loop original: fetchall de todos os pendentes e um UPDATE por linha
+- JobSentimento com 1 processo: lotes por keyset e executemany
+- JobSentimento com N processos: lotes pontuados em paralelo
+- Reexecução do job: a marca d'água evita reler o que já foi analisado
+
+Uso:
+    python benchmark_job_sentimento.py [--noticias 4000] [--posts 4000] [--processos N] [--modelo TextBlob]
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import logging
+import sqlite3
+import tempfile
+from datetime import datetime
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from Coleta_de_dados.analise.job_sentimento import MODELO_PT, MODELO_TEXTBLOB, JobSentimento, _pontuador
+
+PALAVRAS = ("vitória gol excelente ótimo derrota crise fracasso péssimo time jogo técnico torcida "
+            "great win loss bad good match season coach fans very not").split()
+
+
+def criar_banco(caminho, noticias, posts, semente=42):
+    aleatorio = random.Random(semente)
+
+    def frase(n):
+        return " ".join(aleatorio.choice(PALAVRAS) for _ in range(n))
+
+    conn = sqlite3.connect(caminho)
+    conn.executescript("""
+        CREATE TABLE noticias_clubes (
+            id INTEGER PRIMARY KEY, clube_id INTEGER, titulo TEXT, resumo TEXT, conteudo_completo TEXT,
+            sentimento TEXT, score_sentimento REAL, sentimento_geral REAL,
+            confianca_sentimento REAL, polaridade TEXT, analisado_em TIMESTAMP,
+            modelo_analise TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP
+        );
+        CREATE TABLE posts_redes_sociais (
+            id INTEGER PRIMARY KEY, clube_id INTEGER, conteudo TEXT, sentimento TEXT,
+            score_sentimento REAL, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP
+        );
+    """)
+    conn.executemany("INSERT INTO noticias_clubes (clube_id, titulo, resumo, conteudo_completo) VALUES (?, ?, ?, ?)",
+                     [(aleatorio.randint(1, 20), frase(8), frase(25), frase(150)) for _ in range(noticias)])
+    conn.executemany("INSERT INTO posts_redes_sociais (clube_id, conteudo) VALUES (?, ?)",
+                     [(aleatorio.randint(1, 20), frase(30)) for _ in range(posts)])
+    conn.commit()
+    conn.close()
+
+
+def loop_original(caminho, modelo):
+    """Comportamento anterior de analisar_sentimento_textos (fetchall + UPDATE por linha)."""
+    pontuar = _pontuador(modelo)
+    conn = sqlite3.connect(caminho)
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, titulo, resumo, conteudo_completo FROM noticias_clubes "
+                   "WHERE sentimento IS NULL OR score_sentimento IS NULL")
+    noticias = cursor.fetchall()
+    cursor.execute("SELECT id, conteudo FROM posts_redes_sociais WHERE sentimento IS NULL OR score_sentimento IS NULL")
+    posts = cursor.fetchall()
+    total = 0
+    for noticia_id, titulo, resumo, conteudo in noticias:
+        texto = f"{titulo or ''} {resumo or ''} {conteudo or ''}".strip()
+        (sentimento, score, confianca), = pontuar([texto])
+        cursor.execute("""
+            UPDATE noticias_clubes SET sentimento = ?, score_sentimento = ?, sentimento_geral = ?,
+                confianca_sentimento = ?, polaridade = ?, analisado_em = ?, modelo_analise = ?,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, (sentimento, score, score, confianca, sentimento, datetime.now(), modelo, noticia_id))
+        total += 1
+    for post_id, conteudo in posts:
+        (sentimento, score, _), = pontuar([conteudo])
+        cursor.execute("UPDATE posts_redes_sociais SET sentimento = ?, score_sentimento = ?, "
+                       "updated_at = CURRENT_TIMESTAMP WHERE id = ?", (sentimento, score, post_id))
+        total += 1
+    conn.commit()
+    conn.close()
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--noticias", type=int, default=4000)
+    parser.add_argument("--posts", type=int, default=4000)
+    parser.add_argument("--processos", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--tamanho-lote", type=int, default=500)
+    parser.add_argument("--modelo", choices=(MODELO_TEXTBLOB, MODELO_PT), default=MODELO_TEXTBLOB)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    _pontuador(args.modelo)(["aquecimento"])
+    diretorio = tempfile.mkdtemp()
+
+    def banco(nome):
+        caminho = os.path.join(diretorio, f"{nome}.db")
+        criar_banco(caminho, args.noticias, args.posts)
+        return caminho
+
+    resultados = []
+    caminho = banco("original")
+    inicio = time.perf_counter()
+    total = loop_original(caminho, args.modelo)
+    resultados.append(("loop original", total, time.perf_counter() - inicio))
+
+    for processos in sorted({1, args.processos}):
+        job = JobSentimento(banco(f"job_{processos}"), args.modelo, args.tamanho_lote, processos)
+        resumo = job.executar()
+        resultados.append((f"job - {processos} processo(s)", resumo['total'], resumo['segundos']))
+    resumo = job.executar()
+    resultados.append(("job - reexecução", resumo['total'], resumo['segundos']))
+
+    print(f"\n📊 BENCHMARK JOB DE SENTIMENTO ({args.noticias} notícias + {args.posts} posts, "
+          f"modelo {args.modelo}, lote {args.tamanho_lote})")
+    print("=" * 66)
+    print(f"{'cenário':<28}{'itens':>10}{'tempo (s)':>12}{'itens/s':>14}")
+    for nome, itens, segundos in resultados:
+        print(f"{nome:<28}{itens:>10}{segundos:>12.2f}{itens / segundos if segundos else 0:>14.0f}")
+    print("=" * 66)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark do pipeline de logs do CentralizedLogger
+
+Mede chamadas de log por segundo, com o padrão dos scrapers (vários logs
+INFO/DEBUG por requisição, com dados e tempo de execução):
+- Síncrono original: LogEntry + json.dumps(asdict(...)), escrita, estatísticas
+  e alertas na thread que chama log()
+- Síncrono atual: mesmo fluxo com a serialização pré-montada
+- Pipeline assíncrono: log() só enfileira; a thread escritora faz o resto.
+  Mede a rajada vista por quem chama e o total até o flush()
+
+Uso:
+    python benchmark_logger_centralizado.py [--logs 20000] [--rajada 5000] [--amostragem-debug 0.1] [--console]
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import logging
+import tempfile
+from dataclasses import asdict
+from datetime import datetime
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from Coleta_de_dados.utils.logger_centralizado import CentralizedLogger, LogEntry
+
+
+class LoggerOriginal(CentralizedLogger):
+    """log() original: tudo na thread que chama."""
+
+    def log(self, level, module, function, message, data=None, execution_time=None, api_status=None):
+        if data is None:
+            data = {}
+        log_entry = LogEntry(
+            timestamp=datetime.now().isoformat(), level=level.upper(), module=module, function=function,
+            message=message, data=data, execution_time=execution_time, api_status=api_status
+        )
+        log_method = getattr(self.logger, level.lower(), self.logger.info)
+        log_method(json.dumps(asdict(log_entry), ensure_ascii=False))
+        self._update_stats(log_entry)
+        self._check_alerts(log_entry)
+
+
+def logs_de_requisicao(logger, quantidade):
+    """Padrão de um scraper: DEBUG antes, INFO com dados e tempo depois."""
+    for i in range(quantidade // 2):
+        url = f"https://fbref.com/en/matches/{i:08x}/Match-Report"
+        logger.log("DEBUG", "fbref_utils", "fazer_requisicao", f"Requisitando {url}", {"tentativa": 1})
+        logger.log("INFO", "fbref_utils", "fazer_requisicao", "Página obtida",
+                   {"url": url, "status": 200, "bytes": 185000}, execution_time=0.42, api_status="ok")
+
+
+def medir(classe, quantidade, **opcoes):
+    # Cada instância adiciona handlers ao logger "apostapro"; começa sem os anteriores
+    logging.getLogger("apostapro").handlers = []
+    logger = classe(log_dir=tempfile.mkdtemp(), **opcoes)
+    inicio = time.perf_counter()
+    logs_de_requisicao(logger, quantidade)
+    chamador = time.perf_counter() - inicio
+    logger.flush()
+    total = time.perf_counter() - inicio
+    logger.close()
+    return quantidade / chamador, quantidade / total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logs", type=int, default=20000, help="logs na medição contínua")
+    parser.add_argument("--rajada", type=int, default=5000, help="logs numa rajada (menor que a fila)")
+    parser.add_argument("--amostragem-debug", type=float, default=0.1)
+    parser.add_argument("--console", action="store_true", help="inclui o handler de console (ENVIRONMENT=dev)")
+    args = parser.parse_args()
+
+    os.environ["ENVIRONMENT"] = "dev" if args.console else "benchmark"
+    saida_erro = sys.stderr
+    if args.console:
+        sys.stderr = open(os.devnull, "w")
+
+    cenarios = (
+        ("síncrono original", LoggerOriginal, {"async_pipeline": False}),
+        ("síncrono atual", CentralizedLogger, {"async_pipeline": False}),
+        ("pipeline assíncrono", CentralizedLogger, {}),
+        (f"assíncrono + DEBUG {args.amostragem_debug:.0%}", CentralizedLogger,
+         {"debug_sample_rate": args.amostragem_debug}),
+    )
+    resultados = []
+    for nome, classe, opcoes in cenarios:
+        rajada, _ = medir(classe, args.rajada, **opcoes)
+        chamador, total = medir(classe, args.logs, **opcoes)
+        resultados.append((nome, rajada, chamador, total))
+
+    sys.stderr = saida_erro
+    print(f"\n📊 BENCHMARK LOGGER CENTRALIZADO (logs/s; rajada de {args.rajada}, contínuo {args.logs}"
+          f"{', com console' if args.console else ''})")
+    print("=" * 90)
+    print(f"{'cenário':<30}{'rajada (chamador)':>19}{'contínuo (chamador)':>21}{'contínuo (total)':>20}")
+    for nome, rajada, chamador, total in resultados:
+        print(f"{nome:<30}{rajada:>19.0f}{chamador:>21.0f}{total:>20.0f}")
+    print("=" * 90)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark da paginação offset vs cursor (keyset)
+
+Mede o tempo por página da listagem de notícias em profundidades crescentes:
+- offset: COUNT(*) + OFFSET (page-1)*size, comportamento original
+- cursor: keyset sobre (data_publicacao, id) sem contagem
+
+Uso:
+    python benchmark_paginacao.py [--noticias 200000] [--size 50]
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from api.pagination import ChaveOrdenacao, ParametrosPaginacao, paginar
+from Coleta_de_dados.database.config import Base
+from Coleta_de_dados.database.models import Clube, NoticiaClube
+
+
+def popular_banco(engine, total: int):
+    """Insere clubes e notícias sintéticas em lote."""
+    inicio = datetime(2023, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(Clube), [{"id": i, "nome": f"Clube {i}"} for i in range(1, 101)])
+        lote = []
+        for i in range(total):
+            lote.append({
+                "clube_id": random.randint(1, 100),
+                "titulo": f"Notícia {i}",
+                "url_noticia": f"https://exemplo.com/noticia/{i}",
+                "fonte": random.choice(["GE", "UOL", "ESPN"]),
+                "data_publicacao": inicio + timedelta(minutes=random.randint(0, 900_000)),
+            })
+            if len(lote) == 10_000:
+                conn.execute(insert(NoticiaClube), lote)
+                lote = []
+        if lote:
+            conn.execute(insert(NoticiaClube), lote)
+
+
+def medir_offset(Session, chave, page: int, size: int) -> float:
+    params = ParametrosPaginacao(paginacao="offset", cursor=None, contagem=None)
+    with Session() as session:
+        inicio = time.perf_counter()
+        pagina = paginar(session.query(NoticiaClube), params, page, size, chave)
+        pagina.resultados(pagina.query.all())
+        return (time.perf_counter() - inicio) * 1000
+
+
+def cursores_por_pagina(Session, chave, paginas_alvo, size: int) -> dict:
+    """Percorre a listagem por cursor e guarda o cursor de cada página alvo."""
+    cursores, cursor, page = {}, None, 1
+    ultima = max(paginas_alvo)
+    with Session() as session:
+        while page <= ultima:
+            if page in paginas_alvo:
+                cursores[page] = cursor
+            params = ParametrosPaginacao(paginacao="cursor", cursor=cursor, contagem=None)
+            pagina = paginar(session.query(NoticiaClube.id, NoticiaClube.data_publicacao), params, page, size, chave)
+            pagina.resultados(pagina.query.all())
+            cursor = pagina.next_cursor
+            page += 1
+    return cursores
+
+
+def medir_cursor(Session, chave, cursor, size: int) -> float:
+    params = ParametrosPaginacao(paginacao="cursor", cursor=cursor, contagem=None)
+    with Session() as session:
+        inicio = time.perf_counter()
+        pagina = paginar(session.query(NoticiaClube), params, 1, size, chave)
+        pagina.resultados(pagina.query.all())
+        return (time.perf_counter() - inicio) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--noticias", type=int, default=200_000)
+    parser.add_argument("--size", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(42)
+    caminho = os.path.join(tempfile.mkdtemp(), "benchmark_paginacao.db")
+    engine = create_engine(f"sqlite:///{caminho}")
+    Base.metadata.create_all(engine)
+    popular_banco(engine, args.noticias)
+    Session = sessionmaker(bind=engine)
+
+    chave = ChaveOrdenacao(NoticiaClube.id, NoticiaClube.data_publicacao, descendente=True)
+    total_paginas = args.noticias // args.size
+    paginas = sorted({1, 10, 100, total_paginas // 4, total_paginas // 2, total_paginas})
+    cursores = cursores_por_pagina(Session, chave, set(paginas), args.size)
+
+    print(f"\n📊 BENCHMARK PAGINAÇÃO ({args.noticias} notícias, size={args.size})")
+    print("=" * 52)
+    print(f"{'página':>10}{'offset (ms)':>20}{'cursor (ms)':>20}")
+    for page in paginas:
+        ms_offset = min(medir_offset(Session, chave, page, args.size) for _ in range(3))
+        ms_cursor = min(medir_cursor(Session, chave, cursores[page], args.size) for _ in range(3))
+        print(f"{page:>10}{ms_offset:>20.2f}{ms_cursor:>20.2f}")
+    print("=" * 52)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark do parser de match reports do FBRef
+
+Mede o tempo de parsing por página das tabelas de jogadores:
+- BeautifulSoup (comportamento original): parse da página, reparse com o
+  conteúdo dos comentários e busca linha a linha (find/find_all por jogador)
+- lxml em uma passada (parser_match_report): tabelas indexadas por id e
+  data-stat uma única vez, inclusive as de comentários
+
+Usa os arquivos "Match Report" de htmls/; se forem ponteiros do git-lfs, usa
+páginas sintéticas com as mesmas tabelas (visíveis e dentro de comentários).
+
+Uso:
+    python benchmark_parser_match_report.py [--repeticoes 5]
+"""
+
+import sys
+import os
+import re
+import time
+import argparse
+import logging
+import statistics
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from bs4 import BeautifulSoup
+
+from benchmark_coleta_pipeline import carregar_match_reports, gerar_match_report
+from Coleta_de_dados.apis.fbref.coletar_estatisticas_detalhadas import ColetorEstatisticas
+from Coleta_de_dados.apis.fbref.fbref_utils import processar_soup_com_comentarios
+
+
+class ColetorBS4(ColetorEstatisticas):
+    """Extração original: find/find_all do BeautifulSoup para cada jogador."""
+
+    def extrair_match_report(self, soup, partida_id):
+        jogadores = []
+        times_mapeados = {}
+        for caption in soup.select("table[id*='_summary'] caption"):
+            if caption.parent:
+                id_base = caption.parent['id'].replace('_summary', '')
+                time_nome = caption.get_text().replace(" Player Stats Table", "").strip()
+                if time_nome:
+                    times_mapeados[id_base] = time_nome
+        if not times_mapeados:
+            return None
+
+        for id_base, time_nome in times_mapeados.items():
+            tabelas = {
+                'sum': soup.find('table', id=f'{id_base}_summary'),
+                'pass': soup.find('table', id=f'{id_base}_passing'),
+                'pass_types': soup.find('table', id=f'{id_base}_passing_types'),
+                'def': soup.find('table', id=f'{id_base}_defense'),
+                'poss': soup.find('table', id=f'{id_base}_possession'),
+                'misc': soup.find('table', id=f'{id_base}_misc')
+            }
+            if not all(tabelas.values()):
+                continue
+            tbody_sum = tabelas['sum'].find('tbody')
+            if not tbody_sum:
+                continue
+            for i, linha_sum in enumerate(tbody_sum.find_all('tr')):
+                linhas_outras = {}
+                for tipo, tabela in tabelas.items():
+                    if tipo != 'sum':
+                        todas_linhas = tabela.find('tbody').find_all('tr')
+                        linhas_outras[tipo] = todas_linhas[i] if i < len(todas_linhas) else None
+                if None in linhas_outras.values():
+                    continue
+                stats_jogador = self.extrair_estatisticas_jogador(
+                    linha_sum, linhas_outras['pass'], linhas_outras['pass_types'], linhas_outras['def'],
+                    linhas_outras['poss'], linhas_outras['misc'], partida_id, time_nome
+                )
+                if stats_jogador:
+                    jogadores.append(stats_jogador)
+        return jogadores
+
+
+def comentar_tabelas(html: str) -> str:
+    """Move todas as tabelas para dentro de comentários, como o FBRef faz em várias páginas."""
+    return re.sub(r'(<table.*?</table>)', r'<div class="placeholder"><!--\n\1\n--></div>', html, flags=re.S)
+
+
+def parse_bs4(coletor, html):
+    soup = processar_soup_com_comentarios(BeautifulSoup(html, 'lxml'))
+    return coletor.extrair_match_report(soup, 1) or []
+
+
+def parse_lxml(coletor, html):
+    return coletor.extrair_match_report_html(html, 1) or []
+
+
+def medir(funcao, coletor, paginas, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        for html in paginas:
+            inicio = time.perf_counter()
+            jogadores = funcao(coletor, html)
+            tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.mean(tempos), max(tempos), len(jogadores)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--jogadores", type=int, default=16, help="jogadores por time nas páginas sintéticas")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    paginas = carregar_match_reports()
+    conjuntos = [("htmls/ (salvas)", paginas)] if paginas else []
+    if not paginas:
+        sinteticas = [gerar_match_report(i, args.jogadores) for i in range(5)]
+        conjuntos = [("sintéticas visíveis", sinteticas),
+                     ("sintéticas em comentários", [comentar_tabelas(html) for html in sinteticas])]
+
+    coletor_bs4, coletor = ColetorBS4(":memory:"), ColetorEstatisticas(":memory:")
+    print(f"\n📊 BENCHMARK PARSER DE MATCH REPORTS ({args.repeticoes} repetições por página)")
+    print("=" * 82)
+    print(f"{'páginas':<28}{'parser':<10}{'KB':>8}{'média (ms)':>12}{'máx (ms)':>12}{'jogadores':>12}")
+    for nome, htmls in conjuntos:
+        tamanho = sum(len(html) for html in htmls) // len(htmls) // 1024
+        for rotulo, funcao, instancia in (("bs4", parse_bs4, coletor_bs4), ("lxml", parse_lxml, coletor)):
+            media, maximo, jogadores = medir(funcao, instancia, htmls, args.repeticoes)
+            print(f"{nome:<28}{rotulo:<10}{tamanho:>8}{media:>12.1f}{maximo:>12.1f}{jogadores:>12}")
+    print("=" * 82)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark da preparação do dataset de treinamento (PreparadorDadosML)
+
+Compara, sobre um banco SQLite sintético, a implementação original (uma
+consulta de confrontos e um dicionário de features por partida, via iterrows)
+com o pipeline em lote (histórico de confrontos em uma consulta e janelas
+calculadas por par de clubes):
+- Tempo total e consultas SQL executadas
+- Igualdade dos DataFrames produzidos (colunas, tipos e valores)
+
+O sentimento é fornecido diretamente (as consultas usam MODE() do PostgreSQL).
+
+Uso:
+    python benchmark_preparacao_dados.py [--partidas 20000] [--clubes 400]
+"""
+
+import sys
+import os
+import argparse
+import tempfile
+import logging
+from datetime import datetime, timedelta
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+import pandas as pd
+
+from ml_models.preparacao_dados import PreparadorDadosML
+from tests.unit.ml_models.referencia_preparacao_dados import PreparadorOriginal, criar_banco, executar
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--partidas", type=int, default=20_000)
+    parser.add_argument("--clubes", type=int, default=400)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    engine, Sessao, sentimento = criar_banco(
+        os.path.join(tempfile.mkdtemp(), "bench.db"), args.partidas, args.clubes
+    )
+    # Dataset dos últimos 2 anos; o histórico de confrontos usa todo o período
+    data_inicio = datetime.now() - timedelta(days=730)
+
+    print(f"\n📊 BENCHMARK PREPARAÇÃO DE DADOS ({args.partidas} partidas, {args.clubes} clubes)")
+    print("=" * 66)
+    print(f"{'implementação':<24}{'tempo (s)':>12}{'consultas':>12}{'linhas':>9}{'colunas':>9}")
+    resultados = {}
+    for nome, classe in (("original (por partida)", PreparadorOriginal), ("lote", PreparadorDadosML)):
+        tempo, consultas, dataset = executar(classe, Sessao, engine, sentimento, data_inicio)
+        resultados[nome] = dataset
+        print(f"{nome:<24}{tempo:>12.2f}{consultas:>12}{dataset.shape[0]:>9}{dataset.shape[1]:>9}")
+    print("=" * 66)
+
+    original, lote = resultados.values()
+    pd.testing.assert_frame_equal(original, lote)
+    print(f"DataFrames idênticos (colunas, tipos e valores); "
+          f"{(lote['historico_empates'] + lote['historico_vitorias_clube_referencia'] + lote['historico_derrotas_clube_referencia'] > 0).mean():.0%} "
+          f"das partidas com histórico de confrontos")
+
+
+if __name__ == "__main__":
+    main()
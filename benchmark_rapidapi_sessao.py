@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark da sessão HTTP compartilhada das APIs RapidAPI
+
+Compara, contra um servidor HTTP local que simula a RapidAPI:
+- Sessão por requisição (comportamento original) x sessão compartilhada com
+  keep-alive: tempo total, requisições/s e conexões TCP abertas
+- Rajada de chamadas concorrentes para a mesma cache_key: chamadas ao
+  servidor sem e com agrupamento (single-flight)
+
+O servidor local não usa TLS; contra a RapidAPI real cada conexão nova também
+paga o handshake TLS, então a diferença tende a ser maior.
+
+Uso:
+    python benchmark_rapidapi_sessao.py [--requisicoes 1000] [--concorrencia 20] [--rajada 200]
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+import logging
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+import aiohttp
+from aiohttp import web
+
+from Coleta_de_dados.apis.rapidapi.base_rapidapi import (
+    RapidAPIBase, RapidAPIConfig, fechar_sessoes_http
+)
+
+
+class APIBenchmark(RapidAPIBase):
+    async def coletar_jogos(self, **kwargs):
+        return []
+
+    async def coletar_jogadores(self, **kwargs):
+        return []
+
+    async def coletar_ligas(self, **kwargs):
+        return []
+
+    async def coletar_estatisticas(self, **kwargs):
+        return []
+
+    async def coletar_odds(self, **kwargs):
+        return []
+
+    async def coletar_noticias(self, **kwargs):
+        return []
+
+
+class APISessaoPorRequisicao(APIBenchmark):
+    """Implementação original: uma ClientSession nova por requisição, sem agrupamento."""
+
+    async def _make_request(self, url, params=None, headers=None, cache_key=None, cache_ttl=3600):
+        if cache_key:
+            cached_data = self._cache.get(cache_key)
+            if cached_data is not None:
+                return cached_data
+        headers = {"X-RapidAPI-Key": self._get_next_api_key(), "X-RapidAPI-Host": self.config.host}
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.config.timeout)) as session:
+            async with session.get(url, params=params, headers=headers) as response:
+                data = await response.json()
+                self._update_request_counts()
+                if cache_key:
+                    self._cache.set(cache_key, data, cache_ttl)
+                return data
+
+
+class ServidorStub:
+    """Servidor local com latência fixa que conta chamadas e conexões."""
+
+    def __init__(self, latencia: float):
+        self.latencia = latencia
+        self.chamadas = 0
+        self.conexoes = set()
+
+    async def tratar(self, request):
+        self.chamadas += 1
+        self.conexoes.add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(self.latencia)
+        return web.json_response({"response": [{"id": 1, "caminho": request.path}]})
+
+    async def iniciar(self) -> str:
+        app = web.Application()
+        app.router.add_get("/{caminho:.*}", self.tratar)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    def zerar(self):
+        self.chamadas = 0
+        self.conexoes = set()
+
+
+def criar_config() -> RapidAPIConfig:
+    return RapidAPIConfig(
+        nome="Benchmark", host="benchmark.p.rapidapi.com", endpoint_base="",
+        chaves=["chave"], limite_requisicoes_dia=10**9, limite_requisicoes_minuto=10**9,
+        retry_attempts=1, max_conexoes=100
+    )
+
+
+async def medir_vazao(api, url: str, requisicoes: int, concorrencia: int) -> float:
+    semaforo = asyncio.Semaphore(concorrencia)
+
+    async def uma(i):
+        async with semaforo:
+            await api._make_request(f"{url}/fixtures/{i}", cache_key=f"fixtures:{i}")
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(uma(i) for i in range(requisicoes)))
+    return time.perf_counter() - inicio
+
+
+async def medir_rajada(api, url: str, rajada: int) -> float:
+    inicio = time.perf_counter()
+    await asyncio.gather(*(api._make_request(f"{url}/odds", cache_key="odds") for _ in range(rajada)))
+    return time.perf_counter() - inicio
+
+
+async def principal(args):
+    servidor = ServidorStub(args.latencia / 1000)
+    url = await servidor.iniciar()
+
+    print(f"\n📊 BENCHMARK SESSÃO HTTP RAPIDAPI ({args.requisicoes} requisições, "
+          f"concorrência {args.concorrencia}, latência {args.latencia} ms)")
+    print("=" * 74)
+    print(f"{'cenário':<34}{'tempo (s)':>10}{'req/s':>10}{'conexões':>10}{'chamadas':>10}")
+
+    for nome, classe in (("sessão por requisição", APISessaoPorRequisicao),
+                         ("sessão compartilhada", APIBenchmark)):
+        servidor.zerar()
+        tempo = await medir_vazao(classe(criar_config()), url, args.requisicoes, args.concorrencia)
+        print(f"{nome:<34}{tempo:>10.2f}{args.requisicoes / tempo:>10.0f}"
+              f"{len(servidor.conexoes):>10}{servidor.chamadas:>10}")
+
+    for nome, classe in (("rajada mesma chave (original)", APISessaoPorRequisicao),
+                         ("rajada mesma chave (agrupada)", APIBenchmark)):
+        servidor.zerar()
+        tempo = await medir_rajada(classe(criar_config()), url, args.rajada)
+        print(f"{nome:<34}{tempo:>10.2f}{'-':>10}{len(servidor.conexoes):>10}{servidor.chamadas:>10}")
+
+    print("=" * 74)
+    await fechar_sessoes_http()
+    await servidor.runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requisicoes", type=int, default=1000)
+    parser.add_argument("--concorrencia", type=int, default=20)
+    parser.add_argument("--rajada", type=int, default=200)
+    parser.add_argument("--latencia", type=float, default=5.0, help="latência do servidor em ms")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    asyncio.run(principal(args))
+
+
+if __name__ == "__main__":
+    main()
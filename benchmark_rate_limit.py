@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark do rate limiting da API
+
+Compara, com 10k clientes distintos e tráfego concentrado em poucos clientes
+(distribuição de Zipf), o limiter original (lista de datetimes por cliente)
+com o contador de janela deslizante:
+- Tempo por requisição (is_rate_limited + get_rate_limit_info, como no middleware)
+- Memória ocupada pelos contadores
+- Chaves retidas após todos os clientes ficarem ociosos
+
+Uso:
+    python benchmark_rate_limit.py [--clientes 10000] [--requisicoes 200000]
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import tempfile
+import logging
+import tracemalloc
+from datetime import datetime
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from api.config import get_api_settings
+from api.security import MemoryRateLimitBackend, RateLimitMiddleware, SQLiteRateLimitBackend
+
+
+class RateLimitListas:
+    """Implementação original: lista de datetimes reconstruída a cada requisição."""
+
+    def __init__(self):
+        self.requests = {}
+        self.settings = get_api_settings()
+
+    def is_rate_limited(self, client_ip, api_key=None):
+        now = datetime.now()
+        key = f"{client_ip}:{api_key}" if api_key else client_ip
+        if key in self.requests:
+            self.requests[key] = [
+                req_time for req_time in self.requests[key]
+                if (now - req_time).seconds < self.settings.api_rate_limit_period
+            ]
+        else:
+            self.requests[key] = []
+        if len(self.requests[key]) >= self.settings.api_rate_limit:
+            return True
+        self.requests[key].append(now)
+        return False
+
+    def get_rate_limit_info(self, client_ip, api_key=None):
+        key = f"{client_ip}:{api_key}" if api_key else client_ip
+        current_requests = len(self.requests.get(key, []))
+        return {
+            "limit": self.settings.api_rate_limit,
+            "remaining": max(0, self.settings.api_rate_limit - current_requests),
+        }
+
+
+class Relogio:
+    """Relógio controlado pelo benchmark para simular a passagem do tempo."""
+
+    def __init__(self):
+        self.agora = time.time()
+
+    def __call__(self):
+        return self.agora
+
+
+def gerar_trafego(clientes: int, requisicoes: int) -> list:
+    ips = [f"10.{i // 65536}.{(i // 256) % 256}.{i % 256}" for i in range(clientes)]
+    pesos = [1 / (i + 1) for i in range(clientes)]
+    # Garante que todos os clientes apareçam ao menos uma vez
+    return ips + random.choices(ips, weights=pesos, k=max(0, requisicoes - clientes))
+
+
+def medir_novo(limiter, trafego) -> float:
+    inicio = time.perf_counter()
+    for ip in trafego:
+        limiter.verificar(ip)
+    return (time.perf_counter() - inicio) / len(trafego) * 1e6
+
+
+def medir_antigo(limiter, trafego) -> float:
+    inicio = time.perf_counter()
+    for ip in trafego:
+        limiter.is_rate_limited(ip)
+        limiter.get_rate_limit_info(ip)
+    return (time.perf_counter() - inicio) / len(trafego) * 1e6
+
+
+def medir_memoria(criar, medir, trafego) -> float:
+    """Memória (MB) retida pelos contadores após processar o tráfego."""
+    tracemalloc.start()
+    limiter = criar()
+    medir(limiter, trafego)
+    memoria = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+    return memoria
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clientes", type=int, default=10_000)
+    parser.add_argument("--requisicoes", type=int, default=200_000)
+    parser.add_argument("--requisicoes-sqlite", type=int, default=20_000)
+    args = parser.parse_args()
+
+    random.seed(42)
+    logging.disable(logging.WARNING)
+    trafego = gerar_trafego(args.clientes, args.requisicoes)
+    settings = get_api_settings()
+
+    print(f"\n📊 BENCHMARK RATE LIMIT ({args.clientes} clientes, {len(trafego)} requisições, "
+          f"{settings.api_rate_limit}/{settings.api_rate_limit_period}s)")
+    print("=" * 70)
+    print(f"{'implementação':<26}{'µs/req':>10}{'memória (MB)':>16}{'chaves ociosas':>18}")
+
+    antigo = RateLimitListas()
+    us = medir_antigo(antigo, trafego)
+    memoria = medir_memoria(RateLimitListas, medir_antigo, trafego)
+    # A implementação original nunca remove chaves de clientes ociosos
+    print(f"{'listas (original)':<26}{us:>10.2f}{memoria:>16.2f}{len(antigo.requests):>18}")
+
+    relogio = Relogio()
+    backend = MemoryRateLimitBackend()
+    novo = RateLimitMiddleware(backend=backend, relogio=relogio)
+    us = medir_novo(novo, trafego)
+    memoria = medir_memoria(
+        lambda: RateLimitMiddleware(backend=MemoryRateLimitBackend(), relogio=Relogio()),
+        medir_novo, trafego
+    )
+    relogio.agora += 3 * settings.api_rate_limit_period
+    novo.verificar("127.0.0.1")
+    print(f"{'janela deslizante/memória':<26}{us:>10.2f}{memoria:>16.2f}{len(backend.estados) - 1:>18}")
+
+    caminho = os.path.join(tempfile.mkdtemp(), "rate_limit.db")
+    sqlite = RateLimitMiddleware(backend=SQLiteRateLimitBackend(caminho), relogio=Relogio())
+    us = medir_novo(sqlite, trafego[:args.requisicoes_sqlite])
+    print(f"{'janela deslizante/sqlite':<26}{us:>10.2f}{'-':>16}{'-':>18}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark da geração de recomendações em lote
+
+Gera e grava as recomendações de uma rodada de fim de semana de várias ligas
+(modelos treinados sintéticos, histórico de partidas, notícias e posts em um
+SQLite temporário):
+- Por partida (comportamento original): iterrows, consulta de confrontos,
+  DataFrame de uma linha e uma predição por mercado para cada partida; um
+  INSERT por recomendação
+- Vetorizada (gerar_recomendacoes_lote): matriz de features de todas as
+  partidas, confrontos em uma consulta, uma predição por modelo e um único
+  upsert
+
+Uso:
+    python benchmark_recomendacoes_lote.py [--ligas 20] [--clubes 20] [--temporadas 3]
+"""
+
+import sys
+import os
+import time
+import pickle
+import argparse
+import logging
+import tempfile
+from datetime import date, datetime, timedelta
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from Coleta_de_dados.database.config import Base
+from Coleta_de_dados.database.models import (
+    Clube, Competicao, NoticiaClube, Partida, PostRedeSocial, RecomendacaoAposta
+)
+from ml_models.gerar_recomendacoes import GeradorRecomendacoes, TIPOS_APOSTA
+
+
+class GeradorOriginal(GeradorRecomendacoes):
+    """Gravação original: um INSERT por recomendação."""
+
+    def salvar_recomendacoes_banco(self, recomendacoes):
+        for recomendacao in recomendacoes:
+            for tipo_aposta, detalhes in recomendacao['recomendacoes'].items():
+                self.db_session.execute(text("""
+                    INSERT INTO recomendacoes_apostas
+                    (partida_id, mercado_aposta, previsao, probabilidade, odd_justa, rating,
+                     confianca_modelo, modelo_utilizado, features_utilizadas, status)
+                    VALUES (:partida_id, :mercado_aposta, :previsao, :probabilidade, :odd_justa, :rating,
+                            :confianca_modelo, :modelo_utilizado, :features_utilizadas, 'ativa')
+                """), {
+                    'partida_id': int(recomendacao['partida_id']),
+                    'mercado_aposta': tipo_aposta,
+                    'previsao': str(detalhes['predicao']),
+                    'probabilidade': float(detalhes['confianca']),
+                    'odd_justa': float(detalhes['odd_justa']),
+                    'rating': int(detalhes['rating']),
+                    'confianca_modelo': float(detalhes['confianca']),
+                    'modelo_utilizado': detalhes['modelo_utilizado'],
+                    'features_utilizadas': ','.join(recomendacao['features_utilizadas'])
+                })
+        self.db_session.commit()
+        return True
+
+
+def treinar_modelos(diretorio, colunas):
+    """Um RandomForest por tipo de aposta, salvo como o treinamento salva."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(2000, len(colunas))), columns=colunas)
+    alvos = {'resultado_1x2': ['1', 'X', '2'], 'over_under_2_5': ['Over 2.5', 'Under 2.5'],
+             'ambos_marcam': ['Sim', 'Não']}
+    for tipo in TIPOS_APOSTA:
+        y = np.array(alvos[tipo])[rng.integers(0, len(alvos[tipo]), size=len(X))]
+        scaler, encoder = StandardScaler().fit(X), LabelEncoder().fit(y)
+        modelo = RandomForestClassifier(n_estimators=100, max_depth=8, random_state=0)
+        modelo.fit(scaler.transform(X), encoder.transform(y))
+        for nome, objeto in (('modelo', modelo), ('scaler', scaler), ('label_encoder', encoder)):
+            with open(os.path.join(diretorio, f'{tipo}_{nome}.pkl'), 'wb') as f:
+                pickle.dump(objeto, f)
+
+
+def criar_banco(caminho, ligas, clubes, temporadas):
+    engine = create_engine(f"sqlite:///{caminho}")
+    Base.metadata.create_all(engine)
+    rng = np.random.default_rng(1)
+    hoje = date.today()
+    with engine.begin() as conn:
+        conn.execute(insert(Competicao), [{"nome": f"Liga {l}", "url": f"/comps/{l}"} for l in range(ligas)])
+        conn.execute(insert(Clube), [{"nome": f"Clube {i}"} for i in range(ligas * clubes)])
+        partidas = []
+        for liga in range(ligas):
+            ids = [liga * clubes + i + 1 for i in range(clubes)]
+            # Turno e returno por temporada (a mesma rodada todos os dias, para simplificar)
+            for t in range(temporadas):
+                for rodada, (casa, fora) in enumerate((c, f) for c in ids for f in ids if c != f):
+                    partidas.append({"competicao_id": liga + 1, "clube_casa_id": casa, "clube_visitante_id": fora,
+                                     "data_partida": hoje - timedelta(days=30 + t * 365 + rodada % 300),
+                                     "gols_casa": int(rng.poisson(1.5)), "gols_visitante": int(rng.poisson(1.1)),
+                                     "status": "finalizada"})
+            # Rodada do fim de semana
+            for i in range(0, clubes, 2):
+                partidas.append({"competicao_id": liga + 1, "clube_casa_id": ids[i], "clube_visitante_id": ids[i + 1],
+                                 "data_partida": hoje + timedelta(days=1 + i // 2 % 2),
+                                 "gols_casa": None, "gols_visitante": None, "status": "agendada"})
+        conn.execute(insert(Partida), partidas)
+        agora = datetime.now()
+        conn.execute(insert(NoticiaClube), [
+            {"clube_id": i % (ligas * clubes) + 1, "titulo": f"Notícia {i}", "url_noticia": f"/noticia/{i}",
+             "fonte": "GE", "data_publicacao": agora - timedelta(days=i % 20), "score_sentimento": float(rng.normal())}
+            for i in range(ligas * clubes * 5)
+        ])
+        conn.execute(insert(PostRedeSocial), [
+            {"clube_id": i % (ligas * clubes) + 1, "rede_social": "twitter", "post_id": str(i),
+             "data_postagem": agora - timedelta(days=i % 20), "score_sentimento": float(rng.normal()),
+             "curtidas": int(rng.integers(0, 1000)), "comentarios": int(rng.integers(0, 100)),
+             "compartilhamentos": int(rng.integers(0, 50))}
+            for i in range(ligas * clubes * 5)
+        ])
+    return engine
+
+
+def resumo(recomendacoes):
+    return sorted((r['partida_id'], tipo, str(d['predicao']), round(d['confianca'], 12), d['rating'])
+                  for r in recomendacoes for tipo, d in r['recomendacoes'].items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ligas", type=int, default=20)
+    parser.add_argument("--clubes", type=int, default=20, help="clubes por liga (par)")
+    parser.add_argument("--temporadas", type=int, default=3, help="temporadas de histórico")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    diretorio = tempfile.mkdtemp()
+
+    resultados = []
+    for nome, classe, vetorizado in (("por partida", GeradorOriginal, False),
+                                     ("vetorizada", GeradorRecomendacoes, True)):
+        engine = criar_banco(os.path.join(diretorio, f"{nome.replace(' ', '_')}.db"),
+                             args.ligas, args.clubes, args.temporadas)
+        with sessionmaker(bind=engine)() as session:
+            if not resultados:
+                # Colunas das features na ordem de criar_features_partida
+                probe = GeradorRecomendacoes(session, diretorio)
+                partidas = probe.carregar_partidas_futuras()
+                features = probe.criar_features_lote(
+                    partidas, probe.carregar_estatisticas_clubes(), probe.carregar_sentimento_clubes(),
+                    probe.carregar_historico_confrontos_lote(partidas))
+                treinar_modelos(diretorio, list(features.columns))
+
+            gerador = classe(session, diretorio)
+            inicio = time.perf_counter()
+            recomendacoes = gerador.gerar_recomendacoes_lote(vetorizado=vetorizado)
+            tempo_geracao = time.perf_counter() - inicio
+            gerador.salvar_recomendacoes_banco(recomendacoes)
+            tempo_total = time.perf_counter() - inicio
+            linhas = sorted(session.query(RecomendacaoAposta.partida_id, RecomendacaoAposta.mercado_aposta,
+                                          RecomendacaoAposta.previsao, RecomendacaoAposta.probabilidade,
+                                          RecomendacaoAposta.rating))
+        resultados.append((nome, tempo_geracao, tempo_total, len(recomendacoes), resumo(recomendacoes), linhas))
+
+    print(f"\n📊 BENCHMARK RECOMENDAÇÕES EM LOTE ({args.ligas} ligas x {args.clubes // 2} partidas, "
+          f"{args.temporadas} temporadas de histórico)")
+    print("=" * 62)
+    print(f"{'geração':<14}{'previsões (s)':>15}{'com gravação (s)':>19}{'partidas':>12}")
+    for nome, tempo_geracao, tempo_total, partidas, _, _ in resultados:
+        print(f"{nome:<14}{tempo_geracao:>15.2f}{tempo_total:>19.2f}{partidas:>12}")
+    print("=" * 62)
+    print(f"Recomendações idênticas: {'sim' if resultados[0][4] == resultados[1][4] else 'NÃO'}")
+    print(f"Linhas gravadas idênticas: {'sim' if resultados[0][5] == resultados[1][5] else 'NÃO'}")
+
+
+if __name__ == "__main__":
+    main()
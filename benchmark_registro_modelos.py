@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark da inferência com modelos residentes e micro-lotes
+
+Clientes concorrentes (threads) pedem a previsão de uma partida por vez ao
+modelo de apostas mais recente de ml_models/saved_models:
+- Carga por requisição (comportamento original do /recomendacoes/gerar):
+  joblib.load do arquivo mais recente e predict/predict_proba da linha
+- Residente: modelo carregado uma vez, uma chamada ao modelo por requisição
+- Residente + micro-lotes (RegistroModelos): as requisições que chegam juntas
+  viram uma única chamada a predict_proba
+
+Uso:
+    python benchmark_registro_modelos.py [--clientes 1 10 100] [--requisicoes 20] [--models-dir ml_models/saved_models]
+"""
+
+import sys
+import os
+import time
+import argparse
+import logging
+import threading
+import warnings
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+import joblib
+import numpy as np
+
+from Coleta_de_dados.ml.registro_modelos import PREFIXO_APOSTAS, RegistroModelos
+
+
+def previsao_original(models_dir, linha):
+    """Como o GeradorRecomendacoes original: carrega o arquivo a cada requisição."""
+    registro = RegistroModelos(models_dir)
+    dados = joblib.load(os.path.join(models_dir, registro.arquivo_mais_recente(PREFIXO_APOSTAS)))
+    features = dados['scaler'].transform(linha.reshape(1, -1))
+    previsao = dados['modelo'].predict(features)[0]
+    return dados['label_encoder'].inverse_transform([previsao])[0], dados['modelo'].predict_proba(features)[0]
+
+
+def executar(clientes, requisicoes, linhas, prever):
+    """Latências (s) de todas as requisições e tempo total."""
+    latencias, resultados = [], {}
+    barreira = threading.Barrier(clientes)
+
+    def cliente(indice):
+        barreira.wait()
+        for r in range(requisicoes):
+            linha = (indice * requisicoes + r) % len(linhas)
+            inicio = time.perf_counter()
+            resultados[linha] = prever(linhas[linha])
+            latencias.append(time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    threads = [threading.Thread(target=cliente, args=(i,)) for i in range(clientes)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return np.array(latencias), time.perf_counter() - inicio, resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clientes", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--requisicoes", type=int, default=20, help="requisições por cliente")
+    parser.add_argument("--models-dir", default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                             "ml_models", "saved_models"))
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+    registro = RegistroModelos(args.models_dir)
+    versao = registro.obter(PREFIXO_APOSTAS)
+    linhas = np.random.default_rng(42).normal(size=(500, versao.n_features))
+
+    def residente(linha):
+        probabilidades = versao.prever_proba(linha.reshape(1, -1))[0]
+        return versao.classes[probabilidades.argmax()], probabilidades
+
+    def micro_lote(linha):
+        _, probabilidades = registro.prever_proba(PREFIXO_APOSTAS, linha)
+        return versao.classes[probabilidades[0].argmax()], probabilidades[0]
+
+    modos = (("carga por requisição", lambda linha: previsao_original(args.models_dir, linha)),
+             ("residente", residente), ("residente + lotes", micro_lote))
+    resultados, previsoes = [], {}
+    for clientes in args.clientes:
+        for nome, prever in modos:
+            # A carga por requisição é lenta demais para muitas requisições
+            requisicoes = 1 if nome == modos[0][0] and clientes > 1 else args.requisicoes
+            latencias, total, saida = executar(clientes, requisicoes, linhas, prever)
+            resultados.append((clientes, nome, np.percentile(latencias, 50) * 1000,
+                               np.percentile(latencias, 95) * 1000, len(latencias) / total))
+            for linha, (classe, probabilidades) in saida.items():
+                previsoes.setdefault(linha, []).append((classe, probabilidades))
+
+    identicas = all(
+        all(classe == itens[0][0] and np.allclose(prob, itens[0][1]) for classe, prob in itens)
+        for itens in previsoes.values()
+    )
+
+    print(f"\n📊 BENCHMARK MODELOS RESIDENTES ({versao.arquivo}, {args.requisicoes} requisições por cliente)")
+    print("=" * 72)
+    print(f"{'clientes':>9}  {'inferência':<24}{'p50 (ms)':>11}{'p95 (ms)':>11}{'previsões/s':>15}")
+    for clientes, nome, p50, p95, vazao in resultados:
+        print(f"{clientes:>9}  {nome:<24}{p50:>11.2f}{p95:>11.2f}{vazao:>15.1f}")
+    print("=" * 72)
+    print(f"Maior lote: {registro.get_stats()['lotes'][PREFIXO_APOSTAS]['maior_lote']} requisições")
+    print(f"Previsões idênticas: {'sim' if identicas else 'NÃO'}")
+
+
+if __name__ == "__main__":
+    main()
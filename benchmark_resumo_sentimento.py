@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos endpoints de sentimento com o resumo materializado
+
+Mede o tempo por requisição de /analise/sentimento/{clube_id},
+/analise/sentimento/estatisticas e /analise/sentimento/clubes/ranking em um
+SQLite temporário com notícias e posts já analisados:
+- Agregação completa (comportamento original): nova conexão sqlite3 e AVG/COUNT
+  sobre todas as linhas de noticias_clubes e posts_redes_sociais a cada chamada
+- Resumo (resumo_sentimento): somas por clube/fonte (e por dia, para a
+  janela das estatísticas) mantidas pelo job, lidas por conexões da pool
+
+Uso:
+    python benchmark_resumo_sentimento.py [--clubes 100] [--textos 200000] [--dias 180] [--repeticoes 20]
+"""
+
+import sys
+import os
+import time
+import random
+import sqlite3
+import argparse
+import logging
+import tempfile
+from datetime import datetime, timedelta
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from api.routers import analise
+from Coleta_de_dados.analise import resumo_sentimento
+
+SENTIMENTOS = ('positivo', 'negativo', 'neutro')
+
+
+def criar_banco(caminho: str, clubes: int, textos: int, dias: int) -> None:
+    rng = random.Random(42)
+    agora = datetime.now()
+    conn = sqlite3.connect(caminho)
+    conn.executescript("""
+        CREATE TABLE clubes (id INTEGER PRIMARY KEY, nome TEXT);
+        CREATE TABLE noticias_clubes (
+            id INTEGER PRIMARY KEY, clube_id INTEGER, sentimento TEXT, score_sentimento REAL,
+            confianca_sentimento REAL, analisado_em TIMESTAMP, created_at TIMESTAMP
+        );
+        CREATE TABLE posts_redes_sociais (
+            id INTEGER PRIMARY KEY, clube_id INTEGER, sentimento TEXT, score_sentimento REAL,
+            created_at TIMESTAMP
+        );
+        CREATE INDEX idx_noticias_clube ON noticias_clubes(clube_id);
+        CREATE INDEX idx_posts_clube ON posts_redes_sociais(clube_id);
+    """)
+    conn.executemany("INSERT INTO clubes VALUES (?, ?)", [(i, f"Clube {i}") for i in range(1, clubes + 1)])
+
+    def linha():
+        data = str(agora - timedelta(days=rng.random() * dias))
+        return rng.randint(1, clubes), rng.choice(SENTIMENTOS), rng.uniform(-1, 1), data
+
+    conn.executemany(
+        "INSERT INTO noticias_clubes (clube_id, sentimento, score_sentimento, confianca_sentimento, "
+        "analisado_em, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        [(c, s, sc, rng.random(), data, data) for c, s, sc, data in (linha() for _ in range(textos // 2))]
+    )
+    conn.executemany(
+        "INSERT INTO posts_redes_sociais (clube_id, sentimento, score_sentimento, created_at) VALUES (?, ?, ?, ?)",
+        [linha() for _ in range(textos - textos // 2)]
+    )
+    conn.commit()
+    conn.close()
+
+
+# Consultas originais dos endpoints, mantidas para comparação
+def clube_original(caminho: str, clube_id: int):
+    conn = sqlite3.connect(caminho)
+    noticias = conn.execute("""
+        SELECT COUNT(*), AVG(score_sentimento), AVG(confianca_sentimento), MAX(analisado_em)
+        FROM noticias_clubes WHERE clube_id = ? AND sentimento IS NOT NULL
+    """, (clube_id,)).fetchone()
+    posts = conn.execute("""
+        SELECT COUNT(*), AVG(score_sentimento)
+        FROM posts_redes_sociais WHERE clube_id = ? AND sentimento IS NOT NULL
+    """, (clube_id,)).fetchone()
+    conn.close()
+    return noticias[0], posts[0]
+
+
+def estatisticas_original(caminho: str, dias_atras: int):
+    conn = sqlite3.connect(caminho)
+    # Janela alinhada ao início do dia, como no resumo diário
+    data_limite = str((datetime.now() - timedelta(days=dias_atras)).date())
+    totais = [conn.execute(f"""
+        SELECT COUNT(*),
+               COUNT(CASE WHEN sentimento = 'positivo' THEN 1 END),
+               COUNT(CASE WHEN sentimento = 'negativo' THEN 1 END),
+               COUNT(CASE WHEN sentimento = 'neutro' THEN 1 END),
+               AVG(score_sentimento)
+        FROM {tabela} WHERE sentimento IS NOT NULL AND created_at >= ?
+    """, (data_limite,)).fetchone() for tabela in ('noticias_clubes', 'posts_redes_sociais')]
+    for sentimento, ordem in (('positivo', 'DESC'), ('negativo', 'ASC')):
+        conn.execute(f"""
+            SELECT c.nome, COUNT(n.id), AVG(n.score_sentimento) AS score_medio
+            FROM noticias_clubes n JOIN clubes c ON n.clube_id = c.id
+            WHERE n.sentimento = ? AND n.created_at >= ?
+            GROUP BY c.id, c.nome ORDER BY score_medio {ordem} LIMIT 5
+        """, (sentimento, data_limite)).fetchall()
+    conn.close()
+    return totais[0][0], totais[1][0]
+
+
+def ranking_original(caminho: str, limite: int):
+    conn = sqlite3.connect(caminho)
+    linhas = conn.execute("""
+        SELECT c.id, c.nome, COUNT(n.id), AVG(n.score_sentimento) AS score_medio,
+               AVG(n.confianca_sentimento), MAX(n.analisado_em)
+        FROM noticias_clubes n JOIN clubes c ON n.clube_id = c.id
+        WHERE n.sentimento IS NOT NULL
+        GROUP BY c.id, c.nome ORDER BY score_medio DESC LIMIT ?
+    """, (limite,)).fetchall()
+    conn.close()
+    return [(linha[0], linha[2]) for linha in linhas]
+
+
+def cronometrar(funcao, repeticoes: int):
+    resultado = funcao()
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clubes", type=int, default=100)
+    parser.add_argument("--textos", type=int, default=200000, help="notícias + posts analisados")
+    parser.add_argument("--dias", type=int, default=180, help="período coberto pelos textos")
+    parser.add_argument("--repeticoes", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    caminho = os.path.join(tempfile.mkdtemp(), "aposta.db")
+    criar_banco(caminho, args.clubes, args.textos, args.dias)
+    analise.get_db_path = lambda: caminho
+
+    conn = sqlite3.connect(caminho)
+    inicio = time.perf_counter()
+    resumo_sentimento.criar_tabela(conn)
+    tempo_criacao = time.perf_counter() - inicio
+    linhas_resumo = [conn.execute(f"SELECT COUNT(*) FROM {tabela}").fetchone()[0]
+                     for tabela in (resumo_sentimento.TABELA_RESUMO_CLUBE, resumo_sentimento.TABELA_RESUMO)]
+    conn.close()
+
+    endpoints = (
+        ("clube",
+         lambda: clube_original(caminho, 1),
+         lambda: analise.get_sentimento_clube(1, db=None, incluir_posts=True),
+         lambda r: (r["noticias_analisadas"], r["posts_analisados"])),
+        ("estatisticas",
+         lambda: estatisticas_original(caminho, 30),
+         lambda: analise.get_estatisticas_sentimento(db=None, dias_atras=30),
+         lambda r: (r["total_noticias"], r["total_posts"])),
+        ("ranking",
+         lambda: ranking_original(caminho, 10),
+         lambda: analise.get_ranking_sentimento_clubes(db=None, limite=10, tipo_sentimento=None),
+         lambda r: [(c["clube_id"], c["noticias_analisadas"]) for c in r]),
+    )
+
+    resultados = []
+    for nome, original, resumo, normalizar in endpoints:
+        tempo_original, esperado = cronometrar(original, args.repeticoes)
+        tempo_resumo, obtido = cronometrar(resumo, args.repeticoes)
+        resultados.append((nome, tempo_original, tempo_resumo, normalizar(obtido) == esperado))
+
+    print(f"\n📊 BENCHMARK RESUMO DE SENTIMENTO ({args.textos} textos, {args.clubes} clubes, "
+          f"{args.dias} dias)")
+    print(f"Resumo criado em {tempo_criacao:.2f} s: {linhas_resumo[0]} linhas por clube, "
+          f"{linhas_resumo[1]} por clube e dia")
+    print("=" * 70)
+    print(f"{'endpoint':<16}{'original (ms)':>15}{'resumo (ms)':>14}{'ganho':>10}{'mesmos totais':>15}")
+    for nome, tempo_original, tempo_resumo, iguais in resultados:
+        print(f"{nome:<16}{tempo_original:>15.2f}{tempo_resumo:>14.2f}{tempo_original / tempo_resumo:>9.1f}x"
+              f"{'sim' if iguais else 'NÃO':>15}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
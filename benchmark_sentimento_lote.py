@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark da análise de sentimento em lote
+
+Compara, sobre um feed sintético com títulos repetidos:
+- AnalisadorSentimentoPT: análise palavra a palavra (original) x léxico
+  compilado com pontuação vetorizada do lote e cache de textos repetidos
+- SentimentAnalyzer (ml_models): um analyze_sentiment_<método> por texto
+  (original) x analyze_batch_sentiments (pré-processamento único, TextBlob e
+  léxico compartilhados, léxico vetorizado); cache em disco desligado
+
+Uso:
+    python benchmark_sentimento_lote.py [--textos 5000] [--repetidos 0.3] [--metodo hybrid]
+"""
+
+import sys
+import os
+import re
+import time
+import random
+import argparse
+import logging
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from Coleta_de_dados.analise.sentimento_pt import AnalisadorSentimentoPT
+
+PALAVRAS = ("vitória gol excelente ótimo derrota crise fracasso péssimo time jogo técnico torcida muito não "
+            "nunca clássico final empate lesão campeão rebaixamento contrato renovação estádio rival").split()
+
+
+class AnalisadorPalavraAPalavra(AnalisadorSentimentoPT):
+    """Análise original: regex de normalização e laço por palavra para cada texto."""
+
+    def analisar_textos(self, textos):
+        return [self.analisar_texto(texto) for texto in textos]
+
+    def analisar_texto(self, texto):
+        if not texto or not isinstance(texto, str):
+            return 'neutro', 0.0, 0.0
+        palavras = re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', ' ', texto)).strip().split()
+        score_positivo = score_negativo = encontradas = 0
+        for i, palavra in enumerate(palavras):
+            palavra_lower = palavra.lower()
+            if palavra_lower in self.palavras_positivas:
+                score_positivo += self._intensidade(palavras, i)
+                encontradas += 1
+            elif palavra_lower in self.palavras_negativas:
+                score_negativo += self._intensidade(palavras, i)
+                encontradas += 1
+        score = score_positivo - score_negativo
+        return self._classificar_sentimento(score), score, min(1.0, encontradas / 10)
+
+    def _intensidade(self, palavras, indice):
+        intensidade = 1.0
+        if indice > 0 and palavras[indice - 1].lower() in self.palavras_intensificadoras:
+            intensidade *= 2.0
+        if indice > 0 and palavras[indice - 1].lower() in self.palavras_negacao:
+            intensidade *= -1.0
+        return intensidade
+
+
+def gerar_feed(quantidade, repetidos, semente=42):
+    aleatorio = random.Random(semente)
+    textos = []
+    for _ in range(quantidade):
+        if textos and aleatorio.random() < repetidos:
+            textos.append(aleatorio.choice(textos))
+        else:
+            textos.append(" ".join(aleatorio.choice(PALAVRAS) for _ in range(aleatorio.randint(8, 40))) + "!")
+    return textos
+
+
+def medir(funcao, textos):
+    inicio = time.perf_counter()
+    resultados = funcao(textos)
+    return time.perf_counter() - inicio, resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--textos", type=int, default=5000)
+    parser.add_argument("--repetidos", type=float, default=0.3, help="fração de textos repetidos no feed")
+    parser.add_argument("--metodo", choices=("hybrid", "lexical", "textblob"), default="hybrid")
+    args = parser.parse_args()
+
+    # O léxico do ml_models registra erro por texto quando faltam dados do NLTK
+    logging.disable(logging.CRITICAL)
+    textos = gerar_feed(args.textos, args.repetidos)
+
+    resultados = []
+    original, compilado = AnalisadorPalavraAPalavra(), AnalisadorSentimentoPT()
+    tempo_original, esperado = medir(original.analisar_textos, textos)
+    tempo_compilado, obtido = medir(compilado.analisar_textos, textos)
+    resultados.append(("PT palavra a palavra", tempo_original, True))
+    resultados.append(("PT léxico compilado", tempo_compilado, obtido == esperado))
+
+    from ml_models.cache_manager import cache_manager
+    from ml_models.sentiment_analyzer import SentimentAnalyzer
+    cache_manager.config.enable_caching = False
+    analisador = SentimentAnalyzer()
+    por_texto = getattr(analisador, f"analyze_sentiment_{args.metodo}")
+    tempo_original, esperado = medir(lambda lote: [por_texto(texto) for texto in lote], textos)
+    tempo_lote, obtido = medir(lambda lote: analisador.analyze_batch_sentiments(lote, args.metodo), textos)
+    iguais = [{k: v for k, v in r.items() if k not in ('text_index', 'original_text')} for r in obtido] == esperado
+    resultados.append((f"ml {args.metodo} texto a texto", tempo_original, True))
+    resultados.append((f"ml {args.metodo} em lote", tempo_lote, iguais))
+
+    print(f"\n📊 BENCHMARK SENTIMENTO EM LOTE ({args.textos} textos, {args.repetidos:.0%} repetidos)")
+    print("=" * 70)
+    print(f"{'analisador':<30}{'tempo (s)':>12}{'textos/s':>14}{'iguais':>10}")
+    for nome, tempo, iguais in resultados:
+        print(f"{nome:<30}{tempo:>12.3f}{args.textos / tempo:>14.0f}{'sim' if iguais else 'NÃO':>10}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark do SQLite de fallback com leitura e escrita simultâneas
+
+Um processo coletor grava notícias em lotes (um commit por lote) enquanto
+threads leitoras consultam o mesmo arquivo por sessões do ORM, como a API:
+- Padrão (comportamento original): rollback journal, synchronous=FULL, sem
+  mmap e uma única pool para leitura e escrita
+- Otimizado (perfil_sqlite): WAL, synchronous=NORMAL, mmap, cache maior,
+  temp_store em memória, uma conexão de escrita e pool de leitura query_only
+
+Uso:
+    python benchmark_sqlite_fallback.py [--leitores 8] [--segundos 5] [--lote 50] [--noticias 20000]
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import logging
+import tempfile
+import threading
+import multiprocessing
+from datetime import datetime
+
+# Adicionar path do projeto
+sys.path.append(os.path.dirname(__file__))
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from Coleta_de_dados.database.config import Base, DatabaseSettings
+from Coleta_de_dados.database.models import Clube, NoticiaClube
+from Coleta_de_dados.database.perfil_sqlite import SessaoSQLite, criar_engines_sqlite
+
+CLUBES = 40
+
+
+def criar_sessoes(url: str, otimizado: bool):
+    """Factory de sessões do fallback em cada perfil."""
+    if otimizado:
+        escrita, leitura = criar_engines_sqlite(url, DatabaseSettings())
+        return sessionmaker(bind=escrita, class_=SessaoSQLite, engine_leitura=leitura)
+    # Engine original do DatabaseManager._create_engine
+    engine = create_engine(url, connect_args={"check_same_thread": False, "timeout": 30})
+    return sessionmaker(bind=engine)
+
+
+def noticias(quantidade: int, rng: random.Random, prefixo: str):
+    agora = datetime.now()
+    return [
+        {"clube_id": rng.randint(1, CLUBES), "titulo": f"Notícia {prefixo}-{i}",
+         "url_noticia": f"https://ge.globo.com/{prefixo}/{i}", "fonte": "Globo Esporte",
+         "data_publicacao": agora, "resumo": "Resumo " * 20}
+        for i in range(quantidade)
+    ]
+
+
+def criar_banco(url: str, quantidade: int) -> None:
+    engine = create_engine(url)
+    Base.metadata.create_all(engine, tables=[Clube.__table__, NoticiaClube.__table__])
+    with engine.begin() as conn:
+        conn.execute(insert(Clube), [{"nome": f"Clube {i}"} for i in range(CLUBES)])
+        conn.execute(insert(NoticiaClube), noticias(quantidade, random.Random(1), "inicial"))
+    engine.dispose()
+
+
+def coletor(url: str, otimizado: bool, lote: int, inicio, fim, resultado) -> None:
+    """Processo que grava lotes de notícias até o fim do cenário."""
+    logging.disable(logging.WARNING)
+    Sessao = criar_sessoes(url, otimizado)
+    rng = random.Random(2)
+    lotes = erros = 0
+    inicio.wait()
+    while not fim.is_set():
+        try:
+            with Sessao() as session:
+                session.execute(insert(NoticiaClube), noticias(lote, rng, f"coleta-{lotes}"))
+                session.commit()
+            lotes += 1
+        except OperationalError:
+            erros += 1
+    resultado.put((lotes * lote, erros))
+
+
+def leitor(Sessao, parar: threading.Event, contagem: list, indice: int) -> None:
+    rng = random.Random(indice)
+    while not parar.is_set():
+        clube_id = rng.randint(1, CLUBES)
+        try:
+            with Sessao() as session:
+                session.execute(
+                    select(func.count(NoticiaClube.id)).where(NoticiaClube.clube_id == clube_id)
+                ).scalar()
+                session.execute(
+                    select(NoticiaClube.titulo, NoticiaClube.data_publicacao)
+                    .where(NoticiaClube.clube_id == clube_id)
+                    .order_by(NoticiaClube.id.desc()).limit(20)
+                ).all()
+            contagem[indice] += 1
+        except OperationalError:
+            contagem[-1] += 1
+
+
+def cenario(diretorio: str, otimizado: bool, args) -> tuple:
+    url = f"sqlite:///{os.path.join(diretorio, 'otimizado' if otimizado else 'padrao')}.db"
+    criar_banco(url, args.noticias)
+    Sessao = criar_sessoes(url, otimizado)
+
+    contexto = multiprocessing.get_context("spawn")
+    inicio, fim, resultado = contexto.Event(), contexto.Event(), contexto.Queue()
+    processo = contexto.Process(target=coletor, args=(url, otimizado, args.lote, inicio, fim, resultado))
+    processo.start()
+
+    parar = threading.Event()
+    contagem = [0] * (args.leitores + 1)  # última posição: erros de leitura
+    threads = [threading.Thread(target=leitor, args=(Sessao, parar, contagem, i)) for i in range(args.leitores)]
+    inicio.set()
+    for thread in threads:
+        thread.start()
+    time.sleep(args.segundos)
+    parar.set()
+    fim.set()
+    for thread in threads:
+        thread.join()
+    escritas, erros_escrita = resultado.get()
+    processo.join()
+
+    leituras = sum(contagem[:-1])
+    return leituras / args.segundos, escritas / args.segundos, contagem[-1] + erros_escrita
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--leitores", type=int, default=8, help="threads leitoras (requisições da API)")
+    parser.add_argument("--segundos", type=float, default=5.0, help="duração de cada cenário")
+    parser.add_argument("--lote", type=int, default=50, help="notícias por commit do coletor")
+    parser.add_argument("--noticias", type=int, default=20000, help="notícias já existentes no banco")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    diretorio = tempfile.mkdtemp()
+    resultados = [(nome, *cenario(diretorio, otimizado, args))
+                  for nome, otimizado in (("padrão", False), ("otimizado", True))]
+
+    print(f"\n📊 BENCHMARK SQLITE DE FALLBACK ({args.leitores} leitores, 1 coletor com lotes de "
+          f"{args.lote}, {args.segundos:.0f} s)")
+    print("=" * 70)
+    print(f"{'perfil':<14}{'leituras/s':>14}{'notícias gravadas/s':>22}{'erros (locked)':>18}")
+    for nome, leituras, escritas, erros in resultados:
+        print(f"{nome:<14}{leituras:>14.0f}{escritas:>22.0f}{erros:>18}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
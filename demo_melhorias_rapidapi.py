@@ -59,7 +59,10 @@ from Coleta_de_dados.apis.rapidapi import (
     # Dashboard web
     RapidAPIDashboard,
     DashboardConfig,
-    start_dashboard
+    start_dashboard,
+    
+    # Encerramento das sessões HTTP ao fim da execução
+    executar_coleta
 )
 
 # Configuração de logging
@@ -687,7 +690,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        executar_coleta(main())
     except KeyboardInterrupt:
         print("\n🛑 Demonstração interrompida pelo usuário")
     except Exception as e:
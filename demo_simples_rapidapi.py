@@ -322,4 +322,5 @@ async def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    from Coleta_de_dados.apis.rapidapi import executar_coleta
+    executar_coleta(main())
@@ -35,7 +35,8 @@ from Coleta_de_dados.apis.rapidapi import (
     PlayerMarketDataAPI,
     FootballProAPI,
     Bet365FutebolVirtualAPI,
-    SportAPI7API
+    SportAPI7API,
+    executar_coleta
 )
 
 from Coleta_de_dados.utils.logger_centralizado import CentralizedLogger
@@ -374,4 +375,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    executar_coleta(main())
@@ -26,7 +26,7 @@ from .data_preparation import (
 
 # Modelos de ML
 from .ml_models import (
-    train_model, train_ensemble, make_prediction,
+    train_model, train_ensemble, make_prediction, make_predictions_batch,
     save_model, load_model, get_model_info,
     MLModelManager
 )
@@ -126,7 +126,7 @@ __all__ = [
     "DataPreparationPipeline",
     
     # Modelos
-    "train_model", "train_ensemble", "make_prediction",
+    "train_model", "train_ensemble", "make_prediction", "make_predictions_batch",
     "save_model", "load_model", "get_model_info", "MLModelManager",
     
     # Recomendações
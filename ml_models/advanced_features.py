@@ -175,29 +175,38 @@ class AdvancedFeatures:
         
         return trends
     
+    @staticmethod
+    def _team_values(matches_data: pd.DataFrame, is_home: np.ndarray, column: str,
+                     default: Any = None) -> np.ndarray:
+        """
+        Valores de ``home_<column>``/``away_<column>`` do ponto de vista da equipe
+        
+        Partidas em que a equipe não é mandante são tratadas como partidas fora.
+        Colunas ausentes assumem o valor padrão.
+        """
+        def values(side: str) -> np.ndarray:
+            name = f'{side}_{column}'
+            if name in matches_data.columns:
+                return matches_data[name].to_numpy()
+            return np.full(len(matches_data), default)
+        
+        return np.where(is_home, values('home'), values('away'))
+    
+    def _team_goals(self, matches_data: pd.DataFrame, team_name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Gols marcados e sofridos pela equipe em cada partida"""
+        is_home = (matches_data['home_team'] == team_name).to_numpy()
+        scored = self._team_values(matches_data, is_home, 'goals')
+        conceded = self._team_values(matches_data, ~is_home, 'goals')
+        return scored, conceded
+    
     def _calculate_result_trends(self, matches_data: pd.DataFrame, team_name: str) -> Dict[str, Any]:
         """Calcula tendências de resultados para uma equipe"""
-        results = []
-        
-        for _, match in matches_data.iterrows():
-            if match['home_team'] == team_name:
-                if match['home_goals'] > match['away_goals']:
-                    results.append('W')
-                elif match['home_goals'] < match['away_goals']:
-                    results.append('L')
-                else:
-                    results.append('D')
-            else:
-                if match['away_goals'] > match['home_goals']:
-                    results.append('W')
-                elif match['away_goals'] < match['home_goals']:
-                    results.append('L')
-                else:
-                    results.append('D')
+        scored, conceded = self._team_goals(matches_data, team_name)
+        results = np.select([scored > conceded, scored < conceded], ['W', 'L'], 'D')
         
         # Calcular tendências
         if len(results) >= 5:
-            recent_results = results[-5:]
+            recent_results = results[-5:].tolist()
             win_rate_recent = recent_results.count('W') / len(recent_results)
             
             # Detectar padrões
@@ -214,16 +223,7 @@ class AdvancedFeatures:
     
     def _calculate_goals_trends(self, matches_data: pd.DataFrame, team_name: str) -> Dict[str, Any]:
         """Calcula tendências de gols para uma equipe"""
-        goals_scored = []
-        goals_conceded = []
-        
-        for _, match in matches_data.iterrows():
-            if match['home_team'] == team_name:
-                goals_scored.append(match['home_goals'])
-                goals_conceded.append(match['away_goals'])
-            else:
-                goals_scored.append(match['away_goals'])
-                goals_conceded.append(match['home_goals'])
+        goals_scored, goals_conceded = self._team_goals(matches_data, team_name)
         
         # Calcular métricas
         avg_scored = np.mean(goals_scored)
@@ -250,35 +250,23 @@ class AdvancedFeatures:
     
     def _calculate_performance_trends(self, matches_data: pd.DataFrame, team_name: str) -> Dict[str, Any]:
         """Calcula tendências de performance para uma equipe"""
-        performance_metrics = []
-        
-        for _, match in matches_data.iterrows():
-            if match['home_team'] == team_name:
-                possession = match.get('home_possession', 50)
-                shots = match.get('home_shots', 10)
-                shots_on_target = match.get('home_shots_on_target', 5)
-                xg = match.get('home_xg', 1.0)
-            else:
-                possession = match.get('away_possession', 50)
-                shots = match.get('away_shots', 10)
-                shots_on_target = match.get('away_shots_on_target', 5)
-                xg = match.get('away_xg', 1.0)
-            
-            # Calcular eficiência
-            shot_efficiency = shots_on_target / shots if shots > 0 else 0
-            xg_efficiency = xg / shots if shots > 0 else 0
-            
-            performance_metrics.append({
-                'possession': possession,
-                'shot_efficiency': shot_efficiency,
-                'xg_efficiency': xg_efficiency
-            })
+        is_home = (matches_data['home_team'] == team_name).to_numpy()
+        possession = self._team_values(matches_data, is_home, 'possession', 50)
+        shots = self._team_values(matches_data, is_home, 'shots', 10)
+        shots_on_target = self._team_values(matches_data, is_home, 'shots_on_target', 5)
+        xg = self._team_values(matches_data, is_home, 'xg', 1.0)
+        
+        # Calcular eficiência (0 quando não há chutes)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            has_shots = shots > 0
+            shot_efficiency = np.where(has_shots, shots_on_target / shots, 0)
+            xg_efficiency = np.where(has_shots, xg / shots, 0)
         
         # Calcular tendências
-        if performance_metrics:
-            avg_possession = np.mean([m['possession'] for m in performance_metrics])
-            avg_shot_efficiency = np.mean([m['shot_efficiency'] for m in performance_metrics])
-            avg_xg_efficiency = np.mean([m['xg_efficiency'] for m in performance_metrics])
+        if len(matches_data) > 0:
+            avg_possession = np.mean(possession)
+            avg_shot_efficiency = np.mean(shot_efficiency)
+            avg_xg_efficiency = np.mean(xg_efficiency)
             
             return {
                 'avg_possession': round(avg_possession, 1),
@@ -295,25 +283,13 @@ class AdvancedFeatures:
         if 'home_odds' not in matches_data.columns:
             return {'error': 'Dados de odds não disponíveis'}
         
-        odds_data = []
+        is_home = (matches_data['home_team'] == team_name).to_numpy()
+        odds = self._team_values(matches_data, is_home, 'odds')
         
-        for _, match in matches_data.iterrows():
-            if match['home_team'] == team_name:
-                odds_data.append({
-                    'odds': match['home_odds'],
-                    'implied_prob': 1 / match['home_odds'],
-                    'position': 'home'
-                })
-            else:
-                odds_data.append({
-                    'odds': match['away_odds'],
-                    'implied_prob': 1 / match['away_odds'],
-                    'position': 'away'
-                })
-        
-        if odds_data:
-            avg_odds = np.mean([d['odds'] for d in odds_data])
-            avg_prob = np.mean([d['implied_prob'] for d in odds_data])
+        if len(odds) > 0:
+            avg_odds = np.mean(odds)
+            with np.errstate(divide='ignore'):
+                avg_prob = np.mean(1 / odds)
             
             # Detectar valor de mercado
             market_value = 'Overvalued' if avg_prob < 0.3 else 'Undervalued' if avg_prob > 0.4 else 'Fair'
@@ -346,43 +322,75 @@ class AdvancedFeatures:
         else:
             return 'Stable'
     
-    def _identify_value_betting(self, matches_data: pd.DataFrame) -> List[Dict[str, Any]]:
-        """Identifica oportunidades de value betting"""
-        opportunities = []
+    def _value_bet_candidates(self, matches_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apostas de valor candidatas de todas as partidas
         
-        for _, match in matches_data.iterrows():
+        Retorna uma linha por aposta, na ordem das partidas (mandante antes do
+        visitante), com a posição da partida, tipo, odd, score de valor e
+        resultado da aposta.
+        """
+        home_odds = matches_data['home_odds'].to_numpy(dtype=float)
+        away_odds = matches_data['away_odds'].to_numpy(dtype=float)
+        draw_odds = matches_data['draw_odds'].to_numpy(dtype=float)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
             # Calcular probabilidades implícitas
-            home_prob = 1 / match['home_odds']
-            away_prob = 1 / match['away_odds']
-            draw_prob = 1 / match['draw_odds']
+            home_prob = 1 / home_odds
+            away_prob = 1 / away_odds
+            draw_prob = 1 / draw_odds
             
             total_prob = home_prob + away_prob + draw_prob
             
             # Normalizar
             home_prob_norm = home_prob / total_prob
             away_prob_norm = away_prob / total_prob
-            draw_prob_norm = draw_prob / total_prob
-            
-            # Identificar value bets (probabilidade real > probabilidade implícita)
-            if home_prob_norm > 0.4 and match['home_odds'] > 2.0:
-                opportunities.append({
-                    'match': f"{match['home_team']} vs {match['away_team']}",
-                    'bet_type': 'Home Win',
-                    'odds': match['home_odds'],
-                    'value_score': round(home_prob_norm - (1/match['home_odds']), 3)
-                })
-            
-            if away_prob_norm > 0.35 and match['away_odds'] > 2.5:
-                opportunities.append({
-                    'match': f"{match['home_team']} vs {match['away_team']}",
-                    'bet_type': 'Away Win',
-                    'odds': match['away_odds'],
-                    'value_score': round(away_prob_norm - (1/match['away_odds']), 3)
-                })
-        
-        # Ordenar por score de valor
-        opportunities.sort(key=lambda x: x['value_score'], reverse=True)
-        return opportunities[:5]  # Top 5 oportunidades
+        
+        # Identificar value bets (probabilidade real > probabilidade implícita)
+        home_bets = np.flatnonzero((home_prob_norm > 0.4) & (home_odds > 2.0))
+        away_bets = np.flatnonzero((away_prob_norm > 0.35) & (away_odds > 2.5))
+        
+        home_goals = matches_data['home_goals'].to_numpy()
+        away_goals = matches_data['away_goals'].to_numpy()
+        
+        candidates = pd.DataFrame({
+            'position': np.concatenate([home_bets, away_bets]),
+            'side': np.repeat([0, 1], [len(home_bets), len(away_bets)]),
+            'bet_type': np.repeat(['Home Win', 'Away Win'], [len(home_bets), len(away_bets)]),
+            'odds': np.concatenate([home_odds[home_bets], away_odds[away_bets]]),
+            'value_score': np.round(np.concatenate([
+                home_prob_norm[home_bets] - home_prob[home_bets],
+                away_prob_norm[away_bets] - away_prob[away_bets]
+            ]), 3),
+            'won': np.concatenate([
+                home_goals[home_bets] > away_goals[home_bets],
+                away_goals[away_bets] > home_goals[away_bets]
+            ])
+        })
+        order = np.lexsort((candidates['side'].to_numpy(), candidates['position'].to_numpy()))
+        return candidates.iloc[order].reset_index(drop=True)
+    
+    @staticmethod
+    def _match_labels(matches_data: pd.DataFrame, positions: np.ndarray) -> List[str]:
+        """Descrição 'Mandante vs Visitante' das partidas nas posições informadas"""
+        home = matches_data['home_team'].to_numpy()[positions]
+        away = matches_data['away_team'].to_numpy()[positions]
+        return [f"{h} vs {a}" for h, a in zip(home, away)]
+    
+    def _identify_value_betting(self, matches_data: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Identifica oportunidades de value betting"""
+        candidates = self._value_bet_candidates(matches_data)
+        
+        # Ordenar por score de valor (estável: empates mantêm a ordem das partidas)
+        top = candidates.iloc[np.argsort(-candidates['value_score'].to_numpy(), kind='stable')[:5]]
+        labels = self._match_labels(matches_data, top['position'].to_numpy())
+        
+        return [
+            {'match': label, 'bet_type': bet_type, 'odds': odds, 'value_score': value_score}
+            for label, bet_type, odds, value_score in zip(
+                labels, top['bet_type'], top['odds'].tolist(), top['value_score'].tolist()
+            )
+        ]  # Top 5 oportunidades
     
     def run_backtesting(self, 
                        strategy_name: str,
@@ -439,113 +447,41 @@ class AdvancedFeatures:
             logger.error(f"Erro no backtesting: {e}")
             return {'error': str(e)}
     
-    def _run_value_betting_strategy(self, matches_data: pd.DataFrame) -> Dict[str, Any]:
-        """Executa estratégia de value betting"""
-        bankroll = self.backtesting_config['initial_bankroll']
-        bet_size = self.backtesting_config['bet_size_percentage']
-        bets = []
-        current_bankroll = bankroll
-        
-        for _, match in matches_data.iterrows():
-            # Identificar value bets
-            opportunities = self._identify_value_betting(pd.DataFrame([match]))
-            
-            for opp in opportunities:
-                if current_bankroll <= bankroll * (1 - self.backtesting_config['stop_loss']):
-                    break  # Stop loss atingido
-                
-                bet_amount = current_bankroll * bet_size
-                odds = opp['odds']
-                
-                # Simular resultado da aposta
-                if self._simulate_bet_result(opp['bet_type'], match):
-                    # Vitória
-                    profit = bet_amount * (odds - 1)
-                    current_bankroll += profit
-                    result = 'W'
-                else:
-                    # Derrota
-                    current_bankroll -= bet_amount
-                    profit = -bet_amount
-                    result = 'L'
-                
-                bets.append({
-                    'match': opp['match'],
-                    'bet_type': opp['bet_type'],
-                    'odds': odds,
-                    'bet_amount': bet_amount,
-                    'profit': profit,
-                    'result': result,
-                    'bankroll': current_bankroll
-                })
-        
-        # Calcular métricas
-        total_bets = len(bets)
-        winning_bets = len([b for b in bets if b['result'] == 'W'])
-        win_rate = winning_bets / total_bets if total_bets > 0 else 0
-        
-        total_profit = current_bankroll - bankroll
-        roi = (total_profit / bankroll) * 100 if bankroll > 0 else 0
+    def _simulate_bankroll(self, strategy: str, matches: List[str], bet_types: List[str],
+                           odds: List[float], won: List[bool]) -> Dict[str, Any]:
+        """
+        Simula a banca apostando uma fração fixa da banca atual em cada aposta
         
-        return {
-            'strategy': 'value_betting',
-            'initial_bankroll': bankroll,
-            'final_bankroll': current_bankroll,
-            'total_profit': total_profit,
-            'roi': roi,
-            'total_bets': total_bets,
-            'winning_bets': winning_bets,
-            'win_rate': win_rate,
-            'bets': bets
-        }
-    
-    def _run_trend_following_strategy(self, matches_data: pd.DataFrame) -> Dict[str, Any]:
-        """Executa estratégia de seguir tendências"""
+        O valor de cada aposta depende da banca após a anterior, então a
+        sequência é percorrida em ordem (sobre listas já calculadas).
+        """
         bankroll = self.backtesting_config['initial_bankroll']
         bet_size = self.backtesting_config['bet_size_percentage']
+        stop_loss_bankroll = bankroll * (1 - self.backtesting_config['stop_loss'])
         bets = []
         current_bankroll = bankroll
         
-        # Calcular tendências para cada equipe
-        team_trends = {}
-        for _, match in matches_data.iterrows():
-            for team in [match['home_team'], match['away_team']]:
-                if team not in team_trends:
-                    team_trends[team] = self._calculate_team_trend_simple(matches_data, team)
-        
-        for _, match in matches_data.iterrows():
-            home_trend = team_trends.get(match['home_team'], 'Unknown')
-            away_trend = team_trends.get(match['away_team'], 'Unknown')
-            
-            # Apostar na equipe com tendência melhor
-            if home_trend == 'Good' and away_trend != 'Good':
-                bet_type = 'Home Win'
-                odds = match['home_odds']
-            elif away_trend == 'Good' and home_trend != 'Good':
-                bet_type = 'Away Win'
-                odds = match['away_odds']
-            else:
-                continue  # Não apostar se ambas têm tendências similares
-            
-            if current_bankroll <= bankroll * (1 - self.backtesting_config['stop_loss']):
-                break
+        for match, bet_type, odds_value, bet_won in zip(matches, bet_types, odds, won):
+            if current_bankroll <= stop_loss_bankroll:
+                break  # Stop loss atingido
             
             bet_amount = current_bankroll * bet_size
             
-            # Simular resultado
-            if self._simulate_bet_result(bet_type, match):
-                profit = bet_amount * (odds - 1)
+            if bet_won:
+                # Vitória
+                profit = bet_amount * (odds_value - 1)
                 current_bankroll += profit
                 result = 'W'
             else:
-                profit = -bet_amount
+                # Derrota
                 current_bankroll -= bet_amount
+                profit = -bet_amount
                 result = 'L'
             
             bets.append({
-                'match': f"{match['home_team']} vs {match['away_team']}",
+                'match': match,
                 'bet_type': bet_type,
-                'odds': odds,
+                'odds': odds_value,
                 'bet_amount': bet_amount,
                 'profit': profit,
                 'result': result,
@@ -561,7 +497,7 @@ class AdvancedFeatures:
         roi = (total_profit / bankroll) * 100 if bankroll > 0 else 0
         
         return {
-            'strategy': 'trend_following',
+            'strategy': strategy,
             'initial_bankroll': bankroll,
             'final_bankroll': current_bankroll,
             'total_profit': total_profit,
@@ -572,6 +508,55 @@ class AdvancedFeatures:
             'bets': bets
         }
     
+    def _run_value_betting_strategy(self, matches_data: pd.DataFrame) -> Dict[str, Any]:
+        """Executa estratégia de value betting"""
+        candidates = self._value_bet_candidates(matches_data)
+        
+        # Em cada partida, apostas em ordem decrescente de score de valor
+        order = np.lexsort((
+            candidates['side'].to_numpy(),
+            -candidates['value_score'].to_numpy(),
+            candidates['position'].to_numpy()
+        ))
+        candidates = candidates.iloc[order]
+        
+        return self._simulate_bankroll(
+            'value_betting',
+            self._match_labels(matches_data, candidates['position'].to_numpy()),
+            candidates['bet_type'].tolist(),
+            candidates['odds'].tolist(),
+            candidates['won'].tolist()
+        )
+    
+    def _run_trend_following_strategy(self, matches_data: pd.DataFrame) -> Dict[str, Any]:
+        """Executa estratégia de seguir tendências"""
+        # Calcular tendências para cada equipe (uma única passada)
+        team_trends = self._calculate_team_trends(matches_data)
+        home_good = (matches_data['home_team'].map(team_trends) == 'Good').to_numpy()
+        away_good = (matches_data['away_team'].map(team_trends) == 'Good').to_numpy()
+        
+        # Apostar na equipe com tendência melhor; não apostar se ambas são similares
+        home_bets = home_good & ~away_good
+        positions = np.flatnonzero(home_good != away_good)
+        bet_home = home_bets[positions]
+        
+        home_goals = matches_data['home_goals'].to_numpy()[positions]
+        away_goals = matches_data['away_goals'].to_numpy()[positions]
+        odds = np.where(
+            bet_home,
+            matches_data['home_odds'].to_numpy()[positions],
+            matches_data['away_odds'].to_numpy()[positions]
+        )
+        won = np.where(bet_home, home_goals > away_goals, away_goals > home_goals)
+        
+        return self._simulate_bankroll(
+            'trend_following',
+            self._match_labels(matches_data, positions),
+            np.where(bet_home, 'Home Win', 'Away Win').tolist(),
+            odds.tolist(),
+            won.tolist()
+        )
+    
     def _run_ml_predictions_strategy(self, matches_data: pd.DataFrame) -> Dict[str, Any]:
         """Executa estratégia baseada em predições ML"""
         # Esta estratégia seria implementada quando os modelos ML estiverem disponíveis
@@ -581,48 +566,39 @@ class AdvancedFeatures:
             'note': 'Implementar quando modelos estiverem treinados'
         }
     
-    def _calculate_team_trend_simple(self, matches_data: pd.DataFrame, team_name: str) -> str:
-        """Calcula tendência simples de uma equipe"""
-        team_matches = matches_data[
-            (matches_data['home_team'] == team_name) | 
-            (matches_data['away_team'] == team_name)
-        ].tail(5)  # Últimas 5 partidas
-        
-        if len(team_matches) < 3:
-            return 'Unknown'
-        
-        wins = 0
-        for _, match in team_matches.iterrows():
-            if match['home_team'] == team_name:
-                if match['home_goals'] > match['away_goals']:
-                    wins += 1
-            else:
-                if match['away_goals'] > match['home_goals']:
-                    wins += 1
-        
-        win_rate = wins / len(team_matches)
+    def _calculate_team_trends(self, matches_data: pd.DataFrame) -> pd.Series:
+        """
+        Calcula a tendência simples (últimas 5 partidas) de todas as equipes
         
-        if win_rate >= 0.6:
-            return 'Good'
-        elif win_rate <= 0.2:
-            return 'Poor'
-        else:
-            return 'Average'
-    
-    def _simulate_bet_result(self, bet_type: str, match: pd.Series) -> bool:
-        """Simula resultado de uma aposta"""
-        if bet_type == 'Home Win':
-            return match['home_goals'] > match['away_goals']
-        elif bet_type == 'Away Win':
-            return match['away_goals'] > match['home_goals']
-        elif bet_type == 'Draw':
-            return match['home_goals'] == match['away_goals']
-        elif bet_type == 'Over 2.5':
-            return match['total_goals'] > 2.5
-        elif bet_type == 'Both Teams Score':
-            return match['both_teams_score'] == 1
-        else:
-            return False
+        Returns:
+            Série indexada pelo nome da equipe com 'Good', 'Average', 'Poor'
+            ou 'Unknown' (menos de 3 partidas)
+        """
+        home = matches_data['home_team'].to_numpy()
+        away = matches_data['away_team'].to_numpy()
+        home_goals = matches_data['home_goals'].to_numpy()
+        away_goals = matches_data['away_goals'].to_numpy()
+        positions = np.arange(len(matches_data))
+        # Uma partida conta uma única vez para a equipe, mesmo se mandante e visitante
+        away_only = away != home
+        
+        team_matches = pd.DataFrame({
+            'team': np.concatenate([home, away[away_only]]),
+            'position': np.concatenate([positions, positions[away_only]]),
+            'win': np.concatenate([home_goals > away_goals, (away_goals > home_goals)[away_only]])
+        }).sort_values('position', kind='stable')
+        
+        # Últimas 5 partidas de cada equipe
+        last_matches = team_matches.groupby('team', sort=False).tail(5)
+        summary = last_matches.groupby('team', sort=False)['win'].agg(['sum', 'size'])
+        win_rate = summary['sum'] / summary['size']
+        
+        trends = np.select(
+            [summary['size'] < 3, win_rate >= 0.6, win_rate <= 0.2],
+            ['Unknown', 'Good', 'Poor'],
+            'Average'
+        )
+        return pd.Series(trends, index=summary.index)
     
     def optimize_hyperparameters(self, 
                                model_type: str,
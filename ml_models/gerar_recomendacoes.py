@@ -12,7 +12,9 @@ import os
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import text, bindparam, func, update
+from sqlalchemy.dialects import postgresql, sqlite
+from Coleta_de_dados.database.models import RecomendacaoAposta
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -20,6 +22,22 @@ warnings.filterwarnings('ignore')
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tipos de aposta com modelo treinado (<tipo>_modelo.pkl, _scaler.pkl, _label_encoder.pkl)
+TIPOS_APOSTA = ['resultado_1x2', 'over_under_2_5', 'ambos_marcam']
+
+# Colunas usadas nas features, na mesma ordem de criar_features_partida
+ESTATISTICAS_CASA = ['gols_marcados_por_jogo', 'gols_sofridos_por_jogo', 'saldo_gols', 'aproveitamento',
+                     'vitorias_casa', 'empates_casa', 'derrotas_casa', 'pontos', 'jogos']
+ESTATISTICAS_VISITANTE = ['gols_marcados_por_jogo', 'gols_sofridos_por_jogo', 'saldo_gols', 'aproveitamento',
+                          'vitorias_fora', 'empates_fora', 'derrotas_fora', 'pontos', 'jogos']
+SENTIMENTO = ['sentimento_medio_noticias', 'sentimento_medio_posts', 'media_curtidas',
+              'media_comentarios', 'media_compartilhamentos']
+HISTORICO = ['historico_vitorias_clube_referencia', 'historico_empates', 'historico_derrotas_clube_referencia',
+             'historico_media_gols_clube_referencia', 'historico_media_gols_adversario', 'historico_media_total_gols']
+
+# Confrontos diretos considerados por partida
+CONFRONTOS_POR_PARTIDA = 5
+
 class GeradorRecomendacoes:
     """Gerador de recomendações de apostas usando modelos de ML treinados."""
     
@@ -50,10 +68,7 @@ class GeradorRecomendacoes:
                 logger.error(f"❌ Diretório de modelos não encontrado: {self.diretorio_modelos}")
                 return False
             
-            # Tipos de modelos disponíveis
-            tipos_modelos = ['resultado_1x2', 'over_under_2_5', 'ambos_marcam']
-            
-            for tipo in tipos_modelos:
+            for tipo in TIPOS_APOSTA:
                 caminho_modelo = os.path.join(self.diretorio_modelos, f'{tipo}_modelo.pkl')
                 caminho_scaler = os.path.join(self.diretorio_modelos, f'{tipo}_scaler.pkl')
                 caminho_le = os.path.join(self.diretorio_modelos, f'{tipo}_label_encoder.pkl')
@@ -99,8 +114,6 @@ class GeradorRecomendacoes:
                 SELECT 
                     p.id,
                     p.data_partida,
-                    p.estadio,
-                    p.arbitro,
                     p.status,
                     c1.nome as clube_casa,
                     c1.id as clube_casa_id,
@@ -187,9 +200,17 @@ class GeradorRecomendacoes:
                         CASE WHEN p.gols_visitante < p.gols_casa THEN 1 ELSE 0 END
                     ELSE 0 END), 0) as derrotas_fora
                 FROM clubes c
-                LEFT JOIN partidas p ON (p.clube_casa_id = c.id OR p.clube_visitante_id = c.id)
-                    AND p.status = 'finalizada' 
-                    AND p.data_partida < :data_referencia
+                LEFT JOIN (
+                    -- Cada partida uma vez por clube envolvido, para o join ser por igualdade
+                    SELECT clube_casa_id AS clube_id, clube_casa_id, clube_visitante_id, gols_casa, gols_visitante
+                    FROM partidas
+                    WHERE status = 'finalizada' AND data_partida < :data_referencia
+                    UNION ALL
+                    SELECT clube_visitante_id, clube_casa_id, clube_visitante_id, gols_casa, gols_visitante
+                    FROM partidas
+                    WHERE status = 'finalizada' AND data_partida < :data_referencia
+                        AND clube_visitante_id <> clube_casa_id
+                ) p ON p.clube_id = c.id
                 GROUP BY c.id, c.nome
             """
             
@@ -388,7 +409,93 @@ class GeradorRecomendacoes:
         except Exception as e:
             logger.error(f"❌ Erro ao carregar histórico de confrontos: {e}")
             return pd.DataFrame()
-    
+
+    def carregar_historico_confrontos_lote(self, partidas: pd.DataFrame) -> pd.DataFrame:
+        """
+        Resume os confrontos diretos de todas as partidas com uma única consulta.
+
+        Para cada partida considera os últimos confrontos entre os dois clubes
+        anteriores à data da partida, como em carregar_historico_confrontos,
+        com os gols do ponto de vista do clube da casa.
+
+        Args:
+            partidas: DataFrame de carregar_partidas_futuras
+
+        Returns:
+            DataFrame com as colunas de histórico, indexado como ``partidas``
+        """
+        resumo = pd.DataFrame(0.0, index=partidas.index, columns=HISTORICO)
+        try:
+            clubes = sorted(set(partidas['clube_casa_id']) | set(partidas['clube_visitante_id']))
+            query = text("""
+                SELECT
+                    p.data_partida,
+                    p.gols_casa,
+                    p.gols_visitante,
+                    p.clube_casa_id,
+                    p.clube_visitante_id
+                FROM partidas p
+                WHERE p.status = 'finalizada'
+                    AND p.data_partida < :data_referencia
+                    AND p.clube_casa_id IN :clubes
+                    AND p.clube_visitante_id IN :clubes
+            """).bindparams(bindparam('clubes', expanding=True))
+
+            result = self.db_session.execute(query, {
+                'data_referencia': partidas['data_partida'].max(),
+                'clubes': clubes
+            })
+            confrontos = pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+            if confrontos.empty:
+                return resumo
+
+            # Cada partida futura com todos os jogos anteriores entre o mesmo par de clubes
+            def par(df):
+                return list(zip(np.minimum(df['clube_casa_id'], df['clube_visitante_id']),
+                                np.maximum(df['clube_casa_id'], df['clube_visitante_id'])))
+
+            futuras = pd.DataFrame({
+                'ordem': partidas.index,
+                'par': par(partidas),
+                'referencia_id': partidas['clube_casa_id'].to_numpy(),
+                'data_referencia': partidas['data_partida'].to_numpy()
+            })
+            confrontos['par'] = par(confrontos)
+            jogos = futuras.merge(confrontos, on='par')
+            jogos = jogos[jogos['data_partida'] < jogos['data_referencia']]
+            if jogos.empty:
+                return resumo
+
+            referencia_em_casa = jogos['clube_casa_id'] == jogos['referencia_id']
+            jogos = jogos.assign(
+                gols_clube=np.where(referencia_em_casa, jogos['gols_casa'], jogos['gols_visitante']),
+                gols_adversario=np.where(referencia_em_casa, jogos['gols_visitante'], jogos['gols_casa'])
+            )
+            jogos = (jogos.sort_values(['ordem', 'data_partida'], ascending=[True, False], kind='stable')
+                     .groupby('ordem').head(CONFRONTOS_POR_PARTIDA))
+
+            vitorias = jogos['gols_clube'] > jogos['gols_adversario']
+            derrotas = jogos['gols_clube'] < jogos['gols_adversario']
+            agregado = jogos.assign(
+                vitorias=vitorias, derrotas=derrotas, empates=~(vitorias | derrotas),
+                total_gols=jogos['gols_clube'] + jogos['gols_adversario']
+            ).groupby('ordem').agg(
+                historico_vitorias_clube_referencia=('vitorias', 'sum'),
+                historico_empates=('empates', 'sum'),
+                historico_derrotas_clube_referencia=('derrotas', 'sum'),
+                historico_media_gols_clube_referencia=('gols_clube', 'mean'),
+                historico_media_gols_adversario=('gols_adversario', 'mean'),
+                historico_media_total_gols=('total_gols', 'mean')
+            )
+            resumo.loc[agregado.index, HISTORICO] = agregado[HISTORICO].to_numpy(dtype=float)
+
+            logger.info(f"✅ Confrontos históricos de {len(agregado)} partidas carregados")
+            return resumo
+
+        except Exception as e:
+            logger.error(f"❌ Erro ao carregar histórico de confrontos em lote: {e}")
+            return resumo
+
     def criar_features_partida(self, partida: pd.Series, estatisticas_clubes: pd.DataFrame,
                               sentimento_clubes: pd.DataFrame, historico_confrontos: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -556,7 +663,50 @@ class GeradorRecomendacoes:
         except Exception as e:
             logger.error(f"❌ Erro ao criar features da partida: {e}")
             return {}
-    
+
+    def criar_features_lote(self, partidas: pd.DataFrame, estatisticas_clubes: pd.DataFrame,
+                            sentimento_clubes: pd.DataFrame, historico_confrontos: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cria a matriz de features de todas as partidas de uma vez.
+
+        Mesmas colunas, na mesma ordem e com os mesmos valores padrão de
+        criar_features_partida, uma linha por partida.
+
+        Args:
+            partidas: DataFrame de carregar_partidas_futuras
+            estatisticas_clubes: DataFrame com estatísticas dos clubes
+            sentimento_clubes: DataFrame com dados de sentimento
+            historico_confrontos: DataFrame de carregar_historico_confrontos_lote
+
+        Returns:
+            DataFrame com uma linha de features por partida
+        """
+        def colunas_clube(tabela, coluna_id, colunas, prefixo):
+            # Clubes sem dados ficam com 0, como no cálculo por partida
+            por_clube = tabela.reindex(columns=['clube_id', *colunas]).set_index('clube_id')
+            valores = por_clube.reindex(partidas[coluna_id].to_numpy()).fillna(0.0)
+            valores.columns = [f'{prefixo}_{coluna}' for coluna in colunas]
+            valores.index = partidas.index
+            return valores
+
+        features = pd.concat([
+            colunas_clube(estatisticas_clubes, 'clube_casa_id', ESTATISTICAS_CASA, 'casa'),
+            colunas_clube(estatisticas_clubes, 'clube_visitante_id', ESTATISTICAS_VISITANTE, 'visitante'),
+            colunas_clube(sentimento_clubes, 'clube_casa_id', SENTIMENTO, 'casa'),
+            colunas_clube(sentimento_clubes, 'clube_visitante_id', SENTIMENTO, 'visitante'),
+            historico_confrontos[HISTORICO]
+        ], axis=1)
+
+        # Features derivadas
+        for coluna in ['aproveitamento', 'saldo_gols', 'gols_marcados_por_jogo', 'gols_sofridos_por_jogo']:
+            features[f'diferenca_{coluna}'] = features[f'casa_{coluna}'] - features[f'visitante_{coluna}']
+        features['diferenca_sentimento_noticias'] = (features['casa_sentimento_medio_noticias']
+                                                     - features['visitante_sentimento_medio_noticias'])
+        features['diferenca_sentimento_posts'] = (features['casa_sentimento_medio_posts']
+                                                  - features['visitante_sentimento_medio_posts'])
+
+        return features
+
     def gerar_recomendacao_partida(self, partida: pd.Series, estatisticas_clubes: pd.DataFrame,
                                   sentimento_clubes: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -680,7 +830,48 @@ class GeradorRecomendacoes:
         except Exception as e:
             logger.error(f"❌ Erro ao fazer predição com modelo {tipo_aposta}: {e}")
             return {}
-    
+
+    def _fazer_predicao_lote(self, features: pd.DataFrame, tipo_aposta: str) -> List[Dict[str, Any]]:
+        """
+        Faz a predição de todas as partidas com uma chamada ao modelo.
+
+        A classe prevista é a de maior probabilidade, então basta uma chamada
+        a predict_proba por modelo.
+
+        Args:
+            features: Matriz de features (uma linha por partida)
+            tipo_aposta: Tipo de aposta
+
+        Returns:
+            Lista com a predição de cada partida, no formato de _fazer_predicao_modelo
+            (vazia em caso de erro)
+        """
+        try:
+            if tipo_aposta not in self.modelos:
+                return []
+
+            modelo = self.modelos[tipo_aposta]
+            probabilidades = modelo.predict_proba(self.scalers[tipo_aposta].transform(features))
+            predicao = modelo.classes_[probabilidades.argmax(axis=1)]
+
+            if tipo_aposta in self.label_encoders:
+                predicao = self.label_encoders[tipo_aposta].inverse_transform(predicao)
+
+            confiancas = probabilidades.max(axis=1)
+            return [
+                {
+                    'predicao': predicao[i],
+                    'probabilidades': probabilidades[i],
+                    'confianca': float(confiancas[i]),
+                    'modelo_utilizado': modelo.__class__.__name__
+                }
+                for i in range(len(features))
+            ]
+
+        except Exception as e:
+            logger.error(f"❌ Erro ao fazer predição em lote com modelo {tipo_aposta}: {e}")
+            return []
+
     def _calcular_odds_rating(self, predicao: Dict[str, Any]) -> Tuple[float, int]:
         """
         Calcula odds justa e rating baseado na predição.
@@ -716,12 +907,18 @@ class GeradorRecomendacoes:
         else:
             return 'empate'
     
-    def gerar_recomendacoes_lote(self, dias_futuros: int = 7) -> List[Dict[str, Any]]:
+    def gerar_recomendacoes_lote(self, dias_futuros: int = 7, vetorizado: bool = True) -> List[Dict[str, Any]]:
         """
         Gera recomendações para todas as partidas futuras.
         
+        No modo vetorizado as features de todas as partidas são montadas em uma
+        única matriz (confrontos diretos em uma consulta) e cada modelo é
+        chamado uma vez; com ``vetorizado=False`` cada partida é processada
+        por gerar_recomendacao_partida.
+        
         Args:
             dias_futuros: Número de dias no futuro para buscar partidas
+            vetorizado: Gerar todas as partidas de uma vez
             
         Returns:
             Lista com todas as recomendações geradas
@@ -743,6 +940,13 @@ class GeradorRecomendacoes:
                 logger.error("❌ Nenhuma estatística de clube encontrada")
                 return []
             
+            if vetorizado:
+                todas_recomendacoes = self._gerar_recomendacoes_vetorizado(
+                    partidas_futuras, estatisticas_clubes, sentimento_clubes
+                )
+                logger.info(f"✅ {len(todas_recomendacoes)} recomendações geradas com sucesso")
+                return todas_recomendacoes
+            
             # Lista para armazenar recomendações
             todas_recomendacoes = []
             
@@ -772,10 +976,54 @@ class GeradorRecomendacoes:
             logger.error(f"❌ Erro fatal na geração de recomendações: {e}")
             return []
     
+    def _gerar_recomendacoes_vetorizado(self, partidas: pd.DataFrame, estatisticas_clubes: pd.DataFrame,
+                                        sentimento_clubes: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Recomendações de todas as partidas com uma predição por modelo."""
+        partidas = partidas.reset_index(drop=True)
+        historico = self.carregar_historico_confrontos_lote(partidas)
+        features = self.criar_features_lote(partidas, estatisticas_clubes, sentimento_clubes, historico)
+        
+        predicoes = {}
+        for tipo_aposta in TIPOS_APOSTA:
+            predicoes_tipo = self._fazer_predicao_lote(features, tipo_aposta)
+            if predicoes_tipo:
+                predicoes[tipo_aposta] = predicoes_tipo
+        
+        features_utilizadas = list(features.columns)
+        data_geracao = datetime.now().isoformat()
+        todas_recomendacoes = []
+        for i, partida in enumerate(partidas.to_dict('records')):
+            recomendacoes = {tipo_aposta: predicoes_tipo[i] for tipo_aposta, predicoes_tipo in predicoes.items()}
+            
+            # Calcula odds justas e ratings
+            for predicao in recomendacoes.values():
+                predicao['odd_justa'], predicao['rating'] = self._calcular_odds_rating(predicao)
+            
+            todas_recomendacoes.append({
+                'partida_id': partida['id'],
+                'clube_casa': partida['clube_casa'],
+                'clube_visitante': partida['clube_visitante'],
+                'data_partida': partida['data_partida'],
+                'competicao': partida['competicao'],
+                'recomendacoes': recomendacoes,
+                'features_utilizadas': features_utilizadas,
+                'data_geracao': data_geracao
+            })
+        
+        logger.info(f"📊 {len(partidas)} partidas processadas em lote ({len(predicoes)} modelos)")
+        return todas_recomendacoes
+    
     def salvar_recomendacoes_banco(self, recomendacoes: List[Dict[str, Any]]) -> bool:
         """
         Salva as recomendações geradas no banco de dados.
         
+        Todas as recomendações (uma linha por partida e tipo de aposta em
+        recomendacoes_apostas) são gravadas com um único upsert: uma
+        recomendação já existente para a mesma partida, mercado e previsão
+        é atualizada. Na mesma transação, recomendações ativas da partida e
+        mercado com outra previsão (a predição mudou) passam a 'cancelada',
+        então cada partida e mercado tem no máximo uma recomendação ativa.
+        
         Args:
             recomendacoes: Lista com recomendações
             
@@ -787,71 +1035,71 @@ class GeradorRecomendacoes:
                 logger.warning("⚠️ Nenhuma recomendação para salvar")
                 return True
             
-            logger.info(f"💾 Salvando {len(recomendacoes)} recomendações no banco...")
-            
-            # Insere cada recomendação
+            # Uma linha por (partida, mercado); a última geração vence
+            linhas = {}
             for recomendacao in recomendacoes:
-                try:
-                    # Insere recomendação principal
-                    query_principal = """
-                        INSERT INTO recomendacoes_apostas 
-                        (partida_id, clube_casa, clube_visitante, data_partida, competicao, 
-                         features_utilizadas, data_geracao, status)
-                        VALUES (:partida_id, :clube_casa, :clube_visitante, :data_partida, :competicao,
-                                :features_utilizadas, :data_geracao, 'ativa')
-                        RETURNING id
-                    """
-                    
-                    result = self.db_session.execute(text(query_principal), {
-                        'partida_id': recomendacao['partida_id'],
-                        'clube_casa': recomendacao['clube_casa'],
-                        'clube_visitante': recomendacao['clube_visitante'],
-                        'data_partida': recomendacao['data_partida'],
-                        'competicao': recomendacao['competicao'],
-                        'features_utilizadas': ','.join(recomendacao['features_utilizadas']),
-                        'data_geracao': recomendacao['data_geracao']
-                    })
-                    
-                    recomendacao_id = result.fetchone()[0]
-                    
-                    # Insere detalhes das recomendações
-                    for tipo_aposta, detalhes in recomendacao['recomendacoes'].items():
-                        query_detalhes = """
-                            INSERT INTO detalhes_recomendacoes
-                            (recomendacao_id, tipo_aposta, predicao, probabilidade, confianca,
-                             odd_justa, rating, modelo_utilizado)
-                            VALUES (:recomendacao_id, :tipo_aposta, :predicao, :probabilidade, :confianca,
-                                    :odd_justa, :rating, :modelo_utilizado)
-                        """
-                        
-                        # Calcula probabilidade média
-                        prob_media = np.mean(detalhes['probabilidades'])
-                        
-                        self.db_session.execute(text(query_detalhes), {
-                            'recomendacao_id': recomendacao_id,
-                            'tipo_aposta': tipo_aposta,
-                            'predicao': str(detalhes['predicao']),
-                            'probabilidade': float(prob_media),
-                            'confianca': detalhes['confianca'],
-                            'odd_justa': detalhes['odd_justa'],
-                            'rating': detalhes['rating'],
-                            'modelo_utilizado': detalhes['modelo_utilizado']
-                        })
-                    
-                except Exception as e:
-                    logger.error(f"❌ Erro ao salvar recomendação {recomendacao['partida_id']}: {e}")
-                    continue
-            
-            # Commit das transações
+                features_utilizadas = ','.join(recomendacao['features_utilizadas'])
+                for tipo_aposta, detalhes in recomendacao['recomendacoes'].items():
+                    linha = {
+                        'partida_id': int(recomendacao['partida_id']),
+                        'mercado_aposta': tipo_aposta,
+                        'previsao': str(detalhes['predicao']),
+                        'probabilidade': float(detalhes['confianca']),
+                        'odd_justa': float(detalhes['odd_justa']),
+                        'rating': int(detalhes['rating']),
+                        'confianca_modelo': float(detalhes['confianca']),
+                        'modelo_utilizado': detalhes['modelo_utilizado'],
+                        'features_utilizadas': features_utilizadas,
+                        'status': 'ativa'
+                    }
+                    linhas[(linha['partida_id'], linha['mercado_aposta'])] = linha
+            
+            logger.info(f"💾 Salvando {len(linhas)} recomendações de {len(recomendacoes)} partidas no banco...")
+            
+            self.db_session.execute(self._upsert_recomendacoes(), list(linhas.values()))
+            self.db_session.execute(self._cancelar_previsoes_substituidas(), [
+                {'b_partida_id': linha['partida_id'], 'b_mercado_aposta': linha['mercado_aposta'],
+                 'b_previsao': linha['previsao']}
+                for linha in linhas.values()
+            ])
             self.db_session.commit()
-            logger.info("✅ Todas as recomendações salvas no banco com sucesso!")
             
+            # Resumos em cache (ex.: /recomendacoes/resumo) dependem desta tabela
+            from Coleta_de_dados.database.invalidacao_cache import invalidar_tabelas
+            invalidar_tabelas("recomendacoes_apostas")
+            
+            logger.info("✅ Todas as recomendações salvas no banco com sucesso!")
             return True
             
         except Exception as e:
             logger.error(f"❌ Erro ao salvar recomendações no banco: {e}")
             self.db_session.rollback()
             return False
+    
+    def _upsert_recomendacoes(self):
+        """INSERT ... ON CONFLICT na chave única (partida, mercado, previsão) de recomendacoes_apostas."""
+        tabela = RecomendacaoAposta.__table__
+        dialeto = self.db_session.get_bind().dialect.name
+        insert = postgresql.insert(tabela) if dialeto == 'postgresql' else sqlite.insert(tabela)
+        atualizar = ['probabilidade', 'odd_justa', 'rating', 'confianca_modelo',
+                     'modelo_utilizado', 'features_utilizadas', 'status']
+        return insert.on_conflict_do_update(
+            index_elements=['partida_id', 'mercado_aposta', 'previsao'],
+            set_={**{coluna: insert.excluded[coluna] for coluna in atualizar}, 'updated_at': func.now()}
+        )
+    
+    @staticmethod
+    def _cancelar_previsoes_substituidas():
+        """UPDATE que cancela as recomendações ativas da partida e mercado com outra previsão."""
+        tabela = RecomendacaoAposta.__table__
+        return (
+            update(tabela)
+            .where(tabela.c.partida_id == bindparam('b_partida_id'),
+                   tabela.c.mercado_aposta == bindparam('b_mercado_aposta'),
+                   tabela.c.previsao != bindparam('b_previsao'),
+                   tabela.c.status == 'ativa')
+            .values(status='cancelada', updated_at=func.now())
+        )
 
 
 def executar_geracao_recomendacoes():
@@ -408,6 +408,52 @@ class MLModelManager:
             logger.error(f"Erro ao fazer previsão com {model_key}: {e}")
             raise
     
+    def make_predictions_batch(self, model_key: str, linhas: List[List[float]],
+                               return_probability: bool = True) -> List[Dict[str, Any]]:
+        """
+        Faz previsões para várias linhas com uma única chamada a predict/predict_proba.
+        
+        Cada item do resultado tem o formato de ``make_prediction`` para uma linha.
+        """
+        try:
+            if model_key not in self.models:
+                raise ValueError(f"Modelo '{model_key}' não encontrado")
+            
+            model = self.models[model_key]
+            feature_names = self.model_metadata[model_key]['feature_names']
+            
+            # Um DataFrame para todas as linhas; a largura é validada uma vez
+            matriz = np.array(linhas, dtype=float)
+            if matriz.ndim != 2 or matriz.shape[1] != len(feature_names):
+                raise ValueError(
+                    f"Features não correspondem: esperadas {len(feature_names)} por linha, "
+                    f"recebidas {matriz.shape[-1] if matriz.ndim else 0}"
+                )
+            features = pd.DataFrame(matriz, columns=feature_names)
+            
+            predictions = model.predict(features)
+            probabilities = model.predict_proba(features) if return_probability and hasattr(model, 'predict_proba') else None
+            confidences = np.max(probabilities, axis=1) if probabilities is not None else None
+            
+            timestamp = datetime.now().isoformat()
+            results = []
+            for i, prediction in enumerate(predictions):
+                result = {
+                    'prediction': prediction,
+                    'confidence': confidences[i] if confidences is not None else 1.0,
+                    'model_key': model_key,
+                    'timestamp': timestamp
+                }
+                if probabilities is not None:
+                    result['probabilities'] = probabilities[i]
+                results.append(result)
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Erro ao fazer previsões em lote com {model_key}: {e}")
+            raise
+    
     def save_model(self, model_key: str, filename: str = None) -> str:
         """Salva um modelo treinado"""
         try:
@@ -534,6 +580,10 @@ def make_prediction(model_key: str, features: Union[pd.DataFrame, np.ndarray, Li
     """Faz previsão usando um modelo treinado"""
     return ml_model_manager.make_prediction(model_key, features, **kwargs)
 
+def make_predictions_batch(model_key: str, linhas: List[List[float]], **kwargs) -> List[Dict]:
+    """Faz previsões em lote usando um modelo treinado"""
+    return ml_model_manager.make_predictions_batch(model_key, linhas, **kwargs)
+
 def save_model(model_key: str, filename: str = None) -> str:
     """Salva um modelo treinado"""
     return ml_model_manager.save_model(model_key, filename)
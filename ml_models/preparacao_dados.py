@@ -10,7 +10,7 @@ import logging
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import text, func
+from sqlalchemy import text, func, bindparam
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -97,9 +97,11 @@ class PreparadorDadosML:
             df_partidas = pd.DataFrame(partidas)
             
             # Calcula resultado da partida
-            df_partidas['resultado'] = df_partidas.apply(
-                lambda row: self._calcular_resultado(row['gols_casa'], row['gols_visitante']), 
-                axis=1
+            df_partidas['resultado'] = np.select(
+                [df_partidas['gols_casa'] > df_partidas['gols_visitante'],
+                 df_partidas['gols_casa'] < df_partidas['gols_visitante']],
+                ['casa', 'visitante'],
+                'empate'
             )
             
             # Calcula total de gols
@@ -329,7 +331,7 @@ class PreparadorDadosML:
                     AND p.data_partida < :data_referencia
                     AND ((p.clube_casa_id = :clube_casa_id AND p.clube_visitante_id = :clube_visitante_id)
                          OR (p.clube_casa_id = :clube_visitante_id AND p.clube_visitante_id = :clube_casa_id))
-                ORDER BY p.data_partida DESC
+                ORDER BY p.data_partida DESC, p.id DESC
                 LIMIT 10
             """
             
@@ -533,6 +535,221 @@ class PreparadorDadosML:
             logger.error(f"❌ Erro ao criar features da partida: {e}")
             return {}
     
+    def carregar_historico_confrontos_lote(self, df_partidas: pd.DataFrame) -> pd.DataFrame:
+        """
+        Carrega, em uma única consulta, o histórico de confrontos de todas as partidas.
+        
+        Busca as partidas finalizadas entre os clubes envolvidos anteriores à
+        partida mais recente; o recorte por confronto e por data é feito em
+        ``calcular_features_confrontos``.
+        
+        Args:
+            df_partidas: DataFrame de partidas (``carregar_dados_partidas``)
+            
+        Returns:
+            DataFrame com id, data, clubes e gols de cada confronto
+        """
+        try:
+            clubes = pd.unique(pd.concat([df_partidas['clube_casa_id'], df_partidas['clube_visitante_id']]))
+            
+            query = text("""
+                SELECT 
+                    p.id,
+                    p.data_partida,
+                    p.gols_casa,
+                    p.gols_visitante,
+                    p.clube_casa_id,
+                    p.clube_visitante_id
+                FROM partidas p
+                JOIN clubes c1 ON p.clube_casa_id = c1.id
+                JOIN clubes c2 ON p.clube_visitante_id = c2.id
+                WHERE p.status = 'finalizada'
+                    AND p.data_partida < :data_referencia
+                    AND p.clube_casa_id IN :clubes
+                    AND p.clube_visitante_id IN :clubes
+            """).bindparams(bindparam('clubes', expanding=True))
+            
+            result = self.db_session.execute(query, {
+                'data_referencia': df_partidas['data_partida'].max(),
+                'clubes': [int(clube) for clube in clubes]
+            })
+            
+            df_historico = pd.DataFrame(
+                result.fetchall(),
+                columns=['id', 'data_partida', 'gols_casa', 'gols_visitante',
+                         'clube_casa_id', 'clube_visitante_id']
+            )
+            
+            logger.info(f"✅ {len(df_historico)} confrontos históricos carregados")
+            return df_historico
+            
+        except Exception as e:
+            logger.error(f"❌ Erro ao carregar histórico de confrontos: {e}")
+            return pd.DataFrame()
+    
+    def calcular_features_confrontos(self, df_partidas: pd.DataFrame, 
+                                     historico: pd.DataFrame, janela: int = 5) -> pd.DataFrame:
+        """
+        Calcula as features de histórico de confrontos de todas as partidas.
+        
+        Equivale a ``carregar_historico_confrontos`` + ``criar_features_partida``
+        por partida: considera os ``janela`` confrontos mais recentes entre os
+        dois clubes anteriores à data da partida, do ponto de vista do mandante.
+        As somas móveis são calculadas uma vez por confronto (somas acumuladas
+        por par de clubes) e associadas às partidas com ``merge_asof``.
+        
+        Args:
+            df_partidas: DataFrame de partidas
+            historico: DataFrame de ``carregar_historico_confrontos_lote``
+            janela: Número de confrontos considerados
+            
+        Returns:
+            DataFrame alinhado ao índice de ``df_partidas`` com as colunas historico_*
+        """
+        colunas_padrao = {
+            'historico_vitorias_clube_referencia': 0,
+            'historico_empates': 0,
+            'historico_derrotas_clube_referencia': 0,
+            'historico_media_gols_clube_referencia': 0.0,
+            'historico_media_gols_adversario': 0.0,
+            'historico_media_total_gols': 0.0
+        }
+        features = pd.DataFrame(colunas_padrao, index=df_partidas.index)
+        if historico.empty:
+            return features
+        
+        # Confrontos identificados pelo par ordenado (menor id, maior id)
+        historico = historico.copy()
+        historico['data_partida'] = pd.to_datetime(historico['data_partida'])
+        historico['par_a'] = np.minimum(historico['clube_casa_id'], historico['clube_visitante_id'])
+        historico['par_b'] = np.maximum(historico['clube_casa_id'], historico['clube_visitante_id'])
+        a_em_casa = historico['clube_casa_id'] == historico['par_a']
+        gols_a = np.where(a_em_casa, historico['gols_casa'], historico['gols_visitante'])
+        gols_b = np.where(a_em_casa, historico['gols_visitante'], historico['gols_casa'])
+        
+        historico['gols_a'] = gols_a
+        historico['gols_b'] = gols_b
+        historico['vitorias_a'] = (gols_a > gols_b).astype(int)
+        historico['empates'] = (gols_a == gols_b).astype(int)
+        historico['vitorias_b'] = (gols_a < gols_b).astype(int)
+        historico['jogos'] = 1
+        
+        # Somas dos últimos `janela` confrontos até cada partida do histórico (inclusive)
+        colunas = ['gols_a', 'gols_b', 'vitorias_a', 'empates', 'vitorias_b', 'jogos']
+        historico = historico.sort_values(['par_a', 'par_b', 'data_partida', 'id'])
+        acumulado = historico.groupby(['par_a', 'par_b'], sort=False)[colunas].cumsum()
+        anterior = acumulado.groupby([historico['par_a'], historico['par_b']], sort=False).shift(janela)
+        historico[colunas] = acumulado - anterior.fillna(0)
+        
+        # Último confronto estritamente anterior a cada partida
+        partidas = pd.DataFrame({
+            'par_a': np.minimum(df_partidas['clube_casa_id'], df_partidas['clube_visitante_id']),
+            'par_b': np.maximum(df_partidas['clube_casa_id'], df_partidas['clube_visitante_id']),
+            'data_partida': pd.to_datetime(df_partidas['data_partida']),
+            'mandante_a': df_partidas['clube_casa_id'] <= df_partidas['clube_visitante_id']
+        }, index=df_partidas.index).dropna(subset=['data_partida'])
+        
+        janelas = pd.merge_asof(
+            partidas.reset_index().sort_values('data_partida'),
+            historico.sort_values(['data_partida', 'id'])[['par_a', 'par_b', 'data_partida', *colunas]],
+            on='data_partida',
+            by=['par_a', 'par_b'],
+            allow_exact_matches=False
+        ).set_index('index')
+        janelas = janelas[janelas['jogos'] > 0]
+        
+        mandante_a = janelas['mandante_a'].to_numpy(dtype=bool)
+        jogos = janelas['jogos']
+        gols_referencia = np.where(mandante_a, janelas['gols_a'], janelas['gols_b'])
+        gols_adversario = np.where(mandante_a, janelas['gols_b'], janelas['gols_a'])
+        
+        features.loc[janelas.index, 'historico_vitorias_clube_referencia'] = np.where(
+            mandante_a, janelas['vitorias_a'], janelas['vitorias_b']
+        ).astype(int)
+        features.loc[janelas.index, 'historico_empates'] = janelas['empates'].astype(int)
+        features.loc[janelas.index, 'historico_derrotas_clube_referencia'] = np.where(
+            mandante_a, janelas['vitorias_b'], janelas['vitorias_a']
+        ).astype(int)
+        features.loc[janelas.index, 'historico_media_gols_clube_referencia'] = gols_referencia / jogos
+        features.loc[janelas.index, 'historico_media_gols_adversario'] = gols_adversario / jogos
+        features.loc[janelas.index, 'historico_media_total_gols'] = (gols_referencia + gols_adversario) / jogos
+        
+        return features
+    
+    def criar_features_lote(self, df_partidas: pd.DataFrame, estatisticas_clubes: pd.DataFrame,
+                            sentimento_clubes: pd.DataFrame, features_confrontos: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cria as features de todas as partidas de uma vez.
+        
+        Produz as mesmas colunas, na mesma ordem, que ``criar_features_partida``
+        aplicada a cada partida, usando junções por clube em vez de filtros por linha.
+        
+        Args:
+            df_partidas: DataFrame de partidas
+            estatisticas_clubes: DataFrame com estatísticas dos clubes
+            sentimento_clubes: DataFrame com dados de sentimento (pode ser vazio)
+            features_confrontos: DataFrame de ``calcular_features_confrontos``
+            
+        Returns:
+            DataFrame com uma linha de features por partida
+        """
+        features = pd.DataFrame({
+            'partida_id': df_partidas['id'],
+            'data_partida': df_partidas['data_partida'],
+            'clube_casa_id': df_partidas['clube_casa_id'],
+            'clube_visitante_id': df_partidas['clube_visitante_id'],
+            'competicao_id': df_partidas['competicao_id']
+        })
+        
+        def juntar(clube_id: pd.Series, tabela: pd.DataFrame, colunas: Dict[str, Any], prefixo: str):
+            """Valores da tabela por clube (ou o padrão, se o clube não estiver nela)."""
+            for coluna, padrao in colunas.items():
+                if tabela.empty or coluna not in tabela.columns:
+                    features[f'{prefixo}_{coluna}'] = padrao
+                    continue
+                valores = tabela.drop_duplicates('clube_id').set_index('clube_id')[coluna]
+                serie = clube_id.map(valores)
+                if serie.isna().any():
+                    serie = serie.fillna(padrao)
+                    if pd.api.types.is_integer_dtype(valores.dtype):
+                        serie = serie.astype(valores.dtype)
+                features[f'{prefixo}_{coluna}'] = serie
+        
+        # Features dos clubes
+        juntar(df_partidas['clube_casa_id'], estatisticas_clubes, {
+            'gols_marcados_por_jogo': 0.0, 'gols_sofridos_por_jogo': 0.0, 'saldo_gols': 0,
+            'aproveitamento': 0.0, 'vitorias_casa': 0, 'empates_casa': 0, 'derrotas_casa': 0,
+            'pontos': 0, 'jogos': 0
+        }, 'casa')
+        juntar(df_partidas['clube_visitante_id'], estatisticas_clubes, {
+            'gols_marcados_por_jogo': 0.0, 'gols_sofridos_por_jogo': 0.0, 'saldo_gols': 0,
+            'aproveitamento': 0.0, 'vitorias_fora': 0, 'empates_fora': 0, 'derrotas_fora': 0,
+            'pontos': 0, 'jogos': 0
+        }, 'visitante')
+        
+        # Features de sentimento
+        colunas_sentimento = {
+            'sentimento_medio_noticias': 0.0, 'sentimento_medio_posts': 0.0, 'media_curtidas': 0.0,
+            'media_comentarios': 0.0, 'media_compartilhamentos': 0.0
+        }
+        juntar(df_partidas['clube_casa_id'], sentimento_clubes, colunas_sentimento, 'casa')
+        juntar(df_partidas['clube_visitante_id'], sentimento_clubes, colunas_sentimento, 'visitante')
+        
+        # Features de histórico de confrontos
+        features = features.join(features_confrontos)
+        
+        # Features derivadas
+        features['diferenca_aproveitamento'] = features['casa_aproveitamento'] - features['visitante_aproveitamento']
+        features['diferenca_saldo_gols'] = features['casa_saldo_gols'] - features['visitante_saldo_gols']
+        features['diferenca_gols_marcados_por_jogo'] = features['casa_gols_marcados_por_jogo'] - features['visitante_gols_marcados_por_jogo']
+        features['diferenca_gols_sofridos_por_jogo'] = features['casa_gols_sofridos_por_jogo'] - features['visitante_gols_sofridos_por_jogo']
+        
+        # Features de sentimento agregadas
+        features['diferenca_sentimento_noticias'] = features['casa_sentimento_medio_noticias'] - features['visitante_sentimento_medio_noticias']
+        features['diferenca_sentimento_posts'] = features['casa_sentimento_medio_posts'] - features['visitante_sentimento_medio_posts']
+        
+        return features
+    
     def preparar_dataset_treinamento(self, data_inicio: Optional[datetime] = None,
                                    data_fim: Optional[datetime] = None) -> pd.DataFrame:
         """
@@ -566,46 +783,31 @@ class PreparadorDadosML:
                 logger.warning("⚠️ Nenhum dado de sentimento encontrado, usando valores padrão")
                 sentimento_clubes = pd.DataFrame()
             
-            # Lista para armazenar features de todas as partidas
-            todas_features = []
-            
-            # Processa cada partida
-            for idx, partida in df_partidas.iterrows():
-                try:
-                    # Carrega histórico de confrontos
-                    historico_confrontos = self.carregar_historico_confrontos(
-                        partida['clube_casa_id'], 
-                        partida['clube_visitante_id'],
-                        partida['data_partida']
-                    )
-                    
-                    # Cria features para a partida
-                    features = self.criar_features_partida(
-                        partida, estatisticas_clubes, sentimento_clubes, historico_confrontos
-                    )
-                    
-                    if features:
-                        # Adiciona target (resultado da partida)
-                        features['target_resultado'] = partida['resultado']
-                        features['target_total_gols'] = partida['total_gols']
-                        features['target_ambos_marcam'] = 1 if (partida['gols_casa'] > 0 and partida['gols_visitante'] > 0) else 0
-                        
-                        todas_features.append(features)
-                    
-                    # Log de progresso
-                    if (idx + 1) % 100 == 0:
-                        logger.info(f"📊 Processadas {idx + 1}/{len(df_partidas)} partidas")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Erro ao processar partida {partida['id']}: {e}")
-                    continue
+            # Histórico de confrontos de todas as partidas em uma consulta
+            historico_confrontos = self.carregar_historico_confrontos_lote(df_partidas)
+            features_confrontos = self.calcular_features_confrontos(df_partidas, historico_confrontos)
+            
+            # Partidas sem placar não geram features
+            com_placar = df_partidas['gols_casa'].notna() & df_partidas['gols_visitante'].notna()
+            if not com_placar.all():
+                logger.warning(f"⚠️ Ignorando {int((~com_placar).sum())} partidas sem placar")
+                df_partidas = df_partidas[com_placar]
             
-            if not todas_features:
+            if df_partidas.empty:
                 logger.error("❌ Nenhuma feature foi criada")
                 return pd.DataFrame()
             
-            # Converte para DataFrame
-            df_features = pd.DataFrame(todas_features)
+            df_features = self.criar_features_lote(
+                df_partidas, estatisticas_clubes, sentimento_clubes, features_confrontos
+            )
+            
+            # Adiciona targets (resultado da partida)
+            df_features['target_resultado'] = df_partidas['resultado']
+            df_features['target_total_gols'] = df_partidas['total_gols']
+            df_features['target_ambos_marcam'] = (
+                (df_partidas['gols_casa'] > 0) & (df_partidas['gols_visitante'] > 0)
+            ).astype(int)
+            df_features = df_features.reset_index(drop=True)
             
             # Remove colunas com muitos valores nulos
             colunas_com_nulos = df_features.columns[df_features.isnull().sum() > len(df_features) * 0.5]
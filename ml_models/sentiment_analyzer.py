@@ -70,6 +70,12 @@ class SentimentAnalyzer:
             'promoção': 0.8,
             'rebaixamento': -0.8
         }
+        
+        # Léxico compilado: id inteiro por palavra (0 = fora do léxico) e score por id
+        self._lexicon_ids = {word: i for i, word in enumerate(self.football_sentiment_words, start=1)}
+        self._lexicon_scores = np.array([0.0] + list(self.football_sentiment_words.values()))
+        # Token -> id já lematizado (memoriza o lematizador)
+        self._token_ids: Dict[str, int] = {}
     
     def preprocess_text(self, text: str) -> str:
         """Pré-processa o texto para análise"""
@@ -114,16 +120,35 @@ class SentimentAnalyzer:
     @timed_cache_result(ttl_hours=12)
     def analyze_sentiment_textblob(self, text: str) -> Dict[str, Union[float, str, List[str]]]:
         """Análise de sentimento usando TextBlob"""
+        return self._textblob_result(text)
+    
+    def _empty_result(self, method: str) -> Dict[str, Union[float, str, List[str]]]:
+        return {
+            'sentiment_score': 0.0,
+            'sentiment_label': 'neutral',
+            'confidence': 0.0,
+            'football_keywords': [],
+            'analysis_method': method
+        }
+    
+    def _error_result(self, method: str, error: Exception) -> Dict[str, Union[float, str, List[str]]]:
+        return {
+            'sentiment_score': 0.0,
+            'sentiment_label': 'error',
+            'confidence': 0.0,
+            'football_keywords': [],
+            'analysis_method': method,
+            'error': str(error)
+        }
+    
+    def _textblob_result(self, text: str,
+                         preprocessed_text: Optional[str] = None) -> Dict[str, Union[float, str, List[str]]]:
+        """Resultado TextBlob, reaproveitando o texto pré-processado quando informado"""
         try:
-            preprocessed_text = self.preprocess_text(text)
+            if preprocessed_text is None:
+                preprocessed_text = self.preprocess_text(text)
             if not preprocessed_text:
-                return {
-                    'sentiment_score': 0.0,
-                    'sentiment_label': 'neutral',
-                    'confidence': 0.0,
-                    'football_keywords': [],
-                    'analysis_method': 'textblob'
-                }
+                return self._empty_result('textblob')
             
             # Análise TextBlob
             blob = TextBlob(preprocessed_text)
@@ -156,47 +181,83 @@ class SentimentAnalyzer:
             
         except Exception as e:
             logger.error(f"Erro na análise TextBlob: {e}")
-            return {
-                'sentiment_score': 0.0,
-                'sentiment_label': 'error',
-                'confidence': 0.0,
-                'football_keywords': [],
-                'analysis_method': 'textblob',
-                'error': str(e)
-            }
+            return self._error_result('textblob', e)
     
     def analyze_sentiment_lexical(self, text: str) -> Dict[str, Union[float, str, List[str]]]:
         """Análise de sentimento baseada em léxico esportivo"""
         try:
             preprocessed_text = self.preprocess_text(text)
+        except Exception as e:
+            logger.error(f"Erro na análise léxica: {e}")
+            return self._error_result('lexical', e)
+        return self._lexical_results([text], [preprocessed_text])[0]
+    
+    def _lexicon_token_ids(self, preprocessed_text: str) -> List[int]:
+        """Tokeniza e lematiza o texto, retornando o id de cada palavra no léxico esportivo"""
+        ids = []
+        for word in word_tokenize(preprocessed_text):
+            word_id = self._token_ids.get(word)
+            if word_id is None:
+                if len(self._token_ids) > 100000:
+                    self._token_ids.clear()
+                word_id = self._token_ids[word] = self._lexicon_ids.get(self.lemmatizer.lemmatize(word), 0)
+            ids.append(word_id)
+        return ids
+    
+    def _lexical_results(self, texts: List[str], preprocessed_texts: List[str],
+                         chunk_size: int = 64) -> List[Dict[str, Union[float, str, List[str]]]]:
+        """
+        Análise léxica de um lote de textos já pré-processados.
+        
+        Cada palavra contribui com o score do léxico e, como na análise palavra
+        a palavra, com o score de cada expressão idiomática presente no texto.
+        As contribuições ficam numa matriz (texto x palavra x [palavra, idiomas])
+        somada em ordem com cumsum, o que reproduz exatamente a soma sequencial.
+        """
+        results: List[Optional[Dict]] = [None] * len(texts)
+        scored = []  # (índice, ids das palavras, scores dos idiomas presentes)
+        
+        for i, preprocessed_text in enumerate(preprocessed_texts):
             if not preprocessed_text:
-                return {
-                    'sentiment_score': 0.0,
-                    'sentiment_label': 'neutral',
-                    'confidence': 0.0,
-                    'football_keywords': [],
-                    'analysis_method': 'lexical'
-                }
+                results[i] = self._empty_result('lexical')
+                continue
+            try:
+                ids = self._lexicon_token_ids(preprocessed_text)
+            except Exception as e:
+                logger.error(f"Erro na análise léxica: {e}")
+                results[i] = self._error_result('lexical', e)
+                continue
+            idiom_scores = [score for idiom, score in self.football_idioms.items() if idiom in preprocessed_text]
+            scored.append((i, ids, idiom_scores))
+        
+        # Lotes de tamanho parecido para pouco preenchimento na matriz
+        scored.sort(key=lambda item: len(item[1]) * (1 + len(item[2])))
+        for start in range(0, len(scored), chunk_size):
+            chunk = scored[start:start + chunk_size]
+            max_words = max(len(ids) for _, ids, _ in chunk)
+            width = 1 + max(len(idiom_scores) for _, _, idiom_scores in chunk)
             
-            words = word_tokenize(preprocessed_text)
-            total_score = 0.0
-            matched_words = 0
+            word_ids = np.zeros((len(chunk), max_words), dtype=np.intp)
+            contributions = np.zeros((len(chunk), max_words, width))
+            for row, (_, ids, idiom_scores) in enumerate(chunk):
+                word_ids[row, :len(ids)] = ids
+                if idiom_scores:
+                    contributions[row, :len(ids), 1:1 + len(idiom_scores)] = idiom_scores
+            contributions[:, :, 0] = self._lexicon_scores[word_ids]
             
-            # Calcular score baseado no léxico esportivo
-            for word in words:
-                word_lemma = self.lemmatizer.lemmatize(word)
-                
-                # Verificar palavras do futebol
-                if word_lemma in self.football_sentiment_words:
-                    total_score += self.football_sentiment_words[word_lemma]
-                    matched_words += 1
-                
-                # Verificar expressões idiomáticas
-                for idiom, score in self.football_idioms.items():
-                    if idiom in preprocessed_text:
-                        total_score += score
-                        matched_words += 1
+            # Zeros do preenchimento não alteram a soma acumulada
+            totals = np.cumsum(contributions.reshape(len(chunk), -1), axis=1)[:, -1].tolist()
+            word_matches = np.count_nonzero(word_ids, axis=1).tolist()
             
+            for (i, ids, idiom_scores), total_score, matched in zip(chunk, totals, word_matches):
+                matched_words = matched + len(ids) * len(idiom_scores)
+                results[i] = self._lexical_result(texts[i], preprocessed_texts[i], total_score, matched_words)
+        
+        return results
+    
+    def _lexical_result(self, text: str, preprocessed_text: str, total_score: float,
+                        matched_words: int) -> Dict[str, Union[float, str, List[str]]]:
+        try:
             # Normalizar score
             if matched_words > 0:
                 sentiment_score = total_score / matched_words
@@ -227,14 +288,7 @@ class SentimentAnalyzer:
             
         except Exception as e:
             logger.error(f"Erro na análise léxica: {e}")
-            return {
-                'sentiment_score': 0.0,
-                'sentiment_label': 'error',
-                'confidence': 0.0,
-                'football_keywords': [],
-                'analysis_method': 'lexical',
-                'error': str(e)
-            }
+            return self._error_result('lexical', e)
     
     @timed_cache_result(ttl_hours=6)
     def analyze_sentiment_hybrid(self, text: str) -> Dict[str, Union[float, str, List[str]]]:
@@ -243,7 +297,14 @@ class SentimentAnalyzer:
             # Análises individuais
             textblob_result = self.analyze_sentiment_textblob(text)
             lexical_result = self.analyze_sentiment_lexical(text)
-            
+        except Exception as e:
+            logger.error(f"Erro na análise híbrida: {e}")
+            return self._error_result('hybrid', e)
+        return self._hybrid_result(textblob_result, lexical_result)
+    
+    def _hybrid_result(self, textblob_result: Dict, lexical_result: Dict) -> Dict[str, Union[float, str, List[str]]]:
+        """Combina os resultados TextBlob e léxico de um texto"""
+        try:
             # Peso para cada método (TextBlob tem mais peso para texto geral)
             textblob_weight = 0.6
             lexical_weight = 0.4
@@ -288,27 +349,60 @@ class SentimentAnalyzer:
             
         except Exception as e:
             logger.error(f"Erro na análise híbrida: {e}")
-            return {
-                'sentiment_score': 0.0,
-                'sentiment_label': 'error',
-                'confidence': 0.0,
-                'football_keywords': [],
-                'analysis_method': 'hybrid',
-                'error': str(e)
-            }
+            return self._error_result('hybrid', e)
+    
+    def _analyze_single(self, text: str, method: str) -> Dict:
+        if method == 'textblob':
+            return self.analyze_sentiment_textblob(text)
+        elif method == 'lexical':
+            return self.analyze_sentiment_lexical(text)
+        return self.analyze_sentiment_hybrid(text)
+    
+    def _analyze_unique_texts(self, texts: List[str], method: str) -> List[Dict]:
+        """
+        Analisa textos distintos em lote: cada texto é pré-processado uma vez,
+        TextBlob e léxico compartilham esse resultado e a pontuação léxica é
+        feita para o lote inteiro.
+        """
+        preprocessed_texts = [self.preprocess_text(text) for text in texts]
+        
+        textblob_results = lexical_results = None
+        if method != 'lexical':
+            textblob_results = [self._textblob_result(text, preprocessed)
+                                for text, preprocessed in zip(texts, preprocessed_texts)]
+        if method != 'textblob':
+            lexical_results = self._lexical_results(texts, preprocessed_texts)
+        
+        if method == 'textblob':
+            return textblob_results
+        elif method == 'lexical':
+            return lexical_results
+        return [self._hybrid_result(textblob_result, lexical_result)
+                for textblob_result, lexical_result in zip(textblob_results, lexical_results)]
     
     def analyze_batch_sentiments(self, texts: List[str], method: str = 'hybrid') -> List[Dict]:
-        """Analisa sentimento de uma lista de textos"""
+        """
+        Analisa sentimento de uma lista de textos
+        
+        Textos repetidos (títulos republicados pelos feeds) são analisados uma
+        única vez; os scores são os mesmos da análise texto a texto.
+        """
         results = []
+        unique_texts = list(dict.fromkeys(text for text in texts if isinstance(text, str)))
+        try:
+            analyzed = dict(zip(unique_texts, self._analyze_unique_texts(unique_texts, method)))
+        except Exception as e:
+            logger.error(f"Erro na análise em lote, analisando texto a texto: {e}")
+            analyzed = {}
         
         for i, text in enumerate(texts):
             try:
-                if method == 'textblob':
-                    result = self.analyze_sentiment_textblob(text)
-                elif method == 'lexical':
-                    result = self.analyze_sentiment_lexical(text)
+                if isinstance(text, str) and text in analyzed:
+                    # Cópia: cada posição recebe seu próprio text_index
+                    result = dict(analyzed[text])
+                    result['football_keywords'] = list(result['football_keywords'])
                 else:
-                    result = self.analyze_sentiment_hybrid(text)
+                    result = self._analyze_single(text, method)
                 
                 result['text_index'] = i
                 result['original_text'] = text[:100] + '...' if len(text) > 100 else text
@@ -0,0 +1,139 @@
+"""
+Testes dos endpoints de sentimento lidos do resumo por clube/dia/fonte.
+"""
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.database import get_db
+from api.routers import analise
+from Coleta_de_dados.analise import resumo_sentimento
+
+HOJE = datetime.now().replace(microsecond=0)
+ANTIGA = HOJE - timedelta(days=60)
+
+NOTICIAS = [
+    # (clube_id, sentimento, score, confiança, created_at)
+    (1, 'positivo', 0.8, 0.9, HOJE),
+    (1, 'positivo', 0.4, 0.7, HOJE - timedelta(days=1)),
+    (1, 'negativo', -0.5, None, ANTIGA),
+    (2, 'negativo', -0.6, 0.8, HOJE),
+    (2, 'neutro', 0.0, 0.5, HOJE),
+    (3, None, None, None, HOJE),
+]
+POSTS = [
+    # (clube_id, sentimento, score, created_at)
+    (1, 'positivo', 0.6, HOJE),
+    (2, 'negativo', -0.2, ANTIGA),
+    (None, 'neutro', 0.05, HOJE),
+]
+
+
+@pytest.fixture(params=["resumo", "sem_resumo"])
+def client(request, tmp_path, monkeypatch):
+    caminho = str(tmp_path / "aposta.db")
+    conn = sqlite3.connect(caminho)
+    conn.executescript("""
+        CREATE TABLE clubes (id INTEGER PRIMARY KEY, nome TEXT);
+        CREATE TABLE noticias_clubes (
+            id INTEGER PRIMARY KEY, clube_id INTEGER, sentimento TEXT, score_sentimento REAL,
+            confianca_sentimento REAL, analisado_em TIMESTAMP, created_at TIMESTAMP
+        );
+        CREATE TABLE posts_redes_sociais (
+            id INTEGER PRIMARY KEY, clube_id INTEGER, sentimento TEXT, score_sentimento REAL,
+            created_at TIMESTAMP
+        );
+        INSERT INTO clubes VALUES (1, 'Flamengo'), (2, 'Palmeiras'), (3, 'Santos');
+    """)
+    conn.executemany(
+        "INSERT INTO noticias_clubes (clube_id, sentimento, score_sentimento, confianca_sentimento, "
+        "analisado_em, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        [(c, s, sc, cf, str(data) if s else None, str(data)) for c, s, sc, cf, data in NOTICIAS]
+    )
+    conn.executemany(
+        "INSERT INTO posts_redes_sociais (clube_id, sentimento, score_sentimento, created_at) VALUES (?, ?, ?, ?)",
+        [(c, s, sc, str(data)) for c, s, sc, data in POSTS]
+    )
+    conn.commit()
+    if request.param == "resumo":
+        resumo_sentimento.criar_tabela(conn)
+    conn.close()
+
+    monkeypatch.setattr(analise, "get_db_path", lambda: caminho)
+    app = FastAPI()
+    app.include_router(analise.router)
+    app.dependency_overrides[get_db] = lambda: None
+    return TestClient(app)
+
+
+def test_sentimento_do_clube(client):
+    resposta = client.get("/analise/sentimento/1")
+
+    assert resposta.status_code == 200
+    dados = resposta.json()
+    assert dados["noticias_analisadas"] == 3
+    assert dados["sentimento_medio_noticias"] == pytest.approx((0.8 + 0.4 - 0.5) / 3)
+    assert dados["confianca_media"] == pytest.approx(0.8)
+    assert dados["posts_analisados"] == 1
+    assert dados["sentimento_medio_posts"] == pytest.approx(0.6)
+    assert dados["sentimento_geral"] == "positivo"
+    assert dados["ultima_atualizacao"] == HOJE.isoformat()
+
+    sem_posts = client.get("/analise/sentimento/3", params={"incluir_posts": False}).json()
+    assert (sem_posts["noticias_analisadas"], sem_posts["posts_analisados"]) == (0, None)
+    assert client.get("/analise/sentimento/99").status_code == 404
+
+
+def test_estatisticas_da_janela(client):
+    resposta = client.get("/analise/sentimento/estatisticas", params={"dias_atras": 30})
+
+    assert resposta.status_code == 200
+    dados = resposta.json()
+    assert (dados["total_noticias"], dados["total_posts"]) == (4, 2)
+    assert dados["distribuicao_sentimento"] == {"positivo": 3, "negativo": 1, "neutro": 2}
+    media_noticias, media_posts = (0.8 + 0.4 - 0.6 + 0.0) / 4, (0.6 + 0.05) / 2
+    assert dados["score_medio_geral"] == pytest.approx((media_noticias * 4 + media_posts * 2) / 6)
+    assert dados["top_clubes_positivos"] == [
+        {"nome": "Flamengo", "total_noticias": 2, "score_medio": pytest.approx(0.6)}
+    ]
+    assert dados["top_clubes_negativos"] == [
+        {"nome": "Palmeiras", "total_noticias": 1, "score_medio": pytest.approx(-0.6)}
+    ]
+
+
+def test_ranking_de_clubes(client):
+    ranking = client.get("/analise/sentimento/clubes/ranking").json()
+
+    assert [(c["nome_clube"], c["noticias_analisadas"]) for c in ranking] == [("Flamengo", 3), ("Palmeiras", 2)]
+    assert ranking[1]["sentimento_medio_noticias"] == pytest.approx(-0.3)
+    assert ranking[1]["confianca_media"] == pytest.approx(0.65)
+    assert ranking[1]["sentimento_geral"] == "negativo"
+
+    negativos = client.get("/analise/sentimento/clubes/ranking", params={"tipo_sentimento": "negativo"}).json()
+    assert [(c["nome_clube"], c["sentimento_medio_noticias"]) for c in negativos] == [
+        ("Flamengo", pytest.approx(-0.5)), ("Palmeiras", pytest.approx(-0.6))
+    ]
+    assert client.get("/analise/sentimento/clubes/ranking", params={"tipo_sentimento": "x"}).status_code == 400
+
+
+def test_reprocessar_com_job_em_execucao(client, monkeypatch):
+    monkeypatch.setattr(analise.job_sentimento, "job_em_execucao", lambda: True)
+
+    resposta = client.post("/analise/sentimento/reprocessar")
+
+    assert resposta.status_code == 409
+    assert client.get("/analise/sentimento/reprocessar/status").json()["em_execucao"] is True
+
+
+def test_status_reprocessamento_devolve_conexao_ao_pool(client):
+    from api.database import _pools_sqlite
+
+    for _ in range(3):
+        resposta = client.get("/analise/sentimento/reprocessar/status")
+        assert resposta.status_code == 200
+
+    assert resposta.json()["watermarks"] == {}
+    assert _pools_sqlite[analise.get_db_path()].checkedout() == 0
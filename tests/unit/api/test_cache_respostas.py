@@ -0,0 +1,118 @@
+"""
+Testes do cache de respostas (ETag, 304 e invalidação por tag).
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import api.cache
+from api.cache import CacheRespostas
+from api.routers import competitions
+from api.security import get_current_api_key
+from Coleta_de_dados.database import invalidacao_cache
+from Coleta_de_dados.database.config import Base
+from Coleta_de_dados.database.invalidacao_cache import RegistroVersoesTags, instalar_invalidacao_orm
+from Coleta_de_dados.database.models import Competicao
+
+URL = "/competitions/stats/summary"
+
+
+@pytest.fixture
+def registro(monkeypatch):
+    registro = RegistroVersoesTags()
+    monkeypatch.setattr(invalidacao_cache, "_registro", registro)
+    monkeypatch.setattr(api.cache, "cache_respostas", CacheRespostas(registro=registro))
+    instalar_invalidacao_orm()
+    return registro
+
+
+@pytest.fixture
+def ambiente(registro):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    Sessao = sessionmaker(bind=engine)
+    with Sessao() as session:
+        session.add(Competicao(id=1, nome="Série A", url="/comps/24", ativa=True))
+        session.commit()
+
+    consultas = []
+    event.listen(engine, "before_cursor_execute", lambda *args: consultas.append(args[2]))
+
+    def get_db():
+        with Sessao() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(competitions.router)
+    app.dependency_overrides[competitions.get_db] = get_db
+    app.dependency_overrides[get_current_api_key] = lambda: "teste"
+    return TestClient(app), Sessao, consultas
+
+
+def test_segunda_requisicao_nao_consulta_o_banco(ambiente):
+    client, _, consultas = ambiente
+
+    primeira = client.get(URL)
+    assert primeira.headers["X-Cache"] == "MISS"
+    assert consultas
+
+    consultas.clear()
+    segunda = client.get(URL)
+    assert segunda.headers["X-Cache"] == "HIT"
+    assert segunda.json() == primeira.json()
+    assert segunda.headers["ETag"] == primeira.headers["ETag"]
+    assert consultas == []
+
+
+def test_if_none_match_devolve_304(ambiente):
+    client, _, _ = ambiente
+    etag = client.get(URL).headers["ETag"]
+
+    resposta = client.get(URL, headers={"If-None-Match": etag})
+    assert resposta.status_code == 304
+    assert resposta.content == b""
+    assert client.get(URL, headers={"If-None-Match": '"outro"'}).status_code == 200
+
+
+def test_commit_no_orm_invalida_a_resposta(ambiente):
+    client, Sessao, _ = ambiente
+    assert client.get(URL).json()["total_competitions"] == 1
+
+    with Sessao() as session:
+        session.add(Competicao(id=2, nome="Série B", url="/comps/38", ativa=True))
+        session.commit()
+
+    resposta = client.get(URL)
+    assert resposta.headers["X-Cache"] == "MISS"
+    assert resposta.json()["total_competitions"] == 2
+
+
+def test_rollback_nao_invalida(ambiente, registro):
+    client, Sessao, _ = ambiente
+    client.get(URL)
+    antes = registro.versoes(("competicoes",))
+
+    with Sessao() as session:
+        session.add(Competicao(id=3, nome="Copa", url="/comps/99"))
+        session.flush()
+        session.rollback()
+
+    assert registro.versoes(("competicoes",)) == antes
+    assert client.get(URL).headers["X-Cache"] == "HIT"
+
+
+def test_registro_em_arquivo_compartilha_versoes(tmp_path):
+    caminho = str(tmp_path / "cache_tags.db")
+    api_worker = RegistroVersoesTags(caminho, intervalo=0)
+    coletor = RegistroVersoesTags(caminho, intervalo=0)
+
+    antes = api_worker.versoes(("clubes", "jogadores"))
+    coletor.invalidar(["jogadores"])
+    assert api_worker.versoes(("clubes", "jogadores")) == (antes[0], antes[1] + 1)
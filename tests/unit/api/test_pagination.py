@@ -0,0 +1,98 @@
+"""
+Testes da paginação compartilhada (offset e cursor/keyset) da API.
+"""
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.pagination import (
+    ChaveOrdenacao, ParametrosPaginacao, codificar_cursor, decodificar_cursor, paginar
+)
+from Coleta_de_dados.database.config import Base
+from Coleta_de_dados.database.models import Clube, Competicao, Partida
+
+
+def parametros(paginacao="offset", cursor=None, contagem=None):
+    return ParametrosPaginacao(paginacao=paginacao, cursor=cursor, contagem=contagem)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Competicao(id=1, nome="Série A", url="/comps/24"))
+    session.add_all([Clube(id=1, nome="Casa"), Clube(id=2, nome="Fora")])
+    for i in range(1, 48):
+        # Datas repetidas e nulas para exercitar desempate e cauda de nulos
+        data = date(2024, 1, 1) + timedelta(days=i % 6) if i % 5 else None
+        session.add(Partida(
+            id=i, competicao_id=1, clube_casa_id=1, clube_visitante_id=2,
+            data_partida=data, status="finalizada",
+        ))
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.mark.parametrize("valor", [None, 42, "abc", date(2024, 5, 1), datetime(2024, 5, 1, 13, 30)])
+def test_cursor_ida_e_volta(valor):
+    assert decodificar_cursor(codificar_cursor(valor, 7)) == (valor, 7)
+
+
+@pytest.mark.parametrize("cursor", ["nao-e-um-cursor", codificar_cursor("2024-01-01", None)])
+def test_cursor_invalido_gera_400(cursor):
+    with pytest.raises(HTTPException) as erro:
+        decodificar_cursor(cursor)
+    assert erro.value.status_code == 400
+
+
+def test_cursor_ativa_modo_cursor_sem_contagem():
+    params = parametros(cursor=codificar_cursor(None, 1))
+    assert params.modo == "cursor"
+    assert params.contagem == "nenhuma"
+
+
+@pytest.mark.parametrize("descendente", [True, False])
+def test_keyset_percorre_mesma_ordem_que_offset(session, descendente):
+    chave = ChaveOrdenacao(Partida.id, Partida.data_partida, descendente=descendente)
+    query = session.query(Partida)
+
+    por_offset = [p.id for p in chave.ordenar(query).all()]
+
+    por_cursor, cursor = [], None
+    while True:
+        pagina = paginar(query, parametros("cursor", cursor), 1, 10, chave)
+        por_cursor += [p.id for p in pagina.resultados(pagina.query.all())]
+        cursor = pagina.next_cursor
+        if cursor is None:
+            assert not pagina.has_more
+            break
+
+    assert por_cursor == por_offset
+
+
+def test_offset_mantem_contagem_exata(session):
+    pagina = paginar(session.query(Partida), parametros(), 5, 10, ChaveOrdenacao(Partida.id))
+    itens = pagina.resultados(pagina.query.all())
+    assert len(itens) == 7
+    assert pagina.metadados()["total"] == 47
+    assert pagina.metadados()["pages"] == 5
+    assert not pagina.has_more
+
+
+def test_contagem_estimada(session):
+    pagina = paginar(
+        session.query(Partida), parametros("cursor", contagem="estimada"), 1, 10,
+        ChaveOrdenacao(Partida.id), tabela="partidas"
+    )
+    assert pagina.total == 47
+    assert pagina.total_estimado
@@ -0,0 +1,121 @@
+"""
+Testes do rate limiting por janela deslizante e seus backends.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from api.security import (
+    MemoryRateLimitBackend, RateLimitBackend, RateLimitMiddleware, SQLiteRateLimitBackend
+)
+
+
+class Relogio:
+    def __init__(self, agora: float = 6000.0):
+        self.agora = agora
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+def criar_limiter(backend, relogio, limite=10, periodo=60):
+    limiter = RateLimitMiddleware(backend=backend, relogio=relogio)
+    limiter.settings = limiter.settings.model_copy(
+        update={"api_rate_limit": limite, "api_rate_limit_period": periodo}
+    )
+    return limiter
+
+
+@pytest.fixture(params=["memoria", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteRateLimitBackend(str(tmp_path / "rate_limit.db"))
+    return MemoryRateLimitBackend()
+
+
+def test_bloqueia_apos_limite(backend):
+    limiter = criar_limiter(backend, Relogio())
+    resultados = [limiter.is_rate_limited("1.1.1.1") for _ in range(12)]
+    assert resultados == [False] * 10 + [True] * 2
+
+    info = limiter.get_rate_limit_info("1.1.1.1")
+    assert info["remaining"] == 0
+    assert info["current"] == 10
+    # Outros clientes não são afetados
+    assert not limiter.is_rate_limited("2.2.2.2")
+
+
+def test_janela_deslizante_pondera_janela_anterior(backend):
+    relogio = Relogio(6000.0)
+    limiter = criar_limiter(backend, relogio)
+    for _ in range(10):
+        limiter.is_rate_limited("1.1.1.1")
+
+    # Metade da janela seguinte: 10 * 0.5 = 5 requisições ainda contam
+    relogio.agora = 6090.0
+    limitado, info = limiter.verificar("1.1.1.1")
+    assert not limitado
+    assert info["current"] == 6
+    assert [limiter.is_rate_limited("1.1.1.1") for _ in range(5)] == [False] * 4 + [True]
+
+    # Duas janelas depois, o histórico foi descartado
+    relogio.agora = 6240.0
+    assert limiter.get_rate_limit_info("1.1.1.1")["current"] == 0
+
+
+def test_remove_clientes_inativos(backend):
+    relogio = Relogio(6000.0)
+    limiter = criar_limiter(backend, relogio)
+    for cliente in range(100):
+        limiter.is_rate_limited(f"10.0.0.{cliente}")
+
+    relogio.agora = 6200.0
+    limiter.is_rate_limited("1.1.1.1")
+
+    assert backend.consultar("10.0.0.1", 103, 0.0) == 0.0
+    if isinstance(backend, MemoryRateLimitBackend):
+        assert list(backend.estados) == ["1.1.1.1"]
+
+
+def test_sqlite_compartilha_contadores_entre_instancias(tmp_path):
+    caminho = str(tmp_path / "rate_limit.db")
+    relogio = Relogio()
+    worker_a = criar_limiter(SQLiteRateLimitBackend(caminho), relogio)
+    worker_b = criar_limiter(SQLiteRateLimitBackend(caminho), relogio)
+
+    for _ in range(5):
+        worker_a.is_rate_limited("1.1.1.1")
+    for _ in range(5):
+        worker_b.is_rate_limited("1.1.1.1")
+
+    assert worker_a.is_rate_limited("1.1.1.1")
+    assert worker_b.get_rate_limit_info("1.1.1.1")["current"] == 10
+
+
+def test_backend_sqlite_roda_fora_do_event_loop(tmp_path):
+    threads = []
+
+    class BackendRegistrado(SQLiteRateLimitBackend):
+        def consumir(self, *args):
+            threads.append(threading.get_ident())
+            return super().consumir(*args)
+
+    limiter = criar_limiter(BackendRegistrado(str(tmp_path / "rate_limit.db")), Relogio(), limite=1)
+
+    async def requisicoes():
+        return [await limiter.verificar_async("1.1.1.1") for _ in range(2)], threading.get_ident()
+
+    resultados, thread_loop = asyncio.run(requisicoes())
+
+    assert [limitado for limitado, _ in resultados] == [False, True]
+    assert threads and thread_loop not in threads
+
+
+def test_backend_sem_metodos_nao_e_instanciado():
+    class Incompleto(RateLimitBackend):
+        def consumir(self, chave, janela, fracao, limite):
+            return True, 0.0
+
+    with pytest.raises(TypeError):
+        Incompleto()
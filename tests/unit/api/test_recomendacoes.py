@@ -0,0 +1,218 @@
+"""
+Testes das consultas de recomendações (faixa de datas, índices e tabela de resumo).
+"""
+import importlib.util
+import sqlite3
+from pathlib import Path
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+import api.cache
+from api.cache import CacheRespostas
+from api.routers import recomendacoes
+from Coleta_de_dados.database import invalidacao_cache
+from Coleta_de_dados.database.config import Base
+from Coleta_de_dados.database.models import RecomendacaoAposta
+from Coleta_de_dados.database.invalidacao_cache import RegistroVersoesTags
+
+MIGRACAO = Path(__file__).parents[3] / "alembic" / "versions" / \
+    "20261016_2040_b41c7e9d2a10_indices_e_resumo_recomendacoes.py"
+
+RECOMENDACOES = [
+    # (partida, mercado, previsão, probabilidade, data_geracao)
+    (1, "Resultado Final", "Casa", 0.6, "2026-10-01 00:00:00"),
+    (1, "Ambas Marcam", "Sim", 0.55, "2026-10-01 12:30:00"),
+    (2, "Resultado Final", "Fora", 0.4, "2026-10-02 23:59:59"),
+    (2, "Total de Gols", "Mais de 2.5", None, "2026-10-03 00:00:00"),
+]
+
+
+def aplicar_migracao(caminho):
+    spec = importlib.util.spec_from_file_location("migracao_recomendacoes", MIGRACAO)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    engine = create_engine(f"sqlite:///{caminho}")
+    with engine.begin() as conn:
+        with Operations.context(MigrationContext.configure(conn)):
+            modulo.upgrade()
+    engine.dispose()
+
+
+@pytest.fixture
+def banco(tmp_path, monkeypatch):
+    caminho = str(tmp_path / "aposta.db")
+    conn = sqlite3.connect(caminho)
+    conn.executescript("""
+        CREATE TABLE partidas (id INTEGER PRIMARY KEY, time_casa TEXT, time_visitante TEXT, data TEXT);
+        CREATE TABLE recomendacoes_apostas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            partida_id INTEGER, mercado_aposta TEXT, previsao TEXT,
+            probabilidade REAL, odd_justa REAL, data_geracao TEXT
+        );
+        INSERT INTO partidas VALUES (1, 'Flamengo', 'Palmeiras', '2026-10-05'), (2, 'Santos', 'Grêmio', '2026-10-06');
+    """)
+    conn.executemany(
+        "INSERT INTO recomendacoes_apostas (partida_id, mercado_aposta, previsao, probabilidade, odd_justa, data_geracao) "
+        "VALUES (?, ?, ?, ?, 2.0, ?)", RECOMENDACOES
+    )
+    conn.commit()
+    conn.close()
+
+    registro = RegistroVersoesTags()
+    monkeypatch.setattr(invalidacao_cache, "_registro", registro)
+    monkeypatch.setattr(api.cache, "cache_respostas", CacheRespostas(registro=registro))
+    monkeypatch.setattr(recomendacoes, "DB_PATH", caminho)
+    return caminho
+
+
+@pytest.fixture
+def client(banco):
+    app = FastAPI()
+    app.include_router(recomendacoes.router)
+    return TestClient(app)
+
+
+def resumo_completo(caminho):
+    """Resumo calculado direto da tabela de recomendações."""
+    conn = sqlite3.connect(caminho)
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT COALESCE(mercado_aposta, ''), COUNT(*), COUNT(probabilidade),
+               ROUND(COALESCE(SUM(probabilidade), 0), 6), MAX(data_geracao)
+        FROM recomendacoes_apostas GROUP BY 1 ORDER BY 1
+    """)
+    resumo = cursor.fetchall()
+    conn.close()
+    return resumo
+
+
+def resumo_materializado(caminho):
+    conn = sqlite3.connect(caminho)
+    resumo = conn.execute("""
+        SELECT mercado_aposta, total, com_probabilidade, ROUND(soma_probabilidade, 6), ultima_geracao
+        FROM recomendacoes_resumo_mercado ORDER BY mercado_aposta
+    """).fetchall()
+    conn.close()
+    return resumo
+
+
+def test_filtro_de_datas_inclui_o_dia_final_inteiro(client):
+    resposta = client.get("/recomendacoes/", params={"data_inicio": "2026-10-01", "data_fim": "2026-10-02"})
+
+    assert resposta.status_code == 200
+    datas = [r["data_geracao"] for r in resposta.json()]
+    assert datas == ["2026-10-02T23:59:59", "2026-10-01T12:30:00", "2026-10-01T00:00:00"]
+
+    resposta = client.get("/recomendacoes/", params={"data_inicio": "2026-10-02", "data_fim": "2026-10-02"})
+    assert [r["data_geracao"] for r in resposta.json()] == ["2026-10-02T23:59:59"]
+
+
+def test_data_invalida_retorna_400(client):
+    assert client.get("/recomendacoes/", params={"data_fim": "02/10/2026"}).status_code == 400
+
+
+def test_filtro_usa_indice_de_mercado_e_data(banco):
+    aplicar_migracao(banco)
+    conn = sqlite3.connect(banco)
+    plano = " ".join(linha[3] for linha in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT r.id FROM recomendacoes_apostas r "
+        "WHERE r.mercado_aposta = ? AND r.data_geracao >= ? AND r.data_geracao < ?",
+        ("Resultado Final", "2026-10-01", "2026-10-03"),
+    ))
+    conn.close()
+    assert "idx_recomendacoes_mercado_geracao" in plano
+
+
+INDICES_DATA = {"idx_recomendacoes_mercado_data", "idx_recomendacoes_data",
+                "idx_recomendacoes_mercado_geracao", "idx_recomendacoes_geracao"}
+
+
+def indices_de_data(conn):
+    return {nome: [coluna[2] for coluna in conn.execute(f"PRAGMA index_info({nome})")]
+            for (nome,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            if nome in INDICES_DATA}
+
+
+def test_indices_de_data_tem_nomes_distintos_por_coluna(banco, tmp_path):
+    aplicar_migracao(banco)
+    conn = sqlite3.connect(banco)
+    assert indices_de_data(conn) == {
+        "idx_recomendacoes_mercado_geracao": ["mercado_aposta", "data_geracao"],
+        "idx_recomendacoes_geracao": ["data_geracao"],
+    }
+    conn.close()
+
+    # Tabela do modelo ORM: os índices declarados em RecomendacaoAposta, em created_at
+    caminho = str(tmp_path / "orm.db")
+    engine = create_engine(f"sqlite:///{caminho}")
+    Base.metadata.create_all(engine, tables=[RecomendacaoAposta.__table__])
+    engine.dispose()
+    aplicar_migracao(caminho)
+    conn = sqlite3.connect(caminho)
+    assert indices_de_data(conn) == {
+        "idx_recomendacoes_mercado_data": ["mercado_aposta", "created_at"],
+        "idx_recomendacoes_data": ["created_at"],
+    }
+    conn.close()
+
+
+def test_resumo_materializado_acompanha_alteracoes(banco):
+    aplicar_migracao(banco)
+    assert resumo_materializado(banco) == resumo_completo(banco)
+
+    conn = sqlite3.connect(banco)
+    conn.execute("INSERT INTO recomendacoes_apostas (partida_id, mercado_aposta, previsao, probabilidade, data_geracao) "
+                 "VALUES (2, 'Ambas Marcam', 'Não', 0.7, '2026-10-04 08:00:00')")
+    conn.execute("UPDATE recomendacoes_apostas SET mercado_aposta = 'Ambas Marcam', probabilidade = 0.3 "
+                 "WHERE mercado_aposta = 'Total de Gols'")
+    conn.execute("DELETE FROM recomendacoes_apostas WHERE data_geracao = '2026-10-04 08:00:00'")
+    conn.commit()
+    conn.close()
+
+    assert resumo_materializado(banco) == resumo_completo(banco)
+    assert [linha[0] for linha in resumo_materializado(banco)] == ["Ambas Marcam", "Resultado Final"]
+
+
+@pytest.mark.parametrize("migrado", [True, False])
+def test_resumo_e_mercados_com_e_sem_tabela_de_resumo(banco, client, migrado):
+    if migrado:
+        aplicar_migracao(banco)
+
+    resumo = client.get("/recomendacoes/resumo").json()
+    assert resumo["total_recomendacoes"] == 4
+    assert resumo["recomendacoes_por_mercado"] == {"Ambas Marcam": 1, "Resultado Final": 2, "Total de Gols": 1}
+    assert resumo["probabilidade_media"] == round((0.6 + 0.55 + 0.4) / 3, 4)
+    assert resumo["ultima_atualizacao"] == "2026-10-03T00:00:00"
+
+    assert client.get("/recomendacoes/mercados").json() == ["Ambas Marcam", "Resultado Final", "Total de Gols"]
+
+
+@pytest.mark.parametrize("migrado", [True, False])
+def test_mercado_nulo_continua_none(banco, client, migrado):
+    if migrado:
+        aplicar_migracao(banco)
+    conn = sqlite3.connect(banco)
+    conn.execute("INSERT INTO recomendacoes_apostas (partida_id, mercado_aposta, previsao, probabilidade, "
+                 "odd_justa, data_geracao) VALUES (2, NULL, 'Casa', 0.5, 2.0, '2026-10-04 00:00:00')")
+    conn.commit()
+    conn.close()
+
+    assert client.get("/recomendacoes/mercados").json() == [None, "Ambas Marcam", "Resultado Final", "Total de Gols"]
+
+
+@pytest.mark.parametrize("metodo, url", [
+    ("get", "/recomendacoes/partida/99"),
+    ("delete", "/recomendacoes/999"),
+])
+def test_404_devolve_a_conexao_a_pool(client, banco, metodo, url):
+    from api.database import _pools_sqlite
+
+    for _ in range(3):
+        assert getattr(client, metodo)(url).status_code == 404
+
+    assert _pools_sqlite[banco].checkedout() == 0
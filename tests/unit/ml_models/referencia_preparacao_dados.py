@@ -0,0 +1,189 @@
+"""
+Implementação de referência do PreparadorDadosML (confrontos e features por
+partida, via iterrows) e banco SQLite sintético para compará-la com o lote.
+
+Compartilhado pelo teste de regressão e por benchmark_preparacao_dados.py.
+"""
+import logging
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from Coleta_de_dados.database.config import Base
+from Coleta_de_dados.database.models import Clube, Competicao, Partida
+from ml_models.preparacao_dados import PreparadorDadosML
+
+logger = logging.getLogger(__name__)
+
+
+class PreparadorOriginal(PreparadorDadosML):
+    """Implementação original: consulta de confrontos e features por partida."""
+
+    def preparar_dataset_treinamento(self, data_inicio: Optional[datetime] = None,
+                                   data_fim: Optional[datetime] = None) -> pd.DataFrame:
+        """
+        Prepara dataset completo para treinamento de modelos.
+        
+        Args:
+            data_inicio: Data de início para filtrar partidas
+            data_fim: Data de fim para filtrar partidas
+            
+        Returns:
+            DataFrame com features e targets para treinamento
+        """
+        try:
+            logger.info("🚀 Iniciando preparação do dataset de treinamento...")
+            
+            # Carrega dados básicos
+            df_partidas = self.carregar_dados_partidas(data_inicio, data_fim)
+            if df_partidas.empty:
+                logger.error("❌ Nenhuma partida encontrada para preparar dataset")
+                return pd.DataFrame()
+            
+            # Carrega estatísticas dos clubes
+            estatisticas_clubes = self.carregar_estatisticas_clubes()
+            if estatisticas_clubes.empty:
+                logger.error("❌ Nenhuma estatística de clube encontrada")
+                return pd.DataFrame()
+            
+            # Carrega dados de sentimento
+            sentimento_clubes = self.carregar_sentimento_clubes()
+            if sentimento_clubes.empty:
+                logger.warning("⚠️ Nenhum dado de sentimento encontrado, usando valores padrão")
+                sentimento_clubes = pd.DataFrame()
+            
+            # Lista para armazenar features de todas as partidas
+            todas_features = []
+            
+            # Processa cada partida
+            for idx, partida in df_partidas.iterrows():
+                try:
+                    # Carrega histórico de confrontos
+                    historico_confrontos = self.carregar_historico_confrontos(
+                        partida['clube_casa_id'], 
+                        partida['clube_visitante_id'],
+                        partida['data_partida']
+                    )
+                    
+                    # Cria features para a partida
+                    features = self.criar_features_partida(
+                        partida, estatisticas_clubes, sentimento_clubes, historico_confrontos
+                    )
+                    
+                    if features:
+                        # Adiciona target (resultado da partida)
+                        features['target_resultado'] = partida['resultado']
+                        features['target_total_gols'] = partida['total_gols']
+                        features['target_ambos_marcam'] = 1 if (partida['gols_casa'] > 0 and partida['gols_visitante'] > 0) else 0
+                        
+                        todas_features.append(features)
+                    
+                    # Log de progresso
+                    if (idx + 1) % 100 == 0:
+                        logger.info(f"📊 Processadas {idx + 1}/{len(df_partidas)} partidas")
+                        
+                except Exception as e:
+                    logger.error(f"❌ Erro ao processar partida {partida['id']}: {e}")
+                    continue
+            
+            if not todas_features:
+                logger.error("❌ Nenhuma feature foi criada")
+                return pd.DataFrame()
+            
+            # Converte para DataFrame
+            df_features = pd.DataFrame(todas_features)
+            
+            # Remove colunas com muitos valores nulos
+            colunas_com_nulos = df_features.columns[df_features.isnull().sum() > len(df_features) * 0.5]
+            if not colunas_com_nulos.empty:
+                logger.warning(f"⚠️ Removendo colunas com muitos valores nulos: {colunas_com_nulos.tolist()}")
+                df_features = df_features.drop(columns=colunas_com_nulos)
+            
+            # Preenche valores nulos restantes
+            df_features = df_features.fillna(0)
+            
+            # Remove colunas não numéricas
+            colunas_nao_numericas = df_features.select_dtypes(include=['object', 'datetime64']).columns
+            if not colunas_nao_numericas.empty:
+                logger.info(f"ℹ️ Removendo colunas não numéricas: {colunas_nao_numericas.tolist()}")
+                df_features = df_features.drop(columns=colunas_nao_numericas)
+            
+            logger.info(f"✅ Dataset preparado com sucesso: {df_features.shape}")
+            logger.info(f"📊 Features: {df_features.shape[1] - 3}")  # -3 para os targets
+            logger.info(f"📊 Partidas: {df_features.shape[0]}")
+            
+            return df_features
+            
+        except Exception as e:
+            logger.error(f"❌ Erro fatal na preparação do dataset: {e}")
+            return pd.DataFrame()
+
+
+def criar_banco(caminho: str, partidas: int, clubes: int, seed: int = 42):
+    """Banco SQLite com ligas de 20 clubes e partidas nos últimos 5 anos; retorna o sentimento por clube."""
+    engine = create_engine(f"sqlite:///{caminho}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        # Colunas lidas por carregar_dados_partidas que não estão no modelo ORM
+        conn.execute(text("ALTER TABLE partidas ADD COLUMN estadio VARCHAR(255)"))
+        conn.execute(text("ALTER TABLE partidas ADD COLUMN arbitro VARCHAR(255)"))
+
+    rng = np.random.default_rng(seed)
+    ligas = clubes // 20
+    liga = rng.integers(0, ligas, partidas)
+    casa = liga * 20 + rng.integers(0, 20, partidas) + 1
+    fora = liga * 20 + ((casa - 1) % 20 + rng.integers(1, 20, partidas)) % 20 + 1
+    dias = np.sort(rng.integers(0, 5 * 365, partidas))
+    inicio = date.today() - timedelta(days=5 * 365)
+
+    Sessao = sessionmaker(bind=engine)
+    with Sessao() as session:
+        session.execute(insert(Competicao), [
+            {"id": i + 1, "nome": f"Liga {i}", "url": f"/comps/{i}"} for i in range(ligas)
+        ])
+        session.execute(insert(Clube), [{"id": i + 1, "nome": f"Clube {i}"} for i in range(clubes)])
+        session.execute(insert(Partida), [
+            {
+                "competicao_id": int(l) + 1, "clube_casa_id": int(c), "clube_visitante_id": int(f),
+                "data_partida": inicio + timedelta(days=int(d)), "status": "finalizada",
+                "gols_casa": int(gc), "gols_visitante": int(gf)
+            }
+            for l, c, f, d, gc, gf in zip(
+                liga, casa, fora, dias, rng.poisson(1.5, partidas), rng.poisson(1.1, partidas)
+            )
+        ])
+        session.commit()
+
+    sentimento = pd.DataFrame({
+        "clube_id": np.arange(1, clubes + 1),
+        "sentimento_medio_noticias": np.round(rng.uniform(-1, 1, clubes), 3),
+        "total_noticias": rng.integers(0, 50, clubes),
+        "sentimento_medio_posts": np.round(rng.uniform(-1, 1, clubes), 3),
+        "total_posts": rng.integers(0, 500, clubes),
+        "media_curtidas": np.round(rng.uniform(0, 5000, clubes), 1),
+        "media_comentarios": np.round(rng.uniform(0, 300, clubes), 1),
+        "media_compartilhamentos": np.round(rng.uniform(0, 100, clubes), 1),
+    })
+    return engine, Sessao, sentimento
+
+
+def executar(classe, Sessao, engine, sentimento, data_inicio):
+    """Dataset produzido pela classe, tempo gasto e número de consultas SQL executadas."""
+    consultas = []
+    ouvinte = lambda *args: consultas.append(1)
+    event.listen(engine, "before_cursor_execute", ouvinte)
+    try:
+        with Sessao() as session:
+            preparador = classe(session)
+            # As consultas de sentimento usam MODE() do PostgreSQL
+            preparador.carregar_sentimento_clubes = lambda data_referencia=None: sentimento
+            inicio = time.perf_counter()
+            dataset = preparador.preparar_dataset_treinamento(data_inicio)
+            return time.perf_counter() - inicio, len(consultas), dataset
+    finally:
+        event.remove(engine, "before_cursor_execute", ouvinte)
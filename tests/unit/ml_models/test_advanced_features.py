@@ -0,0 +1,59 @@
+"""
+Testes das análises vetorizadas do AdvancedFeatures contra a implementação
+original, linha a linha (iterrows), mantida em referencia_advanced_features.py.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from ml_models.advanced_features import AdvancedFeatures
+from tests.unit.ml_models.referencia_advanced_features import AdvancedFeaturesOriginal, gerar_partidas
+
+
+def normalizar(valor):
+    """NaN != NaN: troca por um marcador para comparar resultados com odds ausentes."""
+    if isinstance(valor, float) and math.isnan(valor):
+        return "nan"
+    if isinstance(valor, dict):
+        return {chave: normalizar(item) for chave, item in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [normalizar(item) for item in valor]
+    return valor
+
+
+@pytest.fixture(scope="module")
+def partidas():
+    partidas = gerar_partidas(300, 40, seed=3)
+    partidas.loc[[5, 17, 60], 'home_odds'] = np.nan
+    partidas.loc[[8, 90], 'away_odds'] = np.nan
+    partidas.loc[[33], 'draw_odds'] = np.nan
+    # Empates, inclusive sem gols, entram nas tendências e nas apostas perdidas
+    partidas.loc[[0, 1, 2], ['home_goals', 'away_goals', 'total_goals', 'both_teams_score']] = [0, 0, 0, 0]
+    assert (partidas['home_goals'] == partidas['away_goals']).sum() > 20
+    return partidas
+
+
+@pytest.mark.parametrize("stop_loss", [None, 1.0])
+@pytest.mark.parametrize("estrategia", ["_run_value_betting_strategy", "_run_trend_following_strategy"])
+def test_backtesting_igual_ao_linha_a_linha(partidas, estrategia, stop_loss):
+    original, vetorizado = AdvancedFeaturesOriginal(), AdvancedFeatures()
+    if stop_loss is not None:
+        for features in (original, vetorizado):
+            features.backtesting_config['stop_loss'] = stop_loss
+
+    esperado = getattr(original, estrategia)(partidas)
+    obtido = getattr(vetorizado, estrategia)(partidas)
+
+    assert esperado['total_bets'] > 0
+    assert normalizar(obtido) == normalizar(esperado)
+
+
+def test_tendencias_e_value_betting_iguais_ao_linha_a_linha(partidas):
+    original, vetorizado = AdvancedFeaturesOriginal(), AdvancedFeatures()
+    equipes = list(partidas['home_team'].unique()[:8])
+
+    assert normalizar([vetorizado._analyze_team_trends(partidas, equipe) for equipe in equipes]) == \
+        normalizar([original._analyze_team_trends(partidas, equipe) for equipe in equipes])
+    assert normalizar(vetorizado._identify_value_betting(partidas)) == \
+        normalizar(original._identify_value_betting(partidas))
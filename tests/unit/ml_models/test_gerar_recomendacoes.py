@@ -0,0 +1,140 @@
+"""
+Testes da geração de recomendações em lote (vetorizada x por partida) e da gravação com upsert.
+"""
+import pickle
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from Coleta_de_dados.database import invalidacao_cache
+from Coleta_de_dados.database.config import Base
+from Coleta_de_dados.database.invalidacao_cache import RegistroVersoesTags
+from Coleta_de_dados.database.models import (
+    Clube, Competicao, NoticiaClube, Partida, PostRedeSocial, RecomendacaoAposta
+)
+from ml_models.gerar_recomendacoes import GeradorRecomendacoes, TIPOS_APOSTA
+
+CLASSES = {'resultado_1x2': ['1', 'X', '2'], 'over_under_2_5': ['Over 2.5', 'Under 2.5'],
+           'ambos_marcam': ['Sim', 'Não']}
+
+
+@pytest.fixture(autouse=True)
+def registro(monkeypatch):
+    monkeypatch.setattr(invalidacao_cache, "_registro", RegistroVersoesTags())
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'aposta.db'}")
+    Base.metadata.create_all(engine)
+    rng = np.random.default_rng(1)
+    hoje = date.today()
+    clubes = list(range(1, 7))
+    partidas = [
+        {"competicao_id": 1, "clube_casa_id": casa, "clube_visitante_id": fora,
+         "data_partida": hoje - timedelta(days=10 + i), "gols_casa": int(rng.poisson(1.5)),
+         "gols_visitante": int(rng.poisson(1.1)), "status": "finalizada"}
+        for i, (casa, fora) in enumerate((c, f) for c in clubes[:4] for f in clubes[:4] if c != f)
+    ]
+    # Clubes 5 e 6 sem histórico, estatísticas nem sentimento (valores padrão)
+    partidas += [
+        {"competicao_id": 1, "clube_casa_id": casa, "clube_visitante_id": fora,
+         "data_partida": hoje + timedelta(days=1), "gols_casa": None, "gols_visitante": None,
+         "status": "agendada"}
+        for casa, fora in ((1, 2), (3, 4), (5, 6), (2, 5))
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Competicao), [{"nome": "Série A", "url": "/comps/24"}])
+        conn.execute(insert(Clube), [{"nome": f"Clube {i}"} for i in clubes])
+        conn.execute(insert(Partida), partidas)
+        agora = datetime.now()
+        conn.execute(insert(NoticiaClube), [
+            {"clube_id": i % 4 + 1, "titulo": f"Notícia {i}", "url_noticia": f"/noticia/{i}", "fonte": "GE",
+             "data_publicacao": agora - timedelta(days=i), "score_sentimento": float(rng.normal())}
+            for i in range(12)
+        ])
+        conn.execute(insert(PostRedeSocial), [
+            {"clube_id": i % 3 + 1, "rede_social": "twitter", "post_id": str(i), "data_postagem": agora,
+             "score_sentimento": float(rng.normal()), "curtidas": i * 10, "comentarios": i,
+             "compartilhamentos": i % 2}
+            for i in range(6)
+        ])
+    with sessionmaker(bind=engine)() as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def gerador(session, tmp_path):
+    probe = GeradorRecomendacoes(session, str(tmp_path / "sem_modelos"))
+    partidas = probe.carregar_partidas_futuras()
+    colunas = list(probe.criar_features_lote(
+        partidas, probe.carregar_estatisticas_clubes(), probe.carregar_sentimento_clubes(),
+        probe.carregar_historico_confrontos_lote(partidas)).columns)
+
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(300, len(colunas))), columns=colunas)
+    for tipo in TIPOS_APOSTA:
+        y = np.array(CLASSES[tipo])[rng.integers(0, len(CLASSES[tipo]), size=len(X))]
+        scaler, encoder = StandardScaler().fit(X), LabelEncoder().fit(y)
+        modelo = RandomForestClassifier(n_estimators=10, max_depth=4, random_state=0)
+        modelo.fit(scaler.transform(X), encoder.transform(y))
+        for nome, objeto in (('modelo', modelo), ('scaler', scaler), ('label_encoder', encoder)):
+            with open(tmp_path / f'{tipo}_{nome}.pkl', 'wb') as f:
+                pickle.dump(objeto, f)
+    return GeradorRecomendacoes(session, str(tmp_path))
+
+
+def resumo(recomendacoes):
+    return sorted((r['partida_id'], tipo, str(d['predicao']), round(d['confianca'], 12), d['rating'],
+                   tuple(np.round(d['probabilidades'], 12)), tuple(r['features_utilizadas']))
+                  for r in recomendacoes for tipo, d in r['recomendacoes'].items())
+
+
+def test_lote_igual_ao_calculo_por_partida(gerador):
+    vetorizado = gerador.gerar_recomendacoes_lote(vetorizado=True)
+    por_partida = gerador.gerar_recomendacoes_lote(vetorizado=False)
+
+    assert len(vetorizado) == 4
+    assert resumo(vetorizado) == resumo(por_partida)
+
+
+def recomendacao(previsao, confianca=0.7):
+    return {
+        'partida_id': 1,
+        'recomendacoes': {'over_under_2_5': {'predicao': previsao, 'confianca': confianca, 'odd_justa': 1 / confianca,
+                                             'rating': int(confianca * 10), 'modelo_utilizado': 'RandomForestClassifier'}},
+        'features_utilizadas': ['casa_aproveitamento'],
+    }
+
+
+def ativas(session):
+    return session.execute(
+        select(RecomendacaoAposta.mercado_aposta, RecomendacaoAposta.previsao, RecomendacaoAposta.probabilidade)
+        .where(RecomendacaoAposta.status == 'ativa')
+    ).all()
+
+
+def test_previsao_alterada_cancela_a_anterior(gerador, session):
+    assert gerador.salvar_recomendacoes_banco([recomendacao('Over 2.5')])
+    assert gerador.salvar_recomendacoes_banco([recomendacao('Under 2.5', 0.6)])
+    assert ativas(session) == [('over_under_2_5', 'Under 2.5', 0.6)]
+
+    # A previsão volta: a linha antiga é reativada e a outra cancelada
+    assert gerador.salvar_recomendacoes_banco([recomendacao('Over 2.5', 0.8)])
+    assert ativas(session) == [('over_under_2_5', 'Over 2.5', 0.8)]
+    assert session.execute(select(RecomendacaoAposta.previsao, RecomendacaoAposta.status)
+                           .order_by(RecomendacaoAposta.id)).all() == [
+        ('Over 2.5', 'ativa'), ('Under 2.5', 'cancelada')
+    ]
+
+
+def test_mesmo_lote_com_duas_previsoes_mantem_a_ultima(gerador, session):
+    assert gerador.salvar_recomendacoes_banco([recomendacao('Over 2.5'), recomendacao('Under 2.5', 0.6)])
+    assert ativas(session) == [('over_under_2_5', 'Under 2.5', 0.6)]
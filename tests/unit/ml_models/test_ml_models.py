@@ -0,0 +1,51 @@
+"""
+Testes da previsão em lote do MLModelManager.
+"""
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from ml_models.ml_models import ml_model_manager
+
+
+class ModeloContado(LogisticRegression):
+    """Regressão logística que conta as chamadas de predict/predict_proba."""
+    chamadas = 0
+
+    def predict(self, X):
+        ModeloContado.chamadas += 1
+        return super().predict(X)
+
+    def predict_proba(self, X):
+        ModeloContado.chamadas += 1
+        return super().predict_proba(X)
+
+
+@pytest.fixture
+def modelo(monkeypatch):
+    rng = np.random.default_rng(3)
+    X = rng.normal(size=(60, 3))
+    modelo = ModeloContado().fit(X, (X[:, 0] + X[:, 1] > 0).astype(int))
+    monkeypatch.setitem(ml_model_manager.models, "teste_lote", modelo)
+    monkeypatch.setitem(ml_model_manager.model_metadata, "teste_lote", {"feature_names": ["a", "b", "c"]})
+    ModeloContado.chamadas = 0
+    return modelo
+
+
+def test_lote_igual_as_previsoes_por_linha_com_uma_chamada(modelo):
+    linhas = [[0.5, 0.2, -1.0], [-2.0, 0.1, 0.3], [1.0, 1.0, 1.0]]
+
+    lote = ml_model_manager.make_predictions_batch("teste_lote", linhas)
+    assert ModeloContado.chamadas == 2
+
+    por_linha = [ml_model_manager.make_prediction("teste_lote", linha) for linha in linhas]
+    for obtido, esperado in zip(lote, por_linha):
+        assert obtido["prediction"] == esperado["prediction"]
+        assert obtido["confidence"] == pytest.approx(esperado["confidence"])
+        np.testing.assert_allclose(obtido["probabilities"], esperado["probabilities"])
+
+
+def test_lote_com_largura_errada_e_rejeitado(modelo):
+    with pytest.raises(ValueError):
+        ml_model_manager.make_predictions_batch("teste_lote", [[1.0, 2.0]])
+    assert ModeloContado.chamadas == 0
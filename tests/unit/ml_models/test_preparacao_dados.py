@@ -0,0 +1,36 @@
+"""
+Teste de regressão do dataset de treinamento em lote do PreparadorDadosML
+contra a implementação original, por partida (iterrows), mantida em
+referencia_preparacao_dados.py.
+"""
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from ml_models.preparacao_dados import PreparadorDadosML
+from tests.unit.ml_models.referencia_preparacao_dados import PreparadorOriginal, criar_banco, executar
+
+
+@pytest.fixture
+def banco(tmp_path):
+    engine, Sessao, sentimento = criar_banco(str(tmp_path / "preparacao.db"), partidas=600, clubes=40, seed=7)
+    yield engine, Sessao, sentimento
+    engine.dispose()
+
+
+@pytest.mark.parametrize("dias", [None, 730])
+def test_dataset_em_lote_igual_ao_por_partida(banco, dias):
+    engine, Sessao, sentimento = banco
+    data_inicio = datetime.now() - timedelta(days=dias) if dias else None
+
+    _, consultas_original, original = executar(PreparadorOriginal, Sessao, engine, sentimento, data_inicio)
+    _, consultas_lote, lote = executar(PreparadorDadosML, Sessao, engine, sentimento, data_inicio)
+
+    assert not lote.empty
+    pd.testing.assert_frame_equal(lote, original)
+    # Confrontos anteriores entram nas features e vêm de uma única consulta
+    historico = lote['historico_empates'] + lote['historico_vitorias_clube_referencia'] + \
+        lote['historico_derrotas_clube_referencia']
+    assert (historico > 0).any()
+    assert consultas_lote < 10 < consultas_original
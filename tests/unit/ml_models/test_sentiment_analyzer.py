@@ -0,0 +1,70 @@
+"""
+Testes da análise de sentimento em lote contra a análise texto a texto.
+"""
+import pytest
+
+from ml_models import cache_manager, sentiment_analyzer
+from ml_models.sentiment_analyzer import SentimentAnalyzer
+
+TEXTOS = [
+    "Vitória do Flamengo no clássico, com gol e assistência do jogador!",
+    "Derrota, lesão e suspensão: rebaixamento à vista para o rival",
+    "",
+    "Great win for the team, an amazing final",
+    "Vitória do Flamengo no clássico, com gol e assistência do jogador!",
+    "http://ge.globo.com/noticia #final @torcida contrato e renovação do técnico",
+    "",
+    "Empate sem graça no estádio",
+]
+
+POR_TEXTO = {
+    'textblob': 'analyze_sentiment_textblob',
+    'lexical': 'analyze_sentiment_lexical',
+    'hybrid': 'analyze_sentiment_hybrid',
+}
+
+
+@pytest.fixture
+def analisador(tmp_path, monkeypatch):
+    # Resultados por texto são cacheados em disco; isola o cache do teste
+    monkeypatch.setattr(cache_manager.cache_manager, "cache_dir", tmp_path)
+    # Tokenização determinística, sem depender dos dados do NLTK instalados
+    monkeypatch.setattr(sentiment_analyzer, "word_tokenize", str.split)
+    analisador = SentimentAnalyzer()
+    monkeypatch.setattr(analisador.lemmatizer, "lemmatize", lambda palavra: palavra)
+    return analisador
+
+
+def comparavel(resultado):
+    resultado = {chave: valor for chave, valor in resultado.items()
+                 if chave not in ('text_index', 'original_text')}
+    resultado['football_keywords'] = sorted(resultado['football_keywords'])
+    return resultado
+
+
+@pytest.mark.parametrize("metodo", sorted(POR_TEXTO))
+def test_lote_igual_a_analise_por_texto(analisador, metodo):
+    lote = analisador.analyze_batch_sentiments(TEXTOS, method=metodo)
+
+    assert [resultado['text_index'] for resultado in lote] == list(range(len(TEXTOS)))
+    analisar = getattr(analisador, POR_TEXTO[metodo])
+    for texto, resultado in zip(TEXTOS, lote):
+        assert comparavel(resultado) == comparavel(analisar(texto))
+        assert resultado['original_text'] == texto
+
+
+def test_scores_lexicos_nao_triviais(analisador):
+    # Garante que a comparação acima exercita o léxico e os idiomas
+    lote = analisador.analyze_batch_sentiments(TEXTOS, method='lexical')
+    assert lote[0]['sentiment_label'] == 'positive'
+    assert lote[1]['sentiment_label'] == 'negative'
+    assert lote[2]['sentiment_label'] == 'neutral' and lote[2]['confidence'] == 0.0
+    assert all('error' not in resultado for resultado in lote)
+
+
+def test_textos_repetidos_recebem_copias_independentes(analisador):
+    lote = analisador.analyze_batch_sentiments(TEXTOS, method='hybrid')
+
+    lote[0]['football_keywords'].append('alterada')
+    assert 'alterada' not in lote[4]['football_keywords']
+    assert lote[0]['sentiment_score'] == lote[4]['sentiment_score']
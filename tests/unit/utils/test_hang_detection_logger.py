@@ -0,0 +1,70 @@
+"""
+Testes da roda de tempo do detector de travamentos.
+"""
+import threading
+
+from utils.hang_detection_logger import (
+    HangDetectionLogger, cancel_on_expiry, count_expiry_metrics, dump_stack_on_expiry
+)
+
+
+def criar_detector(**opcoes):
+    # Sem start_monitoring: os ticks são avançados pelo teste
+    return HangDetectionLogger(tick_seconds=1.0, **opcoes)
+
+
+def test_operacao_vence_so_depois_do_timeout():
+    detector = criar_detector(wheel_size=8)
+    curta = detector.log_operation_start("HTTP_REQUEST", "URL: a", timeout_seconds=3)
+    # Prazo maior que uma volta da roda
+    longa = detector.log_operation_start("DB_SELECT", "", timeout_seconds=20)
+
+    vencidas = {}
+    for tick in range(1, 30):
+        for operacao in detector.advance():
+            vencidas[operacao.op_id] = tick
+
+    assert vencidas == {curta: 4, longa: 21}
+    assert detector.active_operations == {}
+    assert detector.get_metrics()["expired"] == {"HTTP_REQUEST": 1, "DB_SELECT": 1}
+
+
+def test_fim_remove_do_slot_e_ids_nao_colidem():
+    detector = criar_detector()
+    ids = [detector.log_operation_start("HTTP_REQUEST", timeout_seconds=2) for _ in range(1000)]
+    assert len(set(ids)) == 1000
+
+    for op_id in ids[:999]:
+        detector.log_operation_end(op_id, success=op_id != ids[0])
+    expiradas = [op for _ in range(5) for op in detector.advance()]
+
+    assert [op.op_id for op in expiradas] == [ids[999]]
+    metricas = detector.get_metrics()
+    assert (metricas["started"], metricas["finished"], metricas["failed"], metricas["active"]) == (1000, 999, 1, 0)
+    # Fim de operação já vencida não quebra
+    detector.log_operation_end(ids[999])
+
+
+def test_acoes_de_cancelamento_e_stack_dump(caplog):
+    canceladas = []
+    detector = criar_detector(expiry_actions=[cancel_on_expiry, dump_stack_on_expiry, count_expiry_metrics])
+
+    pronto, liberar = threading.Event(), threading.Event()
+
+    def operacao_travada():
+        detector.log_operation_start("SELENIUM_GET", timeout_seconds=1, cancel=lambda: canceladas.append(1))
+        pronto.set()
+        liberar.wait(5)
+
+    thread = threading.Thread(target=operacao_travada)
+    thread.start()
+    pronto.wait(5)
+    with caplog.at_level("ERROR", logger="hang_detection"):
+        detector.advance()
+        detector.advance()
+    liberar.set()
+    thread.join()
+
+    assert canceladas == [1]
+    assert "operacao_travada" in caplog.text
+    assert detector.metrics["expired"]["SELENIUM_GET"] == 1
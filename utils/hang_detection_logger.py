@@ -3,15 +3,20 @@
 Sistema de Logging para Detecção de Travamentos
 
 Sistema especializado para identificar onde e por que o código está travando.
-Inclui timeouts, heartbeats e logging detalhado de operações críticas.
+Inclui timeouts por operação (agendados numa roda de tempo), ações
+configuráveis ao vencer o prazo (log, stack dump, cancelamento, métricas) e
+logging de operações críticas.
 """
 
 import logging
 import time
+import math
 import threading
 import functools
+import itertools
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict, Iterable, List
 import traceback
 import sys
 import os
@@ -19,12 +24,106 @@ import os
 # Logger especializado para detecção de travamentos
 hang_logger = logging.getLogger("hang_detection")
 
+
+class TrackedOperation:
+    """Operação em andamento, agendada num slot da roda de tempo."""
+    
+    __slots__ = ("op_id", "name", "details", "timeout", "started_at", "started_monotonic",
+                 "thread_id", "cancel", "slot", "rounds")
+    
+    def __init__(self, op_id: str, name: str, details: str, timeout: float,
+                 cancel: Optional[Callable[[], Any]] = None):
+        self.op_id = op_id
+        self.name = name
+        self.details = details
+        self.timeout = timeout
+        self.started_at = datetime.now()
+        self.started_monotonic = time.monotonic()
+        # Thread que iniciou a operação (alvo do stack dump)
+        self.thread_id = threading.get_ident()
+        self.cancel = cancel
+        self.slot = 0
+        self.rounds = 0
+    
+    @property
+    def duration(self) -> float:
+        return time.monotonic() - self.started_monotonic
+
+
+# Ações de expiração: recebem (detector, operação)
+
+def log_expired_operation(detector: "HangDetectionLogger", operation: TrackedOperation):
+    """Registra o possível travamento no log."""
+    hang_logger.error(f"🚨 POSSÍVEL TRAVAMENTO DETECTADO!")
+    hang_logger.error(f"   Operação: {operation.op_id}")
+    if operation.details:
+        hang_logger.error(f"   Detalhes: {operation.details}")
+    hang_logger.error(f"   Duração: {operation.duration:.1f}s (timeout: {operation.timeout}s)")
+    hang_logger.error(f"   Iniciada em: {operation.started_at}")
+
+
+def dump_stack_on_expiry(detector: "HangDetectionLogger", operation: TrackedOperation):
+    """Registra a pilha da thread que iniciou a operação travada."""
+    frame = sys._current_frames().get(operation.thread_id)
+    if frame is None:
+        hang_logger.error(f"   Thread {operation.thread_id} da operação {operation.op_id} já terminou")
+        return
+    stack = "".join(traceback.format_stack(frame))
+    hang_logger.error(f"   Stack da thread {operation.thread_id} ({operation.op_id}):\n{stack}")
+
+
+def cancel_on_expiry(detector: "HangDetectionLogger", operation: TrackedOperation):
+    """Chama o cancelamento registrado com a operação (ex.: fechar a sessão HTTP)."""
+    if operation.cancel is None:
+        return
+    try:
+        operation.cancel()
+        hang_logger.warning(f"   Operação {operation.op_id} cancelada")
+    except Exception as e:
+        hang_logger.error(f"   Erro ao cancelar {operation.op_id}: {e}")
+
+
+def count_expiry_metrics(detector: "HangDetectionLogger", operation: TrackedOperation):
+    """Contabiliza a expiração por tipo de operação em detector.metrics."""
+    detector.metrics["expired"][operation.name] += 1
+
+
+DEFAULT_EXPIRY_ACTIONS = (log_expired_operation, count_expiry_metrics)
+
+
 class HangDetectionLogger:
-    """Logger especializado para detectar travamentos."""
+    """
+    Logger especializado para detectar travamentos.
+    
+    As operações são agendadas numa roda de tempo (timer wheel): cada slot
+    corresponde a um tick e guarda as operações que vencem nele; prazos maiores
+    que uma volta completa contam voltas restantes. Início e fim são O(1) e o
+    monitor, a cada tick, só olha o slot atual, sem varrer todas as operações.
     
-    def __init__(self):
-        self.active_operations = {}
-        self.operation_timeouts = {}
+    Args:
+        tick_seconds: Resolução da detecção
+        wheel_size: Número de slots da roda
+        expiry_actions: Funções (detector, operação) chamadas quando uma operação vence
+    """
+    
+    def __init__(self, tick_seconds: float = 1.0, wheel_size: int = 512,
+                 expiry_actions: Optional[Iterable[Callable]] = None):
+        self.active_operations: Dict[str, TrackedOperation] = {}
+        self.tick_seconds = tick_seconds
+        self.wheel_size = wheel_size
+        self.expiry_actions = list(DEFAULT_EXPIRY_ACTIONS if expiry_actions is None else expiry_actions)
+        self.metrics = {
+            "started": 0,
+            "finished": 0,
+            "failed": 0,
+            "expired": defaultdict(int),
+        }
+        
+        self._wheel = [dict() for _ in range(wheel_size)]
+        self._current_tick = 0
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self._stop_event = threading.Event()
         self.heartbeat_thread = None
         self.monitoring = False
         
@@ -38,86 +137,131 @@ class HangDetectionLogger:
             hang_logger.addHandler(handler)
             hang_logger.setLevel(logging.INFO)
     
+    @property
+    def operation_timeouts(self) -> Dict[str, float]:
+        """Timeout de cada operação ativa."""
+        return {op_id: operation.timeout for op_id, operation in list(self.active_operations.items())}
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Contadores de operações iniciadas, finalizadas, com falha, vencidas e ativas."""
+        with self._lock:
+            return {**self.metrics, "expired": dict(self.metrics["expired"]),
+                    "active": len(self.active_operations)}
+    
+    def add_expiry_action(self, action: Callable[["HangDetectionLogger", TrackedOperation], Any]):
+        """Adiciona uma ação executada para cada operação que vencer."""
+        self.expiry_actions.append(action)
+    
     def start_monitoring(self):
         """Inicia monitoramento de travamentos."""
         if not self.monitoring:
             self.monitoring = True
-            self.heartbeat_thread = threading.Thread(target=self._heartbeat_monitor, daemon=True)
+            self._stop_event.clear()
+            self.heartbeat_thread = threading.Thread(target=self._timer_loop, daemon=True)
             self.heartbeat_thread.start()
             hang_logger.info("🔍 Sistema de detecção de travamentos ATIVADO")
     
     def stop_monitoring(self):
         """Para monitoramento de travamentos."""
         self.monitoring = False
+        self._stop_event.set()
         hang_logger.info("🔍 Sistema de detecção de travamentos DESATIVADO")
     
-    def _heartbeat_monitor(self):
-        """Monitor que verifica operações em andamento."""
-        while self.monitoring:
+    def _timer_loop(self):
+        """Avança a roda um slot por tick, compensando atrasos da thread."""
+        next_tick = time.monotonic() + self.tick_seconds
+        while not self._stop_event.wait(max(0.0, next_tick - time.monotonic())):
             try:
-                current_time = datetime.now()
-                
-                # Verificar operações que podem estar travadas
-                for op_id, start_time in list(self.active_operations.items()):
-                    duration = (current_time - start_time).total_seconds()
-                    timeout = self.operation_timeouts.get(op_id, 300)  # 5 min default
-                    
-                    if duration > timeout:
-                        hang_logger.error(f"🚨 POSSÍVEL TRAVAMENTO DETECTADO!")
-                        hang_logger.error(f"   Operação: {op_id}")
-                        hang_logger.error(f"   Duração: {duration:.1f}s (timeout: {timeout}s)")
-                        hang_logger.error(f"   Iniciada em: {start_time}")
-                        
-                        # Remover da lista para evitar spam
-                        del self.active_operations[op_id]
-                        if op_id in self.operation_timeouts:
-                            del self.operation_timeouts[op_id]
-                
-                time.sleep(10)  # Verificar a cada 10 segundos
-                
+                while next_tick <= time.monotonic():
+                    self.advance()
+                    next_tick += self.tick_seconds
             except Exception as e:
                 hang_logger.error(f"Erro no monitor de travamentos: {e}")
-                time.sleep(30)
     
-    def log_operation_start(self, operation_name: str, details: str = "", timeout_seconds: int = 300):
-        """Registra início de operação que pode travar."""
-        op_id = f"{operation_name}_{int(time.time())}"
-        self.active_operations[op_id] = datetime.now()
-        self.operation_timeouts[op_id] = timeout_seconds
+    def advance(self) -> List[TrackedOperation]:
+        """
+        Avança um tick e processa as operações vencidas no slot atual.
+        
+        Returns:
+            Operações que venceram neste tick
+        """
+        expired = []
+        with self._lock:
+            self._current_tick += 1
+            bucket = self._wheel[self._current_tick % self.wheel_size]
+            for op_id, operation in list(bucket.items()):
+                if operation.rounds > 0:
+                    operation.rounds -= 1
+                    continue
+                # Removida para evitar spam, como antes
+                del bucket[op_id]
+                del self.active_operations[op_id]
+                expired.append(operation)
+        
+        for operation in expired:
+            for action in self.expiry_actions:
+                try:
+                    action(self, operation)
+                except Exception as e:
+                    hang_logger.error(f"Erro na ação de expiração {getattr(action, '__name__', action)}: {e}")
+        return expired
+    
+    def log_operation_start(self, operation_name: str, details: str = "", timeout_seconds: int = 300,
+                            cancel: Optional[Callable[[], Any]] = None):
+        """
+        Registra início de operação que pode travar.
+        
+        Args:
+            operation_name: Tipo da operação (HTTP_REQUEST, DB_..., ...)
+            details: Descrição (URL, tabela, ...)
+            timeout_seconds: Prazo para considerar a operação travada
+            cancel: Chamado por cancel_on_expiry se a operação vencer
+        """
+        op_id = f"{operation_name}_{int(time.time())}_{next(self._sequence)}"
+        operation = TrackedOperation(op_id, operation_name, details, timeout_seconds, cancel)
+        # +1: o tick atual já pode estar no fim; a operação nunca vence antes do timeout
+        ticks = math.ceil(timeout_seconds / self.tick_seconds) + 1
+        
+        with self._lock:
+            operation.slot = (self._current_tick + ticks) % self.wheel_size
+            operation.rounds = (ticks - 1) // self.wheel_size
+            self._wheel[operation.slot][op_id] = operation
+            self.active_operations[op_id] = operation
+            self.metrics["started"] += 1
         
-        hang_logger.info(f"🔄 INICIANDO: {operation_name}")
-        if details:
-            hang_logger.info(f"   Detalhes: {details}")
-        hang_logger.info(f"   Timeout: {timeout_seconds}s")
-        hang_logger.info(f"   ID: {op_id}")
+        if hang_logger.isEnabledFor(logging.DEBUG):
+            hang_logger.debug(f"🔄 INICIANDO: {operation_name} | {details} | timeout {timeout_seconds}s | ID: {op_id}")
         
         return op_id
     
     def log_operation_end(self, op_id: str, success: bool = True, details: str = ""):
         """Registra fim de operação."""
-        if op_id in self.active_operations:
-            start_time = self.active_operations[op_id]
-            duration = (datetime.now() - start_time).total_seconds()
-            
-            status = "✅ CONCLUÍDA" if success else "❌ FALHOU"
-            hang_logger.info(f"{status}: {op_id.split('_')[0]}")
-            hang_logger.info(f"   Duração: {duration:.2f}s")
-            if details:
-                hang_logger.info(f"   Detalhes: {details}")
-            
-            # Remover da lista de operações ativas
-            del self.active_operations[op_id]
-            if op_id in self.operation_timeouts:
-                del self.operation_timeouts[op_id]
-        else:
+        with self._lock:
+            operation = self.active_operations.pop(op_id, None)
+            if operation is not None:
+                del self._wheel[operation.slot][op_id]
+                self.metrics["finished"] += 1
+                if not success:
+                    self.metrics["failed"] += 1
+        
+        if operation is None:
             hang_logger.warning(f"⚠️ Tentativa de finalizar operação não registrada: {op_id}")
+            return
+        
+        if not success:
+            hang_logger.info(f"❌ FALHOU: {operation.name} em {operation.duration:.2f}s"
+                             f"{' | ' + details if details else ''}")
+        elif hang_logger.isEnabledFor(logging.DEBUG):
+            hang_logger.debug(f"✅ CONCLUÍDA: {operation.name} em {operation.duration:.2f}s"
+                              f"{' | ' + details if details else ''}")
     
-    def log_http_request_start(self, url: str, timeout: int = 30):
+    def log_http_request_start(self, url: str, timeout: int = 30, cancel: Optional[Callable[[], Any]] = None):
         """Registra início de requisição HTTP."""
         return self.log_operation_start(
             "HTTP_REQUEST", 
             f"URL: {url}", 
-            timeout + 10  # Timeout um pouco maior que o da requisição
+            timeout + 10,  # Timeout um pouco maior que o da requisição
+            cancel
         )
     
     def log_http_request_end(self, op_id: str, status_code: Optional[int] = None, error: str = ""):